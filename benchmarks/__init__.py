@@ -0,0 +1 @@
+# Бенчмарки для geometry_calculator
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк пакетного вычисления площадей против цикла calculate_area.
+
+Запуск:
+    python -m benchmarks.bench_batch [--size N]
+"""
+
+import argparse
+import random
+import time
+from array import array
+
+from geometry_calculator import Circle, Triangle, calculate_area
+from geometry_calculator import _backend
+from geometry_calculator.batch import circle_areas, triangle_areas
+
+
+def _best_of(func, repeat=3):
+    """Возвращает лучшее время выполнения func из repeat запусков."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10 ** 6, help="Количество фигур")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    radii = array('d', (rng.uniform(0.1, 100.0) for _ in range(args.size)))
+    side_a = array('d', (rng.uniform(1.0, 2.0) for _ in range(args.size)))
+    side_b = array('d', (rng.uniform(1.0, 2.0) for _ in range(args.size)))
+    side_c = array('d', (rng.uniform(1.0, 2.0) for _ in range(args.size)))
+
+    np = _backend.get_numpy()
+    print(f"Фигур: {args.size}, backend: {'numpy ' + np.__version__ if np else 'pure python'}")
+
+    cases = [
+        ("Круги",
+         lambda: [calculate_area(Circle(r)) for r in radii],
+         lambda: circle_areas(radii)),
+        ("Треугольники",
+         lambda: [calculate_area(Triangle(a, b, c)) for a, b, c in zip(side_a, side_b, side_c)],
+         lambda: triangle_areas(side_a, side_b, side_c)),
+    ]
+    for name, scalar, batch in cases:
+        scalar_time = _best_of(scalar, repeat=1)
+        batch_time = _best_of(batch)
+        print(f"{name:>13}: цикл {scalar_time:.3f} c, пакет {batch_time:.4f} c, "
+              f"ускорение x{scalar_time / batch_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
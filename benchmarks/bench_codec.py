@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк бинарного кодека фигур против pickle и JSON: скорость и размер.
+
+Запуск:
+    python -m benchmarks.bench_codec [--size N] [--repeat R]
+
+Смешанный набор кругов и треугольников кодируется encode_shapes, pickle
+(протокол по умолчанию) и JSON (записи {"shape": ..., параметры} как в
+потоковой обработке JSONL). Замеряются кодирование, декодирование в
+объекты фигур, декодирование в колонки без копирования (только кодек) и
+путь «декодирование + площади»: pickle.loads + calculate_areas против
+decode_columns(...).areas().
+"""
+
+import argparse
+import json
+import pickle
+import random
+import time
+
+from geometry_calculator.batch import calculate_areas
+from geometry_calculator.codec import decode_columns, decode_shapes, encode_shapes
+from geometry_calculator.shapes import Circle, Triangle
+
+
+def _best_of(repeat, function):
+    """Лучшее время из repeat запусков и результат последнего."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _shapes(count, seed=42):
+    """Круги и треугольники поровну, перемешанные."""
+    rng = random.Random(seed)
+    shapes = []
+    for index in range(count):
+        if index % 2:
+            shapes.append(Circle(rng.uniform(0.1, 100.0)))
+        else:
+            a, b = rng.uniform(1.0, 2.0), rng.uniform(1.0, 2.0)
+            shapes.append(Triangle(a, b, rng.uniform(abs(a - b) + 0.01, a + b - 0.01)))
+    return shapes
+
+
+def _json_encode(shapes):
+    """Записи JSON в формате потоковой обработки."""
+    records = []
+    for shape in shapes:
+        if type(shape) is Circle:
+            records.append({"shape": "circle", "radius": shape.radius})
+        else:
+            records.append({"shape": "triangle", "side_a": shape.side_a,
+                            "side_b": shape.side_b, "side_c": shape.side_c})
+    return json.dumps(records).encode()
+
+
+def _json_decode(data):
+    """Объекты фигур из записей JSON."""
+    shapes = []
+    for record in json.loads(data):
+        if record["shape"] == "circle":
+            shapes.append(Circle(record["radius"]))
+        else:
+            shapes.append(Triangle(record["side_a"], record["side_b"], record["side_c"]))
+    return shapes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10 ** 6, help="Количество фигур")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    shapes = _shapes(args.size)
+    formats = [
+        ("pickle", pickle.dumps, pickle.loads),
+        ("JSON", _json_encode, _json_decode),
+        ("encode_shapes", encode_shapes, decode_shapes),
+    ]
+
+    print(f"Фигур: {args.size} (круги и треугольники поровну)")
+    print(f"{'Формат':16s} {'байт/фигуру':>12s} {'кодирование':>14s} {'декодирование':>16s}")
+    payloads = {}
+    for name, encode, decode in formats:
+        encode_time, data = _best_of(args.repeat, lambda: encode(shapes))
+        decode_time, restored = _best_of(args.repeat, lambda: decode(data))
+        assert restored == shapes
+        payloads[name] = data
+        print(f"{name:16s} {len(data) / args.size:12.1f} "
+              f"{args.size / encode_time / 1e6:9.2f} млн/с {args.size / decode_time / 1e6:11.2f} млн/с")
+
+    columns_time, _ = _best_of(args.repeat, lambda: decode_columns(payloads["encode_shapes"]))
+    print(f"decode_columns (без копирования): {columns_time * 1e3:.3f} мс")
+
+    cases = [
+        ("pickle.loads + calculate_areas",
+         lambda: calculate_areas(pickle.loads(payloads["pickle"]))),
+        ("decode_columns(...).areas()",
+         lambda: decode_columns(payloads["encode_shapes"]).areas()),
+    ]
+    baseline = None
+    for name, function in cases:
+        elapsed, _ = _best_of(args.repeat, function)
+        baseline = baseline or elapsed
+        print(f"{name:34s} {elapsed:8.3f} c  x{baseline / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк диспетчеризации calculate_area: реестр ядер по type(shape)
+против прежнего пути isinstance(shape, Shape) + shape.area().
+
+Запуск:
+    python -m benchmarks.bench_dispatch [--number N]
+"""
+
+import argparse
+import timeit
+
+from geometry_calculator import Circle, Shape, Triangle, calculate_area
+
+
+def legacy_calculate_area(shape):
+    """Прежняя реализация calculate_area."""
+    if not isinstance(shape, Shape):
+        raise TypeError("Объект должен быть экземпляром класса Shape")
+    return shape.area()
+
+
+class Rectangle(Shape):
+    """Сторонняя фигура (как в examples/extensibility_demo.py)."""
+
+    __slots__ = ("width", "height")
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def area(self):
+        return self.width * self.height
+
+    def __str__(self):
+        return f"Прямоугольник({self.width}x{self.height})"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=1_000_000, help="Вызовов в замере")
+    args = parser.parse_args()
+
+    shapes = [("Circle", Circle(5)), ("Triangle", Triangle(5, 6, 7)), ("Rectangle", Rectangle(4, 6))]
+    for name, shape in shapes:
+        shape.area()  # прогрев кэша производных величин Triangle
+        calculate_area(shape)  # регистрация сторонней фигуры
+        namespace = {"shape": shape, "new": calculate_area, "old": legacy_calculate_area}
+        old = min(timeit.repeat("old(shape)", globals=namespace, number=args.number, repeat=5))
+        new = min(timeit.repeat("new(shape)", globals=namespace, number=args.number, repeat=5))
+        print(f"{name:>10}: isinstance {old / args.number * 1e9:6.1f} нс, "
+              f"реестр {new / args.number * 1e9:6.1f} нс, ускорение x{old / new:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк формулы Герона в форме Кахана против учебной формулы.
+
+Запуск:
+    python -m benchmarks.bench_heron [--size N]
+
+Сравниваются пропускная способность (скалярный цикл и пакетная
+функция) и максимальная относительная ошибка на почти вырожденных
+треугольниках относительно точной рациональной арифметики.
+"""
+
+import argparse
+import math
+import random
+import time
+from array import array
+from decimal import Decimal, localcontext
+from fractions import Fraction
+
+from geometry_calculator import _backend
+from geometry_calculator.batch import _as_column, triangle_areas
+
+
+def textbook_area(a, b, c):
+    """Учебная формула Герона (прежняя реализация Triangle.area)."""
+    s = (a + b + c) / 2
+    return math.sqrt(max(s * (s - a) * (s - b) * (s - c), 0.0))
+
+
+def kahan_area(a, b, c):
+    """Форма Кахана с сортировкой сторон (как Triangle.area)."""
+    if c > b:
+        c, b = b, c
+    if b > a:
+        b, a = a, b
+        if c > b:
+            c, b = b, c
+    return 0.25 * math.sqrt((a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c)))
+
+
+def textbook_areas(side_a, side_b, side_c):
+    """Пакетная учебная формула (прежняя реализация triangle_areas)."""
+    side_a, side_b, side_c = _as_column(side_a), _as_column(side_b), _as_column(side_c)
+    np = _backend.get_numpy()
+    if np is not None:
+        s = (side_a + side_b + side_c) / 2
+        with np.errstate(invalid='ignore'):
+            return np.sqrt(s * (s - side_a) * (s - side_b) * (s - side_c))
+    return array('d', map(textbook_area, side_a, side_b, side_c))
+
+
+def _exact_area(a, b, c):
+    a, b, c = Fraction(a), Fraction(b), Fraction(c)
+    product = (a + b + c) * (-a + b + c) * (a - b + c) * (a + b - c)
+    with localcontext() as context:
+        context.prec = 60
+        return float((Decimal(product.numerator) / Decimal(product.denominator)).sqrt() / 4)
+
+
+def _best_of(func, repeat=3):
+    """Возвращает лучшее время выполнения func из repeat запусков."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10 ** 6, help="Количество треугольников")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    columns = [array('d'), array('d'), array('d')]
+    needles = []
+    for _ in range(args.size):
+        a, b = rng.uniform(1.0, 2.0), rng.uniform(1.0, 2.0)
+        for column, value in zip(columns, (a, b, rng.uniform(abs(a - b) + 0.01, a + b - 0.01))):
+            column.append(value)
+    while len(needles) < 1000:
+        a, b = rng.uniform(1.0, 2.0), rng.uniform(1.0, 2.0)
+        c = (a + b) * (1 - 10.0 ** -rng.randint(4, 14))
+        if a + b > c:
+            needles.append((a, b, c))
+
+    np = _backend.get_numpy()
+    print(f"Треугольников: {args.size}, backend: {'numpy ' + np.__version__ if np else 'pure python'}")
+    exact = [_exact_area(*sides) for sides in needles]
+    for name, scalar, batch in (("учебная", textbook_area, textbook_areas),
+                                ("Кахан", kahan_area, triangle_areas)):
+        scalar_time = _best_of(lambda: list(map(scalar, *columns)), repeat=1)
+        batch_time = _best_of(lambda: batch(*columns))
+        error = max(abs(scalar(*sides) - value) / value for sides, value in zip(needles, exact))
+        print(f"{name:>8}: цикл {args.size / scalar_time / 1e6:6.2f} млн/с, "
+              f"пакет {args.size / batch_time / 1e6:7.1f} млн/с, "
+              f"макс. отн. ошибка (иглы) {error:.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк времени импорта пакета по данным ``python -X importtime``.
+
+Запуск:
+    python -m benchmarks.bench_import [--module geometry_calculator] [--repeat 5] [--top 10]
+                                      [--budget-ms 25]
+
+Каждый замер выполняется в новом интерпретаторе; печатается лучшее
+суммарное время импорта модуля и самые дорогие вложенные импорты. С
+``--budget-ms`` скрипт завершается с кодом 1, если лучшее время больше
+бюджета (проверка для CI на стабильной машине: время импорта зависит
+от диска, кэша байт-кода и загрузки машины).
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import FrozenSet, List, NamedTuple
+
+
+class ImportTiming(NamedTuple):
+    """Строка вывода -X importtime."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def measure_import(module: str = "geometry_calculator", statement: str = None) -> List[ImportTiming]:
+    """
+    Импортирует модуль в новом интерпретаторе с ``-X importtime``.
+
+    Args:
+        module (str): Имя импортируемого модуля.
+        statement (str | None): Код для выполнения вместо ``import module``.
+
+    Returns:
+        list: Замеры всех импортов в порядке вывода интерпретатора.
+    """
+    code = statement or f"import {module}"
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                               stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    timings = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings.append(ImportTiming(name.strip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def best_import_time_us(module: str = "geometry_calculator", repeat: int = 5) -> int:
+    """Лучшее из repeat суммарное время импорта модуля, мкс."""
+    best = None
+    for _ in range(repeat):
+        cumulative = {timing.module: timing.cumulative_us for timing in measure_import(module)}
+        value = cumulative[module]
+        best = value if best is None else min(best, value)
+    return best
+
+
+def loaded_modules(module: str = "geometry_calculator") -> FrozenSet[str]:
+    """Множество модулей, загруженных после ``import module`` в новом интерпретаторе."""
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE,
+                               universal_newlines=True, check=True)
+    return frozenset(completed.stdout.split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="geometry_calculator")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Сколько вложенных импортов показать")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Бюджет времени импорта, мс (код возврата 1 при превышении)")
+    args = parser.parse_args()
+
+    elapsed_ms = best_import_time_us(args.module, args.repeat) / 1000
+    print(f"Импорт {args.module}: {elapsed_ms:.1f} мс (лучшее из {args.repeat})")
+    timings = measure_import(args.module)
+    print(f"Загружено модулей: {len(loaded_modules(args.module))}")
+    for timing in sorted(timings, key=lambda item: item.self_us, reverse=True)[:args.top]:
+        print(f"  {timing.module:<40} собственное {timing.self_us / 1000:6.2f} мс, "
+              f"суммарное {timing.cumulative_us / 1000:6.2f} мс")
+    if args.budget_ms is not None and elapsed_ms >= args.budget_ms:
+        print(f"Превышен бюджет импорта: {elapsed_ms:.1f} мс >= {args.budget_ms:.0f} мс")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
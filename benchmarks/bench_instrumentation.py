@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк накладных расходов инструментации: до включения, во время
+работы и после выключения.
+
+Запуск:
+    python -m benchmarks.bench_instrumentation [--number N]
+"""
+
+import argparse
+import timeit
+
+from geometry_calculator import Circle, Triangle, calculate_area, instrumentation
+
+
+STATEMENTS = [
+    ("Circle + calculate_area", "calculate_area(Circle(5))"),
+    ("Triangle + calculate_area", "calculate_area(Triangle(5, 6, 7))"),
+]
+
+
+def _measure(number):
+    """Время на вызов (нс) для каждой строки STATEMENTS."""
+    namespace = {"Circle": Circle, "Triangle": Triangle, "calculate_area": calculate_area}
+    return [min(timeit.repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e9
+            for _, statement in STATEMENTS]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=300_000, help="Вызовов в замере")
+    args = parser.parse_args()
+
+    before = _measure(args.number)
+    instrumentation.enable()
+    enabled = _measure(args.number)
+    instrumentation.disable()
+    after = _measure(args.number)
+
+    for (name, _), base, on, off in zip(STATEMENTS, before, enabled, after):
+        print(f"{name:>26}: до {base:7.1f} нс, включена {on:7.1f} нс, "
+              f"выключена {off:7.1f} нс ({(off / base - 1) * 100:+.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк интернирования фигур на наборе с повторяющимися параметрами.
+
+Запуск:
+    python -m benchmarks.bench_interning [--size N] [--unique U]
+
+Набор из N треугольников содержит U различных (с точностью до порядка
+сторон). Сравниваются память, удерживаемая списком фигур, и время
+первого вычисления площадей для отдельных объектов и для общих
+экземпляров ShapeInterner.
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from geometry_calculator.interning import ShapeInterner
+from geometry_calculator.shapes import Triangle
+
+
+def _measure(build):
+    """Возвращает (результат build(), байт, удерживаемых результатом)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def _area_time(shapes):
+    """Время первого прохода area() по фигурам."""
+    start = time.perf_counter()
+    for shape in shapes:
+        shape.area()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10 ** 6, help="Количество фигур")
+    parser.add_argument("--unique", type=int, default=10 ** 4, help="Различных треугольников")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    distinct = []
+    for _ in range(args.unique):
+        a, b = rng.uniform(1, 2), rng.uniform(1, 2)
+        distinct.append((a, b, rng.uniform(abs(a - b) + 0.01, a + b - 0.01)))
+    # Повторы приходят с переставленными сторонами, как в реальных данных
+    rows = []
+    for _ in range(args.size):
+        sides = list(rng.choice(distinct))
+        rng.shuffle(sides)
+        rows.append(tuple(sides))
+
+    plain, plain_bytes = _measure(lambda: [Triangle(a, b, c) for a, b, c in rows])
+    plain_time = _area_time(plain)
+    del plain
+
+    interner = ShapeInterner()
+    shared, shared_bytes = _measure(lambda: [interner.triangle(a, b, c) for a, b, c in rows])
+    shared_time = _area_time(shared)
+    stats = interner.stats()
+
+    print(f"Фигур: {args.size}, различных: {stats.unique}, "
+          f"дедупликация: {stats.dedup_ratio:.1f}x (попаданий {stats.hit_rate:.1%})")
+    print(f"Отдельные объекты: {plain_bytes / args.size:6.1f} байт/фигура, "
+          f"площади {plain_time:.3f} c")
+    print(f"Интернирование:    {shared_bytes / args.size:6.1f} байт/фигура, "
+          f"площади {shared_time:.3f} c")
+    print(f"Память в {plain_bytes / shared_bytes:.1f} раз меньше, "
+          f"площади в {plain_time / shared_time:.1f} раз быстрее")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк LiveShapeSet: инкрементальные агрегаты против пересчета после каждого изменения.
+
+Запуск:
+    python -m benchmarks.bench_live [--size N] [--updates U] [--repeat R]
+
+Набор из N фигур (круги и треугольники) меняется U заменами случайных
+фигур; после каждой замены нужны сумма и средняя площадь. Сравниваются
+пересчет циклом calculate_area, пересчет пакетным calculate_areas и
+LiveShapeSet.update. Для пересчетов замеряется меньше замен (они O(N)),
+время приводится к одной замене. В конце — ошибка суммы после серии
+замен относительно math.fsum: обычная сумма, компенсированная без
+периодического пересчета и с ним.
+"""
+
+import argparse
+import math
+import random
+import time
+
+from geometry_calculator.batch import calculate_areas
+from geometry_calculator.live import LiveShapeSet
+from geometry_calculator.shapes import Circle, Triangle, calculate_area
+
+
+def _best_of(repeat, function):
+    """Лучшее время из repeat запусков и результат последнего."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _shapes(rng, count):
+    """Случайные круги и треугольники (треть прямоугольных)."""
+    shapes = []
+    for index in range(count):
+        if index % 2:
+            shapes.append(Circle(rng.uniform(0.1, 100.0)))
+        elif index % 3:
+            a, b = rng.uniform(1.0, 2.0), rng.uniform(1.0, 2.0)
+            shapes.append(Triangle(a, b, rng.uniform(abs(a - b) + 0.01, a + b - 0.01)))
+        else:
+            scale = rng.uniform(0.1, 10.0)
+            shapes.append(Triangle(3 * scale, 4 * scale, 5 * scale))
+    return shapes
+
+
+def _recompute_loop(shapes, changes):
+    """Замена и пересчет суммы и средней циклом calculate_area."""
+    for index, shape in changes:
+        shapes[index] = shape
+        total = sum(calculate_area(item) for item in shapes)
+        _ = total, total / len(shapes)
+
+
+def _recompute_batch(shapes, changes):
+    """Замена и пересчет суммы и средней пакетным calculate_areas."""
+    for index, shape in changes:
+        shapes[index] = shape
+        total = math.fsum(calculate_areas(shapes))
+        _ = total, total / len(shapes)
+
+
+def _live(live, changes):
+    """Замена в LiveShapeSet и чтение суммы и средней."""
+    for handle, shape in changes:
+        live.update(handle, shape)
+        _ = live.total_area, live.mean_area
+
+
+def _drift(rng, size, updates, resum_every):
+    """
+    Относительная ошибка суммы после серии замен: обычная сумма и LiveShapeSet.
+
+    Фигуры поочередно заменяются большими кругами и обратно малыми, так
+    что итоговая сумма мала по сравнению с промежуточными.
+    """
+    live = LiveShapeSet(_shapes(rng, size), resum_every=resum_every)
+    naive = math.fsum(live.area(handle) for handle in live)
+    handles = list(live)
+    for shape in _shapes(rng, updates):
+        handle = rng.choice(handles)
+        for new in (Circle(rng.uniform(1e6, 1e8)), shape):
+            naive += calculate_area(new) - live.area(handle)
+            live.update(handle, new)
+    exact = math.fsum(live.area(handle) for handle in live)
+    return abs(naive - exact) / exact, abs(live.total_area - exact) / exact
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000, help="Количество фигур в наборе")
+    parser.add_argument("--updates", type=int, default=100_000, help="Количество замен")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    base = _shapes(rng, args.size)
+    replacements = _shapes(rng, args.updates)
+    positions = [rng.randrange(args.size) for _ in range(args.updates)]
+    # Пересчеты O(N) на замену: замеряем долю замен
+    slow_updates = max(1, min(args.updates, 10 ** 7 // (20 * args.size)))
+
+    live = LiveShapeSet(base)
+    handles = list(live)
+    live_changes = [(handles[i], shape) for i, shape in zip(positions, replacements)]
+    plain_changes = list(zip(positions, replacements))[:slow_updates]
+
+    print(f"Фигур: {args.size}, замен: {args.updates} (пересчеты: {slow_updates})")
+    cases = [
+        ("Пересчет: calculate_area", slow_updates,
+         lambda: _recompute_loop(list(base), plain_changes)),
+        ("Пересчет: calculate_areas", slow_updates,
+         lambda: _recompute_batch(list(base), plain_changes)),
+        ("LiveShapeSet.update", args.updates, lambda: _live(live, live_changes)),
+    ]
+    baseline = None
+    for name, updates, function in cases:
+        elapsed, _ = _best_of(args.repeat, function)
+        per_update = elapsed / updates
+        baseline = baseline or per_update
+        print(f"{name:30s} {per_update * 1e6:12.2f} мкс/замена  x{baseline / per_update:.0f}")
+
+    naive, unresummed = _drift(random.Random(7), args.size, args.updates, 10 ** 12)
+    _, resummed = _drift(random.Random(7), args.size, args.updates, 4096)
+    print(f"Ошибка суммы: обычная {naive:.1e}, Ноймайер {unresummed:.1e}, "
+          f"Ноймайер + пересчет {resummed:.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк памяти на одну фигуру: объекты с __dict__, объекты с __slots__
+и колоночная ShapeCollection.
+
+Запуск:
+    python -m benchmarks.bench_memory [--size N]
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+
+from geometry_calculator import Circle, Triangle, ShapeCollection
+
+
+class _DictCircle:
+    """Круг с __dict__ — раскладка Circle до перехода на __slots__."""
+
+    def __init__(self, radius):
+        self.radius = radius
+
+
+class _DictTriangle:
+    """Треугольник с __dict__ — раскладка Triangle до перехода на __slots__."""
+
+    def __init__(self, side_a, side_b, side_c):
+        self.side_a = side_a
+        self.side_b = side_b
+        self.side_c = side_c
+
+
+def _measure(build):
+    """Возвращает количество байт, выделенных build() и удерживаемых результатом."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10 ** 6, help="Количество фигур")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    radii = [rng.uniform(0.1, 100.0) for _ in range(args.size)]
+    triples = []
+    for _ in range(args.size):
+        a, b = rng.uniform(1, 2), rng.uniform(1, 2)
+        triples.append((a, b, rng.uniform(abs(a - b) + 0.01, a + b - 0.01)))
+
+    # Параметры создаются заново внутри build, чтобы учесть и объекты float
+    cases = [
+        ("Круги", [
+            ("__dict__", lambda: [_DictCircle(r + 0.0) for r in radii]),
+            ("__slots__", lambda: [Circle(r + 0.0) for r in radii]),
+            ("ShapeCollection", lambda: ShapeCollection.from_columns(Circle, radii)),
+        ]),
+        ("Треугольники", [
+            ("__dict__", lambda: [_DictTriangle(a + 0.0, b + 0.0, c + 0.0) for a, b, c in triples]),
+            ("__slots__", lambda: [Triangle(a + 0.0, b + 0.0, c + 0.0) for a, b, c in triples]),
+            ("ShapeCollection", lambda: ShapeCollection.from_columns(Triangle, *zip(*triples))),
+        ]),
+    ]
+    # Прогрев: ленивые импорты (например, NumPy) не должны попасть в замер
+    ShapeCollection.from_columns(Triangle, [3], [4], [5])
+
+    print(f"Фигур: {args.size}")
+    for name, variants in cases:
+        baseline = None
+        for label, build in variants:
+            per_shape = _measure(build) / args.size
+            baseline = baseline or per_shape
+            print(f"{name:>13} {label:>16}: {per_shape:7.1f} байт/фигура, "
+                  f"в {baseline / per_shape:.1f} раз меньше __dict__")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк совмещенных метрик треугольников против отдельных вызовов.
+
+Запуск:
+    python -m benchmarks.bench_metrics [--size N] [--repeat R]
+
+Площадь, периметр, вид и радиусы описанной и вписанной окружностей
+вычисляются отдельными проходами (triangle_areas, classify_triangles,
+выражения над колонками) и одним вызовом measure_triangles. Для
+скалярного API сравниваются отдельные методы Triangle и measure().
+"""
+
+import argparse
+import random
+import time
+from array import array
+
+from geometry_calculator import _backend
+from geometry_calculator.batch import triangle_areas
+from geometry_calculator.classification import classify_triangles
+from geometry_calculator.metrics import measure, measure_triangles
+from geometry_calculator.shapes import Triangle
+
+
+def _best_of(repeat, function):
+    """Лучшее время из repeat запусков и результат последнего."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _separate(np, side_a, side_b, side_c):
+    """Метрики отдельными проходами по колонкам."""
+    area = triangle_areas(side_a, side_b, side_c)
+    kinds = classify_triangles(side_a, side_b, side_c, kinds=True).kinds
+    if np is not None:
+        a, b, c = (np.asarray(column) for column in (side_a, side_b, side_c))
+        perimeter = a + b + c
+        return area, perimeter, kinds, a * b * c / (4 * area), 2 * area / perimeter
+    perimeter = array('d', map(lambda x, y, z: x + y + z, side_a, side_b, side_c))
+    circumradius = array('d', (x * y * z / (4 * s) for x, y, z, s in zip(side_a, side_b, side_c, area)))
+    inradius = array('d', (2 * s / p for s, p in zip(area, perimeter)))
+    return area, perimeter, kinds, circumradius, inradius
+
+
+def _separate_scalar(triangles):
+    """Метрики отдельными методами Triangle."""
+    result = []
+    for triangle in triangles:
+        area = triangle.area()
+        perimeter = 2 * triangle.semi_perimeter
+        right = triangle.is_right_triangle()
+        a, b, c = triangle.sorted_sides
+        result.append((area, perimeter, right, a * b * c / (4 * area), area / triangle.semi_perimeter))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10 ** 6, help="Количество треугольников")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    side_a, side_b, side_c = array('d'), array('d'), array('d')
+    for _ in range(args.size):
+        a, b = rng.uniform(1.0, 2.0), rng.uniform(1.0, 2.0)
+        side_a.append(a)
+        side_b.append(b)
+        side_c.append(rng.uniform(abs(a - b) + 0.01, a + b - 0.01))
+    np = _backend.get_numpy()
+    if np is not None:
+        side_a, side_b, side_c = (np.frombuffer(column) for column in (side_a, side_b, side_c))
+    triples = list(zip(side_a.tolist(), side_b.tolist(), side_c.tolist()))
+
+    print(f"Треугольников: {args.size}, backend: {'numpy ' + np.__version__ if np else 'pure python'}")
+    cases = [
+        ("Пакет: отдельные проходы", lambda: _separate(np, side_a, side_b, side_c)),
+        ("Пакет: measure_triangles", lambda: measure_triangles(side_a, side_b, side_c)),
+        ("Пакет: measure_triangles (area, kind)",
+         lambda: measure_triangles(side_a, side_b, side_c, ("area", "kind"))),
+        ("Скаляр: методы Triangle",
+         lambda: _separate_scalar([Triangle(a, b, c) for a, b, c in triples])),
+        ("Скаляр: measure()", lambda: [measure(Triangle(a, b, c)) for a, b, c in triples]),
+    ]
+    baseline = None
+    for index, (name, function) in enumerate(cases):
+        if index == 3:
+            baseline = None
+        elapsed, _ = _best_of(args.repeat, function)
+        baseline = baseline or elapsed
+        print(f"{name:40s} {elapsed:8.3f} c  {args.size / elapsed / 1e6:8.2f} млн/с  "
+              f"x{baseline / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    main()
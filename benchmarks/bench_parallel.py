@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк масштабирования параллельных пакетных функций по числу процессов.
+
+Запуск:
+    python -m benchmarks.bench_parallel [--size N] [--max-workers W]
+
+Для каждого числа процессов 1, 2, 4, ... W печатается пропускная способность
+(млн фигур в секунду) и эффективность относительно линейного роста.
+"""
+
+import argparse
+import os
+import random
+import time
+from array import array
+
+from geometry_calculator import _backend
+from geometry_calculator.parallel import parallel_triangle_areas
+
+
+def _worker_counts(max_workers):
+    """Последовательность 1, 2, 4, ... с обязательным max_workers в конце."""
+    counts = []
+    count = 1
+    while count < max_workers:
+        counts.append(count)
+        count *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10 ** 7, help="Количество треугольников")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1,
+                        help="Максимальное число процессов (по умолчанию os.cpu_count())")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Строк в задаче пула")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    columns = [array('d', (rng.uniform(1.0, 2.0) for _ in range(args.size))) for _ in range(3)]
+    np = _backend.get_numpy()
+    print(f"Треугольников: {args.size}, backend: {'numpy ' + np.__version__ if np else 'pure python'}")
+
+    baseline = None
+    for workers in _worker_counts(args.max_workers):
+        start = time.perf_counter()
+        parallel_triangle_areas(*columns, workers=workers, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - start
+        throughput = args.size / elapsed / 1e6
+        baseline = baseline or throughput
+        print(f"процессов {workers:>3}: {elapsed:.3f} c, {throughput:.2f} млн/с, "
+              f"эффективность {throughput / (baseline * workers):.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк площадей многоугольников: цикл Python против рваного массива.
+
+Запуск:
+    python -m benchmarks.bench_polygon [--size N] [--min-vertices A] [--max-vertices B]
+
+Сравниваются формула шнурков циклом Python по вершинам (как в
+наследнике Shape из examples/extensibility_demo.py), polygon_areas по
+плоскому буферу координат со смещениями и calculate_areas по объектам
+Polygon (сборка буферов и то же пакетное ядро).
+"""
+
+import argparse
+import math
+import random
+import time
+from array import array
+
+from geometry_calculator import _backend
+from geometry_calculator.batch import calculate_areas, polygon_areas
+from geometry_calculator.shapes import Polygon
+
+
+def _best_of(repeat, function):
+    """Лучшее время из repeat запусков и результат последнего."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _loop_area(vertices):
+    """Формула шнурков циклом Python по списку вершин."""
+    total = 0.0
+    for (x1, y1), (x2, y2) in zip(vertices, vertices[1:] + vertices[:1]):
+        total += x1 * y2 - x2 * y1
+    return abs(total) / 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10 ** 5, help="Количество многоугольников")
+    parser.add_argument("--min-vertices", type=int, default=3)
+    parser.add_argument("--max-vertices", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    polygons = []
+    for _ in range(args.size):
+        count = rng.randint(args.min_vertices, args.max_vertices)
+        angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(count))
+        polygons.append([(r * math.cos(t), r * math.sin(t))
+                         for r, t in zip((rng.uniform(1, 2) for _ in angles), angles)])
+    coords = array('d', (value for vertices in polygons for vertex in vertices for value in vertex))
+    offsets = array('q', [0])
+    for vertices in polygons:
+        offsets.append(offsets[-1] + len(vertices))
+    objects = [Polygon(vertices) for vertices in polygons]
+    vertex_count = len(coords) // 2
+
+    np = _backend.get_numpy()
+    print(f"Многоугольников: {args.size}, вершин: {vertex_count}, "
+          f"backend: {'numpy ' + np.__version__ if np else 'pure python'}")
+
+    cases = [
+        ("Цикл Python по вершинам", lambda: [_loop_area(vertices) for vertices in polygons]),
+        ("polygon_areas (рваный массив)", lambda: polygon_areas(coords, offsets)),
+        ("calculate_areas(Polygon)", lambda: calculate_areas(objects)),
+    ]
+    baseline = None
+    for name, function in cases:
+        elapsed, _ = _best_of(args.repeat, function)
+        baseline = baseline or elapsed
+        print(f"{name:32s} {elapsed:8.3f} c  {vertex_count / elapsed / 1e6:8.1f} млн вершин/с  "
+              f"x{baseline / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    main()
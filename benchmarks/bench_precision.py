@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк режима точности single против double для пакетных функций.
+
+Запуск:
+    python -m benchmarks.bench_precision [--size N] [--repeat R]
+
+Для кругов и треугольников печатается пропускная способность (млн фигур
+в секунду), объем колонок и результата на фигуру и наибольшая
+наблюдаемая относительная погрешность режима single против double.
+"""
+
+import argparse
+import random
+import time
+from array import array
+
+from geometry_calculator import _backend
+from geometry_calculator.batch import circle_areas, triangle_areas
+from geometry_calculator.precision import SINGLE_REL_ERROR
+
+
+def _best_of(repeat, function):
+    """Лучшее время из repeat запусков и результат последнего."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _max_relative_error(values, reference):
+    return max(abs(value - exact) / exact for value, exact in zip(values, reference) if exact)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10 ** 7, help="Количество фигур")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    radii = array('d', (rng.uniform(0.1, 100.0) for _ in range(args.size)))
+    side_a, side_b, side_c = array('d'), array('d'), array('d')
+    for _ in range(args.size):
+        a, b = rng.uniform(1.0, 2.0), rng.uniform(1.0, 2.0)
+        side_a.append(a)
+        side_b.append(b)
+        side_c.append(rng.uniform(abs(a - b) + 0.01, a + b - 0.01))
+
+    np = _backend.get_numpy()
+    print(f"Фигур: {args.size}, backend: {'numpy ' + np.__version__ if np else 'pure python'}, "
+          f"гарантия single: {SINGLE_REL_ERROR:g}")
+
+    cases = [
+        ("Круги", circle_areas, [radii]),
+        ("Треугольники", triangle_areas, [side_a, side_b, side_c]),
+    ]
+    for name, function, columns in cases:
+        # Режим single дает выигрыш на колонках, уже хранящихся в float32
+        single_columns = [array('f', column) for column in columns]
+        double_time, _ = _best_of(args.repeat, lambda: function(*columns))
+        single_time, result = _best_of(
+            args.repeat, lambda: function(*single_columns, precision="single"))
+        exact = function(*(array('d', column) for column in single_columns))
+        error = _max_relative_error(result, exact)
+        double_bytes = 8 * (len(columns) + 1)
+        single_bytes = 4 * (len(columns) + 1)
+        print(f"{name}:")
+        print(f"  double: {args.size / double_time / 1e6:8.1f} млн/с, {double_bytes} байт/фигура")
+        print(f"  single: {args.size / single_time / 1e6:8.1f} млн/с, {single_bytes} байт/фигура, "
+              f"в {double_time / single_time:.2f} раза быстрее, "
+              f"макс. погрешность {error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк бинарного хранилища против разбора CSV.
+
+Запуск:
+    python -m benchmarks.bench_store [--size N]
+
+Сравнивается время получения площадей из CSV-файла (разбор и
+пакетное вычисление) и из файла хранилища: открытие через mmap с
+пересчетом площадей и чтение сохраненной колонки площадей.
+"""
+
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+from array import array
+
+from geometry_calculator import Triangle
+from geometry_calculator import _backend
+from geometry_calculator.batch import triangle_areas
+from geometry_calculator.pipeline import compute_chunk_areas, read_records
+from geometry_calculator.store import open_store, write_store
+
+
+def _best_of(func, repeat=3):
+    """Возвращает лучшее время выполнения func из repeat запусков."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _from_csv(path):
+    with open(path, "r", encoding="utf-8", newline="") as stream:
+        return compute_chunk_areas(list(read_records(stream, "csv")))
+
+
+def _from_store(path):
+    with open_store(path) as store:
+        return float(sum(store.areas()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10 ** 6, help="Количество треугольников")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    columns = [array('d'), array('d'), array('d')]
+    for _ in range(args.size):
+        a, b = rng.uniform(1.0, 2.0), rng.uniform(1.0, 2.0)
+        for column, value in zip(columns, (a, b, rng.uniform(abs(a - b) + 0.01, a + b - 0.01))):
+            column.append(value)
+
+    np = _backend.get_numpy()
+    print(f"Треугольников: {args.size}, backend: {'numpy ' + np.__version__ if np else 'pure python'}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "shapes.csv")
+        with open(csv_path, "w", encoding="utf-8", newline="") as stream:
+            writer = csv.writer(stream)
+            writer.writerow(["shape", "side_a", "side_b", "side_c"])
+            writer.writerows(("triangle",) + row for row in zip(*columns))
+        plain_path = os.path.join(directory, "shapes.gcs")
+        areas_path = os.path.join(directory, "areas.gcs")
+        write_store(plain_path, Triangle, *columns)
+        write_store(areas_path, Triangle, *columns, store_areas=True)
+
+        cases = [
+            ("CSV: разбор + площади", lambda: _from_csv(csv_path), csv_path, 1),
+            ("mmap + пересчет площадей", lambda: _from_store(plain_path), plain_path, 3),
+            ("mmap + сохраненные площади", lambda: _from_store(areas_path), areas_path, 3),
+            ("только открытие mmap", lambda: open_store(areas_path).close(), areas_path, 3),
+        ]
+        baseline = None
+        for name, func, path, repeat in cases:
+            elapsed = _best_of(func, repeat)
+            baseline = baseline or elapsed
+            print(f"{name:>28}: {elapsed:.4f} c, файл {os.path.getsize(path) / 2 ** 20:.1f} МиБ, "
+                  f"ускорение x{baseline / elapsed:.1f}")
+        # Контроль: площади из хранилища совпадают с пакетной функцией
+        with open_store(areas_path) as store:
+            assert list(store.areas()[:10]) == list(triangle_areas(*columns)[:10])
+
+
+if __name__ == "__main__":
+    main()
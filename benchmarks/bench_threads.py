@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк масштабирования вычисления площадей по числу потоков.
+
+Запуск:
+    python -m benchmarks.bench_threads [--size N] [--max-threads T]
+    python3.13t -m benchmarks.bench_threads     # free-threaded сборка
+
+Для каждого числа потоков 1, 2, 4, ... T печатается пропускная способность
+(млн треугольников в секунду) и эффективность относительно линейного роста
+для двух режимов:
+
+- цикл calculate_area по объектам Triangle, разделенный между потоками
+  (на обычном CPython сериализуется на GIL);
+- threaded_triangle_areas по колонкам сторон (ufunc'и NumPy отпускают GIL;
+  без NumPy — циклы чистого Python, параллельные только без GIL).
+"""
+
+import argparse
+import os
+import platform
+import random
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from geometry_calculator import _backend
+from geometry_calculator.shapes import Triangle, calculate_area
+from geometry_calculator.threaded import gil_enabled, threaded_triangle_areas
+
+
+def _thread_counts(max_threads):
+    """Последовательность 1, 2, 4, ... с обязательным max_threads в конце."""
+    counts = []
+    count = 1
+    while count < max_threads:
+        counts.append(count)
+        count *= 2
+    counts.append(max_threads)
+    return counts
+
+
+def _best_of(repeat, function):
+    """Лучшее время из repeat запусков."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _object_loop(triangles, threads):
+    """calculate_area по объектам, список делится между потоками поровну."""
+    step = -(-len(triangles) // threads)
+    parts = [triangles[start:start + step] for start in range(0, len(triangles), step)]
+
+    def work(part):
+        return [calculate_area(triangle) for triangle in part]
+
+    def run():
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for _ in executor.map(work, parts):
+                pass
+    return run
+
+
+def _report(title, size, timings):
+    print(title)
+    baseline = None
+    for threads, elapsed in timings:
+        throughput = size / elapsed / 1e6
+        baseline = baseline or throughput
+        print(f"  потоков {threads:>3}: {elapsed:.3f} c, {throughput:.2f} млн/с, "
+              f"эффективность {throughput / (baseline * threads):.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10 ** 6, help="Количество треугольников")
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1,
+                        help="Максимальное число потоков (по умолчанию os.cpu_count())")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    side_a, side_b, side_c = array('d'), array('d'), array('d')
+    for _ in range(args.size):
+        a, b = rng.uniform(1, 2), rng.uniform(1, 2)
+        side_a.append(a)
+        side_b.append(b)
+        side_c.append(rng.uniform(abs(a - b) + 0.01, a + b - 0.01))
+
+    np = _backend.get_numpy()
+    print(f"Python {platform.python_version()} ({platform.python_implementation()}), "
+          f"GIL {'включен' if gil_enabled() else 'отключен'}, CPU: {os.cpu_count()}")
+    print(f"Треугольников: {args.size}, backend: {'numpy ' + np.__version__ if np else 'pure python'}")
+
+    counts = _thread_counts(args.max_threads)
+    # Площадь треугольника кэшируется в объекте: каждый запуск на новых объектах
+    object_timings = []
+    for threads in counts:
+        best = float("inf")
+        for _ in range(args.repeat):
+            triangles = [Triangle(a, b, c) for a, b, c in zip(side_a, side_b, side_c)]
+            best = min(best, _best_of(1, _object_loop(triangles, threads)))
+        object_timings.append((threads, best))
+    _report("Цикл calculate_area по объектам:", args.size, object_timings)
+
+    column_timings = [(threads, _best_of(args.repeat, lambda: threaded_triangle_areas(
+        side_a, side_b, side_c, threads=threads))) for threads in counts]
+    _report("threaded_triangle_areas по колонкам:", args.size, column_timings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Микробенчмарк повторных вызовов методов одного и того же треугольника.
+
+Сравнивает повторные (кэшированные) обращения к производным величинам —
+полупериметру, отсортированным сторонам, area() и is_right_triangle() —
+с чтением обычного атрибута и с первым (вычисляющим) обращением на
+новом объекте.
+
+Запуск:
+    python -m benchmarks.bench_triangle [--number N]
+"""
+
+import argparse
+import timeit
+
+from geometry_calculator import Triangle
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=1_000_000, help="Вызовов в замере")
+    args = parser.parse_args()
+
+    triangle = Triangle(5, 6, 7)
+    namespace = {"Triangle": Triangle, "triangle": triangle}
+    cases = [
+        ("чтение атрибута side_a", "triangle.side_a"),
+        ("semi_perimeter", "triangle.semi_perimeter"),
+        ("sorted_sides", "triangle.sorted_sides"),
+        ("area() (повторно)", "triangle.area()"),
+        ("is_right_triangle()", "triangle.is_right_triangle()"),
+        ("area() на новом объекте", "Triangle(5, 6, 7).area()"),
+        ("is_right_triangle() на новом объекте", "Triangle(5, 6, 7).is_right_triangle()"),
+    ]
+    for name, statement in cases:
+        best = min(timeit.repeat(statement, globals=namespace, number=args.number, repeat=5))
+        print(f"{name:>38}: {best / args.number * 1e9:7.1f} нс/вызов")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк площадей треугольников по вершинам: стороны + Герон против векторного произведения.
+
+Запуск:
+    python -m benchmarks.bench_vertices [--size N] [--dim 2|3] [--repeat R]
+
+Вершины приходят тройками точек. Путь «по сторонам» вычисляет три длины
+(три квадратных корня) и площадь по формуле Герона (еще один корень),
+путь «по вершинам» — половину модуля векторного произведения ребер (без
+корней в 2D, один корень в 3D). Сравниваются скалярный API (создание
+объекта и area()) и пакетные функции, а также точность на вытянутых
+треугольниках относительно точной площади (Fraction).
+"""
+
+import argparse
+import math
+import random
+import time
+from array import array
+from fractions import Fraction
+
+from geometry_calculator import _backend
+from geometry_calculator.batch import triangle_areas, triangle_areas_from_vertices
+from geometry_calculator.shapes import Triangle
+
+
+def _best_of(repeat, function):
+    """Лучшее время из repeat запусков и результат последнего."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _side_columns(coords, dim):
+    """Колонки сторон |bc|, |ca|, |ab| по плоскому буферу вершин."""
+    np = _backend.get_numpy()
+    if np is not None:
+        points = np.asarray(coords).reshape(-1, 3, dim)
+        a, b, c = points[:, 0], points[:, 1], points[:, 2]
+        return [np.sqrt(((q - p) ** 2).sum(axis=1)) for p, q in ((b, c), (c, a), (a, b))]
+    columns = [array('d'), array('d'), array('d')]
+    step = 3 * dim
+    for start in range(0, len(coords), step):
+        a, b, c = (coords[start + k * dim:start + (k + 1) * dim] for k in range(3))
+        for column, (p, q) in zip(columns, ((b, c), (c, a), (a, b))):
+            column.append(math.dist(p, q))
+    return columns
+
+
+def _needle_errors(count=1000):
+    """Наибольшая относительная ошибка двух путей на вытянутых 2D треугольниках."""
+    rng = random.Random(7)
+    worst_vertices = worst_sides = 0.0
+    rejected = 0
+    for _ in range(count):
+        length = 10.0 ** rng.uniform(1, 4)
+        height = 10.0 ** rng.uniform(-8, -3)
+        a, b, c = (0.0, 0.0), (length, 1.0), (2 * length, 2.0 + height)
+        exact = abs(Fraction(b[0]) * Fraction(c[1]) - Fraction(c[0]) * Fraction(b[1])) / 2
+        vertices = Triangle.from_vertices(a, b, c).area()
+        worst_vertices = max(worst_vertices, float(abs(Fraction(vertices) - exact) / exact))
+        try:
+            sides = Triangle(math.dist(b, c), math.dist(c, a), math.dist(a, b)).area()
+        except ValueError:
+            rejected += 1  # Стороны после округления не образуют треугольник
+            continue
+        worst_sides = max(worst_sides, float(abs(Fraction(sides) - exact) / exact))
+    return worst_vertices, worst_sides, rejected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10 ** 6, help="Количество треугольников")
+    parser.add_argument("--dim", type=int, choices=(2, 3), default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    coords = array('d', (rng.uniform(-1e3, 1e3) for _ in range(args.size * 3 * args.dim)))
+    points = [[tuple(coords[start + k * args.dim:start + (k + 1) * args.dim]) for k in range(3)]
+              for start in range(0, len(coords), 3 * args.dim)]
+
+    np = _backend.get_numpy()
+    print(f"Треугольников: {args.size}, {args.dim}D, "
+          f"backend: {'numpy ' + np.__version__ if np else 'pure python'}")
+
+    scalar_cases = [
+        ("Скаляр: стороны + Герон", lambda: [
+            Triangle(math.dist(b, c), math.dist(c, a), math.dist(a, b)).area()
+            for a, b, c in points]),
+        ("Скаляр: from_vertices", lambda: [
+            Triangle.from_vertices(a, b, c).area() for a, b, c in points]),
+    ]
+    batch_cases = [
+        ("Пакет: стороны + triangle_areas",
+         lambda: triangle_areas(*_side_columns(coords, args.dim))),
+        ("Пакет: triangle_areas_from_vertices",
+         lambda: triangle_areas_from_vertices(coords, dim=args.dim)),
+    ]
+    for cases in (scalar_cases, batch_cases):
+        baseline = None
+        for name, function in cases:
+            elapsed, _ = _best_of(args.repeat, function)
+            baseline = baseline or elapsed
+            print(f"{name:38s} {elapsed:8.3f} c  {args.size / elapsed / 1e6:8.2f} млн/с  "
+                  f"x{baseline / elapsed:.1f}")
+
+    worst_vertices, worst_sides, rejected = _needle_errors()
+    print(f"Вытянутые треугольники: ошибка по вершинам {worst_vertices:.1e}, "
+          f"по сторонам {worst_sides:.1e} (стороны отклонены: {rejected} из 1000)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Генератор нагрузки для сервиса площадей (geometry_calculator.service).
+
+Запуск:
+    python -m benchmarks.load_service [--connections 64] [--duration 5] [--max-batch-size 1024]
+    python -m benchmarks.load_service --target 127.0.0.1:8080
+
+Без --target сервис запускается в отдельном процессе на свободном порту.
+Каждое соединение отправляет запросы по keep-alive последовательно;
+печатаются пропускная способность, перцентили задержки и средний
+размер пакета сервиса.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import subprocess
+import sys
+import time
+
+
+def _free_port():
+    """Свободный TCP-порт на localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _random_body(rng):
+    """JSON-тело запроса со случайной валидной фигурой."""
+    if rng.random() < 0.5:
+        record = {"shape": "circle", "radius": rng.uniform(0.1, 100.0)}
+    else:
+        a, b = rng.uniform(1.0, 2.0), rng.uniform(1.0, 2.0)
+        record = {"shape": "triangle", "side_a": a, "side_b": b,
+                  "side_c": rng.uniform(abs(a - b) + 0.01, a + b - 0.01)}
+    return json.dumps(record).encode("utf-8")
+
+
+async def _exchange(reader, writer, method, path, body=b""):
+    """Один HTTP-запрос по открытому соединению; возвращает тело ответа."""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: load\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    return await reader.readexactly(length)
+
+
+async def _client(host, port, deadline, latencies, seed):
+    """Соединение, отправляющее запросы до deadline."""
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            body = _random_body(rng)
+            start = time.perf_counter()
+            await _exchange(reader, writer, "POST", "/area", body)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def _wait_for_server(host, port, timeout=10.0):
+    """Ждет, пока сервер начнет принимать соединения."""
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+
+
+async def _load(host, port, connections, duration):
+    await _wait_for_server(host, port)
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, start + duration, latencies, seed)
+                           for seed in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(host, port)
+    stats = json.loads(await _exchange(reader, writer, "GET", "/stats"))
+    writer.close()
+    return latencies, elapsed, stats
+
+
+def _percentile(ordered, fraction):
+    """Перцентиль отсортированной выборки (ближайший ранг)."""
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--target", help="host:port работающего сервиса")
+    parser.add_argument("--connections", type=int, default=64, help="Одновременных соединений")
+    parser.add_argument("--duration", type=float, default=5.0, help="Длительность нагрузки, c")
+    parser.add_argument("--max-batch-size", type=int, default=1024)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    server = None
+    if args.target:
+        host, _, port = args.target.rpartition(":")
+        port = int(port)
+    else:
+        host, port = "127.0.0.1", _free_port()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "geometry_calculator.service", "--host", host,
+             "--port", str(port), "--max-batch-size", str(args.max_batch_size),
+             "--max-wait-ms", str(args.max_wait_ms)],
+            stdout=subprocess.DEVNULL)
+    try:
+        latencies, elapsed, stats = asyncio.run(
+            _load(host, port, args.connections, args.duration))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    latencies.sort()
+    print(f"Соединений: {args.connections}, запросов: {len(latencies)}, время: {elapsed:.2f} c")
+    print(f"Пропускная способность: {len(latencies) / elapsed:,.0f} запросов/с")
+    for label, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99)):
+        print(f"  {label}: {_percentile(latencies, fraction) * 1e3:8.3f} мс")
+    print(f"Пакетов: {stats['batches']}, средний размер пакета: {stats['mean_batch_size']:.1f}, "
+          f"максимальный: {stats['largest_batch']}")
+
+
+if __name__ == "__main__":
+    main()
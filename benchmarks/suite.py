@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Набор бенчмарков geometry_calculator с сохранением результатов в JSON
+и сравнением двух прогонов.
+
+Запуск:
+    python -m benchmarks.suite run -o results.json [--sizes 1000 100000] [-k area]
+    python -m benchmarks.suite compare baseline.json results.json [--threshold 0.1]
+
+Команда compare завершается с кодом 1, если хотя бы один бенчмарк
+замедлился больше порога (относительное время на одну фигуру) или
+бенчмарк базового отчета отсутствует в текущем (пропавший бенчмарк не
+должен молча скрывать регрессию; ``--allow-missing`` — для сравнения с
+прогоном по фильтру ``-k``).
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import timeit
+from array import array
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import geometry_calculator
+from geometry_calculator import (
+    Circle, Triangle, ShapeCollection, calculate_area, calculate_areas, is_right_triangle,
+    circle_area, triangle_area, circle_areas, triangle_areas, polygon_areas, validate_triangles,
+    triangle_areas_from_vertices, measure_triangles, LiveShapeSet, encode_shapes, decode_shapes,
+    classify_triangles, AreaStats, TopAreas, reduce_areas, enable_area_cache, disable_area_cache,
+)
+from geometry_calculator import _backend
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_THRESHOLD = 0.10
+SCHEMA_VERSION = 1
+
+
+class Benchmark(NamedTuple):
+    """Описание бенчмарка: setup(size, data) возвращает функцию для замера."""
+
+    name: str
+    setup: Callable[[int, "Dataset"], Callable[[], object]]
+
+
+class Dataset(NamedTuple):
+    """Входные данные одного размера (общие для всех бенчмарков)."""
+
+    radii: array
+    side_a: array
+    side_b: array
+    side_c: array
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str):
+    """Декоратор регистрации бенчмарка в наборе."""
+    def decorator(setup):
+        BENCHMARKS.append(Benchmark(name, setup))
+        return setup
+    return decorator
+
+
+def make_dataset(size: int, seed: int = 42) -> Dataset:
+    """Генерирует радиусы и стороны валидных треугольников."""
+    rng = random.Random(seed)
+    radii = array('d', (rng.uniform(0.1, 100.0) for _ in range(size)))
+    side_a, side_b, side_c = array('d'), array('d'), array('d')
+    for _ in range(size):
+        a, b = rng.uniform(1.0, 2.0), rng.uniform(1.0, 2.0)
+        side_a.append(a)
+        side_b.append(b)
+        side_c.append(rng.uniform(abs(a - b) + 0.01, a + b - 0.01))
+    return Dataset(radii, side_a, side_b, side_c)
+
+
+def _triples(data: Dataset):
+    """Список троек сторон."""
+    return list(zip(data.side_a, data.side_b, data.side_c))
+
+
+@benchmark("construct.circle")
+def _(size, data):
+    radii = list(data.radii)
+    return lambda: [Circle(r) for r in radii]
+
+
+@benchmark("construct.triangle")
+def _(size, data):
+    triples = _triples(data)
+    return lambda: [Triangle(a, b, c) for a, b, c in triples]
+
+
+@benchmark("area.circle")
+def _(size, data):
+    circles = [Circle(r) for r in data.radii]
+    return lambda: [circle.area() for circle in circles]
+
+
+@benchmark("area.triangle")
+def _(size, data):
+    triples = _triples(data)
+    # Новые объекты на каждом прогоне: замеряется вычисление, а не кэш экземпляра
+    return lambda: [Triangle(a, b, c).area() for a, b, c in triples]
+
+
+@benchmark("calculate_area.mixed")
+def _(size, data):
+    shapes = [Circle(r) for r in data.radii[: size // 2]]
+    shapes += [Triangle(*sides) for sides in _triples(data)[: size - len(shapes)]]
+    return lambda: [calculate_area(shape) for shape in shapes]
+
+
+@benchmark("calculate_areas.mixed")
+def _(size, data):
+    shapes = [Circle(r) for r in data.radii[: size // 2]]
+    shapes += [Triangle(*sides) for sides in _triples(data)[: size - len(shapes)]]
+    return lambda: calculate_areas(shapes)
+
+
+@benchmark("reduce_areas.stats_top_k")
+def _(size, data):
+    shapes = [Circle(r) for r in data.radii[: size // 2]]
+    shapes += [Triangle(*sides) for sides in _triples(data)[: size - len(shapes)]]
+    return lambda: reduce_areas(shapes, AreaStats(), TopAreas(10))
+
+
+@benchmark("is_right_triangle.method")
+def _(size, data):
+    triples = _triples(data)
+    return lambda: [Triangle(a, b, c).is_right_triangle() for a, b, c in triples]
+
+
+@benchmark("is_right_triangle.function")
+def _(size, data):
+    triples = _triples(data)
+    return lambda: [is_right_triangle(a, b, c) for a, b, c in triples]
+
+
+@benchmark("legacy.circle_area")
+def _(size, data):
+    radii = list(data.radii)
+    return lambda: [circle_area(r) for r in radii]
+
+
+@benchmark("legacy.triangle_area")
+def _(size, data):
+    triples = _triples(data)
+    return lambda: [triangle_area(a, b, c) for a, b, c in triples]
+
+
+def _with_area_cache(enabled: bool, function: Callable[[], object]) -> Callable[[], object]:
+    """Замер с включенным (новым на каждый прогон) или выключенным кэшем площадей."""
+    def run():
+        if enabled:
+            enable_area_cache()
+        else:
+            disable_area_cache()
+        try:
+            return function()
+        finally:
+            disable_area_cache()
+    return run
+
+
+@benchmark("legacy.circle_area.cache_off")
+def _(size, data):
+    radii = list(data.radii)
+    return _with_area_cache(False, lambda: [circle_area(r) for r in radii])
+
+
+@benchmark("legacy.triangle_area.cache_off")
+def _(size, data):
+    triples = _triples(data)
+    return _with_area_cache(False, lambda: [triangle_area(a, b, c) for a, b, c in triples])
+
+
+@benchmark("legacy.triangle_area.cache_on")
+def _(size, data):
+    triples = _triples(data)
+    # Все тройки различны: замеряются промахи, то есть накладные расходы кэша
+    return _with_area_cache(True, lambda: [triangle_area(a, b, c) for a, b, c in triples])
+
+
+@benchmark("batch.circle_areas")
+def _(size, data):
+    return lambda: circle_areas(data.radii)
+
+
+@benchmark("batch.triangle_areas")
+def _(size, data):
+    return lambda: triangle_areas(data.side_a, data.side_b, data.side_c)
+
+
+@benchmark("batch.triangle_areas.single")
+def _(size, data):
+    columns = [array('f', column) for column in (data.side_a, data.side_b, data.side_c)]
+    return lambda: triangle_areas(*columns, precision="single")
+
+
+@benchmark("batch.triangle_areas_from_vertices")
+def _(size, data):
+    # Вершины тех же треугольников: A в начале координат, B на оси x, C по теореме косинусов
+    coords = array('d')
+    for a, b, c in _triples(data):
+        x = (b * b + c * c - a * a) / (2 * c)
+        coords.extend((0.0, 0.0, c, 0.0, x, math.sqrt(max(b * b - x * x, 0.0))))
+    return lambda: triangle_areas_from_vertices(coords)
+
+
+@benchmark("batch.polygon_areas")
+def _(size, data):
+    # Восьмиугольники: по радиусу на многоугольник, вершины на окружности
+    unit = [(math.cos(k * math.pi / 4), math.sin(k * math.pi / 4)) for k in range(8)]
+    coords = array('d', (value * r for r in data.radii for vertex in unit for value in vertex))
+    offsets = array('q', range(0, 8 * size + 1, 8))
+    return lambda: polygon_areas(coords, offsets)
+
+
+@benchmark("batch.validate_triangles")
+def _(size, data):
+    return lambda: validate_triangles(data.side_a, data.side_b, data.side_c)
+
+
+@benchmark("batch.classify_triangles")
+def _(size, data):
+    return lambda: classify_triangles(data.side_a, data.side_b, data.side_c, kinds=True)
+
+
+@benchmark("batch.measure_triangles")
+def _(size, data):
+    return lambda: measure_triangles(data.side_a, data.side_b, data.side_c)
+
+
+@benchmark("collection.triangle_areas")
+def _(size, data):
+    collection = ShapeCollection.from_columns(Triangle, data.side_a, data.side_b, data.side_c)
+    return collection.areas
+
+
+@benchmark("codec.encode_shapes")
+def _(size, data):
+    shapes = [Circle(r) for r in data.radii[: size // 2]]
+    shapes += [Triangle(*sides) for sides in _triples(data)[: size - len(shapes)]]
+    return lambda: encode_shapes(shapes)
+
+
+@benchmark("codec.decode_shapes")
+def _(size, data):
+    shapes = [Circle(r) for r in data.radii[: size // 2]]
+    shapes += [Triangle(*sides) for sides in _triples(data)[: size - len(shapes)]]
+    payload = encode_shapes(shapes)
+    return lambda: decode_shapes(payload)
+
+
+@benchmark("live.update")
+def _(size, data):
+    live = LiveShapeSet(Triangle(*sides) for sides in _triples(data))
+    changes = list(zip(list(live), (Circle(r) for r in data.radii)))
+
+    def run():
+        for handle, shape in changes:
+            live.update(handle, shape)
+            live.mean_area
+    return run
+
+
+def _time(func: Callable[[], object], min_time: float, repeat: int) -> Dict[str, float]:
+    """Замеряет func: подбирает число вызовов и возвращает лучшее и медианное время."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    # autorange подбирает число вызовов на ~0.2 c; масштабируем до min_time
+    number = max(1, int(number * min_time / 0.2))
+    timings = sorted(t / number for t in timer.repeat(repeat=repeat, number=number))
+    return {"best": timings[0], "median": timings[len(timings) // 2], "number": number}
+
+
+def run(sizes=DEFAULT_SIZES, pattern: Optional[str] = None, repeat: int = 5,
+        min_time: float = 0.2, stream=sys.stdout) -> dict:
+    """
+    Выполняет бенчмарки набора.
+
+    Args:
+        sizes: Количества фигур.
+        pattern (str | None): Подстрока имени для фильтрации бенчмарков.
+        repeat (int): Количество повторов замера.
+        min_time (float): Минимальное время одного повтора в секундах.
+        stream: Поток для вывода прогресса (None — без вывода).
+
+    Returns:
+        dict: Результаты в формате JSON-отчета.
+    """
+    np = _backend.get_numpy()
+    report = {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "package_version": geometry_calculator.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "numpy": np.__version__ if np is not None else None,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": {},
+    }
+    for size in sizes:
+        data = make_dataset(size)
+        for case in BENCHMARKS:
+            if pattern and pattern not in case.name:
+                continue
+            key = f"{case.name}[{size}]"
+            timing = _time(case.setup(size, data), min_time, repeat)
+            result = {
+                "name": case.name,
+                "size": size,
+                "best_s": timing["best"],
+                "median_s": timing["median"],
+                "per_item_ns": timing["best"] / size * 1e9,
+                "number": timing["number"],
+                "repeat": repeat,
+            }
+            report["results"][key] = result
+            if stream is not None:
+                print(f"{key:<40} {result['per_item_ns']:10.1f} нс/фигура", file=stream)
+    return report
+
+
+class Change(NamedTuple):
+    """Изменение времени бенчмарка между двумя прогонами."""
+
+    key: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def comparable(self) -> bool:
+        """Базовое время положительно: отношение времен определено."""
+        return self.baseline_ns > 0
+
+    @property
+    def ratio(self) -> float:
+        """Отношение текущего времени к базовому (> 1 — замедление; NaN, если несравнимо)."""
+        return self.current_ns / self.baseline_ns if self.comparable else math.nan
+
+
+def compare(baseline: dict, current: dict) -> List[Change]:
+    """
+    Сравнивает два отчета по общим бенчмаркам.
+
+    Returns:
+        list: Изменения по каждому бенчмарку, присутствующему в обоих
+        отчетах (с нулевым базовым временем — несравнимые, см.
+        ``Change.comparable``).
+    """
+    changes = []
+    for key, result in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+        changes.append(Change(key, base["per_item_ns"], result["per_item_ns"]))
+    return changes
+
+
+def missing(baseline: dict, current: dict) -> List[str]:
+    """Возвращает бенчмарки базового отчета, которых нет в текущем."""
+    return [key for key in baseline["results"] if key not in current["results"]]
+
+
+def regressions(changes: List[Change], threshold: float = DEFAULT_THRESHOLD) -> List[Change]:
+    """Возвращает изменения, замедлившиеся больше чем на threshold (доля); несравнимые пропускаются."""
+    return [change for change in changes if change.comparable and change.ratio > 1 + threshold]
+
+
+def _load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as stream:
+        return json.load(stream)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Выполнить бенчмарки")
+    run_parser.add_argument("-o", "--output", help="Файл для JSON-отчета")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run_parser.add_argument("-k", "--filter", help="Подстрока имени бенчмарка")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--min-time", type=float, default=0.2,
+                            help="Минимальное время одного повтора, c")
+
+    compare_parser = commands.add_parser("compare", help="Сравнить два отчета")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="Допустимое замедление (доля, по умолчанию 0.1)")
+    compare_parser.add_argument("--allow-missing", action="store_true",
+                                help="Не считать ошибкой бенчмарки, отсутствующие в текущем отчете")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        report = run(args.sizes, args.filter, args.repeat, args.min_time)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as stream:
+                json.dump(report, stream, indent=2, ensure_ascii=False)
+        return 0
+
+    baseline, current = _load(args.baseline), _load(args.current)
+    changes = compare(baseline, current)
+    for change in changes:
+        delta = f"{(change.ratio - 1) * 100:+.1f}%" if change.comparable else "несравнимо"
+        print(f"{change.key:<40} {change.baseline_ns:10.1f} → {change.current_ns:10.1f} нс "
+              f"({delta})")
+    absent = missing(baseline, current)
+    for key in absent:
+        print(f"{key:<40} {baseline['results'][key]['per_item_ns']:10.1f} → {'—':>10} нс (отсутствует)")
+    status = 0
+    failed = regressions(changes, args.threshold)
+    if failed:
+        print(f"Регрессий больше {args.threshold:.0%}: {len(failed)}", file=sys.stderr)
+        status = 1
+    if absent and not args.allow_missing:
+        print(f"Отсутствуют в текущем отчете: {len(absent)}", file=sys.stderr)
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
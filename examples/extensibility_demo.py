@@ -4,7 +4,11 @@
 """
 
 import math
-from geometry_calculator import Shape, calculate_area
+import operator
+from array import array
+from geometry_calculator import (
+    Polygon, Shape, calculate_area, calculate_areas, register_area_kernel, register_batch_kernel
+)
 
 
 # Пример 1: Прямоугольник
@@ -71,6 +75,20 @@ class Ellipse(Shape):
         return f"Эллипс(a={self.semi_major_axis}, b={self.semi_minor_axis})"
 
 
+# Опционально: регистрация ядер площади. Скалярное ядро ускоряет
+# calculate_area(), пакетное используется колоночными API.
+def rectangle_areas(widths, heights):
+    """Пакетная площадь прямоугольников."""
+    # Колонки — numpy.ndarray (если установлен NumPy) или array('d')
+    if hasattr(widths, "__array_ufunc__"):
+        return widths * heights
+    return array('d', map(operator.mul, widths, heights))
+
+
+register_area_kernel(Rectangle, lambda rectangle: rectangle.width * rectangle.height)
+register_batch_kernel(Rectangle, ("width", "height"), rectangle_areas)
+
+
 def main():
     """Демонстрация расширяемости библиотеки."""
     
@@ -84,6 +102,8 @@ def main():
         Rectangle(2.5, 8),
         RegularHexagon(2),
         Ellipse(5, 5),  # Это круг (a = b)
+        # Произвольные многоугольники не требуют своего класса
+        Polygon([(0, 0), (3, 0), (3, 1), (1, 1), (1, 3), (0, 3)]),
     ]
     
     print("Все фигуры работают с единой функцией calculate_area():")
@@ -99,6 +119,11 @@ def main():
     
     print(f"Общая площадь всех фигур: {total_area:.6f}")
     
+    # Пакетно: прямоугольники и многоугольники считаются зарегистрированными
+    # пакетными ядрами, остальные фигуры — своим методом area()
+    areas = calculate_areas(shapes)
+    print(f"То же через calculate_areas(): {sum(areas):.6f}")
+    
     print("\n" + "=" * 60)
     print("🎯 Ключевые преимущества новой архитектуры:")
     print("✅ Добавление новой фигуры = всего лишь один новый класс")
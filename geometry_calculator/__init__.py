@@ -2,10 +2,29 @@
 Geometry Calculator - Библиотека для вычисления площадей геометрических фигур
 
 Поддерживаемые функции:
-- Circle, Triangle: Классы для представления фигур
+- Circle, Triangle, Polygon: Классы для представления фигур
+- Triangle.from_vertices, VertexTriangle: Треугольник по координатам вершин (2D/3D)
 - calculate_area: Полиморфное вычисление площади любой фигуры
 - is_right_triangle: Проверка прямоугольного треугольника
 - circle_area, triangle_area: Legacy функции (deprecated)
+- circle_areas, triangle_areas: Пакетное вычисление площадей по массивам
+- triangle_areas_from_vertices: Пакетные площади треугольников по вершинам
+- polygon_areas: Пакетные площади многоугольников по рваному массиву вершин
+- calculate_areas: Пакетное вычисление площадей разнотипных фигур
+- area_precision, set_area_precision: Режим float32 пакетных функций с погрешностью 1e-6
+- AreaStats, AreaHistogram, TopAreas, reduce_areas: Потоковые агрегаты площадей
+- validate_circles, validate_triangles: Пакетная валидация с кодами ошибок
+- classify_triangles, right_triangle_mask: Пакетная классификация треугольников с допуском
+- measure, measure_triangles, measure_circles: Совмещенные метрики фигур за один проход
+- parallel_circle_areas, parallel_triangle_areas: Пакетные функции на пуле процессов
+- threaded_circle_areas, threaded_triangle_areas: Пакетные функции на пуле потоков
+- ShapeCollection: Колоночное хранение большого количества фигур
+- LiveShapeSet: Изменяемый набор фигур с агрегатами, обновляемыми за O(1)
+- ShapeInterner, intern_circle, intern_triangle: Общие экземпляры повторяющихся фигур
+- write_store, open_store: Бинарное колоночное хранилище с чтением через mmap
+- encode_shapes, decode_shapes, decode_columns: Компактный бинарный кодек последовательностей фигур
+- enable_area_cache, disable_area_cache: Опциональный LRU-кэш площадей
+- register_area_kernel, register_batch_kernel: Реестр ядер площади по типу фигуры
 """
 
 from .shapes import (
@@ -13,6 +32,8 @@ from .shapes import (
     Shape,
     Circle,
     Triangle,
+    VertexTriangle,
+    Polygon,
     
     # Полиморфные функции
     calculate_area,
@@ -23,6 +44,126 @@ from .shapes import (
     triangle_area
 )
 
+from .registry import (
+    # Реестр ядер площади
+    BatchKernel,
+    register_area_kernel,
+    register_batch_kernel
+)
+
+from .cache import (
+    # Кэш площадей
+    AreaCache,
+    CacheStats,
+    enable_area_cache,
+    disable_area_cache,
+    get_area_cache
+)
+
+import importlib
+
+# Пакетные, параллельные и I/O подсистемы (и NumPy, который они
+# используют) загружаются при первом обращении к атрибуту (PEP 562):
+# ``import geometry_calculator`` импортирует только ядро.
+_LAZY_ATTRIBUTES = {
+    # Пакетные функции
+    'calculate_areas': 'batch',
+    'circle_areas': 'batch',
+    'triangle_areas': 'batch',
+    'triangle_areas_from_vertices': 'batch',
+    'polygon_areas': 'batch',
+    'triple_columns': 'batch',
+    
+    # Режим точности пакетных функций
+    'area_precision': 'precision',
+    'get_area_precision': 'precision',
+    'set_area_precision': 'precision',
+    
+    # Пакетная валидация
+    'ErrorCode': 'validation',
+    'ValidationResult': 'validation',
+    'validate_circles': 'validation',
+    'validate_triangles': 'validation',
+    'error_for': 'validation',
+    
+    # Потоковые агрегаты
+    'AreaStats': 'reductions',
+    'AreaHistogram': 'reductions',
+    'TopAreas': 'reductions',
+    'reduce_areas': 'reductions',
+    
+    # Пакетная классификация треугольников
+    'TriangleKind': 'classification',
+    'Classification': 'classification',
+    'classify_triangles': 'classification',
+    'right_triangle_mask': 'classification',
+    
+    # Совмещенные метрики
+    'TriangleMetrics': 'metrics',
+    'CircleMetrics': 'metrics',
+    'measure': 'metrics',
+    'measure_triangles': 'metrics',
+    'measure_circles': 'metrics',
+    
+    # Параллельные пакетные функции
+    'parallel_circle_areas': 'parallel',
+    'parallel_triangle_areas': 'parallel',
+    
+    # Пакетные функции на пуле потоков
+    'threaded_circle_areas': 'threaded',
+    'threaded_triangle_areas': 'threaded',
+    
+    # Колоночное хранение
+    'ShapeCollection': 'collection',
+    
+    # Изменяемый набор фигур с агрегатами
+    'LiveShapeSet': 'live',
+    'TypeTotals': 'live',
+    
+    # Интернирование фигур
+    'ShapeInterner': 'interning',
+    'InternStats': 'interning',
+    'intern_circle': 'interning',
+    'intern_triangle': 'interning',
+    'intern_shape': 'interning',
+    
+    # Бинарное хранилище
+    'ShapeStore': 'store',
+    'StoreWriter': 'store',
+    'open_store': 'store',
+    'write_store': 'store',
+    
+    # Бинарный кодек фигур
+    'DecodedShapes': 'codec',
+    'encode_shapes': 'codec',
+    'decode_shapes': 'codec',
+    'decode_columns': 'codec',
+}
+
+_SUBMODULES = frozenset({
+    'batch', 'cache', 'classification', 'codec', 'collection', 'instrumentation', 'interning',
+    'live', 'metrics', 'parallel', 'pipeline', 'precision', 'reductions', 'registry', 'service',
+    'shapes', 'store', 'threaded', 'validation',
+})
+
+
+def __getattr__(name):
+    """Загружает тяжелые атрибуты и подмодули при первом обращении."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
+
+
 __version__ = "2.0.0"
 __author__ = "Shipilov Dmitriy, shipilenok1@gmail.com"
 __description__ = "Библиотека для вычисления площадей геометрических фигур с поддержкой полиморфизма"
@@ -32,6 +173,8 @@ __all__ = [
     'Shape',
     'Circle', 
     'Triangle',
+    'VertexTriangle',
+    'Polygon',
     
     # Полиморфные функции
     'calculate_area',
@@ -39,5 +182,90 @@ __all__ = [
     
     # Legacy функции
     'circle_area',
-    'triangle_area'
+    'triangle_area',
+    
+    # Реестр ядер площади
+    'BatchKernel',
+    'register_area_kernel',
+    'register_batch_kernel',
+    
+    # Пакетные функции
+    'calculate_areas',
+    'circle_areas',
+    'triangle_areas',
+    'triangle_areas_from_vertices',
+    'polygon_areas',
+    'triple_columns',
+    
+    # Режим точности пакетных функций
+    'area_precision',
+    'get_area_precision',
+    'set_area_precision',
+    
+    # Пакетная валидация
+    'ErrorCode',
+    'ValidationResult',
+    'validate_circles',
+    'validate_triangles',
+    'error_for',
+    
+    # Потоковые агрегаты
+    'AreaStats',
+    'AreaHistogram',
+    'TopAreas',
+    'reduce_areas',
+    
+    # Пакетная классификация треугольников
+    'TriangleKind',
+    'Classification',
+    'classify_triangles',
+    'right_triangle_mask',
+    
+    # Совмещенные метрики
+    'TriangleMetrics',
+    'CircleMetrics',
+    'measure',
+    'measure_triangles',
+    'measure_circles',
+    
+    # Параллельные пакетные функции
+    'parallel_circle_areas',
+    'parallel_triangle_areas',
+    
+    # Пакетные функции на пуле потоков
+    'threaded_circle_areas',
+    'threaded_triangle_areas',
+    
+    # Колоночное хранение
+    'ShapeCollection',
+    
+    # Изменяемый набор фигур с агрегатами
+    'LiveShapeSet',
+    'TypeTotals',
+    
+    # Интернирование фигур
+    'ShapeInterner',
+    'InternStats',
+    'intern_circle',
+    'intern_triangle',
+    'intern_shape',
+    
+    # Бинарное хранилище
+    'ShapeStore',
+    'StoreWriter',
+    'open_store',
+    'write_store',
+    
+    # Бинарный кодек фигур
+    'DecodedShapes',
+    'encode_shapes',
+    'decode_shapes',
+    'decode_columns',
+    
+    # Кэш площадей
+    'AreaCache',
+    'CacheStats',
+    'enable_area_cache',
+    'disable_area_cache',
+    'get_area_cache'
 ] 
\ No newline at end of file
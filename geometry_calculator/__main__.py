@@ -0,0 +1,73 @@
+"""
+Командная строка geometry_calculator.
+
+Примеры:
+    python -m geometry_calculator shapes.csv -o areas.csv
+    python -m geometry_calculator --format jsonl --chunk-size 10000 < shapes.jsonl
+"""
+
+import argparse
+import io
+import sys
+
+from .pipeline import DEFAULT_CHUNK_SIZE, FORMATS, detect_format, process_stream
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Создает парсер аргументов командной строки."""
+    parser = argparse.ArgumentParser(
+        prog="python -m geometry_calculator",
+        description="Потоковое вычисление площадей фигур из CSV/JSONL",
+    )
+    parser.add_argument("input", nargs="?", default="-",
+                        help="Входной файл (по умолчанию stdin)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="Выходной файл (по умолчанию stdout)")
+    parser.add_argument("-f", "--format", choices=FORMATS,
+                        help="Формат данных (по умолчанию по расширению входного файла, иначе csv)")
+    parser.add_argument("-c", "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Записей в порции (по умолчанию {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--skip-invalid", action="store_true",
+                        help="Пропускать невалидные записи вместо ошибки")
+    return parser
+
+
+def _open(path: str, mode: str, std):
+    """Открывает файл или возвращает стандартный поток для '-'."""
+    if path == "-":
+        return std
+    return io.open(path, mode, encoding="utf-8", newline="")
+
+
+def _run(args, fmt: str) -> None:
+    """Открывает потоки, обрабатывает вход и закрывает открытые файлы."""
+    source = _open(args.input, "r", sys.stdin)
+    try:
+        destination = _open(args.output, "w", sys.stdout)
+        try:
+            process_stream(source, destination, fmt, args.chunk_size, args.skip_invalid)
+        finally:
+            if args.output != "-":
+                destination.close()
+            else:
+                destination.flush()
+    finally:
+        if args.input != "-":
+            source.close()
+
+
+def main(argv=None) -> int:
+    """Точка входа командной строки."""
+    args = build_parser().parse_args(argv)
+    fmt = args.format or (detect_format(args.input) if args.input != "-" else "csv")
+
+    try:
+        _run(args, fmt)
+    except (OSError, TypeError, ValueError) as error:
+        # OSError: вход не найден, нет прав, ошибка записи выхода
+        print(f"Ошибка: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+"""
+Выбор вычислительного backend'а для пакетной обработки.
+
+NumPy является опциональной зависимостью: если он установлен, пакетные
+функции используют векторизованные операции, иначе — чистый Python
+поверх ``array.array``.
+"""
+
+_numpy = None
+_numpy_checked = False
+
+
+def get_numpy():
+    """
+    Возвращает модуль numpy, если он доступен.
+
+    Импорт выполняется один раз при первом обращении.
+
+    Returns:
+        module | None: Модуль numpy или None, если он не установлен.
+    """
+    global _numpy, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+        _numpy_checked = True
+    return _numpy
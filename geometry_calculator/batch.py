@@ -0,0 +1,641 @@
+"""
+Пакетное (колоночное) вычисление площадей.
+
+Функции модуля принимают параметры фигур в виде непрерывных массивов
+(``numpy.ndarray``, ``array.array`` или любой объект с buffer protocol)
+и возвращают массив площадей, не создавая объектов Circle/Triangle.
+
+Используется та же математика, что и в ``Circle.area()`` и
+``Triangle.area()``, поэтому результаты совпадают побитово.
+Треугольники, заданные вершинами, передаются плоским буфером координат.
+Многоугольники передаются рваным (ragged) массивом: плоский буфер
+координат всех вершин и смещения начала каждого многоугольника.
+Входные данные не валидируются: для невалидных строк площадь равна NaN.
+"""
+
+import math
+import operator
+from array import array
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import _backend
+from .precision import DOUBLE, SINGLE, area_precision, resolve_precision
+from .registry import _area_kernels, _batch_kernels, register_area_kernel, register_batch_kernel
+from .shapes import Circle, Polygon, Shape, Triangle, VertexTriangle, _cross_area, _shoelace
+
+
+def _as_column(values: Any):
+    """
+    Приводит одномерную колонку чисел к виду, пригодному для вычислений.
+
+    При наличии NumPy возвращает ``numpy.ndarray`` dtype float64 (без
+    копирования, если данные уже в этом формате), иначе — memoryview
+    формата 'd' или ``array('d')``.
+    """
+    np = _backend.get_numpy()
+    if np is not None:
+        column = np.asarray(values, dtype=np.float64)
+        if column.ndim != 1:
+            raise ValueError("Колонка должна быть одномерным массивом")
+        return column
+
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array('d', values)
+    if view.ndim != 1:
+        raise ValueError("Колонка должна быть одномерным массивом")
+    if view.format == 'd':
+        return view
+    return array('d', view)
+
+
+def _result(values, precision: str = "double"):
+    """Упаковывает результат чистого Python в ``array('d')`` (``array('f')`` для single)."""
+    return array('f' if precision == SINGLE else 'd', values)
+
+
+# Окно масштабов режима single, в котором все промежуточные произведения формулы
+# Кахана — нормализованные float32: 16·S² >= 2**-58, сомножители <= 2**30
+_SINGLE_MAX_SIDE = 2.0 ** 28
+_SINGLE_MIN_AREA = 2.0 ** -31
+
+
+def _single_column(np, values: Any):
+    """Колонка float32 для режима single (без копирования, если уже float32)."""
+    column = np.asarray(values, dtype=np.float32)
+    if column.ndim != 1:
+        raise ValueError("Колонка должна быть одномерным массивом")
+    return column
+
+
+def triple_columns(triples: Any) -> Tuple[Any, Any, Any]:
+    """
+    Разбивает плоский массив троек сторон на три колонки без копирования.
+
+    Args:
+        triples: Массив вида [a0, b0, c0, a1, b1, c1, ...] или
+            ``numpy.ndarray`` формы (n, 3).
+
+    Returns:
+        tuple: Колонки (side_a, side_b, side_c).
+
+    Raises:
+        ValueError: Если длина массива не кратна трем.
+    """
+    np = _backend.get_numpy()
+    if np is not None:
+        flat = np.asarray(triples, dtype=np.float64).reshape(-1)
+    else:
+        flat = _as_column(triples)
+    if len(flat) % 3:
+        raise ValueError("Длина массива троек сторон должна быть кратна трем")
+    return flat[0::3], flat[1::3], flat[2::3]
+
+
+def circle_areas(radii: Any, precision: Optional[str] = None):
+    """
+    Вычисляет площади кругов по массиву радиусов.
+
+    Args:
+        radii: Одномерный массив радиусов.
+        precision (str | None): "double" (по умолчанию) или "single" —
+            float32 с относительной погрешностью не более 1e-6 (см. модуль
+            ``precision``); None — режим текущего контекста.
+
+    Returns:
+        numpy.ndarray | array.array: Массив площадей (float64, в режиме
+        single — float32). Тип результата — ``numpy.ndarray``, если
+        установлен NumPy, иначе ``array('d')``/``array('f')``.
+
+    Examples:
+        >>> list(circle_areas([1.0, 5.0]))
+        [3.141592653589793, 78.53981633974483]
+    """
+    precision = resolve_precision(precision)
+    np = _backend.get_numpy()
+    if np is not None and precision == SINGLE:
+        radii = _single_column(np, radii)
+        areas = np.empty(len(radii), dtype=np.float32)
+        with np.errstate(over='ignore', under='ignore'):
+            _circle_areas_into(np, radii, areas)
+        return areas
+
+    radii = _as_column(radii)
+    if np is not None:
+        areas = np.empty(len(radii), dtype=np.float64)
+        _circle_areas_into(np, radii, areas)
+        return areas
+
+    pi = math.pi
+    return _result([pi * r * r for r in radii], precision)
+
+
+def _circle_areas_into(np, radii, out) -> None:
+    """Площади кругов в готовый массив out (порядок операций как в Circle.area())."""
+    np.multiply(radii, out.dtype.type(math.pi), out=out)
+    out *= radii
+
+
+def _sorted_columns(side_a: Any, side_b: Any, side_c: Any):
+    """
+    Упорядочивает стороны по строкам сетью сравнений-обменов (только NumPy).
+
+    Returns:
+        tuple: Колонки (наименьшая, средняя, наибольшая сторона).
+    """
+    np = _backend.get_numpy()
+    low, high = np.minimum(side_a, side_b), np.maximum(side_a, side_b)
+    smallest, rest = np.minimum(low, side_c), np.maximum(low, side_c)
+    return smallest, np.minimum(high, rest), np.maximum(high, rest)
+
+
+# Строк в блоке формулы Кахана: промежуточные колонки блока остаются в кэше процессора
+_KAHAN_BLOCK = 8192
+
+
+def _kahan_block(np, side_a, side_b, side_c, out, large, middle, small, spare, factor) -> None:
+    """
+    Площади блока по формуле Кахана без временных массивов.
+
+    Порядок операций совпадает с ``Triangle.area()``, поэтому результаты
+    совпадают побитово.
+    """
+    np.minimum(side_a, side_b, out=small)
+    np.maximum(side_a, side_b, out=large)
+    np.maximum(small, side_c, out=spare)
+    np.minimum(small, side_c, out=small)          # c — наименьшая
+    np.minimum(large, spare, out=middle)          # b — средняя
+    np.maximum(large, spare, out=large)           # a — наибольшая
+    np.add(middle, small, out=out)
+    out += large                                  # a + (b + c)
+    np.subtract(large, middle, out=spare)         # a - b
+    np.subtract(small, spare, out=factor)
+    out *= factor                                 # * (c - (a - b))
+    np.add(small, spare, out=factor)
+    out *= factor                                 # * (c + (a - b))
+    np.subtract(middle, small, out=factor)
+    factor += large
+    out *= factor                                 # * (a + (b - c))
+    np.sqrt(out, out=out)
+    out *= 0.25
+
+
+def _triangle_areas_into(np, side_a, side_b, side_c, out) -> None:
+    """Площади треугольников в готовый массив out блоками по _KAHAN_BLOCK строк."""
+    count = len(out)
+    scratch = [np.empty(min(count, _KAHAN_BLOCK), dtype=out.dtype) for _ in range(5)]
+    with np.errstate(invalid='ignore'):
+        for start in range(0, count, _KAHAN_BLOCK):
+            stop = min(start + _KAHAN_BLOCK, count)
+            _kahan_block(np, side_a[start:stop], side_b[start:stop], side_c[start:stop],
+                         out[start:stop], *(buffer[:stop - start] for buffer in scratch))
+
+
+def _single_triangle_areas(np, side_a: Any, side_b: Any, side_c: Any):
+    """
+    Площади треугольников в режиме single (float32).
+
+    Колонки float32 считаются формулой Кахана в float32; строки вне окна
+    масштабов, где промежуточные произведения остаются нормализованными
+    float32 (наибольшая сторона > 2**28 или площадь < 2**-31), пересчитываются
+    в float64. Остальные колонки считаются в float64 и округляются до
+    float32: округление сторон вытянутого треугольника исказило бы площадь
+    сильнее допустимого.
+    """
+    columns = [np.asarray(column) for column in (side_a, side_b, side_c)]
+    if any(column.dtype != np.float32 for column in columns):
+        areas = triangle_areas(*columns, DOUBLE)
+        with np.errstate(over='ignore'):
+            return areas.astype(np.float32)
+
+    side_a, side_b, side_c = (_single_column(np, column) for column in columns)
+    if not len(side_a) == len(side_b) == len(side_c):
+        raise ValueError("Колонки сторон должны иметь одинаковую длину")
+    count = len(side_a)
+    areas = np.empty(count, dtype=np.float32)
+    scratch = [np.empty(min(count, _KAHAN_BLOCK), dtype=np.float32) for _ in range(5)]
+    unstable = []
+    with np.errstate(invalid='ignore', over='ignore', under='ignore'):
+        for start in range(0, count, _KAHAN_BLOCK):
+            stop = min(start + _KAHAN_BLOCK, count)
+            large, middle, small, spare, factor = (buffer[:stop - start] for buffer in scratch)
+            out = areas[start:stop]
+            _kahan_block(np, side_a[start:stop], side_b[start:stop], side_c[start:stop],
+                         out, large, middle, small, spare, factor)
+            # После _kahan_block в large — наибольшая сторона строки
+            mask = large > _SINGLE_MAX_SIDE
+            mask |= out < _SINGLE_MIN_AREA
+            rows = np.flatnonzero(mask)
+            if len(rows):
+                unstable.append(rows + start)
+    if unstable:
+        rows = np.concatenate(unstable)
+        exact = triangle_areas(*(column[rows].astype(np.float64)
+                                 for column in (side_a, side_b, side_c)), DOUBLE)
+        with np.errstate(over='ignore'):
+            areas[rows] = exact
+    return areas
+
+
+def triangle_areas(side_a: Any, side_b: Any, side_c: Any, precision: Optional[str] = None):
+    """
+    Вычисляет площади треугольников по формуле Герона в форме Кахана.
+
+    Та же формула и порядок операций, что в ``Triangle.area()``:
+    стороны упорядочиваются без сортировки списков, и результат точен
+    и для вырожденных («игольчатых») треугольников.
+
+    Args:
+        side_a: Одномерный массив первых сторон.
+        side_b: Одномерный массив вторых сторон.
+        side_c: Одномерный массив третьих сторон.
+        precision (str | None): "double" (по умолчанию) или "single" —
+            float32 с относительной погрешностью не более 1e-6 (см. модуль
+            ``precision``); None — режим текущего контекста.
+
+    Returns:
+        numpy.ndarray | array.array: Массив площадей (float64, в режиме
+        single — float32).
+
+    Raises:
+        ValueError: Если колонки имеют разную длину.
+
+    Examples:
+        >>> list(triangle_areas([3.0], [4.0], [5.0]))
+        [6.0]
+    """
+    precision = resolve_precision(precision)
+    np = _backend.get_numpy()
+    if np is not None and precision == SINGLE:
+        return _single_triangle_areas(np, side_a, side_b, side_c)
+
+    side_a = _as_column(side_a)
+    side_b = _as_column(side_b)
+    side_c = _as_column(side_c)
+    if not len(side_a) == len(side_b) == len(side_c):
+        raise ValueError("Колонки сторон должны иметь одинаковую длину")
+
+    if np is not None:
+        areas = np.empty(len(side_a), dtype=np.float64)
+        _triangle_areas_into(np, side_a, side_b, side_c, areas)
+        return areas
+
+    sqrt = math.sqrt
+    nan = math.nan
+    areas = []
+    append = areas.append
+    for c, b, a in zip(side_a, side_b, side_c):
+        if c > b:
+            c, b = b, c
+        if b > a:
+            b, a = a, b
+            if c > b:
+                c, b = b, c
+        product = (a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c))
+        append(0.25 * sqrt(product) if product >= 0 else nan)
+    return _result(areas, precision)
+
+
+_VERTICES_ERROR = ("Вершины должны быть плоским массивом троек точек размерности dim "
+                   "(2 или 3) или массивом формы (n, 3, dim)")
+
+
+def triangle_areas_from_vertices(coords: Any, dim: Optional[int] = None):
+    """
+    Вычисляет площади треугольников по координатам вершин.
+
+    Площадь — половина модуля векторного произведения ребер ab и ac:
+    для 2D без квадратных корней, для 3D с одним корнем на треугольник.
+    Порядок операций совпадает с ``Triangle.from_vertices(...).area()``,
+    поэтому результаты совпадают побитово. Для вырожденных треугольников
+    площадь равна нулю.
+
+    Args:
+        coords: Плоский массив [ax, ay, bx, by, cx, cy, ...] (для 3D — по
+            три координаты на точку) или ``numpy.ndarray`` формы (n, 3, dim).
+        dim (int | None): Размерность точек, 2 или 3. По умолчанию берется
+            из формы массива, для плоского массива — 2.
+
+    Returns:
+        numpy.ndarray | array.array: Массив площадей (float64).
+
+    Raises:
+        ValueError: Если размерность не 2 и не 3 или длина массива не
+            кратна 3·dim.
+
+    Examples:
+        >>> list(triangle_areas_from_vertices([0, 0, 3, 0, 0, 4]))
+        [6.0]
+        >>> list(triangle_areas_from_vertices([0, 0, 1, 3, 0, 1, 0, 4, 1], dim=3))
+        [6.0]
+    """
+    np = _backend.get_numpy()
+    if np is None:
+        coords = _as_column(coords)
+        dim = 2 if dim is None else dim
+        if dim not in (2, 3) or len(coords) % (3 * dim):
+            raise ValueError(_VERTICES_ERROR)
+        return _result([_cross_area(coords, start, dim)
+                        for start in range(0, len(coords), 3 * dim)])
+
+    coords = np.asarray(coords, dtype=np.float64)
+    if coords.ndim == 3 and coords.shape[1] == 3 and dim in (None, coords.shape[2]):
+        dim = coords.shape[2]
+    elif coords.ndim == 1:
+        dim = 2 if dim is None else dim
+    else:
+        raise ValueError(_VERTICES_ERROR)
+    if dim not in (2, 3) or coords.size % (3 * dim):
+        raise ValueError(_VERTICES_ERROR)
+
+    points = coords.reshape(-1, 3, dim)
+    edge_u = points[:, 1] - points[:, 0]
+    edge_w = points[:, 2] - points[:, 0]
+    ux, uy, wx, wy = edge_u[:, 0], edge_u[:, 1], edge_w[:, 0], edge_w[:, 1]
+    with np.errstate(invalid='ignore', over='ignore'):
+        if dim == 2:
+            areas = ux * wy
+            areas -= uy * wx
+            np.abs(areas, out=areas)
+        else:
+            uz, wz = edge_u[:, 2], edge_w[:, 2]
+            areas = uy * wz
+            areas -= uz * wy
+            areas *= areas                        # cx²
+            cross = uz * wx
+            cross -= ux * wz
+            cross *= cross
+            areas += cross                        # + cy²
+            np.multiply(ux, wy, out=cross)
+            cross -= uy * wx
+            cross *= cross
+            areas += cross                        # + cz²
+            np.sqrt(areas, out=areas)
+        areas *= 0.5
+    return areas
+
+
+def _vertex_triangle_columns(triangles) -> Tuple[Any, int]:
+    """
+    Собирает (coords, dim) для triangle_areas_from_vertices из VertexTriangle.
+
+    Если в группе есть и 2D, и 3D треугольники, 2D точки дополняются
+    нулевой координатой z: векторное произведение тогда равно (0, 0, cz),
+    и sqrt(cz·cz) == |cz| (вне переполнения и потери значимости), то есть
+    площадь не меняется.
+    """
+    data = b"".join([triangle._coords for triangle in triangles])
+    if len(data) == 72 * len(triangles):
+        dim = 3
+    elif len(data) == 48 * len(triangles):
+        dim = 2
+    else:
+        dim = 3
+        data = b"".join([triangle._coords if triangle._dim == 3
+                         else array('d', (value for start in range(0, 6, 2)
+                                          for value in (*triangle._coords[start:start + 2], 0.0)))
+                         for triangle in triangles])
+    np = _backend.get_numpy()
+    if np is not None:
+        return np.frombuffer(data, dtype=np.float64), dim
+    coords = array('d')
+    coords.frombytes(data)
+    return coords, dim
+
+
+def _polygon_offsets(offsets: Any, vertex_count: int) -> List[int]:
+    """
+    Проверяет смещения многоугольников (без NumPy).
+
+    Raises:
+        ValueError: Если смещения не неубывают от 0 до vertex_count.
+    """
+    offsets = [operator.index(offset) for offset in offsets]
+    if (not offsets or offsets[0] != 0 or offsets[-1] != vertex_count
+            or any(stop < start for start, stop in zip(offsets, offsets[1:]))):
+        raise ValueError(_OFFSETS_ERROR)
+    return offsets
+
+
+_COORDS_ERROR = "Координаты должны быть плоским массивом [x0, y0, x1, y1, ...] или массивом формы (n, 2)"
+_OFFSETS_ERROR = ("Смещения должны быть одномерным целочисленным массивом длины n + 1, "
+                  "неубывающим от 0 до количества вершин")
+
+
+def polygon_areas(coords: Any, offsets: Any):
+    """
+    Вычисляет площади многоугольников по рваному массиву вершин.
+
+    Вершины многоугольника i — пары (x, y) с номерами
+    ``offsets[i] ... offsets[i + 1] - 1`` (как в CSR-формате). С NumPy
+    формула шнурков считается одним векторным проходом по всем вершинам:
+    координаты сдвигаются к первой вершине своего многоугольника
+    (``np.repeat``), векторные произведения соседних вершин суммируются
+    по многоугольникам ``np.add.reduceat``. Слагаемые на границе двух
+    многоугольников обнуляются, поэтому значения одного многоугольника не
+    влияют на площади остальных.
+
+    Порядок суммирования ``reduceat`` отличается от последовательного,
+    поэтому площади совпадают с ``Polygon.area()`` с относительной
+    погрешностью порядка (число вершин)·2**-53 (для выпуклых и звездных
+    относительно первой вершины многоугольников); без NumPy — побитово.
+
+    Args:
+        coords: Плоский массив [x0, y0, x1, y1, ...] или массив формы (n, 2).
+        offsets: Целочисленный массив длины (количество многоугольников + 1)
+            с номерами вершин: offsets[0] == 0, offsets[-1] == n.
+
+    Returns:
+        numpy.ndarray | array.array: Массив площадей (float64); для
+        многоугольников меньше чем из трех вершин — NaN.
+
+    Raises:
+        ValueError: Если длина плоского массива нечетна или смещения невалидны.
+
+    Examples:
+        >>> list(polygon_areas([0, 0, 4, 0, 4, 3, 0, 0, 2, 0, 0, 2], [0, 3, 6]))
+        [6.0, 2.0]
+    """
+    np = _backend.get_numpy()
+    if np is None:
+        coords = _as_column(coords)
+        if len(coords) % 2:
+            raise ValueError(_COORDS_ERROR)
+        offsets = _polygon_offsets(offsets, len(coords) // 2)
+        nan = math.nan
+        return _result([_shoelace(coords, 2 * start, 2 * stop) if stop - start >= 3 else nan
+                        for start, stop in zip(offsets, offsets[1:])])
+
+    coords = np.asarray(coords, dtype=np.float64)
+    if coords.ndim == 1 and len(coords) % 2 == 0:
+        coords = coords.reshape(-1, 2)
+    elif coords.ndim != 2 or coords.shape[1] != 2:
+        raise ValueError(_COORDS_ERROR)
+    vertex_count = len(coords)
+
+    offsets = np.asarray(offsets)
+    if offsets.ndim != 1 or len(offsets) == 0 or offsets.dtype.kind not in 'iu':
+        raise ValueError(_OFFSETS_ERROR)
+    offsets = offsets.astype(np.intp, copy=False)
+    counts = np.diff(offsets)
+    if offsets[0] != 0 or offsets[-1] != vertex_count or (counts < 0).any():
+        raise ValueError(_OFFSETS_ERROR)
+
+    areas = np.full(len(counts), np.nan)
+    if vertex_count == 0:
+        return areas
+
+    # Номера первых вершин; у пустых многоугольников в конце — последняя вершина
+    starts = np.minimum(offsets[:-1], vertex_count - 1)
+    with np.errstate(invalid='ignore', over='ignore'):
+        dx = coords[:, 0] - np.repeat(coords[starts, 0], counts)
+        dy = coords[:, 1] - np.repeat(coords[starts, 1], counts)
+        cross = np.empty(vertex_count, dtype=np.float64)
+        np.multiply(dx[:-1], dy[1:], out=cross[:-1])
+        dx[1:] *= dy[:-1]
+        cross[:-1] -= dx[1:]
+        # Слагаемое последней вершины соединяет ее с первой вершиной
+        # следующего многоугольника (замыкающее ребро дает ноль)
+        cross[offsets[1:][counts > 0] - 1] = 0.0
+        sums = np.add.reduceat(cross, starts)
+    valid = counts >= 3
+    areas[valid] = 0.5 * np.abs(sums[valid])
+    return areas
+
+
+def _polygon_columns(polygons) -> Tuple[Any, Any]:
+    """
+    Собирает (coords, offsets) для polygon_areas из многоугольников.
+
+    Буферы вершин склеиваются одним ``bytes.join``, без обхода вершин в Python.
+    """
+    data = b"".join([polygon._coords for polygon in polygons])
+    np = _backend.get_numpy()
+    if np is not None:
+        counts = np.fromiter((len(polygon._coords) for polygon in polygons),
+                             np.intp, len(polygons)) // 2
+        offsets = np.zeros(len(polygons) + 1, dtype=np.intp)
+        np.cumsum(counts, out=offsets[1:])
+        return np.frombuffer(data, dtype=np.float64), offsets
+
+    coords = array('d')
+    coords.frombytes(data)
+    offsets = array('q', [0])
+    for polygon in polygons:
+        offsets.append(offsets[-1] + len(polygon._coords) // 2)
+    return coords, offsets
+
+
+def _group_areas(shape_type: type, members: List[Shape], threads: Optional[int],
+                 executor: Optional[Any]):
+    """Площади фигур одного типа: пакетным ядром или скалярным по одной."""
+    kernel = _batch_kernels.get(shape_type)
+    if kernel is not None and kernel.gather is not None:
+        return kernel.function(*kernel.gather(members))
+    if kernel is not None:
+        np = _backend.get_numpy()
+        if np is not None:
+            columns = [np.fromiter(map(attrgetter(name), members), np.float64, len(members))
+                       for name in kernel.params]
+        else:
+            columns = [array('d', map(attrgetter(name), members)) for name in kernel.params]
+        if threads is not None or executor is not None:
+            from .threaded import run_kernel
+            return run_kernel(kernel.function, columns, threads, executor=executor)
+        return kernel.function(*columns)
+
+    scalar = _area_kernels.get(shape_type)
+    if scalar is None:
+        if not issubclass(shape_type, Shape):
+            raise TypeError("Объект должен быть экземпляром класса Shape")
+        register_area_kernel(shape_type)
+        scalar = _area_kernels[shape_type]
+    return list(map(scalar, members))
+
+
+def calculate_areas(shapes: Iterable[Shape], threads: Optional[int] = None,
+                    executor: Optional[Any] = None, precision: Optional[str] = None):
+    """
+    Вычисляет площади разнотипных фигур, группируя их по типу.
+
+    Фигуры группируются по ``type(shape)``; для типов с пакетным ядром
+    (``register_batch_kernel``) параметры группы собираются в колонки и
+    считаются одним вызовом ядра, для остальных применяется скалярное
+    ядро, как в ``calculate_area``. Результаты возвращаются в порядке
+    входных фигур. Кэш площадей не используется.
+
+    Если задан threads или executor, пакетные ядра больших групп
+    выполняются на пуле потоков (см. ``threaded.run_kernel``).
+
+    В режиме точности single результат хранится в float32. Параметры
+    объектов — float64, поэтому площади считаются в float64 и
+    округляются (погрешность не более 2**-24).
+
+    Args:
+        shapes (Iterable[Shape]): Фигуры любых типов.
+        threads (int | None): Количество потоков для пакетных ядер.
+        executor (concurrent.futures.Executor | None): Готовый пул потоков.
+        precision (str | None): "double", "single" или None — режим
+            текущего контекста.
+
+    Returns:
+        numpy.ndarray | array.array: Массив площадей (float64, в режиме
+        single — float32).
+
+    Raises:
+        TypeError: Если элемент не является экземпляром Shape.
+        ValueError: Если threads неположительно или режим точности неизвестен.
+
+    Examples:
+        >>> list(calculate_areas([Circle(1), Triangle(3, 4, 5), Circle(2)]))
+        [3.141592653589793, 6.0, 12.566370614359172]
+    """
+    shapes = shapes if isinstance(shapes, (list, tuple)) else list(shapes)
+    groups: Dict[type, List[int]] = {}
+    for index, shape in enumerate(shapes):
+        shape_type = type(shape)
+        group = groups.get(shape_type)
+        if group is None:
+            group = groups[shape_type] = []
+        group.append(index)
+
+    resolved = resolve_precision(precision)
+    single = resolved == SINGLE
+    np = _backend.get_numpy()
+    if np is not None:
+        areas = np.empty(len(shapes), dtype=np.float32 if single else np.float64)
+    else:
+        typecode = 'f' if single else 'd'
+        areas = array(typecode, bytes(array(typecode).itemsize * len(shapes)))
+
+    for shape_type, indices in groups.items():
+        members = shapes if len(groups) == 1 else [shapes[i] for i in indices]
+        # Ядра выполняются в разрешенном режиме: аргумент precision важнее
+        # режима контекста
+        with area_precision(resolved):
+            group_areas = _group_areas(shape_type, members, threads, executor)
+
+        if np is not None:
+            with np.errstate(over='ignore'):
+                if len(groups) == 1:
+                    areas[:] = group_areas
+                else:
+                    areas[np.asarray(indices, dtype=np.intp)] = group_areas
+        elif len(groups) == 1:
+            if isinstance(group_areas, array) and group_areas.typecode == areas.typecode:
+                areas = group_areas
+            else:
+                areas = _result(group_areas, SINGLE if single else DOUBLE)
+        else:
+            for index, area in zip(indices, group_areas):
+                areas[index] = area
+    return areas
+
+
+register_batch_kernel(Circle, ("radius",), circle_areas)
+register_batch_kernel(Triangle, ("side_a", "side_b", "side_c"), triangle_areas)
+register_batch_kernel(VertexTriangle, ("vertices",), triangle_areas_from_vertices,
+                      _vertex_triangle_columns)
+register_batch_kernel(Polygon, ("vertices",), polygon_areas, _polygon_columns)
@@ -0,0 +1,158 @@
+"""
+Опциональный кэш площадей с вытеснением LRU.
+
+Кэш выключен по умолчанию. После ``enable_area_cache()`` функции
+``calculate_area``, ``circle_area`` и ``triangle_area`` ищут площадь по
+нормализованным параметрам фигуры (для треугольника — отсортированные
+стороны, порядок не важен) и считают ее только при промахе.
+
+Попадания не доходят до ядер реестра, поэтому для инструментации есть
+отдельная точка наблюдения: ``set_hit_observer``.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple, Optional
+
+
+DEFAULT_MAXSIZE = 4096
+
+
+class CacheStats(NamedTuple):
+    """Счетчики кэша площадей."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля попаданий среди всех обращений (0.0, если обращений не было)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class AreaCache:
+    """
+    Потокобезопасный ограниченный LRU-кэш площадей.
+
+    Examples:
+        >>> cache = AreaCache(maxsize=2)
+        >>> cache.get_or_compute(("circle", 1), lambda: 3.14)
+        3.14
+        >>> cache.stats().misses
+        1
+    """
+
+    __slots__ = ("_maxsize", "_data", "_lock", "_hits", "_misses", "_evictions")
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        Инициализация кэша.
+
+        Args:
+            maxsize (int): Максимальное количество записей.
+
+        Raises:
+            ValueError: Если maxsize неположителен.
+        """
+        if maxsize <= 0:
+            raise ValueError("Размер кэша должен быть положительным числом")
+        self._maxsize = maxsize
+        self._data: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], float]) -> float:
+        """
+        Возвращает площадь по ключу, вычисляя ее при промахе.
+
+        Исключения из compute пробрасываются, результат при этом не кэшируется.
+
+        Args:
+            key (Hashable): Нормализованные параметры фигуры.
+            compute (Callable[[], float]): Функция вычисления площади.
+
+        Returns:
+            float: Площадь фигуры.
+        """
+        with self._lock:
+            try:
+                area = self._data[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._data.move_to_end(key)
+                self._hits += 1
+                if _hit_observer is not None:
+                    _hit_observer(key)
+                return area
+
+        # Вычисление выполняется без блокировки
+        area = compute()
+
+        with self._lock:
+            self._data[key] = area
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+        return area
+
+    def stats(self) -> CacheStats:
+        """Возвращает снимок счетчиков кэша."""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions,
+                              len(self._data), self._maxsize)
+
+    def clear(self) -> None:
+        """Очищает кэш и сбрасывает счетчики."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_active_cache: Optional[AreaCache] = None
+_hit_observer: Optional[Callable[[Hashable], None]] = None
+
+
+def enable_area_cache(maxsize: int = DEFAULT_MAXSIZE) -> AreaCache:
+    """
+    Включает глобальный кэш площадей.
+
+    Args:
+        maxsize (int): Максимальное количество записей.
+
+    Returns:
+        AreaCache: Установленный кэш (для чтения статистики).
+    """
+    global _active_cache
+    _active_cache = AreaCache(maxsize)
+    return _active_cache
+
+
+def disable_area_cache() -> None:
+    """Выключает глобальный кэш площадей."""
+    global _active_cache
+    _active_cache = None
+
+
+def get_area_cache() -> Optional[AreaCache]:
+    """Возвращает активный кэш площадей или None, если кэш выключен."""
+    return _active_cache
+
+
+def set_hit_observer(observer: Optional[Callable[[Hashable], None]]) -> None:
+    """
+    Устанавливает функцию, вызываемую с ключом при каждом попадании в кэш
+    (или снимает ее при None). Ее устанавливает инструментация.
+    """
+    global _hit_observer
+    _hit_observer = observer
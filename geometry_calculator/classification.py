@@ -0,0 +1,148 @@
+"""
+Пакетная классификация треугольников: прямоугольные, остроугольные, тупоугольные.
+
+Стороны каждой строки упорядочиваются сетью из трех сравнений-обменов
+(``minimum``/``maximum`` над колонками), без сортировки списков.
+Сравнение ``c² = a² + b²`` для наибольшей стороны ``c`` ведется с
+допуском в стиле ``math.isclose``::
+
+    |c² - (a² + b²)| <= max(rel_tol * max(c², a² + b²), abs_tol)
+
+Относительный допуск корректно работает и для очень больших, и для
+очень малых сторон, в отличие от фиксированного абсолютного ``1e-10``.
+Входные данные не валидируются: для строк с NaN маска прямоугольности
+ложна, а вид треугольника не определен.
+"""
+
+from array import array
+from enum import IntEnum
+from typing import Any, NamedTuple, Optional
+
+from . import _backend
+from .batch import _as_column, _sorted_columns
+
+
+DEFAULT_REL_TOL = 1e-9
+DEFAULT_ABS_TOL = 0.0
+
+
+class TriangleKind(IntEnum):
+    """Вид треугольника по наибольшему углу."""
+
+    ACUTE = 0    # Остроугольный
+    RIGHT = 1    # Прямоугольный
+    OBTUSE = 2   # Тупоугольный
+
+
+class Classification(NamedTuple):
+    """
+    Результат пакетной классификации.
+
+    Attributes:
+        right: Маска прямоугольных треугольников (``numpy.ndarray`` bool
+            или ``array('b')``).
+        kinds: Коды ``TriangleKind`` (``numpy.ndarray`` uint8 или
+            ``array('B')``) либо None, если не запрошены.
+    """
+
+    right: Any
+    kinds: Optional[Any]
+
+
+def _check_tolerances(rel_tol: float, abs_tol: float) -> None:
+    """Проверяет, что допуски неотрицательны."""
+    if rel_tol < 0 or abs_tol < 0:
+        raise ValueError("Допуски не могут быть отрицательными")
+
+
+def _triangle_kind(lo: float, mid: float, hi: float,
+                   rel_tol: float, abs_tol: float) -> TriangleKind:
+    """Вид треугольника по упорядоченным сторонам lo <= mid <= hi."""
+    hypotenuse = hi * hi
+    legs = lo * lo + mid * mid
+    difference = hypotenuse - legs
+    if abs(difference) <= max(rel_tol * max(hypotenuse, legs), abs_tol):
+        return TriangleKind.RIGHT
+    return TriangleKind.OBTUSE if difference > 0 else TriangleKind.ACUTE
+
+
+def _classify_sorted(np, lo: Any, mid: Any, hi: Any, rel_tol: float, abs_tol: float,
+                     kinds: bool) -> Classification:
+    """Классификация по упорядоченным колонкам сторон (только NumPy)."""
+    hypotenuse = hi * hi
+    legs = lo * lo + mid * mid
+    difference = hypotenuse - legs
+    tolerance = np.maximum(rel_tol * np.maximum(hypotenuse, legs), abs_tol)
+    right = np.abs(difference) <= tolerance
+    if not kinds:
+        return Classification(right, None)
+    codes = np.where(difference > 0, np.uint8(TriangleKind.OBTUSE), np.uint8(TriangleKind.ACUTE))
+    codes[right] = TriangleKind.RIGHT
+    return Classification(right, codes)
+
+
+def classify_triangles(side_a: Any, side_b: Any, side_c: Any,
+                       rel_tol: float = DEFAULT_REL_TOL, abs_tol: float = DEFAULT_ABS_TOL,
+                       kinds: bool = False) -> Classification:
+    """
+    Классифицирует треугольники по колонкам сторон за один проход.
+
+    Args:
+        side_a: Колонка первых сторон.
+        side_b: Колонка вторых сторон.
+        side_c: Колонка третьих сторон.
+        rel_tol (float): Относительный допуск сравнения квадратов сторон.
+        abs_tol (float): Абсолютный допуск сравнения квадратов сторон.
+        kinds (bool): Вычислить также коды TriangleKind.
+
+    Returns:
+        Classification: Маска прямоугольности и (опционально) виды треугольников.
+
+    Raises:
+        ValueError: Если колонки имеют разную длину или допуск отрицателен.
+
+    Examples:
+        >>> result = classify_triangles([3, 2, 2], [4, 2, 2], [5, 2, 3.5], kinds=True)
+        >>> [bool(v) for v in result.right], [int(k) for k in result.kinds]
+        ([True, False, False], [1, 0, 2])
+    """
+    _check_tolerances(rel_tol, abs_tol)
+    side_a = _as_column(side_a)
+    side_b = _as_column(side_b)
+    side_c = _as_column(side_c)
+    if not len(side_a) == len(side_b) == len(side_c):
+        raise ValueError("Колонки сторон должны иметь одинаковую длину")
+
+    np = _backend.get_numpy()
+    if np is not None:
+        lo, mid, hi = _sorted_columns(side_a, side_b, side_c)
+        return _classify_sorted(np, lo, mid, hi, rel_tol, abs_tol, kinds)
+
+    right_mask = array('b')
+    codes = array('B') if kinds else None
+    for a, b, c in zip(side_a, side_b, side_c):
+        if a > b:
+            a, b = b, a
+        if b > c:
+            b, c = c, b
+            if a > b:
+                a, b = b, a
+        kind = _triangle_kind(a, b, c, rel_tol, abs_tol)
+        right_mask.append(kind == TriangleKind.RIGHT)
+        if codes is not None:
+            codes.append(kind)
+    return Classification(right_mask, codes)
+
+
+def right_triangle_mask(side_a: Any, side_b: Any, side_c: Any,
+                        rel_tol: float = DEFAULT_REL_TOL, abs_tol: float = DEFAULT_ABS_TOL):
+    """
+    Возвращает маску прямоугольных треугольников.
+
+    Сокращение для ``classify_triangles(...).right``.
+
+    Examples:
+        >>> [bool(v) for v in right_triangle_mask([3e20, 1], [4e20, 1], [5e20, 1])]
+        [True, False]
+    """
+    return classify_triangles(side_a, side_b, side_c, rel_tol, abs_tol).right
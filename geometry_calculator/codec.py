@@ -0,0 +1,443 @@
+"""
+Компактный бинарный кодек последовательностей фигур.
+
+Фигуры кодируются тегом типа (1 байт на фигуру) и упакованными float64
+параметрами, сгруппированными по типу в колонки — в том виде, в котором
+их принимают пакетные функции площади. Формат (little-endian):
+
+    заголовок, 24 байта:
+        magic       8s   b"GCCODEC\\0"
+        version     u16  версия формата (1)
+        sections    u16  количество секций
+        reserved    u32
+        count       u64  количество фигур
+    теги:
+        count × u8 — тег типа каждой фигуры в исходном порядке,
+        дополненные нулями до кратного 8 размера
+    секции (по одной на тег, в порядке возрастания тега):
+        tag u8, 7 байт нулей, count u64 — количество фигур секции,
+        extra u64 — количество вершин для многоугольников (иначе 0),
+        затем данные секции:
+            circle              count × f8 радиусов
+            triangle            три колонки count × f8: side_a, side_b, side_c
+            vertex_triangle_2d  count × 6 f8 — вершины подряд (ax, ay, bx, ...)
+            vertex_triangle_3d  count × 9 f8
+            polygon             (count + 1) × i8 смещений в вершинах (CSR),
+                                затем extra × 2 f8 координат
+
+Все данные выровнены на 8 байт, поэтому ``decode_columns`` отдает
+колонки как ``numpy.ndarray`` (только чтение) или ``memoryview`` поверх
+переданного буфера без копирования и разбора: декодирование стоит O(1)
+плюс проверка тегов. ``decode_shapes`` проверяет параметры теми же
+условиями, что и конструкторы фигур (круги и треугольники — пакетной
+валидацией), поэтому данные из сети безопасно декодировать.
+
+Кодируются точные типы Circle, Triangle, VertexTriangle, Polygon и
+представления ShapeCollection (как Circle/Triangle); другие наследники
+Shape — TypeError, так как их параметры кодеку неизвестны.
+"""
+
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Tuple
+
+from . import _backend
+from .batch import circle_areas, polygon_areas, triangle_areas, triangle_areas_from_vertices
+from .collection import _VIEW_TYPES
+from .validation import error_for, validate_circles, validate_triangles
+from .shapes import (
+    Circle, Polygon, Shape, Triangle, VertexTriangle,
+    _polygon_from_coords, _vertex_triangle_from_coords
+)
+
+
+MAGIC = b"GCCODEC\0"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sHHIQ")
+_SECTION = struct.Struct("<B7xQQ")
+
+TAG_CIRCLE = 1
+TAG_TRIANGLE = 2
+TAG_VERTEX_TRIANGLE_2D = 3
+TAG_VERTEX_TRIANGLE_3D = 4
+TAG_POLYGON = 5
+
+# Тег → имя секции (ключ DecodedShapes.columns)
+KINDS: Dict[int, str] = {
+    TAG_CIRCLE: "circle",
+    TAG_TRIANGLE: "triangle",
+    TAG_VERTEX_TRIANGLE_2D: "vertex_triangle_2d",
+    TAG_VERTEX_TRIANGLE_3D: "vertex_triangle_3d",
+    TAG_POLYGON: "polygon",
+}
+
+_TAGS: Dict[type, int] = {
+    Circle: TAG_CIRCLE,
+    Triangle: TAG_TRIANGLE,
+    VertexTriangle: TAG_VERTEX_TRIANGLE_2D,
+    Polygon: TAG_POLYGON,
+}
+_TAGS.update((view_type, _TAGS[shape_type]) for shape_type, view_type in _VIEW_TYPES.items())
+
+# Количество float64 на фигуру в секциях фиксированного размера
+_WIDTHS = {TAG_CIRCLE: 1, TAG_TRIANGLE: 3, TAG_VERTEX_TRIANGLE_2D: 6, TAG_VERTEX_TRIANGLE_3D: 9}
+
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+_CORRUPT_ERROR = "Данные кодека повреждены"
+
+
+def _little_endian(column: array) -> bytes:
+    """Байты колонки array в порядке little-endian."""
+    if not _NATIVE_LITTLE_ENDIAN:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _padding(size: int) -> bytes:
+    """Нули до границы 8 байт."""
+    return bytes(-size % 8)
+
+
+def _section(tag: int, members: List[Shape]) -> List[bytes]:
+    """Заголовок и данные секции одного тега."""
+    if tag == TAG_CIRCLE:
+        chunks = [_little_endian(array('d', [shape.radius for shape in members]))]
+        extra = 0
+    elif tag == TAG_TRIANGLE:
+        chunks = [_little_endian(array('d', [getattr(shape, name) for shape in members]))
+                  for name in ("side_a", "side_b", "side_c")]
+        extra = 0
+    elif tag == TAG_POLYGON:
+        offsets = array('q', [0])
+        total = 0
+        for shape in members:
+            total += len(shape._coords) // 2
+            offsets.append(total)
+        coords = b"".join([shape._coords.tobytes() for shape in members])
+        if not _NATIVE_LITTLE_ENDIAN:
+            coords = _little_endian(array('d', coords))
+        chunks = [_little_endian(offsets), coords]
+        extra = total
+    else:
+        coords = b"".join([shape._coords.tobytes() for shape in members])
+        if not _NATIVE_LITTLE_ENDIAN:
+            coords = _little_endian(array('d', coords))
+        chunks = [coords]
+        extra = 0
+    return [_SECTION.pack(tag, len(members), extra)] + chunks
+
+
+def encode_shapes(shapes: Iterable[Shape]) -> bytes:
+    """
+    Кодирует последовательность фигур в компактный бинарный формат.
+
+    Args:
+        shapes (Iterable[Shape]): Фигуры в любом сочетании поддерживаемых типов.
+
+    Returns:
+        bytes: Закодированные данные (порядок фигур сохраняется).
+
+    Raises:
+        TypeError: Если тип фигуры не поддерживается кодеком.
+
+    Examples:
+        >>> data = encode_shapes([Circle(1), Triangle(3, 4, 5)])
+        >>> len(data)
+        112
+    """
+    tags = bytearray()
+    groups: Dict[int, List[Shape]] = {}
+    tags_get = _TAGS.get
+    for shape in shapes:
+        tag = tags_get(type(shape))
+        if tag is None:
+            raise TypeError(f"Тип {type(shape).__name__} не поддерживается кодеком")
+        if tag == TAG_VERTEX_TRIANGLE_2D and shape._dim == 3:
+            tag = TAG_VERTEX_TRIANGLE_3D
+        tags.append(tag)
+        group = groups.get(tag)
+        if group is None:
+            group = groups[tag] = []
+        group.append(shape)
+
+    chunks = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(groups), 0, len(tags)),
+              bytes(tags), _padding(len(tags))]
+    for tag in sorted(groups):
+        chunks.extend(_section(tag, groups[tag]))
+    return b"".join(chunks)
+
+
+def _column(raw: memoryview, start: int, count: int, typecode: str):
+    """Колонка count значений typecode ('d' или 'q') с позиции start без копирования."""
+    stop = start + count * 8
+    if stop > len(raw):
+        raise ValueError(_CORRUPT_ERROR)
+    np = _backend.get_numpy()
+    if np is not None:
+        return np.frombuffer(raw, dtype="<f8" if typecode == 'd' else "<i8",
+                             count=count, offset=start)
+    if _NATIVE_LITTLE_ENDIAN:
+        return raw[start:stop].cast(typecode)
+    column = array(typecode, raw[start:stop].tobytes())
+    column.byteswap()
+    return column
+
+
+class DecodedShapes:
+    """
+    Результат ``decode_columns``: теги и колонки параметров по секциям.
+
+    Колонки — представления переданного буфера без копирования
+    (``numpy.ndarray`` только для чтения или ``memoryview``) в том виде,
+    в котором их принимают пакетные функции:
+
+        "circle"              (radius,)                 circle_areas
+        "triangle"            (side_a, side_b, side_c)  triangle_areas
+        "vertex_triangle_2d"  (coords,)                 triangle_areas_from_vertices(dim=2)
+        "vertex_triangle_3d"  (coords,)                 triangle_areas_from_vertices(dim=3)
+        "polygon"             (coords, offsets)         polygon_areas
+
+    Пока живы колонки, буфер не должен изменяться.
+    """
+
+    __slots__ = ("tags", "columns", "_count")
+
+    def __init__(self, tags: Any, columns: Dict[str, Tuple[Any, ...]], count: int):
+        self.tags = tags
+        self.columns = columns
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _section_areas(self, kind: str):
+        """Площади фигур секции пакетной функцией."""
+        columns = self.columns[kind]
+        if kind == "circle":
+            return circle_areas(*columns)
+        if kind == "triangle":
+            return triangle_areas(*columns)
+        if kind == "polygon":
+            return polygon_areas(*columns)
+        return triangle_areas_from_vertices(columns[0], dim=2 if kind.endswith("2d") else 3)
+
+    def areas(self):
+        """
+        Площади всех фигур в исходном порядке пакетными функциями по колонкам.
+
+        Returns:
+            numpy.ndarray | array.array: Площади (float64).
+        """
+        np = _backend.get_numpy()
+        if np is not None:
+            areas = np.empty(self._count, dtype=np.float64)
+            if len(self.columns) == 1:
+                (kind,) = self.columns
+                areas[:] = self._section_areas(kind)
+                return areas
+            tags = np.asarray(self.tags)
+            for tag, kind in KINDS.items():
+                if kind in self.columns:
+                    areas[tags == tag] = self._section_areas(kind)
+            return areas
+
+        next_of = [None] * (len(KINDS) + 1)
+        for tag, kind in KINDS.items():
+            if kind in self.columns:
+                next_of[tag] = iter(self._section_areas(kind)).__next__
+        return array('d', [next_of[tag]() for tag in self.tags.tobytes()])
+
+    def shapes(self) -> List[Shape]:
+        """
+        Создает объекты фигур в исходном порядке.
+
+        Returns:
+            List[Shape]: Фигуры в исходном порядке.
+
+        Raises:
+            ValueError: Если параметры фигуры невалидны.
+        """
+        built = {tag: _build_shapes(tag, self.columns[kind])
+                 for tag, kind in KINDS.items() if kind in self.columns}
+        if len(built) == 1:
+            (shapes,) = built.values()
+            return shapes
+        # Слияние секций по тегам: список, индексируемый тегом, и байты
+        # тегов быстрее словаря и итерации по массиву NumPy
+        next_of = [None] * (len(KINDS) + 1)
+        for tag, shapes in built.items():
+            next_of[tag] = iter(shapes).__next__
+        return [next_of[tag]() for tag in self.tags.tobytes()]
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{kind}={_section_length(kind, columns)}"
+                           for kind, columns in self.columns.items())
+        return f"DecodedShapes({self._count} фигур: {counts})"
+
+
+def _section_length(kind: str, columns: Tuple[Any, ...]) -> int:
+    """Количество фигур секции по ее колонкам."""
+    if kind == "polygon":
+        return len(columns[1]) - 1
+    if kind.startswith("vertex_triangle"):
+        return len(columns[0]) // (6 if kind.endswith("2d") else 9)
+    return len(columns[0])
+
+
+def _check(shape_type: type, validator, columns: Tuple[Any, ...]) -> None:
+    """
+    Проверяет колонки пакетной валидацией.
+
+    Raises:
+        ValueError: Исключение конструктора для первой невалидной фигуры.
+    """
+    codes = validator(*columns).codes
+    np = _backend.get_numpy()
+    if np is not None:
+        invalid = np.flatnonzero(codes)
+        if len(invalid):
+            raise error_for(shape_type, int(codes[invalid[0]]))
+        return
+    for code in codes:
+        if code:
+            raise error_for(shape_type, code)
+
+
+def _build_shapes(tag: int, columns: Tuple[Any, ...]) -> List[Shape]:
+    """Объекты фигур секции."""
+    # Круги и треугольники проверяются пакетной валидацией (те же условия,
+    # что в конструкторах) и создаются без вызова __init__
+    new, set_slot = object.__new__, object.__setattr__
+    if tag == TAG_CIRCLE:
+        _check(Circle, validate_circles, columns)
+        circles = [new(Circle) for _ in range(len(columns[0]))]
+        for circle, radius in zip(circles, columns[0].tolist()):
+            set_slot(circle, "radius", radius)
+        return circles
+    if tag == TAG_TRIANGLE:
+        _check(Triangle, validate_triangles, columns)
+        triangles = [new(Triangle) for _ in range(len(columns[0]))]
+        for triangle, a, b, c in zip(triangles, *(column.tolist() for column in columns)):
+            set_slot(triangle, "side_a", a)
+            set_slot(triangle, "side_b", b)
+            set_slot(triangle, "side_c", c)
+            set_slot(triangle, "_area", None)
+            set_slot(triangle, "_sorted_sides", None)
+        return triangles
+    if tag == TAG_POLYGON:
+        coords, offsets = columns[0], columns[1].tolist()
+        if (offsets[0] != 0 or 2 * offsets[-1] != len(coords)
+                or any(stop < start for start, stop in zip(offsets, offsets[1:]))):
+            raise ValueError(_CORRUPT_ERROR)
+        values = coords.tolist()
+        return [_polygon_from_coords(array('d', values[2 * start:2 * stop]))
+                for start, stop in zip(offsets, offsets[1:])]
+    dim = 2 if tag == TAG_VERTEX_TRIANGLE_2D else 3
+    values = columns[0].tolist()
+    step = 3 * dim
+    return [_vertex_triangle_from_coords(array('d', values[start:start + step]), dim)
+            for start in range(0, len(values), step)]
+
+
+def decode_columns(data: Any) -> DecodedShapes:
+    """
+    Декодирует данные в колонки без копирования.
+
+    Args:
+        data: bytes, bytearray, memoryview или mmap с результатом encode_shapes.
+
+    Returns:
+        DecodedShapes: Теги и колонки параметров по секциям.
+
+    Raises:
+        ValueError: Если данные повреждены или имеют неизвестный формат.
+
+    Examples:
+        >>> decoded = decode_columns(encode_shapes([Circle(1), Triangle(3, 4, 5)]))
+        >>> decoded.columns["triangle"][2].tolist()
+        [5.0]
+        >>> decoded.areas().tolist()
+        [3.141592653589793, 6.0]
+    """
+    raw = memoryview(data).cast("B")
+    if len(raw) < _HEADER.size:
+        raise ValueError(_CORRUPT_ERROR)
+    magic, version, section_count, _, count = _HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError("Данные не являются закодированными фигурами")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Неподдерживаемая версия формата: {version}")
+
+    position = _HEADER.size
+    if position + count > len(raw):
+        raise ValueError(_CORRUPT_ERROR)
+    tag_view = raw[position:position + count]
+    position += count + (-count % 8)
+
+    np = _backend.get_numpy()
+    if np is not None:
+        tags = np.frombuffer(tag_view, dtype=np.uint8)
+        present = np.bincount(tags, minlength=len(KINDS) + 1)
+    else:
+        tags = tag_view
+        present = [0] * (len(KINDS) + 1)
+        for tag in tags:
+            if tag > len(KINDS):
+                raise ValueError(_CORRUPT_ERROR)
+            present[tag] += 1
+    if len(present) > len(KINDS) + 1:
+        raise ValueError(_CORRUPT_ERROR)
+
+    columns: Dict[str, Tuple[Any, ...]] = {}
+    for _ in range(section_count):
+        if position + _SECTION.size > len(raw):
+            raise ValueError(_CORRUPT_ERROR)
+        tag, size, extra = _SECTION.unpack_from(raw, position)
+        position += _SECTION.size
+        kind = KINDS.get(tag)
+        if kind is None or kind in columns or present[tag] != size:
+            raise ValueError(_CORRUPT_ERROR)
+        if tag == TAG_POLYGON:
+            offsets = _column(raw, position, size + 1, 'q')
+            position += (size + 1) * 8
+            coords = _column(raw, position, 2 * extra, 'd')
+            position += 2 * extra * 8
+            columns[kind] = (coords, offsets)
+        elif tag == TAG_TRIANGLE:
+            section = []
+            for _ in range(3):
+                section.append(_column(raw, position, size, 'd'))
+                position += size * 8
+            columns[kind] = tuple(section)
+        else:
+            width = _WIDTHS[tag]
+            columns[kind] = (_column(raw, position, size * width, 'd'),)
+            position += size * width * 8
+    # Каждому тегу фигуры — своя секция, тег 0 не используется
+    if present[0] or any(present[tag] and kind not in columns for tag, kind in KINDS.items()):
+        raise ValueError(_CORRUPT_ERROR)
+    return DecodedShapes(tags, columns, count)
+
+
+def decode_shapes(data: Any) -> List[Shape]:
+    """
+    Декодирует данные в список фигур.
+
+    Args:
+        data: bytes, bytearray, memoryview или mmap с результатом encode_shapes.
+
+    Returns:
+        List[Shape]: Фигуры в исходном порядке.
+
+    Raises:
+        ValueError: Если данные повреждены или параметры фигур невалидны.
+
+    Examples:
+        >>> decode_shapes(encode_shapes([Circle(1), Triangle(3, 4, 5)]))
+        [Circle(radius=1.0), Triangle(side_a=3.0, side_b=4.0, side_c=5.0)]
+    """
+    return decode_columns(data).shapes()
@@ -0,0 +1,222 @@
+"""
+Колоночное хранение большого количества фигур одного типа.
+
+``ShapeCollection`` хранит параметры фигур в типизированных колонках
+``array('d')`` (8 байт на параметр) вместо отдельных объектов. По
+индексу выдаются легковесные представления (view), которые являются
+экземплярами исходного класса фигуры и поэтому работают с
+``calculate_area`` и остальным API.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, Tuple, Type
+
+from . import batch  # noqa: F401  регистрирует пакетные ядра встроенных фигур
+from .registry import batch_kernel_for
+from .shapes import Circle, Shape, Triangle, _derived, _kahan_area
+from .validation import error_for, validate_circles, validate_triangles
+
+
+# Тип фигуры → (имена колонок, пакетная функция площади, пакетная валидация)
+_LAYOUTS: Dict[type, Tuple[Tuple[str, ...], Any, Any]] = {
+    shape_type: (kernel.params, kernel.function, validator)
+    for shape_type, kernel, validator in (
+        (Circle, batch_kernel_for(Circle), validate_circles),
+        (Triangle, batch_kernel_for(Triangle), validate_triangles),
+    )
+}
+
+
+def _column_property(position: int, name: str) -> property:
+    """Создает свойство view, читающее значение из колонки коллекции."""
+    def getter(self):
+        return self._columns[position][self._index]
+    getter.__name__ = name
+    return property(getter)
+
+
+def _triangle_view_area(self) -> float:
+    return _kahan_area(self.side_a, self.side_b, self.side_c)
+
+
+def _triangle_view_sorted_sides(self) -> tuple:
+    return _derived(self.side_a, self.side_b, self.side_c)[0]
+
+
+def _triangle_view_semi_perimeter(self) -> float:
+    return _derived(self.side_a, self.side_b, self.side_c)[1]
+
+
+def _triangle_view_is_right(self) -> bool:
+    return _derived(self.side_a, self.side_b, self.side_c)[2]
+
+
+# Производные величины view считаются при каждом обращении: колонки
+# изменяемы (column() отдает сами массивы), и сохраненное значение
+# устарело бы после записи в колонку
+_UNCACHED_MEMBERS: Dict[type, Dict[str, Any]] = {
+    Triangle: {
+        "area": _triangle_view_area,
+        "is_right_triangle": _triangle_view_is_right,
+        "sorted_sides": property(_triangle_view_sorted_sides),
+        "semi_perimeter": property(_triangle_view_semi_perimeter),
+    },
+}
+
+
+def _make_view_type(shape_type: type, names: Tuple[str, ...]) -> type:
+    """Создает класс view для типа фигуры."""
+    namespace = {
+        "__slots__": ("_columns", "_index"),
+        "__doc__": f"Представление {shape_type.__name__} в ShapeCollection (только чтение).",
+    }
+    for position, name in enumerate(names):
+        namespace[name] = _column_property(position, name)
+    namespace.update(_UNCACHED_MEMBERS.get(shape_type, {}))
+    return type(f"{shape_type.__name__}View", (shape_type,), namespace)
+
+
+_VIEW_TYPES = {shape_type: _make_view_type(shape_type, layout[0])
+               for shape_type, layout in _LAYOUTS.items()}
+
+
+class ShapeCollection:
+    """
+    Коллекция фигур одного типа в колоночном представлении.
+
+    Examples:
+        >>> collection = ShapeCollection(Triangle)
+        >>> collection.append(Triangle(3, 4, 5))
+        >>> calculate_area(collection[0])
+        6.0
+    """
+
+    __slots__ = ("_shape_type", "_names", "_columns", "_area_kernel", "_validator")
+
+    def __init__(self, shape_type: Type[Shape], shapes: Iterable[Shape] = ()):
+        """
+        Инициализация коллекции.
+
+        Args:
+            shape_type (type): Тип фигур коллекции (Circle или Triangle).
+            shapes (Iterable[Shape]): Начальные фигуры.
+
+        Raises:
+            TypeError: Если тип фигур не поддерживает колоночное хранение.
+        """
+        try:
+            names, area_kernel, validator = _LAYOUTS[shape_type]
+        except KeyError:
+            raise TypeError(f"Тип {shape_type.__name__} не поддерживает колоночное хранение") from None
+        self._shape_type = shape_type
+        self._names = names
+        self._columns = tuple(array('d') for _ in names)
+        self._area_kernel = area_kernel
+        self._validator = validator
+        self.extend(shapes)
+
+    @classmethod
+    def from_columns(cls, shape_type: Type[Shape], *columns: Any) -> "ShapeCollection":
+        """
+        Создает коллекцию из колонок параметров с пакетной валидацией.
+
+        Args:
+            shape_type (type): Circle или Triangle.
+            *columns: Колонки параметров в порядке аргументов конструктора.
+
+        Returns:
+            ShapeCollection: Новая коллекция.
+
+        Raises:
+            ValueError, TypeError: Как конструктор фигуры для первой невалидной строки.
+        """
+        collection = cls(shape_type)
+        if len(columns) != len(collection._names):
+            raise TypeError(f"Ожидается колонок: {len(collection._names)}")
+        validation = collection._validator(*columns)
+        for code in validation.codes:
+            if code:
+                raise error_for(shape_type, code)
+        for target, column in zip(collection._columns, columns):
+            target.extend(array('d', column))
+        return collection
+
+    @property
+    def shape_type(self) -> type:
+        """Тип фигур коллекции."""
+        return self._shape_type
+
+    def column(self, name: str) -> array:
+        """
+        Возвращает колонку параметра (без копирования).
+
+        Args:
+            name (str): Имя параметра, например "radius" или "side_a".
+
+        Returns:
+            array: Колонка array('d').
+        """
+        try:
+            return self._columns[self._names.index(name)]
+        except ValueError:
+            raise KeyError(name) from None
+
+    @property
+    def columns(self) -> Dict[str, array]:
+        """Словарь имя параметра → колонка array('d')."""
+        return dict(zip(self._names, self._columns))
+
+    def append(self, shape: Shape) -> None:
+        """
+        Добавляет фигуру в коллекцию.
+
+        Args:
+            shape (Shape): Экземпляр типа коллекции.
+
+        Raises:
+            TypeError: Если фигура другого типа.
+        """
+        if not isinstance(shape, self._shape_type):
+            raise TypeError(f"Ожидается экземпляр {self._shape_type.__name__}")
+        for name, column in zip(self._names, self._columns):
+            column.append(getattr(shape, name))
+
+    def extend(self, shapes: Iterable[Shape]) -> None:
+        """Добавляет несколько фигур в коллекцию."""
+        for shape in shapes:
+            self.append(shape)
+
+    def areas(self):
+        """
+        Вычисляет площади всех фигур коллекции пакетной функцией.
+
+        Returns:
+            numpy.ndarray | array.array: Массив площадей.
+        """
+        return self._area_kernel(*self._columns)
+
+    def nbytes(self) -> int:
+        """Объем памяти, занимаемый колонками (в байтах)."""
+        return sum(column.itemsize * column.buffer_info()[1] for column in self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def __getitem__(self, index: int) -> Shape:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Индекс вне диапазона коллекции")
+        view = _VIEW_TYPES[self._shape_type].__new__(_VIEW_TYPES[self._shape_type])
+        # object.__setattr__: Triangle запрещает присваивание атрибутов
+        object.__setattr__(view, "_columns", self._columns)
+        object.__setattr__(view, "_index", index)
+        return view
+
+    def __iter__(self) -> Iterator[Shape]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"ShapeCollection({self._shape_type.__name__}, len={len(self)})"
@@ -0,0 +1,315 @@
+"""
+Опциональная инструментация горячих путей фигур.
+
+После ``enable()`` вызовы считаются по типу фигуры, для них строятся
+гистограммы задержек, а ошибки валидации считаются по причинам.
+Площади инструментируются в точке диспетчеризации реестра
+(``registry.set_kernel_wrapper``): обертываются скалярные ядра
+``calculate_area`` ("area") и функции пакетных ядер ``calculate_areas``
+("batch_area", один замер на вызов ядра) выбранных типов и всех их
+наследников, включая ядра, зарегистрированные до или после ``enable()``.
+Прямой вызов ``shape.area()`` не учитывается. Попадания в кэш площадей
+(``cache.enable_area_cache``) до ядра не доходят и считаются отдельно
+("area_cache_hit", без замера задержки), промахи — как вызовы "area".
+
+Конструкторы точки диспетчеризации не имеют, поэтому ``__init__``
+выбранных классов и их наследников со своим ``__init__`` (например,
+``VertexTriangle``) заменяется оберткой ("construct"). Наследники,
+объявленные после ``enable()``, так не оборачиваются: их конструкторы
+учитываются, только если они вызывают ``__init__`` базового класса.
+Фигуры, которые пакетные функции создают без конструктора (``codec``,
+``VertexTriangle`` из колонок вершин), не учитываются.
+
+``disable()`` снимает обертки, поэтому в выключенном состоянии
+накладных расходов нет вовсе.
+
+Снимок метрик — ``snapshot()``; ``export()`` передает снимок всем
+зарегистрированным экспортерам (функциям от словаря).
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from . import cache as _cache, registry
+from .shapes import Circle, Triangle
+from .validation import ErrorCode, _ERRORS
+
+
+# Верхние границы корзин гистограммы в наносекундах: 64 нс ... ~16.8 мс
+BUCKET_BOUNDS_NS: Tuple[int, ...] = tuple(2 ** power for power in range(6, 25))
+
+Exporter = Callable[[Dict[str, Any]], None]
+
+
+class LatencyHistogram:
+    """Гистограмма задержек с логарифмическими корзинами (степени двойки, нс)."""
+
+    __slots__ = ("counts", "count", "total_ns", "min_ns", "max_ns")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+
+    def record(self, elapsed_ns: int) -> None:
+        """Добавляет одно измерение."""
+        index = max(0, elapsed_ns - 1).bit_length() - 6
+        if index < 0:
+            index = 0
+        elif index > len(BUCKET_BOUNDS_NS):
+            index = len(BUCKET_BOUNDS_NS)
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if self.min_ns is None or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    def percentile(self, fraction: float) -> Optional[int]:
+        """Верхняя граница корзины, содержащей заданный перцентиль (None для пустой)."""
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS_NS, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return self.max_ns
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Словарь с корзинами и сводной статистикой."""
+        return {
+            "count": self.count,
+            "mean_ns": self.total_ns / self.count if self.count else None,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns if self.count else None,
+            "p50_ns": self.percentile(0.50),
+            "p99_ns": self.percentile(0.99),
+            "bounds_ns": list(BUCKET_BOUNDS_NS),
+            "counts": list(self.counts),
+        }
+
+
+class Recorder:
+    """Хранилище метрик инструментации (потокобезопасное)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls: Dict[Tuple[str, str], int] = {}
+        self.latency: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self.validation_failures: Dict[Tuple[str, str], int] = {}
+
+    def reset(self) -> None:
+        """Обнуляет все метрики."""
+        with self._lock:
+            self.calls.clear()
+            self.latency.clear()
+            self.validation_failures.clear()
+
+    def record_call(self, shape_name: str, operation: str, elapsed_ns: int) -> None:
+        """Учитывает вызов операции ("construct" или "area") для типа фигуры."""
+        key = (shape_name, operation)
+        with self._lock:
+            self.calls[key] = self.calls.get(key, 0) + 1
+            histogram = self.latency.get(key)
+            if histogram is None:
+                histogram = self.latency[key] = LatencyHistogram()
+            histogram.record(elapsed_ns)
+
+    def record_count(self, shape_name: str, operation: str) -> None:
+        """Учитывает вызов операции без замера задержки (попадание в кэш)."""
+        key = (shape_name, operation)
+        with self._lock:
+            self.calls[key] = self.calls.get(key, 0) + 1
+
+    def record_failure(self, shape_name: str, reason: str) -> None:
+        """Учитывает ошибку валидации конструктора."""
+        key = (shape_name, reason)
+        with self._lock:
+            self.validation_failures[key] = self.validation_failures.get(key, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Возвращает метрики в виде вложенного словаря по типам фигур."""
+        with self._lock:
+            shapes: Dict[str, Dict[str, Any]] = {}
+
+            def entry(name):
+                return shapes.setdefault(name, {"calls": {}, "latency": {}, "validation_failures": {}})
+
+            for (name, operation), count in self.calls.items():
+                entry(name)["calls"][operation] = count
+            for (name, operation), histogram in self.latency.items():
+                entry(name)["latency"][operation] = histogram.snapshot()
+            for (name, reason), count in self.validation_failures.items():
+                entry(name)["validation_failures"][reason] = count
+        return {"enabled": is_enabled(), "timestamp": time.time(), "shapes": shapes}
+
+
+_recorder = Recorder()
+_exporters: List[Exporter] = []
+# Инструментированный тип фигуры → исходный __init__ (None, если унаследован)
+_originals: Dict[type, Optional[Callable]] = {}
+# Признак выполняющегося инструментированного конструктора (по потокам)
+_constructing = threading.local()
+# Первый элемент ключа кэша площадей → тип фигуры
+_CACHE_KEY_TYPES: Dict[str, type] = {"circle": Circle, "triangle": Triangle}
+
+
+def _failure_reasons(shape_type: type) -> Dict[str, str]:
+    """Сообщение исключения конструктора → имя причины (ErrorCode)."""
+    reasons = {}
+    for base in shape_type.__mro__:
+        for code, (_, message) in _ERRORS.get(base, {}).items():
+            reasons.setdefault(message, ErrorCode(code).name)
+    return reasons
+
+
+def _wrap_init(original: Callable, reasons: Dict[str, str]) -> Callable:
+    """Обертка конструктора: задержка и причины ошибок валидации."""
+    perf_counter_ns = time.perf_counter_ns
+
+    def __init__(self, *args, **kwargs):
+        if getattr(_constructing, "active", False):
+            # Вложенный вызов (наследник вызывает __init__ базового класса):
+            # конструирование уже учитывает внешняя обертка
+            original(self, *args, **kwargs)
+            return
+        _constructing.active = True
+        start = perf_counter_ns()
+        try:
+            original(self, *args, **kwargs)
+        except (TypeError, ValueError) as error:
+            _recorder.record_failure(type(self).__name__, reasons.get(str(error), type(error).__name__))
+            raise
+        finally:
+            _constructing.active = False
+        _recorder.record_call(type(self).__name__, "construct", perf_counter_ns() - start)
+
+    __init__.__wrapped__ = original
+    __init__.__doc__ = original.__doc__
+    return __init__
+
+
+def _wrap_kernel(shape_type: type, kernel: Callable, operation: str) -> Callable:
+    """
+    Обертка ядра реестра: задержка и счетчик вызовов.
+
+    Ядра типов, не наследующих инструментированные, возвращаются без изменений.
+    """
+    if not issubclass(shape_type, tuple(_originals)):
+        return kernel
+    perf_counter_ns = time.perf_counter_ns
+    name = shape_type.__name__
+
+    def instrumented(*args):
+        start = perf_counter_ns()
+        result = kernel(*args)
+        _recorder.record_call(name, operation, perf_counter_ns() - start)
+        return result
+
+    instrumented.__wrapped__ = kernel
+    instrumented.__doc__ = kernel.__doc__
+    return instrumented
+
+
+def _record_cache_hit(key: Any) -> None:
+    """Наблюдатель кэша площадей: попадание для инструментированного типа."""
+    shape_type = _CACHE_KEY_TYPES.get(key[0]) if isinstance(key, tuple) and key else None
+    if shape_type is not None and issubclass(shape_type, tuple(_originals)):
+        _recorder.record_count(shape_type.__name__, "area_cache_hit")
+
+
+def _with_subclasses(shape_type: type) -> List[type]:
+    """Тип и все его наследники, объявленные к этому моменту."""
+    found = [shape_type]
+    for subclass in shape_type.__subclasses__():
+        found.extend(_with_subclasses(subclass))
+    return found
+
+
+def enable(shape_types: Iterable[type] = (Circle, Triangle),
+           exporter: Optional[Exporter] = None) -> None:
+    """
+    Включает инструментацию для указанных типов фигур.
+
+    Инструментируются и наследники указанных типов: площади — через
+    реестр ядер, конструкторы уже объявленных наследников со своим
+    ``__init__`` — отдельной оберткой. Повторный вызов добавляет новые
+    типы; уже инструментированные не оборачиваются повторно.
+
+    Args:
+        shape_types (Iterable[type]): Классы фигур (по умолчанию Circle и Triangle).
+        exporter (Callable | None): Дополнительный экспортер метрик.
+    """
+    added = False
+    for shape_type in shape_types:
+        for instrumented in _with_subclasses(shape_type):
+            if instrumented in _originals:
+                continue
+            original_init = instrumented.__dict__.get("__init__")
+            if instrumented is not shape_type and original_init is None:
+                # Наследник без своего __init__ вызывает обертку базового класса
+                continue
+            _originals[instrumented] = original_init
+            added = True
+            if original_init is not None:
+                instrumented.__init__ = _wrap_init(original_init, _failure_reasons(instrumented))
+    if added:
+        # Переустановка оборачивает заново исходные ядра: обертки не вкладываются
+        registry.set_kernel_wrapper(_wrap_kernel)
+        _cache.set_hit_observer(_record_cache_hit)
+    if exporter is not None:
+        add_exporter(exporter)
+
+
+def disable() -> None:
+    """Выключает инструментацию и восстанавливает исходные ядра и конструкторы."""
+    registry.set_kernel_wrapper(None)
+    _cache.set_hit_observer(None)
+    for shape_type, original_init in list(_originals.items()):
+        if original_init is not None:
+            shape_type.__init__ = original_init
+        del _originals[shape_type]
+
+
+def is_enabled() -> bool:
+    """Возвращает True, если инструментация включена хотя бы для одного типа."""
+    return bool(_originals)
+
+
+def snapshot() -> Dict[str, Any]:
+    """Возвращает снимок метрик."""
+    return _recorder.snapshot()
+
+
+def reset() -> None:
+    """Обнуляет метрики."""
+    _recorder.reset()
+
+
+def add_exporter(exporter: Exporter) -> None:
+    """Регистрирует экспортер: функцию, принимающую снимок метрик."""
+    _exporters.append(exporter)
+
+
+def remove_exporter(exporter: Exporter) -> None:
+    """Удаляет ранее зарегистрированный экспортер."""
+    _exporters.remove(exporter)
+
+
+def export() -> Dict[str, Any]:
+    """
+    Передает снимок метрик всем экспортерам.
+
+    Returns:
+        dict: Переданный снимок.
+    """
+    data = snapshot()
+    for exporter in list(_exporters):
+        exporter(data)
+    return data
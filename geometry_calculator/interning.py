@@ -0,0 +1,201 @@
+"""
+Интернирование фигур: общие экземпляры для повторяющихся параметров.
+
+``ShapeInterner`` хранит канонические экземпляры Circle и Triangle в
+таблице со слабыми ссылками на значения, ключ — нормализованные
+параметры (для треугольника — отсортированные стороны, поэтому
+конгруэнтные треугольники с разным порядком сторон дают один
+экземпляр). Фигура удаляется из таблицы, как только на нее не остается
+ссылок вне интернера. Неизменяемые фигуры (Circle, Triangle,
+VertexTriangle) хранятся как есть, остальные наследники — копией.
+
+Фигуры неизменяемы, поэтому общий экземпляр безопасно разделять.
+Память и повторная работа уменьшаются пропорционально доле дубликатов:
+на каждый уникальный набор параметров создается один объект, а площадь
+треугольника вычисляется один раз и сохраняется в экземпляре.
+"""
+
+import threading
+import weakref
+from typing import NamedTuple
+
+from .shapes import Circle, Shape, Triangle, VertexTriangle, _triangle_cache_key
+
+
+# Типы, экземпляры которых неизменяемы и хранятся в таблице без копирования
+_IMMUTABLE_TYPES = frozenset((Circle, Triangle, VertexTriangle))
+
+
+class InternStats(NamedTuple):
+    """Счетчики интернера."""
+
+    requests: int
+    hits: int
+    live: int
+
+    @property
+    def unique(self) -> int:
+        """Количество созданных канонических фигур (промахов)."""
+        return self.requests - self.hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля запросов, получивших существующий экземпляр (0.0 без запросов)."""
+        return self.hits / self.requests if self.requests else 0.0
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Запросов на одну каноническую фигуру (1.0 — дубликатов нет)."""
+        return self.requests / self.unique if self.unique else 1.0
+
+
+class ShapeInterner:
+    """
+    Потокобезопасная фабрика общих неизменяемых Circle и Triangle.
+
+    Examples:
+        >>> interner = ShapeInterner()
+        >>> interner.triangle(3, 4, 5) is interner.triangle(5, 3, 4)
+        True
+        >>> interner.stats().dedup_ratio
+        2.0
+    """
+
+    __slots__ = ("_table", "_lock", "_requests", "_hits")
+
+    def __init__(self):
+        self._table: "weakref.WeakValueDictionary[tuple, Shape]" = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._hits = 0
+
+    def _lookup(self, key: tuple, create) -> Shape:
+        """Возвращает фигуру по ключу, создавая ее вызовом create при промахе."""
+        with self._lock:
+            self._requests += 1
+            shape = self._table.get(key)
+            if shape is not None:
+                self._hits += 1
+                return shape
+            shape = create()
+            self._table[key] = shape
+            return shape
+
+    def circle(self, radius: float) -> Circle:
+        """
+        Возвращает общий круг с заданным радиусом.
+
+        Args:
+            radius (float): Радиус круга.
+
+        Returns:
+            Circle: Канонический экземпляр.
+
+        Raises:
+            TypeError, ValueError: Как у конструктора Circle.
+        """
+        if not isinstance(radius, (int, float)):
+            return Circle(radius)  # Исключение конструктора
+        return self._lookup(("circle", radius), lambda: Circle(radius))
+
+    def triangle(self, side_a: float, side_b: float, side_c: float) -> Triangle:
+        """
+        Возвращает общий треугольник, конгруэнтный заданному.
+
+        Стороны канонического экземпляра — в порядке первого запроса.
+
+        Args:
+            side_a (float): Длина первой стороны.
+            side_b (float): Длина второй стороны.
+            side_c (float): Длина третьей стороны.
+
+        Returns:
+            Triangle: Канонический экземпляр.
+
+        Raises:
+            TypeError, ValueError: Как у конструктора Triangle.
+        """
+        if not (isinstance(side_a, (int, float)) and isinstance(side_b, (int, float))
+                and isinstance(side_c, (int, float))):
+            return Triangle(side_a, side_b, side_c)  # Исключение конструктора
+        return self._lookup(_triangle_cache_key(side_a, side_b, side_c),
+                            lambda: Triangle(side_a, side_b, side_c))
+
+    def intern(self, shape: Shape) -> Shape:
+        """
+        Возвращает канонический экземпляр, равный переданной фигуре.
+
+        При промахе каноническим становится сам переданный объект, если он
+        неизменяем (Circle, Triangle, VertexTriangle), иначе — его копия,
+        восстановленная через ``__reduce__``: представление ShapeCollection
+        копируется как Circle/Triangle.
+
+        Args:
+            shape (Shape): Круг или треугольник.
+
+        Returns:
+            Shape: Канонический экземпляр.
+
+        Raises:
+            TypeError: Если фигура не является Circle или Triangle.
+        """
+        if isinstance(shape, Circle):
+            key = ("circle", shape.radius)
+        elif isinstance(shape, Triangle):
+            key = ("triangle",) + shape.sorted_sides
+        else:
+            raise TypeError("Интернирование поддерживается только для Circle и Triangle")
+        if type(shape) in _IMMUTABLE_TYPES:
+            return self._lookup(key, lambda: shape)
+        # Представление ShapeCollection читает изменяемые колонки: храним копию
+        constructor, args = shape.__reduce__()
+        return self._lookup(key, lambda: constructor(*args))
+
+    def stats(self) -> InternStats:
+        """Возвращает снимок счетчиков интернера."""
+        with self._lock:
+            return InternStats(self._requests, self._hits, len(self._table))
+
+    def clear(self) -> None:
+        """Очищает таблицу и сбрасывает счетчики (выданные фигуры остаются валидными)."""
+        with self._lock:
+            self._table.clear()
+            self._requests = self._hits = 0
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
+_default_interner = ShapeInterner()
+
+
+def get_interner() -> ShapeInterner:
+    """Возвращает общий интернер процесса."""
+    return _default_interner
+
+
+def intern_circle(radius: float) -> Circle:
+    """
+    Возвращает общий круг из интернера процесса.
+
+    Examples:
+        >>> intern_circle(2.5) is intern_circle(2.5)
+        True
+    """
+    return get_interner().circle(radius)
+
+
+def intern_triangle(side_a: float, side_b: float, side_c: float) -> Triangle:
+    """
+    Возвращает общий треугольник из интернера процесса.
+
+    Examples:
+        >>> intern_triangle(3, 4, 5) is intern_triangle(4, 5, 3)
+        True
+    """
+    return get_interner().triangle(side_a, side_b, side_c)
+
+
+def intern_shape(shape: Shape) -> Shape:
+    """Возвращает канонический экземпляр фигуры из интернера процесса."""
+    return get_interner().intern(shape)
@@ -0,0 +1,329 @@
+"""
+Изменяемый набор фигур с поддерживаемыми на лету агрегатами.
+
+``LiveShapeSet`` хранит фигуры под целочисленными дескрипторами
+(``add`` возвращает дескриптор, ``remove`` и ``update`` принимают его) и
+после каждого изменения за O(1) обновляет количество, сумму площадей,
+суммы по типам фигур и количество прямоугольных треугольников. Площадь
+фигуры вычисляется один раз при добавлении (``calculate_area``) и
+хранится рядом с фигурой, поэтому удаление и замена не пересчитывают ее.
+
+Суммы накапливаются алгоритмом Ноймайера, но длинная серия добавлений и
+удалений все равно накапливает ошибку округления (вычитание площади не
+отменяет ее прибавление побитово). Поэтому раз в ``resum_every``
+изменений (но не чаще, чем раз в ``len(self)`` изменений — амортизированно
+O(1)) суммы пересчитываются ``math.fsum`` по хранимым площадям, и
+накопленная ошибка обнуляется. ``resum()`` делает то же явно.
+
+Бесконечные и неопределенные (NaN) площади в суммы не прибавляются:
+вычесть их обратно нельзя (inf - inf — NaN). Вместо этого считается,
+сколько таких площадей каждого вида в наборе, и пока они есть, сумма
+определяется ими (NaN, если есть NaN или бесконечности разных знаков,
+иначе бесконечность) — тоже за O(1), без пересчета по всему набору.
+
+Набор не потокобезопасен: при изменении из нескольких потоков нужна
+внешняя блокировка.
+"""
+
+import math
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .shapes import Shape, Triangle, calculate_area
+
+
+DEFAULT_RESUM_EVERY = 4096
+
+_HANDLE_ERROR = "Фигура с дескриптором {!r} отсутствует в наборе"
+_RESUM_EVERY_ERROR = "Интервал пересчета должен быть положительным целым числом"
+
+
+class TypeTotals(NamedTuple):
+    """Количество и сумма площадей фигур одного типа."""
+
+    count: int
+    total_area: float
+
+
+def _non_finite_kind(area: float) -> int:
+    """Индекс вида не конечной площади в счетчике: 0 — NaN, 1 — +inf, 2 — -inf."""
+    if area != area:
+        return 0
+    return 1 if area > 0 else 2
+
+
+def _aggregate(total: float, compensation: float, non_finite: List[int]) -> float:
+    """Сумма по конечной части и счетчику не конечных площадей [NaN, +inf, -inf]."""
+    nan_count, positive, negative = non_finite
+    if nan_count or (positive and negative):
+        return math.nan
+    if positive:
+        return math.inf
+    if negative:
+        return -math.inf
+    return total + compensation
+
+
+def _neumaier(total: float, compensation: float, value: float) -> Tuple[float, float]:
+    """
+    Компенсированное сложение (Ноймайер): новые сумма и поправка.
+
+    Если сумма не конечна, поправка не меняется: с бесконечностью она
+    стала бы NaN (inf - inf) и испортила сумму после пересчета.
+    """
+    result = total + value
+    if not math.isfinite(result):
+        return result, compensation
+    if abs(total) >= abs(value):
+        compensation += (total - result) + value
+    else:
+        compensation += (value - result) + total
+    return result, compensation
+
+
+class LiveShapeSet:
+    """
+    Набор фигур с дескрипторами и агрегатами, обновляемыми за O(1).
+
+    Args:
+        shapes (Iterable[Shape], optional): Начальные фигуры.
+        resum_every (int): Минимальное количество изменений между
+            точными пересчетами сумм.
+
+    Raises:
+        ValueError: Если resum_every не положительное целое число.
+        TypeError: Если начальный элемент не является фигурой.
+
+    Examples:
+        >>> shapes = LiveShapeSet()
+        >>> handle = shapes.add(Triangle(3, 4, 5))
+        >>> _ = shapes.add(Triangle(2, 2, 2))
+        >>> shapes.right_triangle_count
+        1
+        >>> shapes.update(handle, Triangle(6, 8, 10))
+        Triangle(side_a=3, side_b=4, side_c=5)
+        >>> shapes.total_area
+        25.73205080756888
+    """
+
+    __slots__ = ("_entries", "_next_handle", "_total", "_compensation", "_non_finite",
+                 "_by_type", "_right_count", "_resum_every", "_changes")
+
+    def __init__(self, shapes: Optional[Iterable[Shape]] = None,
+                 resum_every: int = DEFAULT_RESUM_EVERY):
+        if isinstance(resum_every, bool) or not isinstance(resum_every, int) or resum_every < 1:
+            raise ValueError(_RESUM_EVERY_ERROR)
+        # дескриптор -> (фигура, площадь, прямоугольный ли треугольник)
+        self._entries: Dict[int, Tuple[Shape, float, bool]] = {}
+        self._next_handle = 1
+        self._total = 0.0
+        self._compensation = 0.0
+        # количество площадей NaN, +inf, -inf (в сумму не входят)
+        self._non_finite = [0, 0, 0]
+        # тип -> [количество, сумма, поправка Ноймайера, счетчик не конечных]
+        self._by_type: Dict[type, List[Any]] = {}
+        self._right_count = 0
+        self._resum_every = resum_every
+        self._changes = 0
+        if shapes is not None:
+            for shape in shapes:
+                self.add(shape)
+
+    def _include(self, shape: Shape, area: float, is_right: bool) -> None:
+        """Прибавляет фигуру к агрегатам."""
+        state = self._by_type.get(type(shape))
+        if state is None:
+            state = self._by_type[type(shape)] = [0, 0.0, 0.0, [0, 0, 0]]
+        state[0] += 1
+        if math.isfinite(area):
+            self._total, self._compensation = _neumaier(self._total, self._compensation, area)
+            state[1], state[2] = _neumaier(state[1], state[2], area)
+        else:
+            kind = _non_finite_kind(area)
+            self._non_finite[kind] += 1
+            state[3][kind] += 1
+        self._right_count += is_right
+
+    def _exclude(self, shape: Shape, area: float, is_right: bool) -> None:
+        """Вычитает фигуру из агрегатов."""
+        shape_type = type(shape)
+        state = self._by_type[shape_type]
+        finite = math.isfinite(area)
+        if state[0] == 1:
+            del self._by_type[shape_type]
+        else:
+            state[0] -= 1
+            if finite:
+                state[1], state[2] = _neumaier(state[1], state[2], -area)
+            else:
+                state[3][_non_finite_kind(area)] -= 1
+        if not finite:
+            self._non_finite[_non_finite_kind(area)] -= 1
+        if not self._entries:
+            # Пустой набор: сумма точно ноль, накопленная ошибка сбрасывается
+            self._total = self._compensation = 0.0
+        elif finite:
+            self._total, self._compensation = _neumaier(self._total, self._compensation, -area)
+        self._right_count -= is_right
+
+    def _changed(self) -> None:
+        """Учитывает изменение и при необходимости пересчитывает суммы."""
+        self._changes += 1
+        if self._changes >= self._resum_every and self._changes >= len(self._entries):
+            self.resum()
+
+    def add(self, shape: Shape) -> int:
+        """
+        Добавляет фигуру.
+
+        Args:
+            shape (Shape): Фигура.
+
+        Returns:
+            int: Дескриптор фигуры (дескрипторы не переиспользуются).
+
+        Raises:
+            TypeError: Если объект не является фигурой.
+        """
+        area = calculate_area(shape)
+        is_right = isinstance(shape, Triangle) and shape.is_right_triangle()
+        handle = self._next_handle
+        self._next_handle = handle + 1
+        self._entries[handle] = (shape, area, is_right)
+        self._include(shape, area, is_right)
+        self._changed()
+        return handle
+
+    def remove(self, handle: int) -> Shape:
+        """
+        Удаляет фигуру по дескриптору.
+
+        Returns:
+            Shape: Удаленная фигура.
+
+        Raises:
+            KeyError: Если дескриптора нет в наборе.
+        """
+        try:
+            entry = self._entries.pop(handle)
+        except KeyError:
+            raise KeyError(_HANDLE_ERROR.format(handle)) from None
+        self._exclude(*entry)
+        self._changed()
+        return entry[0]
+
+    def update(self, handle: int, shape: Shape) -> Shape:
+        """
+        Заменяет фигуру под дескриптором.
+
+        Args:
+            handle (int): Дескриптор заменяемой фигуры.
+            shape (Shape): Новая фигура (может быть другого типа).
+
+        Returns:
+            Shape: Прежняя фигура.
+
+        Raises:
+            KeyError: Если дескриптора нет в наборе.
+            TypeError: Если объект не является фигурой (набор не меняется).
+        """
+        if handle not in self._entries:
+            raise KeyError(_HANDLE_ERROR.format(handle))
+        area = calculate_area(shape)
+        is_right = isinstance(shape, Triangle) and shape.is_right_triangle()
+        old = self._entries[handle]
+        self._entries[handle] = (shape, area, is_right)
+        self._include(shape, area, is_right)
+        self._exclude(*old)
+        self._changed()
+        return old[0]
+
+    def resum(self) -> None:
+        """Пересчитывает все суммы точно (``math.fsum``) по хранимым площадям."""
+        by_type: Dict[type, List[Any]] = {}
+        finite: Dict[type, List[float]] = {}
+        non_finite = [0, 0, 0]
+        for shape, area, _ in self._entries.values():
+            state = by_type.get(type(shape))
+            if state is None:
+                state = by_type[type(shape)] = [0, 0.0, 0.0, [0, 0, 0]]
+                finite[type(shape)] = []
+            state[0] += 1
+            if math.isfinite(area):
+                finite[type(shape)].append(area)
+            else:
+                kind = _non_finite_kind(area)
+                non_finite[kind] += 1
+                state[3][kind] += 1
+        for shape_type, state in by_type.items():
+            state[1] = math.fsum(finite[shape_type])
+        self._by_type = by_type
+        self._total = math.fsum(area for values in finite.values() for area in values)
+        self._compensation = 0.0
+        self._non_finite = non_finite
+        self._changes = 0
+
+    @property
+    def count(self) -> int:
+        """Количество фигур."""
+        return len(self._entries)
+
+    @property
+    def total_area(self) -> float:
+        """Сумма площадей."""
+        return _aggregate(self._total, self._compensation, self._non_finite)
+
+    @property
+    def mean_area(self) -> float:
+        """Средняя площадь (NaN для пустого набора)."""
+        count = len(self._entries)
+        return self.total_area / count if count else math.nan
+
+    @property
+    def right_triangle_count(self) -> int:
+        """Количество прямоугольных треугольников."""
+        return self._right_count
+
+    def by_type(self) -> Dict[type, TypeTotals]:
+        """
+        Количество и сумма площадей по точному типу фигуры.
+
+        Returns:
+            Dict[type, TypeTotals]: Только типы, фигуры которых есть в наборе.
+        """
+        return {shape_type: TypeTotals(state[0], _aggregate(state[1], state[2], state[3]))
+                for shape_type, state in self._by_type.items()}
+
+    def area(self, handle: int) -> float:
+        """
+        Площадь фигуры, вычисленная при ее добавлении.
+
+        Raises:
+            KeyError: Если дескриптора нет в наборе.
+        """
+        try:
+            return self._entries[handle][1]
+        except KeyError:
+            raise KeyError(_HANDLE_ERROR.format(handle)) from None
+
+    def items(self) -> Iterator[Tuple[int, Shape]]:
+        """Пары (дескриптор, фигура) в порядке добавления."""
+        return ((handle, entry[0]) for handle, entry in self._entries.items())
+
+    def __getitem__(self, handle: int) -> Shape:
+        try:
+            return self._entries[handle][0]
+        except KeyError:
+            raise KeyError(_HANDLE_ERROR.format(handle)) from None
+
+    def __contains__(self, handle: Any) -> bool:
+        return handle in self._entries
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (f"LiveShapeSet(count={len(self._entries)}, total_area={self.total_area!r}, "
+                f"right_triangles={self._right_count})")
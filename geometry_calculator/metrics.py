@@ -0,0 +1,317 @@
+"""
+Совмещенное вычисление метрик фигур за один проход.
+
+Для треугольника доступны площадь, периметр, вид по наибольшему углу
+(``TriangleKind``), радиусы описанной и вписанной окружностей; для круга —
+площадь и длина окружности. Вычисляются только запрошенные метрики, а
+общие промежуточные величины (упорядоченные стороны, квадраты сторон,
+площадь для радиусов) — один раз.
+
+Пакетные функции обходят колонки блоками по ``_KAHAN_BLOCK`` строк: все
+метрики блока считаются, пока его строки в кэше процессора, вместо
+отдельного прохода по всему массиву на каждую метрику.
+
+Формулы:
+
+- площадь — форма Кахана, как в ``Triangle.area()`` (совпадает побитово);
+- периметр — ``side_a + side_b + side_c``;
+- вид — сравнение ``c²`` и ``a² + b²`` с допуском, как в
+  ``classify_triangles``;
+- R = a·b·c / (4·S), r = 2·S / P.
+"""
+
+import math
+from array import array
+from typing import Any, FrozenSet, Iterable, NamedTuple, Optional, Union
+
+from . import _backend
+from .batch import _KAHAN_BLOCK, _as_column, _kahan_block, _sorted_columns, triangle_areas
+from .classification import (
+    DEFAULT_ABS_TOL, DEFAULT_REL_TOL, _check_tolerances, _classify_sorted, _triangle_kind,
+    classify_triangles
+)
+from .precision import DOUBLE
+from .shapes import Circle, Triangle
+
+
+TRIANGLE_METRICS = ("area", "perimeter", "kind", "circumradius", "inradius")
+CIRCLE_METRICS = ("area", "circumference")
+
+# Метрики, для которых нужна площадь треугольника
+_NEEDS_AREA = frozenset({"area", "circumradius", "inradius"})
+_ALL = {TRIANGLE_METRICS: frozenset(TRIANGLE_METRICS), CIRCLE_METRICS: frozenset(CIRCLE_METRICS)}
+
+
+class TriangleMetrics(NamedTuple):
+    """
+    Метрики треугольника (или колонки метрик для пакетной функции).
+
+    Незапрошенные метрики равны None.
+
+    Attributes:
+        area: Площадь.
+        perimeter: Периметр.
+        kind: Вид ``TriangleKind`` (в пакетном режиме — коды uint8).
+        circumradius: Радиус описанной окружности.
+        inradius: Радиус вписанной окружности.
+    """
+
+    area: Optional[Any] = None
+    perimeter: Optional[Any] = None
+    kind: Optional[Any] = None
+    circumradius: Optional[Any] = None
+    inradius: Optional[Any] = None
+
+
+class CircleMetrics(NamedTuple):
+    """
+    Метрики круга (или колонки метрик для пакетной функции).
+
+    Attributes:
+        area: Площадь.
+        circumference: Длина окружности.
+    """
+
+    area: Optional[Any] = None
+    circumference: Optional[Any] = None
+
+
+def _requested(metrics: Union[None, str, Iterable[str]], available: tuple) -> FrozenSet[str]:
+    """
+    Возвращает множество запрошенных метрик (None — все доступные).
+
+    Raises:
+        ValueError: Если метрика неизвестна.
+    """
+    if metrics is None:
+        return _ALL[available]
+    if isinstance(metrics, str):
+        metrics = (metrics,)
+    wanted = frozenset(metrics)
+    unknown = wanted.difference(available)
+    if unknown:
+        raise ValueError(f"Неизвестные метрики: {', '.join(sorted(unknown))} "
+                         f"(доступны: {', '.join(available)})")
+    return wanted
+
+
+def measure(shape: Union[Circle, Triangle], metrics: Union[None, str, Iterable[str]] = None,
+            rel_tol: float = DEFAULT_REL_TOL, abs_tol: float = DEFAULT_ABS_TOL):
+    """
+    Вычисляет метрики одной фигуры.
+
+    Площадь берется из ``area()`` (и сохраняется в экземпляре), вид —
+    по ``sorted_sides`` той же проверкой, что в ``classify_triangles``.
+    Для треугольника по вершинам стороны вычисляются, только если нужны
+    запрошенным метрикам.
+
+    Args:
+        shape (Circle | Triangle): Фигура.
+        metrics (str | Iterable[str] | None): Имена метрик из
+            ``TRIANGLE_METRICS``/``CIRCLE_METRICS``; None — все.
+        rel_tol (float): Относительный допуск проверки прямого угла.
+        abs_tol (float): Абсолютный допуск проверки прямого угла.
+
+    Returns:
+        TriangleMetrics | CircleMetrics: Запись метрик; незапрошенные равны None.
+
+    Raises:
+        TypeError: Если фигура не является Circle или Triangle.
+        ValueError: Если метрика неизвестна или допуск отрицателен.
+
+    Examples:
+        >>> measure(Triangle(3, 4, 5), ("area", "kind"))
+        TriangleMetrics(area=6.0, perimeter=None, kind=<TriangleKind.RIGHT: 1>, circumradius=None, inradius=None)
+        >>> measure(Circle(1)).circumference
+        6.283185307179586
+    """
+    if isinstance(shape, Circle):
+        wanted = _requested(metrics, CIRCLE_METRICS)
+        return CircleMetrics(
+            shape.area() if "area" in wanted else None,
+            math.tau * shape.radius if "circumference" in wanted else None,
+        )
+    if not isinstance(shape, Triangle):
+        raise TypeError("Метрики поддерживаются только для Circle и Triangle")
+
+    wanted = _requested(metrics, TRIANGLE_METRICS)
+    _check_tolerances(rel_tol, abs_tol)
+    area = perimeter = kind = circumradius = inradius = None
+    if wanted & _NEEDS_AREA:
+        area = shape.area()
+    if wanted == {"area"}:
+        return TriangleMetrics(area)
+    lo, mid, hi = shape.sorted_sides
+    if "perimeter" in wanted or "inradius" in wanted:
+        perimeter = shape.side_a + shape.side_b + shape.side_c
+    if "kind" in wanted:
+        kind = _triangle_kind(lo, mid, hi, rel_tol, abs_tol)
+    if "circumradius" in wanted:
+        circumradius = lo * mid * hi / (4 * area) if area else math.inf
+    if "inradius" in wanted:
+        inradius = 2 * area / perimeter
+    return TriangleMetrics(
+        area if "area" in wanted else None,
+        perimeter if "perimeter" in wanted else None,
+        kind, circumradius, inradius,
+    )
+
+
+def _triangle_block(np, side_a, side_b, side_c, wanted, columns, scratch,
+                    rel_tol, abs_tol) -> None:
+    """
+    Метрики блока строк в колонки columns (словарь имя → срез результата).
+
+    scratch — шесть рабочих массивов длины блока.
+    """
+    hi, mid, lo, spare, factor, temporary = scratch
+    if wanted & _NEEDS_AREA:
+        # Площадь как в triangle_areas; после _kahan_block в hi, mid, lo —
+        # упорядоченные стороны, spare и factor свободны
+        area = columns.get("area", temporary)
+        _kahan_block(np, side_a, side_b, side_c, area, hi, mid, lo, spare, factor)
+    elif "kind" in wanted:
+        lo, mid, hi = _sorted_columns(side_a, side_b, side_c)
+
+    if "circumradius" in wanted:
+        out = columns["circumradius"]
+        np.multiply(lo, mid, out=out)
+        out *= hi
+        np.multiply(area, 4, out=factor)
+        out /= factor
+    if "perimeter" in wanted or "inradius" in wanted:
+        perimeter = columns.get("perimeter", spare)
+        np.add(side_a, side_b, out=perimeter)
+        perimeter += side_c
+        if "inradius" in wanted:
+            out = columns["inradius"]
+            np.multiply(area, 2, out=out)
+            out /= perimeter
+    if "kind" in wanted:
+        columns["kind"][...] = _classify_sorted(np, lo, mid, hi, rel_tol, abs_tol, True).kinds
+
+
+def measure_triangles(side_a: Any, side_b: Any, side_c: Any,
+                      metrics: Union[None, str, Iterable[str]] = None,
+                      rel_tol: float = DEFAULT_REL_TOL,
+                      abs_tol: float = DEFAULT_ABS_TOL) -> TriangleMetrics:
+    """
+    Вычисляет метрики треугольников по колонкам сторон за один проход.
+
+    Площадь совпадает с ``triangle_areas`` и ``Triangle.area()`` побитово,
+    вид — с ``classify_triangles(..., kinds=True).kinds``. Входные данные
+    не валидируются: для невалидных строк числовые метрики равны NaN.
+
+    Args:
+        side_a: Колонка первых сторон.
+        side_b: Колонка вторых сторон.
+        side_c: Колонка третьих сторон.
+        metrics (str | Iterable[str] | None): Имена метрик из
+            ``TRIANGLE_METRICS``; None — все.
+        rel_tol (float): Относительный допуск проверки прямого угла.
+        abs_tol (float): Абсолютный допуск проверки прямого угла.
+
+    Returns:
+        TriangleMetrics: Колонки запрошенных метрик (``numpy.ndarray``
+        float64, для вида — uint8; без NumPy — ``array('d')``/``array('B')``),
+        незапрошенные равны None.
+
+    Raises:
+        ValueError: Если колонки имеют разную длину, метрика неизвестна
+            или допуск отрицателен.
+
+    Examples:
+        >>> result = measure_triangles([3, 2], [4, 2], [5, 3.5], ("perimeter", "kind"))
+        >>> list(result.perimeter), [int(k) for k in result.kind]
+        ([12.0, 7.5], [1, 2])
+    """
+    wanted = _requested(metrics, TRIANGLE_METRICS)
+    _check_tolerances(rel_tol, abs_tol)
+    side_a = _as_column(side_a)
+    side_b = _as_column(side_b)
+    side_c = _as_column(side_c)
+    if not len(side_a) == len(side_b) == len(side_c):
+        raise ValueError("Колонки сторон должны иметь одинаковую длину")
+    count = len(side_a)
+
+    np = _backend.get_numpy()
+    if np is not None:
+        columns = {name: np.empty(count, dtype=np.uint8 if name == "kind" else np.float64)
+                   for name in wanted}
+        scratch = [np.empty(min(count, _KAHAN_BLOCK), dtype=np.float64) for _ in range(6)]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for start in range(0, count, _KAHAN_BLOCK):
+                stop = min(start + _KAHAN_BLOCK, count)
+                _triangle_block(np, side_a[start:stop], side_b[start:stop], side_c[start:stop],
+                                wanted, {name: column[start:stop] for name, column in columns.items()},
+                                [buffer[:stop - start] for buffer in scratch], rel_tol, abs_tol)
+        return TriangleMetrics(**columns)
+
+    # Без NumPy площади и виды считаются пакетными функциями, остальные
+    # метрики — одним циклом по строкам
+    area = triangle_areas(side_a, side_b, side_c, DOUBLE) if wanted & _NEEDS_AREA else None
+    kind = (classify_triangles(side_a, side_b, side_c, rel_tol, abs_tol, kinds=True).kinds
+            if "kind" in wanted else None)
+    perimeter = circumradius = inradius = None
+    if "perimeter" in wanted or "inradius" in wanted:
+        perimeter = array('d', [a + b + c for a, b, c in zip(side_a, side_b, side_c)])
+    if "circumradius" in wanted:
+        circumradius = array('d')
+        for a, b, c, s in zip(side_a, side_b, side_c, area):
+            lo, mid, hi = sorted((a, b, c))
+            circumradius.append(lo * mid * hi / (4 * s) if s else math.inf)
+    if "inradius" in wanted:
+        nan = math.nan
+        inradius = array('d', [2 * s / p if p else nan for s, p in zip(area, perimeter)])
+    return TriangleMetrics(
+        area if "area" in wanted else None,
+        perimeter if "perimeter" in wanted else None,
+        kind, circumradius, inradius,
+    )
+
+
+def measure_circles(radii: Any, metrics: Union[None, str, Iterable[str]] = None) -> CircleMetrics:
+    """
+    Вычисляет метрики кругов по колонке радиусов за один проход.
+
+    Площадь совпадает с ``circle_areas`` и ``Circle.area()`` побитово.
+
+    Args:
+        radii: Одномерный массив радиусов.
+        metrics (str | Iterable[str] | None): Имена метрик из
+            ``CIRCLE_METRICS``; None — все.
+
+    Returns:
+        CircleMetrics: Колонки запрошенных метрик (float64), незапрошенные равны None.
+
+    Raises:
+        ValueError: Если метрика неизвестна.
+
+    Examples:
+        >>> list(measure_circles([1.0], "circumference").circumference)
+        [6.283185307179586]
+    """
+    wanted = _requested(metrics, CIRCLE_METRICS)
+    radii = _as_column(radii)
+    count = len(radii)
+
+    np = _backend.get_numpy()
+    if np is not None:
+        area = np.empty(count, dtype=np.float64) if "area" in wanted else None
+        circumference = np.empty(count, dtype=np.float64) if "circumference" in wanted else None
+        for start in range(0, count, _KAHAN_BLOCK):
+            stop = min(start + _KAHAN_BLOCK, count)
+            block = radii[start:stop]
+            if area is not None:
+                out = area[start:stop]
+                np.multiply(block, math.pi, out=out)
+                out *= block
+            if circumference is not None:
+                np.multiply(block, math.tau, out=circumference[start:stop])
+        return CircleMetrics(area, circumference)
+
+    pi, tau = math.pi, math.tau
+    return CircleMetrics(
+        array('d', [pi * r * r for r in radii]) if "area" in wanted else None,
+        array('d', [tau * r for r in radii]) if "circumference" in wanted else None,
+    )
@@ -0,0 +1,195 @@
+"""
+Параллельное пакетное вычисление площадей на нескольких процессах.
+
+Входные колонки копируются в разделяемую память
+(``multiprocessing.shared_memory``), процессы пула обрабатывают свои
+диапазоны строк пакетными функциями и пишут площади в общий выходной
+буфер. Объекты фигур между процессами не передаются, порядок
+результатов совпадает с порядком входа. Режим точности текущего
+контекста (``precision.area_precision``) передается процессам пула, и
+результат имеет тот же тип, что и при вычислении в текущем процессе.
+"""
+
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional, Sequence
+
+from . import _backend
+from .batch import _as_column, _result, circle_areas, triangle_areas
+from .precision import SINGLE, resolve_precision
+
+
+# Меньшие входы считаются в текущем процессе: запуск пула дороже вычислений
+MIN_PARALLEL_SIZE = 100_000
+# Порций на процесс по умолчанию (балансировка нагрузки)
+CHUNKS_PER_WORKER = 4
+
+_KERNELS = {
+    "circle": circle_areas,
+    "triangle": triangle_areas,
+}
+
+_ITEM_SIZE = array('d').itemsize
+
+
+def _float_view(block, length: int) -> memoryview:
+    """Возвращает memoryview формата 'd' длины length на буфер блока."""
+    return block.buf[:length * _ITEM_SIZE].cast('d')
+
+
+def _contiguous_bytes(column) -> memoryview:
+    """Возвращает непрерывное байтовое представление колонки в float64."""
+    np = _backend.get_numpy()
+    if np is not None:
+        column = np.ascontiguousarray(column, dtype=np.float64)
+    elif not memoryview(column).c_contiguous or memoryview(column).format != 'd':
+        column = array('d', column)
+    return memoryview(column).cast('B')
+
+
+def _compute_range(kernel_name: str, precision: str, input_names: Sequence[str],
+                   output_name: str, length: int, start: int, stop: int) -> int:
+    """
+    Вычисляет площади строк [start, stop) в процессе пула.
+
+    Площади режима single пишутся в общий буфер float64 без потерь
+    (float32 точно представим в float64).
+
+    Returns:
+        int: Количество обработанных строк.
+    """
+    from multiprocessing import shared_memory
+
+    blocks = [shared_memory.SharedMemory(name=name) for name in input_names]
+    output = shared_memory.SharedMemory(name=output_name)
+    try:
+        views = [_float_view(block, length) for block in blocks]
+        out_view = _float_view(output, length)
+        try:
+            result = _KERNELS[kernel_name](*[view[start:stop] for view in views],
+                                           precision=precision)
+            out_view[start:stop] = _contiguous_bytes(result).cast('d')
+            del result
+        finally:
+            for view in views:
+                view.release()
+            out_view.release()
+    finally:
+        for block in blocks:
+            block.close()
+        output.close()
+    return stop - start
+
+
+def _ranges(length: int, workers: int, chunk_size: Optional[int]) -> List[range]:
+    """Разбивает [0, length) на диапазоны для процессов пула."""
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(length / (workers * CHUNKS_PER_WORKER)))
+    return [range(start, min(start + chunk_size, length))
+            for start in range(0, length, chunk_size)]
+
+
+def _to_shared(column, shared_memory):
+    """Копирует колонку float64 в новый блок разделяемой памяти."""
+    block = shared_memory.SharedMemory(create=True, size=max(1, len(column) * _ITEM_SIZE))
+    view = _float_view(block, len(column))
+    try:
+        view[:] = _contiguous_bytes(column).cast('d')
+    finally:
+        view.release()
+    return block
+
+
+def _run(kernel_name: str, columns: List[Any], workers: Optional[int],
+         chunk_size: Optional[int]):
+    """Общая часть параллельных функций."""
+    from multiprocessing import shared_memory
+
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным числом")
+    if workers is not None and workers <= 0:
+        raise ValueError("Количество процессов должно быть положительным числом")
+
+    columns = [_as_column(column) for column in columns]
+    length = len(columns[0])
+    if any(len(column) != length for column in columns):
+        raise ValueError("Колонки сторон должны иметь одинаковую длину")
+
+    precision = resolve_precision()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or length < MIN_PARALLEL_SIZE:
+        return _KERNELS[kernel_name](*columns, precision=precision)
+
+    blocks = []
+    try:
+        for column in columns:
+            blocks.append(_to_shared(column, shared_memory))
+        output = shared_memory.SharedMemory(create=True, size=length * _ITEM_SIZE)
+        blocks.append(output)
+
+        input_names = [block.name for block in blocks[:-1]]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_compute_range, kernel_name, precision, input_names,
+                                       output.name, length, part.start, part.stop)
+                       for part in _ranges(length, workers, chunk_size)]
+            for future in futures:
+                future.result()
+
+        result_bytes = bytes(output.buf[:length * _ITEM_SIZE])
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    np = _backend.get_numpy()
+    if np is not None:
+        areas = np.frombuffer(result_bytes, dtype=np.float64)
+        return areas.astype(np.float32) if precision == SINGLE else areas.copy()
+    result = array('d')
+    result.frombytes(result_bytes)
+    return _result(result, precision) if precision == SINGLE else result
+
+
+def parallel_circle_areas(radii: Any, workers: Optional[int] = None,
+                          chunk_size: Optional[int] = None):
+    """
+    Вычисляет площади кругов на пуле процессов.
+
+    Args:
+        radii: Одномерный массив радиусов.
+        workers (int | None): Количество процессов (по умолчанию os.cpu_count()).
+        chunk_size (int | None): Строк в одной задаче пула
+            (по умолчанию len / (workers * CHUNKS_PER_WORKER)).
+
+    Returns:
+        numpy.ndarray | array.array: Массив площадей, как у circle_areas().
+
+    Raises:
+        ValueError: Если workers или chunk_size неположительны.
+    """
+    return _run("circle", [radii], workers, chunk_size)
+
+
+def parallel_triangle_areas(side_a: Any, side_b: Any, side_c: Any,
+                            workers: Optional[int] = None,
+                            chunk_size: Optional[int] = None):
+    """
+    Вычисляет площади треугольников на пуле процессов.
+
+    Args:
+        side_a: Колонка первых сторон.
+        side_b: Колонка вторых сторон.
+        side_c: Колонка третьих сторон.
+        workers (int | None): Количество процессов (по умолчанию os.cpu_count()).
+        chunk_size (int | None): Строк в одной задаче пула.
+
+    Returns:
+        numpy.ndarray | array.array: Массив площадей, как у triangle_areas().
+
+    Raises:
+        ValueError: Если колонки имеют разную длину, workers или chunk_size
+            неположительны.
+    """
+    return _run("triangle", [side_a, side_b, side_c], workers, chunk_size)
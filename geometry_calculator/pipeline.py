@@ -0,0 +1,301 @@
+"""
+Потоковая обработка файлов с фигурами (CSV и JSONL).
+
+Записи читаются порциями по ``chunk_size`` строк, каждая порция
+валидируется и считается пакетными функциями, результат сразу
+записывается в выходной поток. Потребление памяти не зависит от размера
+входного файла.
+
+Формат записи: поле ``shape`` (``circle`` или ``triangle``) и параметры
+``radius`` либо ``side_a``, ``side_b``, ``side_c``. В выходной поток
+записывается исходная запись с добавленным полем ``area``.
+"""
+
+import csv
+import io
+import json
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from .batch import circle_areas, triangle_areas
+from .precision import DOUBLE
+from .shapes import Circle, Triangle
+from .validation import ErrorCode, error_for, validate_circles, validate_triangles
+
+
+DEFAULT_CHUNK_SIZE = 65536
+FORMATS = ("csv", "jsonl")
+
+CSV_FIELDS = ["shape", "radius", "side_a", "side_b", "side_c"]
+
+_RECORD_TYPE_ERROR = "Запись должна быть JSON-объектом"
+_UNKNOWN_KIND_ERROR = "Неизвестный тип фигуры: {!r}"
+_JSON_ERROR = "Некорректный JSON: {}"
+
+# Тип фигуры → (класс, имена параметров)
+_SHAPE_KINDS = {
+    "circle": (Circle, ("radius",)),
+    "triangle": (Triangle, ("side_a", "side_b", "side_c")),
+}
+
+
+def _parse_csv_value(text: Optional[str]) -> Any:
+    """Преобразует значение CSV в число; нечисловое значение возвращается как есть."""
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return text
+
+
+def parse_record(record: Dict[str, Any],
+                 convert: Optional[Callable[[Any], Any]] = None) -> Tuple[str, Tuple[Any, ...]]:
+    """
+    Извлекает тип фигуры и параметры из записи-словаря.
+
+    Args:
+        record (dict): Запись с полем "shape" и параметрами фигуры.
+        convert (Callable | None): Преобразование значений параметров.
+
+    Returns:
+        tuple: (тип фигуры, параметры в порядке аргументов конструктора).
+
+    Raises:
+        ValueError: Если тип фигуры неизвестен.
+    """
+    kind = str(record.get("shape") or "").strip().lower()
+    _, names = _shape_kind(kind)
+    values = tuple(record.get(name) for name in names)
+    if convert is not None:
+        values = tuple(convert(value) for value in values)
+    return kind, values
+
+
+def _read_csv(stream: TextIO) -> Iterator[Tuple[Optional[str], Any, Dict[str, Any]]]:
+    """
+    Читает записи CSV: (тип фигуры, параметры, исходная запись).
+
+    Запись, которую не удалось разобрать, — (None, исключение, запись).
+    """
+    for record in csv.DictReader(stream):
+        try:
+            yield parse_record(record, _parse_csv_value) + (record,)
+        except ValueError as error:
+            yield None, error, record
+
+
+def _read_jsonl(stream: TextIO) -> Iterator[Tuple[Optional[str], Any, Any]]:
+    """
+    Читает записи JSONL: (тип фигуры, параметры, исходная запись).
+
+    Строка, которую не удалось разобрать (не JSON, не объект, неизвестный
+    тип фигуры), — (None, исключение, строка или значение).
+    """
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            yield None, ValueError(_JSON_ERROR.format(error)), line
+            continue
+        if not isinstance(record, dict):
+            yield None, ValueError(_RECORD_TYPE_ERROR), record
+            continue
+        try:
+            yield parse_record(record) + (record,)
+        except ValueError as error:
+            yield None, error, record
+
+
+def _shape_kind(kind: str):
+    """Возвращает описание типа фигуры или выбрасывает ValueError."""
+    try:
+        return _SHAPE_KINDS[kind]
+    except KeyError:
+        raise ValueError(_UNKNOWN_KIND_ERROR.format(kind)) from None
+
+
+def read_records(stream: TextIO, fmt: str = "csv"):
+    """
+    Возвращает итератор записей входного потока.
+
+    Args:
+        stream (TextIO): Текстовый поток с данными.
+        fmt (str): Формат данных: "csv" или "jsonl".
+
+    Returns:
+        Iterator: Кортежи (тип фигуры, параметры, исходная запись); для
+        записи, которую не удалось разобрать, — (None, исключение, запись).
+
+    Raises:
+        ValueError: Если формат не поддерживается.
+    """
+    if fmt == "csv":
+        return _read_csv(stream)
+    if fmt == "jsonl":
+        return _read_jsonl(stream)
+    raise ValueError(f"Неподдерживаемый формат: {fmt!r}")
+
+
+def compute_chunk_areas(chunk: List[Tuple[str, Tuple[Any, ...], Any]]
+                        ) -> List[Tuple[Optional[float], Optional[Exception]]]:
+    """
+    Вычисляет площади для порции записей, группируя их по типу фигуры.
+
+    Args:
+        chunk (list): Кортежи (тип фигуры, параметры, исходная запись).
+            Запись, которую читатель не смог разобрать, передается как
+            (None, исключение, исходная запись).
+
+    Returns:
+        list: Для каждой записи пара (площадь, None) или (None, исключение).
+    """
+    results: List[Tuple[Optional[float], Optional[Exception]]] = [(None, None)] * len(chunk)
+    computed = 0
+    for kind, (shape_type, names) in _SHAPE_KINDS.items():
+        indices = [i for i, (record_kind, _, _) in enumerate(chunk) if record_kind == kind]
+        if not indices:
+            continue
+        computed += len(indices)
+        columns = [[chunk[i][1][j] for i in indices] for j in range(len(names))]
+
+        if shape_type is Circle:
+            validation = validate_circles(columns[0])
+        else:
+            validation = validate_triangles(*columns)
+
+        # Невалидные значения заменяются нулями, чтобы колонки стали числовыми
+        numeric = [[value if ok else 0.0 for value, ok in zip(column, validation.valid)]
+                   for column in columns]
+        # Точность задана явно: вывод побитово совпадает с area() при любом
+        # режиме контекста (area_precision)
+        if shape_type is Circle:
+            areas = circle_areas(*numeric, precision=DOUBLE)
+        else:
+            areas = triangle_areas(*numeric, precision=DOUBLE)
+
+        for position, i in enumerate(indices):
+            code = validation.codes[position]
+            if code == ErrorCode.OK:
+                results[i] = (float(areas[position]), None)
+            else:
+                results[i] = (None, error_for(shape_type, code))
+
+    if computed < len(chunk):
+        # Неразобранные записи и неизвестные типы — ошибки своих строк
+        for i, (kind, params, _) in enumerate(chunk):
+            if kind is None:
+                results[i] = (None, params)
+            elif kind not in _SHAPE_KINDS:
+                results[i] = (None, ValueError(_UNKNOWN_KIND_ERROR.format(kind)))
+    return results
+
+
+class _CsvWriter:
+    """Записывает исходные записи CSV с добавленной колонкой area."""
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+        self._writer = None
+
+    def write(self, record: Dict[str, Any], area: float) -> None:
+        if self._writer is None:
+            fields = [name for name in record if name != "area"] + ["area"]
+            self._writer = csv.DictWriter(self._stream, fieldnames=fields,
+                                          extrasaction="ignore", lineterminator="\n")
+            self._writer.writeheader()
+        row = dict(record)
+        row["area"] = repr(area)
+        self._writer.writerow(row)
+
+
+class _JsonlWriter:
+    """Записывает исходные записи JSONL с добавленным полем area."""
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+
+    def write(self, record: Dict[str, Any], area: float) -> None:
+        row = dict(record)
+        row["area"] = area
+        self._stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def process_stream(source: TextIO, destination: TextIO, fmt: str = "csv",
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, skip_invalid: bool = False) -> int:
+    """
+    Потоково вычисляет площади фигур из source и пишет результат в destination.
+
+    Args:
+        source (TextIO): Входной текстовый поток.
+        destination (TextIO): Выходной текстовый поток.
+        fmt (str): Формат данных: "csv" или "jsonl".
+        chunk_size (int): Количество записей, обрабатываемых за один проход.
+        skip_invalid (bool): Пропускать невалидные записи вместо исключения.
+
+    Returns:
+        int: Количество записанных записей.
+
+    Raises:
+        ValueError: Если формат не поддерживается, chunk_size неположителен
+            или запись невалидна (при skip_invalid=False).
+        TypeError: Если параметр записи не является числом (при skip_invalid=False).
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным числом")
+    records = read_records(source, fmt)
+    writer = _CsvWriter(destination) if fmt == "csv" else _JsonlWriter(destination)
+
+    written = 0
+    first_row = 1
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            break
+        results = compute_chunk_areas(chunk)
+        for offset, ((_, _, record), (area, error)) in enumerate(zip(chunk, results)):
+            if error is not None:
+                if skip_invalid:
+                    continue
+                raise type(error)(f"Запись {first_row + offset}: {error}")
+            writer.write(record, area)
+            written += 1
+        first_row += len(chunk)
+    return written
+
+
+def detect_format(path: str) -> str:
+    """
+    Определяет формат файла по расширению.
+
+    Args:
+        path (str): Путь к файлу.
+
+    Returns:
+        str: "jsonl" для .jsonl/.ndjson, иначе "csv".
+    """
+    lowered = path.lower()
+    if lowered.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return "csv"
+
+
+def process_file(input_path: str, output_path: str, fmt: Optional[str] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, skip_invalid: bool = False) -> int:
+    """
+    Потоково обрабатывает файл с фигурами.
+
+    Args:
+        input_path (str): Путь к входному файлу.
+        output_path (str): Путь к выходному файлу.
+        fmt (str | None): Формат данных; по умолчанию определяется по расширению.
+        chunk_size (int): Количество записей, обрабатываемых за один проход.
+        skip_invalid (bool): Пропускать невалидные записи вместо исключения.
+
+    Returns:
+        int: Количество записанных записей.
+    """
+    fmt = fmt or detect_format(input_path)
+    with io.open(input_path, "r", encoding="utf-8", newline="") as source, \
+            io.open(output_path, "w", encoding="utf-8", newline="") as destination:
+        return process_stream(source, destination, fmt, chunk_size, skip_invalid)
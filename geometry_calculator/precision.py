@@ -0,0 +1,94 @@
+"""
+Режим точности пакетных функций площади.
+
+По умолчанию пакетные функции считают в float64 и совпадают с
+``Circle.area()``/``Triangle.area()`` побитово. Режим ``"single"``
+(opt-in) считает встроенные ядра в float32: колонки и результат вдвое
+меньше, векторные операции обрабатывают вдвое больше элементов за такт.
+
+Гарантия режима ``"single"``: относительная погрешность каждой площади
+по сравнению с ``Circle.area()``/``Triangle.area()`` для тех же
+параметров не превышает ``SINGLE_REL_ERROR`` (1e-6), если площадь
+представима нормализованным float32 (~1.2e-38 ... 3.4e38). Единица
+округления float32 u = 2**-24 ≈ 6e-8.
+
+- Круг: π·r·r в float32 — округление r и π и два умножения, ≤ 5u ≈ 3e-7.
+- Треугольник, колонки float32: формула Кахана в float32 — ≤ 5.5u ≈ 3.3e-7
+  при любой форме треугольника (вычитания в формуле точны). Строки, где
+  промежуточные произведения выходят из нормализованного диапазона
+  (наибольшая сторона > 2**28 или площадь < 2**-31), пересчитываются в
+  float64.
+- Треугольник, колонки float64 (и любые другие): округление сторон до
+  float32 искажает площадь вытянутого треугольника сколь угодно сильно,
+  поэтому площади считаются в float64 и округляются до float32, ≤ u.
+
+Выигрыш в пропускной способности дают колонки, уже хранящиеся в float32;
+для колонок float64 режим лишь вдвое уменьшает результат.
+
+Режим выбирается аргументом ``precision`` пакетной функции или для
+текущего контекста (поток, задача asyncio) через ``area_precision``.
+"""
+
+import contextvars
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+DOUBLE = "double"
+SINGLE = "single"
+PRECISIONS = (DOUBLE, SINGLE)
+
+# Гарантированная относительная погрешность режима SINGLE
+SINGLE_REL_ERROR = 1e-6
+
+_precision: "contextvars.ContextVar[str]" = contextvars.ContextVar(
+    "geometry_calculator_precision", default=DOUBLE)
+
+
+def resolve_precision(precision: Optional[str] = None) -> str:
+    """
+    Возвращает режим точности: переданный или режим текущего контекста.
+
+    Raises:
+        ValueError: Если режим неизвестен.
+    """
+    if precision is None:
+        return _precision.get()
+    if precision not in PRECISIONS:
+        raise ValueError(f"Неизвестный режим точности: {precision!r} "
+                         f"(ожидается {DOUBLE!r} или {SINGLE!r})")
+    return precision
+
+
+def get_area_precision() -> str:
+    """Возвращает режим точности текущего контекста."""
+    return _precision.get()
+
+
+def set_area_precision(precision: str) -> None:
+    """
+    Устанавливает режим точности для текущего контекста.
+
+    Args:
+        precision (str): "double" или "single".
+
+    Raises:
+        ValueError: Если режим неизвестен.
+    """
+    _precision.set(resolve_precision(precision))
+
+
+@contextmanager
+def area_precision(precision: str) -> Iterator[str]:
+    """
+    Контекстный менеджер режима точности пакетных функций.
+
+    Examples:
+        >>> with area_precision("single"):
+        ...     areas = triangle_areas(side_a, side_b, side_c)   # float32
+    """
+    token = _precision.set(resolve_precision(precision))
+    try:
+        yield precision
+    finally:
+        _precision.reset(token)
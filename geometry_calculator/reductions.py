@@ -0,0 +1,431 @@
+"""
+Потоковые агрегаты площадей без хранения списка площадей.
+
+Редукторы принимают площади порциями (``update``) или по одной
+(``add``), занимают O(1) (``AreaStats``, ``AreaHistogram``) или O(k)
+(``TopAreas``) памяти и объединяются (``merge``) — порции, посчитанные
+в разных процессах или потоках, сводятся в один результат. Редукторы
+сериализуются pickle, поэтому их можно возвращать из воркеров пула.
+
+``reduce_areas`` проходит по итератору фигур порциями, считает площади
+порции через ``calculate_areas`` и передает их всем редукторам.
+
+NaN (площади невалидных строк пакетных функций) пропускаются всеми
+редукторами и считаются в ``AreaStats.nan_count``.
+"""
+
+import heapq
+import math
+from itertools import islice
+from typing import Any, Iterable, List, Tuple
+
+from . import _backend
+from .batch import calculate_areas
+
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def _finite_chunk(areas: Any):
+    """
+    Приводит порцию площадей к колонке без NaN.
+
+    Returns:
+        tuple: (колонка без NaN, индексы оставшихся значений или None,
+        количество пропущенных NaN).
+    """
+    np = _backend.get_numpy()
+    if np is not None:
+        column = np.asarray(areas, dtype=np.float64).reshape(-1)
+        nan_mask = np.isnan(column)
+        skipped = int(nan_mask.sum())
+        if not skipped:
+            return column, None, 0
+        keep = np.flatnonzero(~nan_mask)
+        return column[keep], keep, skipped
+
+    values = list(areas)
+    keep = [i for i, value in enumerate(values) if value == value]
+    if len(keep) == len(values):
+        return values, None, 0
+    return [values[i] for i in keep], keep, len(values) - len(keep)
+
+
+def _compensated_sum(column) -> float:
+    """
+    Сумма колонки NumPy попарным суммированием с компенсацией.
+
+    На каждом уровне дерева пары складываются векторно, а ошибка
+    округления каждого сложения находится точно (TwoSum Кнута) и
+    суммируется отдельно. Результат — как при суммировании с двойной
+    точностью и одном округлении в конце; стоит несколько проходов по
+    колонке вместо поэлементного ``math.fsum``.
+    """
+    values = column
+    partials = []
+    while len(values) > 1:
+        half = len(values) // 2
+        if len(values) % 2:
+            partials.append(float(values[-1]))
+        first = values[:half]
+        second = values[half:2 * half]
+        sums = first + second
+        # TwoSum: точная ошибка sums равна (first - first_part) + (second - second_part);
+        # вычитания на месте дают ее с обратным знаком без лишних массивов
+        second_part = sums - first
+        first_part = sums - second_part
+        second_part -= second
+        first_part -= first
+        first_part += second_part
+        partials.append(-float(first_part.sum()))
+        values = sums
+    if len(values):
+        partials.append(float(values[0]))
+    return math.fsum(partials)
+
+
+class AreaStats:
+    """
+    Количество, компенсированная сумма, среднее, дисперсия, минимум и максимум.
+
+    Сумма между порциями накапливается алгоритмом Ноймайера (Кахана —
+    Бабушки), внутри порции — ``math.fsum`` (чистый Python) или попарным
+    суммированием NumPy с компенсацией ошибки каждого сложения
+    (``_compensated_sum``), так что малые слагаемые не теряются и рядом с
+    большими внутри одной порции. Среднее и дисперсия объединяются по
+    формулам Чана, поэтому порядок порций и способ разбиения на них не
+    влияют на точность.
+
+    Examples:
+        >>> stats = AreaStats()
+        >>> stats.update([1.0, 2.0, 3.0])
+        >>> stats.count, stats.total, stats.mean, stats.variance
+        (3, 6.0, 2.0, 0.6666666666666666)
+    """
+
+    __slots__ = ("count", "nan_count", "_total", "_compensation", "_mean", "_m2",
+                 "minimum", "maximum")
+
+    def __init__(self):
+        self.count = 0
+        self.nan_count = 0
+        self._total = 0.0
+        self._compensation = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def _add_to_total(self, value: float) -> None:
+        """Компенсированное сложение (Ноймайер)."""
+        total = self._total + value
+        if abs(self._total) >= abs(value):
+            self._compensation += (self._total - total) + value
+        else:
+            self._compensation += (value - total) + self._total
+        self._total = total
+
+    def _combine(self, count: int, total: float, mean: float, m2: float,
+                 minimum: float, maximum: float) -> None:
+        """Объединяет с агрегатами другой порции (формулы Чана)."""
+        if not count:
+            return
+        combined = self.count + count
+        delta = mean - self._mean
+        self._mean += delta * count / combined
+        self._m2 += m2 + delta * delta * self.count * count / combined
+        self.count = combined
+        self._add_to_total(total)
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+
+    def add(self, area: float) -> None:
+        """Добавляет одну площадь."""
+        self.update((area,))
+
+    def update(self, areas: Any, offset: int = 0) -> None:
+        """
+        Добавляет порцию площадей.
+
+        Args:
+            areas: Массив или последовательность площадей.
+            offset (int): Не используется (для единообразия с TopAreas).
+        """
+        column, _, skipped = _finite_chunk(areas)
+        self.nan_count += skipped
+        count = len(column)
+        if not count:
+            return
+        np = _backend.get_numpy()
+        if np is not None:
+            total = _compensated_sum(column)
+            mean = total / count
+            deviations = column - mean
+            m2 = float(deviations @ deviations)
+            minimum, maximum = float(column.min()), float(column.max())
+        else:
+            total = math.fsum(column)
+            mean = total / count
+            m2 = math.fsum((value - mean) ** 2 for value in column)
+            minimum, maximum = min(column), max(column)
+        self._combine(count, total, mean, m2, minimum, maximum)
+
+    def merge(self, other: "AreaStats") -> "AreaStats":
+        """
+        Добавляет агрегаты другого AreaStats.
+
+        Returns:
+            AreaStats: self.
+        """
+        self.nan_count += other.nan_count
+        self._combine(other.count, other._total, other._mean, other._m2,
+                      other.minimum, other.maximum)
+        self._add_to_total(other._compensation)
+        return self
+
+    @property
+    def total(self) -> float:
+        """Сумма площадей."""
+        return self._total + self._compensation
+
+    @property
+    def mean(self) -> float:
+        """Средняя площадь (NaN для пустого агрегата)."""
+        return self.total / self.count if self.count else math.nan
+
+    @property
+    def variance(self) -> float:
+        """Дисперсия генеральной совокупности (NaN для пустого агрегата)."""
+        return self._m2 / self.count if self.count else math.nan
+
+    @property
+    def stdev(self) -> float:
+        """Стандартное отклонение генеральной совокупности."""
+        return math.sqrt(self.variance)
+
+    def __repr__(self) -> str:
+        return f"AreaStats(count={self.count}, total={self.total!r}, mean={self.mean!r})"
+
+
+class AreaHistogram:
+    """
+    Гистограмма площадей с фиксированными корзинами равной ширины.
+
+    Значения вне [low, high) считаются в ``underflow``/``overflow``.
+
+    Examples:
+        >>> histogram = AreaHistogram(0.0, 10.0, bins=5)
+        >>> histogram.update([1.0, 3.0, 3.5, 12.0])
+        >>> histogram.counts, histogram.overflow
+        ([1, 2, 0, 0, 0], 1)
+    """
+
+    __slots__ = ("low", "high", "bins", "counts", "underflow", "overflow")
+
+    def __init__(self, low: float, high: float, bins: int = 10):
+        """
+        Инициализация.
+
+        Args:
+            low (float): Нижняя граница первой корзины.
+            high (float): Верхняя граница последней корзины.
+            bins (int): Количество корзин.
+
+        Raises:
+            ValueError: Если high <= low или bins < 1.
+        """
+        if not high > low:
+            raise ValueError("Верхняя граница гистограммы должна быть больше нижней")
+        if bins < 1:
+            raise ValueError("Количество корзин должно быть положительным")
+        self.low = float(low)
+        self.high = float(high)
+        self.bins = bins
+        self.counts = [0] * bins
+        self.underflow = 0
+        self.overflow = 0
+
+    @property
+    def edges(self) -> List[float]:
+        """Границы корзин (bins + 1 значение)."""
+        width = (self.high - self.low) / self.bins
+        return [self.low + i * width for i in range(self.bins)] + [self.high]
+
+    def add(self, area: float) -> None:
+        """Добавляет одну площадь."""
+        self.update((area,))
+
+    def update(self, areas: Any, offset: int = 0) -> None:
+        """
+        Добавляет порцию площадей.
+
+        Args:
+            areas: Массив или последовательность площадей.
+            offset (int): Не используется (для единообразия с TopAreas).
+        """
+        column, _, _ = _finite_chunk(areas)
+        scale = self.bins / (self.high - self.low)
+        np = _backend.get_numpy()
+        if np is not None:
+            below = column < self.low
+            above = column >= self.high
+            self.underflow += int(below.sum())
+            self.overflow += int(above.sum())
+            inside = column[~(below | above)]
+            index = ((inside - self.low) * scale).astype(np.intp)
+            # Округление у верхней границы может дать индекс bins
+            np.minimum(index, self.bins - 1, out=index)
+            for position, count in enumerate(np.bincount(index, minlength=self.bins).tolist()):
+                self.counts[position] += count
+            return
+
+        counts = self.counts
+        last = self.bins - 1
+        for value in column:
+            if value < self.low:
+                self.underflow += 1
+            elif value >= self.high:
+                self.overflow += 1
+            else:
+                counts[min(int((value - self.low) * scale), last)] += 1
+
+    def merge(self, other: "AreaHistogram") -> "AreaHistogram":
+        """
+        Добавляет счетчики другой гистограммы с теми же корзинами.
+
+        Returns:
+            AreaHistogram: self.
+
+        Raises:
+            ValueError: Если корзины гистограмм различаются.
+        """
+        if (self.low, self.high, self.bins) != (other.low, other.high, other.bins):
+            raise ValueError("Объединять можно только гистограммы с одинаковыми корзинами")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def __repr__(self) -> str:
+        return f"AreaHistogram([{self.low}, {self.high}), bins={self.bins}, counts={self.counts})"
+
+
+class TopAreas:
+    """
+    k наибольших площадей с индексами фигур во входном потоке.
+
+    Хранит не более k пар (площадь, индекс) в min-куче.
+
+    Examples:
+        >>> top = TopAreas(2)
+        >>> top.update([5.0, 1.0, 7.0, 3.0])
+        >>> top.items()
+        [(7.0, 2), (5.0, 0)]
+    """
+
+    __slots__ = ("k", "_heap")
+
+    def __init__(self, k: int):
+        """
+        Инициализация.
+
+        Args:
+            k (int): Количество хранимых наибольших площадей.
+
+        Raises:
+            ValueError: Если k < 1.
+        """
+        if k < 1:
+            raise ValueError("k должно быть положительным")
+        self.k = k
+        self._heap: List[Tuple[float, int]] = []
+
+    def _push(self, area: float, index: int) -> None:
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, (area, index))
+        elif area > self._heap[0][0]:
+            heapq.heapreplace(self._heap, (area, index))
+
+    def add(self, area: float, index: int) -> None:
+        """Добавляет площадь фигуры с индексом index."""
+        if area == area:
+            self._push(area, index)
+
+    def update(self, areas: Any, offset: int = 0) -> None:
+        """
+        Добавляет порцию площадей.
+
+        Args:
+            areas: Массив или последовательность площадей.
+            offset (int): Индекс первой фигуры порции во входном потоке.
+        """
+        column, keep, _ = _finite_chunk(areas)
+        count = len(column)
+        np = _backend.get_numpy()
+        if np is not None and count > self.k:
+            # Кандидаты порции выбираются за O(n) без полной сортировки
+            candidates = np.argpartition(column, count - self.k)[count - self.k:]
+            positions = candidates.tolist()
+            values = column[candidates].tolist()
+        else:
+            positions = range(count)
+            values = column.tolist() if np is not None else column
+        for position, value in zip(positions, values):
+            index = keep[position] if keep is not None else position
+            self._push(value, offset + int(index))
+
+    def merge(self, other: "TopAreas") -> "TopAreas":
+        """
+        Добавляет элементы другого TopAreas (индексы должны быть согласованы).
+
+        Returns:
+            TopAreas: self.
+        """
+        for area, index in other._heap:
+            self._push(area, index)
+        return self
+
+    def items(self) -> List[Tuple[float, int]]:
+        """Пары (площадь, индекс) по убыванию площади."""
+        return sorted(self._heap, key=lambda item: (-item[0], item[1]))
+
+    def __repr__(self) -> str:
+        return f"TopAreas(k={self.k}, items={self.items()})"
+
+
+def reduce_areas(shapes: Iterable[Any], *reducers: Any,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, offset: int = 0) -> Tuple[Any, ...]:
+    """
+    Потоково передает площади фигур редукторам, не храня все площади.
+
+    Args:
+        shapes (Iterable[Shape]): Фигуры (любой итератор).
+        *reducers: AreaStats, AreaHistogram, TopAreas или объекты с методом
+            ``update(areas, offset)``.
+        chunk_size (int): Размер порции.
+        offset (int): Индекс первой фигуры (для TopAreas при разбиении
+            потока между воркерами).
+
+    Returns:
+        tuple: Переданные редукторы.
+
+    Raises:
+        ValueError: Если chunk_size неположителен.
+
+    Examples:
+        >>> stats, top = reduce_areas([Circle(1), Triangle(3, 4, 5)], AreaStats(), TopAreas(1))
+        >>> top.items()
+        [(6.0, 1)]
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным числом")
+    iterator = iter(shapes)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        areas = calculate_areas(chunk)
+        for reducer in reducers:
+            reducer.update(areas, offset)
+        offset += len(chunk)
+    return reducers
@@ -0,0 +1,154 @@
+"""
+Реестр ядер вычисления площади по типу фигуры.
+
+``calculate_area`` ищет скалярное ядро по ``type(shape)`` — это одно
+обращение к словарю вместо проверки ``isinstance`` по ABC на каждом
+вызове. Встроенные фигуры регистрируются при импорте пакета, сторонние
+наследники Shape регистрируются автоматически при первом вызове
+(ядро — их метод ``area``) или явно через
+``register_area_kernel``. Пакетные ядра (``register_batch_kernel``)
+используются колоночными API.
+
+Словари диспетчеризации хранят ядра, обернутые текущей оберткой
+(``set_kernel_wrapper``, ее устанавливает инструментация); обертка
+применяется и к ядрам, зарегистрированным после ее установки.
+"""
+
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence, Tuple
+
+
+class BatchKernel(NamedTuple):
+    """
+    Пакетное ядро площади.
+
+    Attributes:
+        params: Имена атрибутов фигуры, из которых строятся колонки.
+        function: Функция ``function(*columns) -> массив площадей``.
+        gather: Функция ``gather(shapes) -> columns``, собирающая аргументы
+            function из фигур группы, или None — колонки строятся по params
+            (по одному значению атрибута на фигуру).
+    """
+
+    params: Tuple[str, ...]
+    function: Callable[..., Any]
+    gather: Optional[Callable[[Sequence[Any]], Sequence[Any]]] = None
+
+
+KernelWrapper = Callable[[type, Callable[..., Any], str], Callable[..., Any]]
+
+# Ядра диспетчеризации (с оберткой, если она установлена)
+_area_kernels: Dict[type, Callable[[Any], float]] = {}
+_batch_kernels: Dict[type, BatchKernel] = {}
+# Зарегистрированные ядра без обертки
+_registered_area: Dict[type, Callable[[Any], float]] = {}
+_registered_batch: Dict[type, BatchKernel] = {}
+_wrapper: Optional[KernelWrapper] = None
+
+
+def _check_shape_type(shape_type: type) -> None:
+    """Проверяет, что shape_type — класс-наследник Shape."""
+    from .shapes import Shape
+
+    if not isinstance(shape_type, type) or not issubclass(shape_type, Shape):
+        raise TypeError("Регистрировать можно только наследников Shape")
+
+
+def register_area_kernel(shape_type: type,
+                         kernel: Optional[Callable[[Any], float]] = None) -> None:
+    """
+    Регистрирует скалярное ядро площади для типа фигуры.
+
+    Ядро применяется только к экземплярам ровно этого типа; наследники
+    регистрируются отдельно (или автоматически при первом вызове).
+
+    Args:
+        shape_type (type): Класс-наследник Shape.
+        kernel (Callable | None): Функция ``kernel(shape) -> float``.
+            По умолчанию — функция ``shape_type.area`` (без поиска метода
+            у экземпляра на каждом вызове).
+
+    Raises:
+        TypeError: Если shape_type не наследует Shape.
+    """
+    _check_shape_type(shape_type)
+    kernel = kernel if kernel is not None else shape_type.area
+    _registered_area[shape_type] = kernel
+    _area_kernels[shape_type] = kernel if _wrapper is None else _wrapper(shape_type, kernel, "area")
+
+
+def register_batch_kernel(shape_type: type, params: Tuple[str, ...],
+                          function: Callable[..., Any],
+                          gather: Optional[Callable[[Sequence[Any]], Sequence[Any]]] = None
+                          ) -> None:
+    """
+    Регистрирует пакетное ядро площади для типа фигуры.
+
+    Args:
+        shape_type (type): Класс-наследник Shape.
+        params (tuple): Имена атрибутов фигуры — колонки в порядке аргументов function.
+        function (Callable): Функция ``function(*columns) -> массив площадей``.
+            Колонки передаются как ``numpy.ndarray`` float64, если установлен
+            NumPy, иначе как ``array('d')``.
+        gather (Callable | None): Функция ``gather(shapes) -> columns`` для
+            фигур, параметры которых не сводятся к одному числу на фигуру
+            (например, вершины многоугольника). Такие ядра получают
+            аргументы от gather и не делятся на диапазоны строк пулом потоков.
+
+    Raises:
+        TypeError: Если shape_type не наследует Shape.
+
+    Examples:
+        >>> register_batch_kernel(Rectangle, ("width", "height"), lambda w, h: w * h)
+    """
+    _check_shape_type(shape_type)
+    kernel = BatchKernel(tuple(params), function, gather)
+    _registered_batch[shape_type] = kernel
+    _batch_kernels[shape_type] = _wrap_batch(shape_type, kernel)
+
+
+def _wrap_batch(shape_type: type, kernel: BatchKernel) -> BatchKernel:
+    """Пакетное ядро с функцией, обернутой текущей оберткой."""
+    if _wrapper is None:
+        return kernel
+    return kernel._replace(function=_wrapper(shape_type, kernel.function, "batch_area"))
+
+
+def set_kernel_wrapper(wrapper: Optional[KernelWrapper]) -> None:
+    """
+    Устанавливает обертку ядер в точке диспетчеризации (или снимает ее при None).
+
+    Обертка ``wrapper(shape_type, kernel, operation) -> kernel`` вызывается
+    для каждого зарегистрированного ядра — сейчас и при последующих
+    регистрациях; operation — "area" для скалярных ядер и "batch_area"
+    для функций пакетных. Обертка может вернуть ядро без изменений.
+    Сами классы фигур не меняются: прямой вызов ``shape.area()`` обертку
+    не проходит.
+    """
+    global _wrapper
+    _wrapper = wrapper
+    for shape_type, kernel in list(_registered_area.items()):
+        _area_kernels[shape_type] = kernel if wrapper is None else wrapper(shape_type, kernel, "area")
+    for shape_type, batch_kernel in list(_registered_batch.items()):
+        _batch_kernels[shape_type] = _wrap_batch(shape_type, batch_kernel)
+
+
+def unregister(shape_type: type) -> None:
+    """Удаляет скалярное и пакетное ядра типа фигуры (если были)."""
+    _area_kernels.pop(shape_type, None)
+    _batch_kernels.pop(shape_type, None)
+    _registered_area.pop(shape_type, None)
+    _registered_batch.pop(shape_type, None)
+
+
+def area_kernel_for(shape_type: type) -> Optional[Callable[[Any], float]]:
+    """Возвращает скалярное ядро типа фигуры (с оберткой, если она установлена) или None."""
+    return _area_kernels.get(shape_type)
+
+
+def batch_kernel_for(shape_type: type) -> Optional[BatchKernel]:
+    """Возвращает пакетное ядро типа фигуры или None."""
+    # Пакетные ядра встроенных фигур регистрируются при импорте batch,
+    # который пакет загружает лениво
+    from . import batch  # noqa: F401
+
+    return _batch_kernels.get(shape_type)
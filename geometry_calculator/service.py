@@ -0,0 +1,278 @@
+"""
+Asyncio-сервис вычисления площадей с микро-батчингом запросов.
+
+Конкурентные запросы по одной фигуре собираются в пакет (до
+``max_batch_size`` запросов или ``max_wait`` секунд с первого запроса
+пакета) и считаются одним векторизованным проходом
+(``pipeline.compute_chunk_areas``).
+
+Протокол — HTTP/1.1 с keep-alive поверх TCP или Unix-сокета:
+
+    POST /area   {"shape": "circle", "radius": 5}  →  {"area": 78.53981633974483}
+    GET  /stats                                     →  счетчики микро-батчинга
+
+Невалидная фигура и фигура с бесконечной или неопределенной площадью
+(в JSON нет значений для ``inf`` и ``nan``) — ответ 400 с полем ``error``;
+непредвиденная ошибка вычисления — ответ 500, соединение сохраняется.
+
+Запуск:
+    python -m geometry_calculator.service --port 8080 [--max-batch-size 1024] [--max-wait-ms 2]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from .pipeline import _shape_kind, compute_chunk_areas, parse_record
+
+
+DEFAULT_MAX_BATCH_SIZE = 1024
+DEFAULT_MAX_WAIT = 0.002
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            500: "Internal Server Error"}
+
+NON_FINITE_AREA_ERROR = "Площадь фигуры не является конечным числом"
+INTERNAL_ERROR = "Внутренняя ошибка сервера"
+
+
+class MicroBatcher:
+    """
+    Собирает одиночные запросы в пакеты и считает их одним проходом.
+
+    Должен использоваться из одного event loop.
+    """
+
+    def __init__(self, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_wait: float = DEFAULT_MAX_WAIT):
+        """
+        Инициализация.
+
+        Args:
+            max_batch_size (int): Максимальный размер пакета.
+            max_wait (float): Максимальное ожидание с первого запроса пакета, секунды.
+
+        Raises:
+            ValueError: Если параметры неположительны.
+        """
+        if max_batch_size <= 0:
+            raise ValueError("Размер пакета должен быть положительным числом")
+        if max_wait < 0:
+            raise ValueError("Время ожидания не может быть отрицательным")
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: List[Tuple[str, Tuple[Any, ...], "asyncio.Future[float]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.requests = 0
+        self.batches = 0
+        self.largest_batch = 0
+
+    async def submit(self, kind: str, params: Tuple[Any, ...]) -> float:
+        """
+        Ставит фигуру в очередь и ждет ее площадь.
+
+        Args:
+            kind (str): Тип фигуры ("circle" или "triangle").
+            params (tuple): Параметры фигуры.
+
+        Returns:
+            float: Площадь фигуры.
+
+        Raises:
+            ValueError: Если тип фигуры неизвестен.
+            TypeError, ValueError: Как конструктор фигуры для невалидных параметров.
+        """
+        # Неизвестный тип отклоняется до постановки в очередь
+        _shape_kind(kind)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((kind, params, future))
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Немедленно считает накопленный пакет."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self.requests += len(batch)
+        self.batches += 1
+        self.largest_batch = max(self.largest_batch, len(batch))
+
+        requests = [(kind, params, None) for kind, params, _ in batch]
+        try:
+            results = compute_chunk_areas(requests)
+        except Exception:
+            # Пакет не посчитался целиком: считаем запросы по одному, чтобы
+            # ошибка одной записи досталась только ее запросу, а остальные
+            # не зависли в ожидании
+            results = [self._compute_one(request) for request in requests]
+        for (_, _, future), (area, error) in zip(batch, results):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(area)
+
+    @staticmethod
+    def _compute_one(request: Tuple[str, Tuple[Any, ...], None]
+                     ) -> Tuple[Optional[float], Optional[Exception]]:
+        """Площадь одного запроса или исключение при ее вычислении."""
+        try:
+            return compute_chunk_areas([request])[0]
+        except Exception as error:
+            return None, error
+
+    def stats(self) -> Dict[str, Any]:
+        """Счетчики микро-батчинга."""
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "max_batch_size": self.max_batch_size,
+            "max_wait": self.max_wait,
+        }
+
+
+class AreaService:
+    """HTTP-сервис площадей поверх MicroBatcher."""
+
+    def __init__(self, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_wait: float = DEFAULT_MAX_WAIT):
+        self.batcher = MicroBatcher(max_batch_size, max_wait)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        """Запускает сервер на TCP-порту (0 — выбрать свободный)."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """Запускает сервер на Unix-сокете."""
+        self._server = await asyncio.start_unix_server(self._handle_connection, path)
+        return self._server
+
+    async def close(self) -> None:
+        """Останавливает сервер."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def handle(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """
+        Обрабатывает один запрос.
+
+        Returns:
+            tuple: (HTTP-статус, тело ответа).
+        """
+        if path == "/stats":
+            if method != "GET":
+                return 405, {"error": "Ожидается GET"}
+            return 200, self.batcher.stats()
+        if path != "/area":
+            return 404, {"error": f"Неизвестный путь: {path}"}
+        if method != "POST":
+            return 405, {"error": "Ожидается POST"}
+        try:
+            record = json.loads(body)
+            if not isinstance(record, dict):
+                raise ValueError("Ожидается JSON-объект")
+            kind, params = parse_record(record)
+            area = await self.batcher.submit(kind, params)
+        except (TypeError, ValueError) as error:
+            return 400, {"error": str(error)}
+        except Exception:
+            # Ответ вместо разрыва соединения: клиент keep-alive не должен
+            # терять остальные запросы из-за сбоя вычисления одного
+            return 500, {"error": INTERNAL_ERROR}
+        if not math.isfinite(area):
+            return 400, {"error": NON_FINITE_AREA_ERROR}
+        return 200, {"area": area}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """Обслуживает keep-alive соединение: последовательность HTTP-запросов."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self.handle(method, path, body)
+                data = json.dumps(payload, ensure_ascii=False, allow_nan=False).encode("utf-8")
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+                    + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8080, unix_path: Optional[str] = None,
+                max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                max_wait: float = DEFAULT_MAX_WAIT) -> None:
+    """Запускает сервис и обслуживает запросы до отмены."""
+    service = AreaService(max_batch_size, max_wait)
+    if unix_path:
+        server = await service.start_unix(unix_path)
+    else:
+        server = await service.start(host, port)
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Сервис площадей слушает {addresses}", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main(argv=None) -> int:
+    """Точка входа командной строки сервиса."""
+    parser = argparse.ArgumentParser(prog="python -m geometry_calculator.service",
+                                     description="Сервис площадей с микро-батчингом")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix", help="Путь Unix-сокета (вместо TCP)")
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT * 1000)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix,
+                          args.max_batch_size, args.max_wait_ms / 1000))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,14 +5,42 @@
 
 import math
 from abc import ABC, abstractmethod
+from array import array
 from typing import Protocol, Union
 
+from . import cache as _cache
+from .registry import _area_kernels, register_area_kernel
+
+
+# Сообщения об ошибках валидации (используются также пакетной валидацией)
+CIRCLE_TYPE_ERROR = "Радиус должен быть числом"
+CIRCLE_NEGATIVE_ERROR = "Радиус должен быть неотрицательным числом"
+TRIANGLE_TYPE_ERROR = "Все стороны должны быть числами"
+TRIANGLE_NON_POSITIVE_ERROR = "Все стороны должны быть положительными числами"
+TRIANGLE_INEQUALITY_ERROR = "Заданные стороны не образуют валидный треугольник"
+TRIANGLE_VERTEX_ERROR = "Вершины треугольника должны быть точками одной размерности: (x, y) или (x, y, z)"
+TRIANGLE_COORDINATE_TYPE_ERROR = "Координаты вершин треугольника должны быть числами"
+TRIANGLE_COLLINEAR_ERROR = "Вершины треугольника лежат на одной прямой"
+POLYGON_VERTEX_ERROR = "Вершина должна быть парой координат (x, y)"
+POLYGON_TYPE_ERROR = "Координаты вершин должны быть числами"
+POLYGON_VERTEX_COUNT_ERROR = "Многоугольник должен иметь не менее трех вершин"
+POLYGON_DEGENERATE_ERROR = "Вершины многоугольника не образуют фигуру ненулевой площади"
+
+# Точные типы чисел: проверка по множеству быстрее isinstance с кортежем,
+# наследники int/float (в том числе bool) проверяются isinstance
+_NUMBER_TYPES = frozenset((int, float))
+
 
 class Shape(ABC):
     """
     Абстрактный базовый класс для всех геометрических фигур.
+    
+    Объявляет пустые __slots__, чтобы наследники с __slots__ не получали
+    __dict__ (наследники без __slots__ работают как обычно).
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def area(self) -> float:
         """
@@ -32,8 +60,14 @@ class Shape(ABC):
 class Circle(Shape):
     """
     Класс для представления круга.
+    
+    Круг неизменяем и сравнивается по значению: равные круги имеют
+    одинаковый хэш, поэтому их можно использовать как ключи словарей и
+    разделять между потребителями (см. модуль ``interning``).
     """
     
+    __slots__ = ("radius", "__weakref__")
+    
     def __init__(self, radius: float):
         """
         Инициализация круга.
@@ -45,13 +79,31 @@ class Circle(Shape):
             ValueError: Если радиус отрицательный.
             TypeError: Если радиус не является числом.
         """
-        if not isinstance(radius, (int, float)):
-            raise TypeError("Радиус должен быть числом")
+        if type(radius) not in _NUMBER_TYPES and not isinstance(radius, (int, float)):
+            raise TypeError(CIRCLE_TYPE_ERROR)
         
         if radius < 0:
-            raise ValueError("Радиус должен быть неотрицательным числом")
+            raise ValueError(CIRCLE_NEGATIVE_ERROR)
         
-        self.radius = radius
+        # Дескриптор слота напрямую: быстрее object.__setattr__
+        _set_radius(self, radius)
+    
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("Круг неизменяем")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Круг неизменяем")
+    
+    def __reduce__(self):
+        return (Circle, (self.radius,))
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Circle):
+            return self.radius == other.radius
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(("circle", self.radius))
     
     def area(self) -> float:
         """
@@ -60,7 +112,9 @@ class Circle(Shape):
         Returns:
             float: Площадь круга.
         """
-        return math.pi * self.radius ** 2
+        # Умножение вместо ** 2: результат не зависит от реализации pow() в libm
+        # и совпадает с пакетными функциями побитово
+        return math.pi * self.radius * self.radius
     
     def __str__(self) -> str:
         return f"Круг(радиус={self.radius})"
@@ -72,8 +126,24 @@ class Circle(Shape):
 class Triangle(Shape):
     """
     Класс для представления треугольника.
+    
+    Треугольник неизменяем. Производные величины вычисляются при первом
+    обращении и сохраняются в слотах экземпляра, повторное обращение —
+    чтение слота. Площадь хранится в ``_area``; стороны по возрастанию,
+    полупериметр и признак прямоугольности дешевы по сравнению с записью
+    слота и вычисляются вместе (``_sorted_sides``, ``_semi_perimeter``,
+    ``_is_right``). До вычисления ``_area`` и ``_sorted_sides`` равны
+    ``None``: конструктор записывает две отметки, а не отдельную на
+    каждую величину, и первый вызов ``area()`` не платит за остальные.
+    
+    Треугольники сравниваются по значению с точностью до конгруэнтности:
+    треугольники с одинаковыми сторонами в любом порядке равны и имеют
+    одинаковый хэш.
     """
     
+    __slots__ = ("side_a", "side_b", "side_c", "_sorted_sides", "_semi_perimeter",
+                 "_area", "_is_right", "__weakref__")
+    
     def __init__(self, side_a: float, side_b: float, side_c: float):
         """
         Инициализация треугольника.
@@ -88,37 +158,113 @@ class Triangle(Shape):
             TypeError: Если стороны не являются числами.
         """
         # Проверка типов
-        for side in [side_a, side_b, side_c]:
-            if not isinstance(side, (int, float)):
-                raise TypeError("Все стороны должны быть числами")
+        if not ((type(side_a) in _NUMBER_TYPES or isinstance(side_a, (int, float)))
+                and (type(side_b) in _NUMBER_TYPES or isinstance(side_b, (int, float)))
+                and (type(side_c) in _NUMBER_TYPES or isinstance(side_c, (int, float)))):
+            raise TypeError(TRIANGLE_TYPE_ERROR)
         
         # Проверка положительности сторон
         if side_a <= 0 or side_b <= 0 or side_c <= 0:
-            raise ValueError("Все стороны должны быть положительными числами")
+            raise ValueError(TRIANGLE_NON_POSITIVE_ERROR)
         
         # Проверка неравенства треугольника
         if (side_a + side_b <= side_c or 
             side_a + side_c <= side_b or 
             side_b + side_c <= side_a):
-            raise ValueError("Заданные стороны не образуют валидный треугольник")
+            raise ValueError(TRIANGLE_INEQUALITY_ERROR)
+        
+        # Дескрипторы слотов напрямую: быстрее object.__setattr__
+        _set_side_a(self, side_a)
+        _set_side_b(self, side_b)
+        _set_side_c(self, side_c)
+        _set_area(self, None)
+        _set_sorted_sides(self, None)
+    
+    @classmethod
+    def from_vertices(cls, vertex_a, vertex_b, vertex_c) -> "Triangle":
+        """
+        Создает треугольник по координатам вершин (2D или 3D).
+        
+        Площадь вычисляется по векторному произведению без квадратных
+        корней для 2D и с одним корнем для 3D; длины сторон вычисляются
+        только при обращении к ним.
         
-        self.side_a = side_a
-        self.side_b = side_b
-        self.side_c = side_c
+        Args:
+            vertex_a, vertex_b, vertex_c: Точки (x, y) или (x, y, z).
+        
+        Returns:
+            VertexTriangle: Треугольник (наследник Triangle).
+        
+        Raises:
+            ValueError: Если вершины лежат на одной прямой или имеют разную размерность.
+            TypeError: Если координаты не являются числами.
+        
+        Examples:
+            >>> Triangle.from_vertices((0, 0), (3, 0), (0, 4)).area()
+            6.0
+        """
+        return VertexTriangle(vertex_a, vertex_b, vertex_c)
+    
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("Треугольник неизменяем")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Треугольник неизменяем")
+    
+    def __reduce__(self):
+        # Слоты кэша не сериализуются: восстановление идет через конструктор
+        return (Triangle, (self.side_a, self.side_b, self.side_c))
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Triangle):
+            return self.sorted_sides == other.sorted_sides
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(("triangle",) + self.sorted_sides)
+    
+    def _derive(self) -> tuple:
+        """Вычисляет и сохраняет производные величины, кроме площади; возвращает стороны по возрастанию."""
+        sides, semi_perimeter, is_right = _derived(self.side_a, self.side_b, self.side_c)
+        _set_semi_perimeter(self, semi_perimeter)
+        _set_is_right(self, is_right)
+        _set_sorted_sides(self, sides)
+        return sides
+    
+    @property
+    def semi_perimeter(self) -> float:
+        """Полупериметр треугольника."""
+        if self._sorted_sides is None:
+            self._derive()
+        return self._semi_perimeter
+    
+    @property
+    def sorted_sides(self) -> tuple:
+        """Стороны по возрастанию; последняя — наибольшая."""
+        sides = self._sorted_sides
+        if sides is None:
+            sides = self._derive()
+        return sides
     
     def area(self) -> float:
         """
-        Вычисляет площадь треугольника по формуле Герона.
+        Вычисляет площадь треугольника по формуле Герона в форме Кахана.
+        
+        Стороны упорядочиваются a >= b >= c, и площадь считается как
+        ``sqrt((a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c))) / 4``.
+        Скобки обязательны: в такой записи вычитания точны, и формула
+        сохраняет точность для вырожденных («игольчатых») треугольников,
+        где учебная формула s(s-a)(s-b)(s-c) теряет большинство значащих цифр.
+        
+        Результат сохраняется, повторные вызовы не пересчитывают площадь.
         
         Returns:
             float: Площадь треугольника.
         """
-        # Вычисление площади по формуле Герона
-        semi_perimeter = (self.side_a + self.side_b + self.side_c) / 2
-        area = math.sqrt(semi_perimeter * 
-                         (semi_perimeter - self.side_a) * 
-                         (semi_perimeter - self.side_b) * 
-                         (semi_perimeter - self.side_c))
+        area = self._area
+        if area is None:
+            area = _kahan_area(self.side_a, self.side_b, self.side_c)
+            _set_area(self, area)
         return area
     
     def is_right_triangle(self) -> bool:
@@ -127,15 +273,14 @@ class Triangle(Shape):
         
         Использует теорему Пифагора: c² = a² + b²
         
+        Результат сохраняется вместе с отсортированными сторонами и полупериметром.
+        
         Returns:
             bool: True, если треугольник прямоугольный, False в противном случае.
         """
-        # Сортируем стороны для удобства проверки
-        sides = sorted([self.side_a, self.side_b, self.side_c])
-        a, b, c = sides[0], sides[1], sides[2]  # c - гипотенуза
-        
-        # Проверяем теорему Пифагора с учетом погрешностей вычислений
-        return abs(c**2 - (a**2 + b**2)) < 1e-10
+        if self._sorted_sides is None:
+            self._derive()
+        return self._is_right
     
     def __str__(self) -> str:
         return f"Треугольник(стороны={self.side_a}, {self.side_b}, {self.side_c})"
@@ -144,6 +289,355 @@ class Triangle(Shape):
         return f"Triangle(side_a={self.side_a}, side_b={self.side_b}, side_c={self.side_c})"
 
 
+def _check_sides(side_a: float, side_b: float, side_c: float) -> None:
+    """Проверки сторон из ``Triangle.__init__`` (там они встроены ради скорости)."""
+    if not ((type(side_a) in _NUMBER_TYPES or isinstance(side_a, (int, float)))
+            and (type(side_b) in _NUMBER_TYPES or isinstance(side_b, (int, float)))
+            and (type(side_c) in _NUMBER_TYPES or isinstance(side_c, (int, float)))):
+        raise TypeError(TRIANGLE_TYPE_ERROR)
+    if side_a <= 0 or side_b <= 0 or side_c <= 0:
+        raise ValueError(TRIANGLE_NON_POSITIVE_ERROR)
+    if (side_a + side_b <= side_c or
+        side_a + side_c <= side_b or
+        side_b + side_c <= side_a):
+        raise ValueError(TRIANGLE_INEQUALITY_ERROR)
+
+
+def _kahan_area(side_a: float, side_b: float, side_c: float) -> float:
+    """Площадь по формуле Герона в форме Кахана (см. Triangle.area)."""
+    a, b, c = side_a, side_b, side_c
+    if a > b:
+        a, b = b, a
+    if b > c:
+        b, c = c, b
+    if a > b:
+        a, b = b, a
+    # c >= b >= a
+    return 0.25 * math.sqrt((c + (b + a)) * (a - (c - b)) * (a + (c - b)) * (c + (b - a)))
+
+
+def _derived(side_a: float, side_b: float, side_c: float) -> tuple:
+    """
+    Производные величины треугольника по сторонам, кроме площади.
+    
+    Returns:
+        tuple: (стороны по возрастанию, полупериметр, прямоугольный ли).
+    """
+    a, b, c = side_a, side_b, side_c
+    if a > b:
+        a, b = b, a
+    if b > c:
+        b, c = c, b
+    if a > b:
+        a, b = b, a
+    # Теорема Пифагора (c — гипотенуза) с учетом погрешностей вычислений;
+    # x * x совпадает с x**2 (оба округляются корректно), но быстрее
+    is_right = abs(c * c - (a * a + b * b)) < 1e-10
+    return (a, b, c), (side_a + side_b + side_c) / 2, is_right
+
+
+def _cross_area(coords, start: int, dim: int) -> float:
+    """
+    Площадь треугольника по векторному произведению.
+
+    Вершины — тройка точек размерности dim (2 или 3) плоского буфера
+    coords с позиции start. Векторы ребер берутся от первой вершины.
+    """
+    if dim == 2:
+        x0, y0, x1, y1, x2, y2 = coords[start:start + 6]
+        ux, uy = x1 - x0, y1 - y0
+        wx, wy = x2 - x0, y2 - y0
+        return 0.5 * abs(ux * wy - uy * wx)
+    x0, y0, z0, x1, y1, z1, x2, y2, z2 = coords[start:start + 9]
+    ux, uy, uz = x1 - x0, y1 - y0, z1 - z0
+    wx, wy, wz = x2 - x0, y2 - y0, z2 - z0
+    cx = uy * wz - uz * wy
+    cy = uz * wx - ux * wz
+    cz = ux * wy - uy * wx
+    return 0.5 * math.sqrt(cx * cx + cy * cy + cz * cz)
+
+
+_set_radius = Circle.radius.__set__
+_SIDE_SLOTS = (Triangle.side_a, Triangle.side_b, Triangle.side_c)
+_set_side_a, _set_side_b, _set_side_c = (slot.__set__ for slot in _SIDE_SLOTS)
+_set_sorted_sides = Triangle._sorted_sides.__set__
+_set_semi_perimeter = Triangle._semi_perimeter.__set__
+_set_area = Triangle._area.__set__
+_set_is_right = Triangle._is_right.__set__
+
+
+def _lazy_side(position: int, name: str) -> property:
+    """Свойство стороны VertexTriangle: длины сторон вычисляются при первом обращении."""
+    get_slot = _SIDE_SLOTS[position].__get__
+
+    def getter(self):
+        side = get_slot(self)
+        if side is None:
+            return self._derive_sides()[position]
+        return side
+    getter.__name__ = name
+    return property(getter, doc=f"Длина стороны {name[-1]} (вычисляется при первом обращении).")
+
+
+class VertexTriangle(Triangle):
+    """
+    Треугольник, заданный координатами вершин (2D или 3D).
+
+    Создается через ``Triangle.from_vertices`` или напрямую. Площадь
+    вычисляется при создании по векторному произведению ребер — без
+    квадратных корней для 2D и с одним корнем для 3D — и не теряет
+    точность на вытянутых треугольниках, в отличие от формулы Герона по
+    сторонам, округленным до float. Стороны ``side_a`` (против вершины
+    a, то есть |bc|), ``side_b`` (|ca|) и ``side_c`` (|ab|) вычисляются
+    только при первом обращении к ним или к производным величинам
+    (полупериметр, прямоугольность, сравнение).
+    """
+
+    __slots__ = ("_coords", "_dim")
+
+    side_a = _lazy_side(0, "side_a")
+    side_b = _lazy_side(1, "side_b")
+    side_c = _lazy_side(2, "side_c")
+
+    def __init__(self, vertex_a, vertex_b, vertex_c):
+        """
+        Инициализация треугольника по вершинам.
+
+        Args:
+            vertex_a, vertex_b, vertex_c: Точки (x, y) или (x, y, z).
+
+        Raises:
+            ValueError: Если вершины лежат на одной прямой или имеют разную размерность.
+            TypeError: Если координаты не являются числами.
+        """
+        try:
+            vertex_a, vertex_b, vertex_c = tuple(vertex_a), tuple(vertex_b), tuple(vertex_c)
+        except TypeError:
+            raise TypeError(TRIANGLE_VERTEX_ERROR) from None
+        dim = len(vertex_a)
+        if dim not in (2, 3) or len(vertex_b) != dim or len(vertex_c) != dim:
+            raise ValueError(TRIANGLE_VERTEX_ERROR)
+        values = vertex_a + vertex_b + vertex_c
+        for value in values:
+            if not isinstance(value, (int, float)):
+                raise TypeError(TRIANGLE_COORDINATE_TYPE_ERROR)
+        coords = array('d', values)
+
+        area = _cross_area(coords, 0, dim)
+        if not area > 0:
+            raise ValueError(TRIANGLE_COLLINEAR_ERROR)
+
+        _set = object.__setattr__
+        _set(self, "_coords", coords)
+        _set(self, "_dim", dim)
+        _set_area(self, area)
+        # Стороны вычисляются при первом обращении (None — еще не вычислены)
+        _set_side_a(self, None)
+        _set_side_b(self, None)
+        _set_side_c(self, None)
+        _set_sorted_sides(self, None)
+
+    def _derive_sides(self) -> tuple:
+        """Вычисляет и сохраняет длины сторон (side_a, side_b, side_c)."""
+        a, b, c = self.vertices
+        sides = (math.dist(b, c), math.dist(c, a), math.dist(a, b))
+        for slot, side in zip(_SIDE_SLOTS, sides):
+            slot.__set__(self, side)
+        return sides
+
+    def __reduce__(self):
+        return (VertexTriangle, self.vertices)
+
+    @property
+    def vertices(self) -> tuple:
+        """Вершины (a, b, c) — кортежи координат."""
+        coords, dim = self._coords, self._dim
+        return tuple(tuple(coords[start:start + dim]) for start in range(0, 3 * dim, dim))
+
+    @property
+    def dimension(self) -> int:
+        """Размерность пространства вершин (2 или 3)."""
+        return self._dim
+
+    def __str__(self) -> str:
+        a, b, c = self.vertices
+        return f"Треугольник(вершины={a}, {b}, {c})"
+
+    def __repr__(self) -> str:
+        a, b, c = self.vertices
+        return f"Triangle.from_vertices({a}, {b}, {c})"
+
+
+def _shoelace(coords, start: int, stop: int) -> float:
+    """
+    Площадь многоугольника по формуле шнурков (Гаусса).
+
+    Вершины — пары [x, y] плоского буфера coords в позициях [start, stop).
+    Координаты сдвигаются к первой вершине: слагаемые становятся
+    площадями треугольников веера из нее и не теряют точность при
+    больших абсолютных координатах. Слагаемые с первой вершиной
+    равны нулю и пропускаются.
+    """
+    x0, y0 = coords[start], coords[start + 1]
+    total = 0.0
+    dx = coords[start + 2] - x0
+    dy = coords[start + 3] - y0
+    for index in range(start + 4, stop, 2):
+        next_dx = coords[index] - x0
+        next_dy = coords[index + 1] - y0
+        total += dx * next_dy - next_dx * dy
+        dx, dy = next_dx, next_dy
+    return 0.5 * abs(total)
+
+
+class Polygon(Shape):
+    """
+    Класс для представления простого многоугольника.
+
+    Вершины хранятся плоским буфером ``array('d')`` [x0, y0, x1, y1, ...]
+    (16 байт на вершину), поэтому пакетные функции собирают координаты
+    многих многоугольников копированием буферов, без обхода вершин в
+    Python. Площадь вычисляется при создании по формуле шнурков и не
+    зависит от направления обхода. Самопересечения не проверяются.
+
+    Многоугольник неизменяем и сравнивается по значению: равны
+    многоугольники с одинаковой последовательностью вершин.
+    """
+
+    __slots__ = ("_coords", "_area", "__weakref__")
+
+    def __init__(self, vertices):
+        """
+        Инициализация многоугольника.
+
+        Args:
+            vertices (Iterable): Вершины в порядке обхода — пары (x, y).
+                Замыкающее ребро от последней вершины к первой подразумевается.
+
+        Raises:
+            ValueError: Если вершин меньше трех или площадь равна нулю.
+            TypeError: Если вершина не является парой чисел.
+        """
+        coords = array('d')
+        for vertex in vertices:
+            try:
+                x, y = vertex
+            except (TypeError, ValueError):
+                raise TypeError(POLYGON_VERTEX_ERROR) from None
+            if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
+                raise TypeError(POLYGON_TYPE_ERROR)
+            coords.append(x)
+            coords.append(y)
+
+        if len(coords) < 6:
+            raise ValueError(POLYGON_VERTEX_COUNT_ERROR)
+
+        area = _shoelace(coords, 0, len(coords))
+        if area == 0:
+            raise ValueError(POLYGON_DEGENERATE_ERROR)
+
+        _set = object.__setattr__
+        _set(self, "_coords", coords)
+        _set(self, "_area", area)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("Многоугольник неизменяем")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Многоугольник неизменяем")
+
+    def __reduce__(self):
+        # Плоский буфер координат вместо кортежей вершин: компактнее и
+        # восстанавливается без разбора вершин
+        return (_polygon_from_coords, (self._coords,))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Polygon):
+            return self._coords == other._coords
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(("polygon",) + tuple(self._coords))
+
+    @property
+    def vertices(self) -> tuple:
+        """Вершины в порядке обхода — кортеж пар (x, y)."""
+        coords = self._coords
+        return tuple(zip(coords[0::2], coords[1::2]))
+
+    @property
+    def vertex_count(self) -> int:
+        """Количество вершин."""
+        return len(self._coords) // 2
+
+    def area(self) -> float:
+        """
+        Вычисляет площадь многоугольника по формуле шнурков.
+
+        Returns:
+            float: Площадь многоугольника (вычислена при создании).
+        """
+        return self._area
+
+    def __str__(self) -> str:
+        return f"Многоугольник(вершин={self.vertex_count})"
+
+    def __repr__(self) -> str:
+        return f"Polygon(vertices={self.vertices!r})"
+
+
+def _vertex_triangle_from_coords(coords: array, dim: int) -> VertexTriangle:
+    """
+    Треугольник по плоскому буферу вершин [ax, ay, (az,) bx, ...].
+
+    Путь восстановления кодека: буфер ``array('d')`` принимается во
+    владение без копирования и разбора вершин, проверки — как в
+    конструкторе.
+    """
+    if dim not in (2, 3) or len(coords) != 3 * dim:
+        raise ValueError(TRIANGLE_VERTEX_ERROR)
+    area = _cross_area(coords, 0, dim)
+    if not area > 0:
+        raise ValueError(TRIANGLE_COLLINEAR_ERROR)
+    triangle = object.__new__(VertexTriangle)
+    _set = object.__setattr__
+    _set(triangle, "_coords", coords)
+    _set(triangle, "_dim", dim)
+    _set_area(triangle, area)
+    _set_side_a(triangle, None)
+    _set_side_b(triangle, None)
+    _set_side_c(triangle, None)
+    _set_sorted_sides(triangle, None)
+    return triangle
+
+
+def _polygon_from_coords(coords: array) -> Polygon:
+    """
+    Многоугольник по плоскому буферу координат [x0, y0, x1, y1, ...].
+
+    Путь восстановления pickle и кодека: буфер ``array('d')`` принимается
+    во владение без копирования и разбора вершин, проверки — как в
+    конструкторе.
+    """
+    if len(coords) < 6 or len(coords) % 2:
+        raise ValueError(POLYGON_VERTEX_COUNT_ERROR)
+    area = _shoelace(coords, 0, len(coords))
+    if area == 0:
+        raise ValueError(POLYGON_DEGENERATE_ERROR)
+    polygon = object.__new__(Polygon)
+    _set = object.__setattr__
+    _set(polygon, "_coords", coords)
+    _set(polygon, "_area", area)
+    return polygon
+
+
+# Регистрация встроенных фигур в реестре ядер площади
+register_area_kernel(Circle)
+register_area_kernel(Triangle)
+register_area_kernel(VertexTriangle)
+register_area_kernel(Polygon)
+
+
 # Полиморфная функция для вычисления площади любой фигуры
 def calculate_area(shape: Shape) -> float:
     """
@@ -167,10 +661,44 @@ def calculate_area(shape: Shape) -> float:
         >>> calculate_area(triangle)
         6.0
     """
-    if not isinstance(shape, Shape):
-        raise TypeError("Объект должен быть экземпляром класса Shape")
+    # Диспетчеризация по точному типу: одно обращение к словарю вместо
+    # проверки isinstance по ABC на каждом вызове
+    shape_type = type(shape)
+    kernel = _area_kernels.get(shape_type)
+    if kernel is None:
+        if not isinstance(shape, Shape):
+            raise TypeError("Объект должен быть экземпляром класса Shape")
+        # Незарегистрированный наследник Shape: регистрируем вызов area()
+        register_area_kernel(shape_type)
+        kernel = _area_kernels[shape_type]
+    
+    cache = _cache._active_cache
+    if cache is not None:
+        # NaN в ключе не равен сам себе: такой ключ никогда не дал бы
+        # попадания и только вытеснял бы записи, поэтому не кэшируется
+        # Промах считается ядром реестра, чтобы его видела инструментация
+        if shape_type is Circle and math.isfinite(shape.radius):
+            return cache.get_or_compute(("circle", shape.radius), lambda: kernel(shape))
+        if shape_type is Triangle and math.isfinite(shape.side_a + shape.side_b + shape.side_c):
+            return cache.get_or_compute(("triangle",) + shape.sorted_sides, lambda: kernel(shape))
     
-    return shape.area()
+    return kernel(shape)
+
+
+def _triangle_cache_key(side_a: float, side_b: float, side_c: float) -> tuple:
+    """
+    Ключ кэша площади треугольника: отсортированные стороны.
+    
+    ``Triangle.area()`` тоже упорядочивает стороны, поэтому площадь,
+    сохраненная при промахе, не зависит от их порядка при первом обращении.
+    """
+    if side_a > side_b:
+        side_a, side_b = side_b, side_a
+    if side_b > side_c:
+        side_b, side_c = side_c, side_b
+    if side_a > side_b:
+        side_a, side_b = side_b, side_a
+    return ("triangle", side_a, side_b, side_c)
 
 
 # Функция проверки прямоугольного треугольника
@@ -213,6 +741,17 @@ def circle_area(radius: float) -> float:
     Returns:
         float: Площадь круга.
     """
+    cache = _cache._active_cache
+    if cache is None:
+        # Кэш выключен: проверки конструктора и формула Circle.area без объекта
+        if type(radius) not in _NUMBER_TYPES and not isinstance(radius, (int, float)):
+            raise TypeError(CIRCLE_TYPE_ERROR)
+        if radius < 0:
+            raise ValueError(CIRCLE_NEGATIVE_ERROR)
+        return math.pi * radius * radius
+    if isinstance(radius, (int, float)) and math.isfinite(radius):
+        return cache.get_or_compute(("circle", radius), lambda: Circle(radius).area())
+    
     circle = Circle(radius)
     return circle.area()
 
@@ -231,5 +770,17 @@ def triangle_area(side_a: float, side_b: float, side_c: float) -> float:
     Returns:
         float: Площадь треугольника.
     """
+    cache = _cache._active_cache
+    if cache is None:
+        # Кэш выключен: те же проверки, что в конструкторе, и сразу формула —
+        # без объекта, который тут же был бы выброшен
+        _check_sides(side_a, side_b, side_c)
+        return _kahan_area(side_a, side_b, side_c)
+    if (isinstance(side_a, (int, float))
+            and isinstance(side_b, (int, float)) and isinstance(side_c, (int, float))
+            and math.isfinite(side_a + side_b + side_c)):
+        return cache.get_or_compute(_triangle_cache_key(side_a, side_b, side_c),
+                                    lambda: Triangle(side_a, side_b, side_c).area())
+    
     triangle = Triangle(side_a, side_b, side_c)
     return triangle.area() 
\ No newline at end of file
@@ -0,0 +1,351 @@
+"""
+Бинарное колоночное хранилище фигур с чтением через mmap.
+
+Формат файла (little-endian):
+
+    заголовок, 64 байта:
+        magic       8s   b"GCSTORE\\0"
+        version     u16  версия формата (1)
+        flags       u16  бит 0 — есть колонка площадей
+        columns     u16  количество колонок (включая площадь)
+        reserved    u16
+        kind        16s  тип фигуры ASCII ("circle", "triangle"), дополненный нулями
+        count       u64  количество фигур
+        padding     до 64 байт
+    колонки:
+        count × float64 для каждого параметра в порядке аргументов
+        конструктора, затем (если флаг) count × float64 площадей
+
+Все колонки выровнены на 8 байт, поэтому ``open_store`` отдает их как
+``numpy.ndarray`` (только чтение) или ``memoryview`` поверх отображения
+файла без копирования и без разбора: открытие файла любого размера
+стоит O(1), страницы читаются ОС по мере обращения.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Optional, Tuple, Type
+
+from . import _backend
+from .collection import _LAYOUTS
+from .precision import DOUBLE
+from .shapes import Circle, Shape, Triangle
+
+
+MAGIC = b"GCSTORE\0"
+FORMAT_VERSION = 1
+HEADER_SIZE = 64
+FLAG_AREAS = 0x1
+
+_HEADER = struct.Struct("<8sHHHH16sQ")
+
+_KINDS: Dict[type, str] = {Circle: "circle", Triangle: "triangle"}
+_TYPES: Dict[str, type] = {kind: shape_type for shape_type, kind in _KINDS.items()}
+
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _layout(shape_type: type):
+    """Имена колонок, пакетная функция площади и валидация типа фигуры."""
+    try:
+        return _LAYOUTS[shape_type]
+    except KeyError:
+        raise TypeError(f"Тип {shape_type.__name__} не поддерживает бинарное хранение") from None
+
+
+def _column_bytes(values: Any, count: Optional[int]) -> memoryview:
+    """Байтовое представление колонки float64 (little-endian) без лишних копий."""
+    np = _backend.get_numpy()
+    if np is not None:
+        column = np.ascontiguousarray(values, dtype="<f8")
+        if column.ndim != 1:
+            raise ValueError("Колонка должна быть одномерным массивом")
+        view = memoryview(column).cast("B")
+    else:
+        try:
+            view = memoryview(values)
+        except TypeError:
+            view = None
+        if view is None or view.format != "d" or not view.c_contiguous:
+            view = memoryview(array('d', values))
+        if not _NATIVE_LITTLE_ENDIAN:
+            swapped = array('d', view)
+            swapped.byteswap()
+            view = memoryview(swapped)
+        view = view.cast("B")
+    if count is not None and len(view) != count * 8:
+        raise ValueError("Колонки должны иметь одинаковую длину")
+    return view
+
+
+class StoreWriter:
+    """
+    Последовательная запись хранилища порциями.
+
+    Количество фигур задается заранее: колонки располагаются в файле
+    подряд, и каждая порция записывается в свою позицию каждой колонки.
+    Это позволяет записывать файлы больше оперативной памяти.
+
+    Examples:
+        >>> with StoreWriter("circles.gcs", Circle, count=2, store_areas=True) as writer:
+        ...     writer.append([1.0])
+        ...     writer.append([2.0])
+    """
+
+    def __init__(self, path: str, shape_type: Type[Shape], count: int,
+                 store_areas: bool = False):
+        """
+        Инициализация.
+
+        Args:
+            path (str): Путь к создаваемому файлу.
+            shape_type (type): Circle или Triangle.
+            count (int): Общее количество фигур.
+            store_areas (bool): Сохранять колонку площадей.
+
+        Raises:
+            TypeError: Если тип фигуры не поддерживается.
+            ValueError: Если count отрицателен.
+        """
+        names, area_kernel, _ = _layout(shape_type)
+        if count < 0:
+            raise ValueError("Количество фигур не может быть отрицательным")
+        self._names = names
+        self._area_kernel = area_kernel if store_areas else None
+        self._count = count
+        self._written = 0
+        self._columns = len(names) + (1 if store_areas else 0)
+
+        self._file = open(path, "wb")
+        header = _HEADER.pack(MAGIC, FORMAT_VERSION, FLAG_AREAS if store_areas else 0,
+                              self._columns, 0, _KINDS[shape_type].encode("ascii"), count)
+        self._file.write(header.ljust(HEADER_SIZE, b"\0"))
+        self._file.truncate(HEADER_SIZE + self._columns * count * 8)
+
+    def append(self, *columns: Any) -> None:
+        """
+        Записывает порцию фигур.
+
+        Args:
+            *columns: Колонки параметров порции в порядке аргументов конструктора.
+
+        Raises:
+            ValueError: Если колонки разной длины или превышено количество фигур.
+        """
+        if len(columns) != len(self._names):
+            raise TypeError(f"Ожидается колонок: {len(self._names)}")
+        views = []
+        size = None
+        for column in columns:
+            view = _column_bytes(column, size)
+            size = len(view) // 8
+            views.append(view)
+        if self._written + size > self._count:
+            raise ValueError("Превышено заявленное количество фигур")
+        if self._area_kernel is not None:
+            # Колонка площадей float64: режим точности контекста не применяется
+            views.append(_column_bytes(self._area_kernel(*columns, precision=DOUBLE), size))
+
+        for position, view in enumerate(views):
+            self._file.seek(HEADER_SIZE + (position * self._count + self._written) * 8)
+            self._file.write(view)
+        self._written += size
+
+    def close(self) -> None:
+        """
+        Завершает запись.
+
+        Raises:
+            ValueError: Если записано меньше фигур, чем заявлено.
+        """
+        if self._file.closed:
+            return
+        self._file.close()
+        if self._written != self._count:
+            raise ValueError(f"Записано фигур: {self._written} из {self._count}")
+
+    def __enter__(self) -> "StoreWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+
+
+def write_store(path: str, shape_type: Type[Shape], *columns: Any,
+                store_areas: bool = False) -> int:
+    """
+    Записывает колонки параметров в файл хранилища.
+
+    Args:
+        path (str): Путь к файлу.
+        shape_type (type): Circle или Triangle.
+        *columns: Колонки параметров в порядке аргументов конструктора.
+        store_areas (bool): Сохранить также колонку площадей.
+
+    Returns:
+        int: Количество записанных фигур.
+
+    Examples:
+        >>> write_store("triangles.gcs", Triangle, [3.0], [4.0], [5.0], store_areas=True)
+        1
+    """
+    count = len(_column_bytes(columns[0], None)) // 8 if columns else 0
+    with StoreWriter(path, shape_type, count, store_areas) as writer:
+        writer.append(*columns)
+    return count
+
+
+class ShapeStore:
+    """
+    Хранилище фигур, отображенное в память (только чтение).
+
+    Колонки — представления отображения без копирования. Пока живы
+    полученные колонки, отображение остается открытым даже после close().
+    """
+
+    def __init__(self, path: str):
+        """
+        Открывает файл хранилища.
+
+        Args:
+            path (str): Путь к файлу.
+
+        Raises:
+            ValueError: Если файл поврежден или имеет неизвестный формат.
+        """
+        with open(path, "rb") as stream:
+            size = os.fstat(stream.fileno()).st_size
+            if size < HEADER_SIZE:
+                raise ValueError("Файл слишком мал для хранилища фигур")
+            self._mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, flags, columns, _, kind, count = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError("Файл не является хранилищем фигур")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Неподдерживаемая версия формата: {version}")
+        kind = kind.rstrip(b"\0").decode("ascii")
+        try:
+            shape_type = _TYPES[kind]
+        except KeyError:
+            raise ValueError(f"Неизвестный тип фигуры: {kind!r}") from None
+        names, self._area_kernel, self._validator = _layout(shape_type)
+        has_areas = bool(flags & FLAG_AREAS)
+        if columns != len(names) + has_areas or size < HEADER_SIZE + columns * count * 8:
+            raise ValueError("Файл хранилища поврежден")
+
+        self._shape_type = shape_type
+        self._names = names
+        self._count = count
+        self._has_areas = has_areas
+        self._buffer = memoryview(self._mmap)
+
+    @property
+    def shape_type(self) -> type:
+        """Тип фигур хранилища."""
+        return self._shape_type
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Имена колонок параметров."""
+        return self._names
+
+    @property
+    def has_areas(self) -> bool:
+        """True, если в файле сохранена колонка площадей."""
+        return self._has_areas
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _column_at(self, position: int):
+        """Колонка с номером position как представление отображения."""
+        start = HEADER_SIZE + position * self._count * 8
+        raw = self._buffer[start:start + self._count * 8]
+        np = _backend.get_numpy()
+        if np is not None:
+            return np.frombuffer(raw, dtype="<f8")
+        if _NATIVE_LITTLE_ENDIAN:
+            return raw.cast("d")
+        swapped = array('d', raw.tobytes())
+        swapped.byteswap()
+        return swapped
+
+    def column(self, name: str):
+        """
+        Возвращает колонку параметра без копирования.
+
+        Args:
+            name (str): Имя параметра, например "radius" или "side_a".
+
+        Returns:
+            numpy.ndarray | memoryview: Колонка float64 только для чтения.
+        """
+        try:
+            position = self._names.index(name)
+        except ValueError:
+            raise KeyError(name) from None
+        return self._column_at(position)
+
+    @property
+    def columns(self) -> Dict[str, Any]:
+        """Словарь имя параметра → колонка."""
+        return {name: self._column_at(position) for position, name in enumerate(self._names)}
+
+    def areas(self):
+        """
+        Возвращает площади: сохраненную колонку или результат пакетной функции.
+
+        Returns:
+            numpy.ndarray | memoryview | array.array: Площади фигур.
+        """
+        if self._has_areas:
+            return self._column_at(len(self._names))
+        return self._area_kernel(*(self._column_at(i) for i in range(len(self._names))))
+
+    def validate(self):
+        """Пакетная валидация параметров (ValidationResult)."""
+        return self._validator(*(self._column_at(i) for i in range(len(self._names))))
+
+    def close(self) -> None:
+        """Закрывает отображение (если на него нет живых ссылок из колонок)."""
+        self._buffer.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Колонки еще используются: отображение закроется вместе с ними
+            pass
+
+    def __enter__(self) -> "ShapeStore":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (f"ShapeStore({self._shape_type.__name__}, {self._count} фигур, "
+                f"areas={self._has_areas})")
+
+
+def open_store(path: str) -> ShapeStore:
+    """
+    Открывает файл хранилища через mmap.
+
+    Args:
+        path (str): Путь к файлу.
+
+    Returns:
+        ShapeStore: Хранилище только для чтения.
+
+    Examples:
+        >>> with open_store("triangles.gcs") as store:
+        ...     list(store.areas())
+        [6.0]
+    """
+    return ShapeStore(path)
@@ -0,0 +1,192 @@
+"""
+Пакетное вычисление площадей на пуле потоков.
+
+Колонка делится на диапазоны строк, потоки пула считают свои диапазоны
+и пишут площади в общий выходной массив без копирования входа. С NumPy
+встроенные ядра состоят из ufunc'ов, которые отпускают GIL на время
+цикла по массиву, поэтому потоки масштабируются и на обычном CPython.
+Без NumPy диапазоны считаются циклами чистого Python: они параллельны
+только на free-threaded сборке (PEP 703), а при включенном GIL
+вычисление выполняется в текущем потоке.
+
+В отличие от ``parallel`` не требуется разделяемая память и запуск
+процессов, поэтому порог размера входа намного ниже. Функции модуля
+можно вызывать конкурентно из нескольких потоков, в том числе с общим
+``executor`` веб-сервера.
+"""
+
+import contextvars
+import math
+import os
+import sys
+from array import array
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+from . import _backend
+from .batch import (
+    _as_column, _circle_areas_into, _result, _triangle_areas_into, circle_areas, triangle_areas
+)
+from .precision import SINGLE, resolve_precision
+
+
+# Меньшие входы считаются в текущем потоке: передача задач пулу дороже вычислений
+MIN_THREADED_SIZE = 65_536
+# Порций на поток по умолчанию (балансировка нагрузки)
+CHUNKS_PER_THREAD = 4
+
+# Встроенные ядра, которые умеют писать результат в готовый массив
+_INPLACE_KERNELS = {
+    circle_areas: _circle_areas_into,
+    triangle_areas: _triangle_areas_into,
+}
+
+
+def gil_enabled() -> bool:
+    """
+    Проверяет, включен ли GIL в текущем интерпретаторе.
+
+    Returns:
+        bool: False на free-threaded сборке CPython с отключенным GIL.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def _ranges(length: int, threads: int, chunk_size: Optional[int]) -> List[range]:
+    """Разбивает [0, length) на диапазоны для потоков пула."""
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(length / (threads * CHUNKS_PER_THREAD)))
+    return [range(start, min(start + chunk_size, length))
+            for start in range(0, length, chunk_size)]
+
+
+def run_kernel(function: Callable[..., Any], columns: Sequence[Any],
+               threads: Optional[int] = None, chunk_size: Optional[int] = None,
+               executor: Optional[Executor] = None):
+    """
+    Применяет пакетное ядро к колонкам по диапазонам строк на пуле потоков.
+
+    Встроенные ядра (``circle_areas``, ``triangle_areas``) пишут площади
+    прямо в выходной массив; для остальных ядер результат каждого
+    диапазона копируется в свою позицию выходного массива.
+
+    Args:
+        function (callable): Пакетное ядро ``function(*columns) -> areas``.
+        columns (Sequence): Колонки параметров одинаковой длины.
+        threads (int | None): Количество потоков (по умолчанию os.cpu_count()).
+        chunk_size (int | None): Строк в одной задаче пула
+            (по умолчанию len / (threads * CHUNKS_PER_THREAD)).
+        executor (Executor | None): Готовый пул потоков; если не задан,
+            на время вызова создается собственный пул.
+
+    Returns:
+        numpy.ndarray | array.array: Массив площадей: float64, в режиме
+        точности single текущего контекста — float32 (как у самого ядра).
+
+    Raises:
+        ValueError: Если колонки разной длины, threads или chunk_size
+            неположительны.
+    """
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным числом")
+    if threads is not None and threads <= 0:
+        raise ValueError("Количество потоков должно быть положительным числом")
+
+    columns = [_as_column(column) for column in columns]
+    length = len(columns[0])
+    if any(len(column) != length for column in columns):
+        raise ValueError("Колонки сторон должны иметь одинаковую длину")
+
+    np = _backend.get_numpy()
+    threads = threads or os.cpu_count() or 1
+    if threads == 1 or length < MIN_THREADED_SIZE or (np is None and gil_enabled()):
+        return function(*columns)
+
+    precision = resolve_precision()
+    if np is not None:
+        areas = np.empty(length, dtype=np.float32 if precision == SINGLE else np.float64)
+        # Ядра «на месте» считают в float64; в режиме single вызывается само
+        # ядро, как и без пула потоков
+        inplace = None if precision == SINGLE else _INPLACE_KERNELS.get(function)
+    else:
+        typecode = 'f' if precision == SINGLE else 'd'
+        areas = array(typecode, bytes(array(typecode).itemsize * length))
+        inplace = None
+
+    def compute(part: range) -> None:
+        start, stop = part.start, part.stop
+        parts = [column[start:stop] for column in columns]
+        if inplace is not None:
+            inplace(np, *parts, areas[start:stop])
+            return
+        result = function(*parts)
+        if np is None and not (isinstance(result, array) and result.typecode == areas.typecode):
+            result = _result(result, precision)
+        areas[start:stop] = result
+
+    def submit(pool: Executor, part: range):
+        # Задача выполняется в копии контекста вызывающего потока: ядро
+        # видит его режим точности (area_precision)
+        return pool.submit(contextvars.copy_context().run, compute, part)
+
+    parts = _ranges(length, threads, chunk_size)
+    if executor is not None:
+        futures = [submit(executor, part) for part in parts]
+        for future in futures:
+            future.result()
+    else:
+        with ThreadPoolExecutor(max_workers=min(threads, len(parts))) as pool:
+            for future in [submit(pool, part) for part in parts]:
+                future.result()
+    return areas
+
+
+def threaded_circle_areas(radii: Any, threads: Optional[int] = None,
+                          chunk_size: Optional[int] = None,
+                          executor: Optional[Executor] = None):
+    """
+    Вычисляет площади кругов на пуле потоков.
+
+    Args:
+        radii: Одномерный массив радиусов.
+        threads (int | None): Количество потоков (по умолчанию os.cpu_count()).
+        chunk_size (int | None): Строк в одной задаче пула.
+        executor (Executor | None): Готовый пул потоков.
+
+    Returns:
+        numpy.ndarray | array.array: Массив площадей, как у circle_areas().
+
+    Raises:
+        ValueError: Если threads или chunk_size неположительны.
+
+    Examples:
+        >>> list(threaded_circle_areas([1.0, 5.0], threads=4))
+        [3.141592653589793, 78.53981633974483]
+    """
+    return run_kernel(circle_areas, [radii], threads, chunk_size, executor)
+
+
+def threaded_triangle_areas(side_a: Any, side_b: Any, side_c: Any,
+                            threads: Optional[int] = None,
+                            chunk_size: Optional[int] = None,
+                            executor: Optional[Executor] = None):
+    """
+    Вычисляет площади треугольников на пуле потоков.
+
+    Args:
+        side_a: Колонка первых сторон.
+        side_b: Колонка вторых сторон.
+        side_c: Колонка третьих сторон.
+        threads (int | None): Количество потоков (по умолчанию os.cpu_count()).
+        chunk_size (int | None): Строк в одной задаче пула.
+        executor (Executor | None): Готовый пул потоков.
+
+    Returns:
+        numpy.ndarray | array.array: Массив площадей, как у triangle_areas().
+
+    Raises:
+        ValueError: Если колонки имеют разную длину, threads или chunk_size
+            неположительны.
+    """
+    return run_kernel(triangle_areas, [side_a, side_b, side_c], threads, chunk_size, executor)
@@ -0,0 +1,222 @@
+"""
+Пакетная (векторизованная) валидация параметров фигур.
+
+Вместо исключения на первой невалидной строке функции модуля
+возвращают маску валидности и код ошибки для каждой строки. Коды
+соответствуют исключениям, которые выбросили бы конструкторы
+``Circle`` и ``Triangle``, и проверяются в том же порядке: тип,
+знак, неравенство треугольника. Дополнительно строка с целым числом вне
+диапазона float (конструктор его принимает, но площадь не вычислить)
+получает код ``OUT_OF_RANGE``.
+"""
+
+import math
+from array import array
+from enum import IntEnum
+from typing import Any, NamedTuple
+
+from . import _backend
+from .batch import _as_column
+from .shapes import (
+    Circle, Triangle,
+    CIRCLE_TYPE_ERROR, CIRCLE_NEGATIVE_ERROR,
+    TRIANGLE_TYPE_ERROR, TRIANGLE_NON_POSITIVE_ERROR, TRIANGLE_INEQUALITY_ERROR,
+)
+
+
+NUMBER_RANGE_ERROR = "Параметр фигуры вне диапазона float"
+
+# Форматы буфера (модуль struct) с числами: без них значения проверяются поэлементно
+_NUMERIC_FORMATS = frozenset("bBhHiIlLqQnNefd?")
+
+
+class ErrorCode(IntEnum):
+    """Коды результата валидации строки."""
+
+    OK = 0
+    NOT_A_NUMBER = 1          # TypeError: параметр не является числом
+    NEGATIVE_RADIUS = 2       # ValueError: отрицательный радиус
+    NON_POSITIVE_SIDE = 3     # ValueError: неположительная сторона
+    TRIANGLE_INEQUALITY = 4   # ValueError: нарушено неравенство треугольника
+    OUT_OF_RANGE = 5          # ValueError: целое число не представимо во float
+
+
+_ERRORS = {
+    Circle: {
+        ErrorCode.NOT_A_NUMBER: (TypeError, CIRCLE_TYPE_ERROR),
+        ErrorCode.NEGATIVE_RADIUS: (ValueError, CIRCLE_NEGATIVE_ERROR),
+        ErrorCode.OUT_OF_RANGE: (ValueError, NUMBER_RANGE_ERROR),
+    },
+    Triangle: {
+        ErrorCode.NOT_A_NUMBER: (TypeError, TRIANGLE_TYPE_ERROR),
+        ErrorCode.NON_POSITIVE_SIDE: (ValueError, TRIANGLE_NON_POSITIVE_ERROR),
+        ErrorCode.TRIANGLE_INEQUALITY: (ValueError, TRIANGLE_INEQUALITY_ERROR),
+        ErrorCode.OUT_OF_RANGE: (ValueError, NUMBER_RANGE_ERROR),
+    },
+}
+
+
+class ValidationResult(NamedTuple):
+    """
+    Результат пакетной валидации.
+
+    Attributes:
+        valid: Маска валидных строк (``numpy.ndarray`` bool или ``array('b')``).
+        codes: Коды ошибок ``ErrorCode`` (``numpy.ndarray`` uint8 или ``array('B')``).
+    """
+
+    valid: Any
+    codes: Any
+
+
+def error_for(shape_type: type, code: int) -> Exception:
+    """
+    Возвращает исключение, которое выбросил бы конструктор фигуры.
+
+    Args:
+        shape_type (type): Circle или Triangle.
+        code (int): Код ошибки, отличный от ErrorCode.OK.
+
+    Returns:
+        Exception: Экземпляр TypeError или ValueError с исходным сообщением.
+
+    Raises:
+        KeyError: Если код не применим к данному типу фигуры.
+    """
+    exception_type, message = _ERRORS[shape_type][ErrorCode(code)]
+    return exception_type(message)
+
+
+def _numeric_column(values: Any):
+    """
+    Приводит колонку к числам, помечая строки с непригодными значениями.
+
+    Returns:
+        tuple: (колонка float64, коды строк или None). Коды —
+        ``NOT_A_NUMBER`` для нечисловых значений, ``OUT_OF_RANGE`` для
+        целых вне диапазона float, ``OK`` для остальных; в колонке на их
+        месте NaN.
+    """
+    try:
+        view = memoryview(values)
+    except TypeError:
+        pass
+    else:
+        # Буфер с числами (не объекты и не строки NumPy) приводится целиком
+        if view.format.lstrip("@=<>!") in _NUMERIC_FORMATS:
+            return _as_column(values), None
+
+    values = list(values)
+    not_number = [not isinstance(value, (int, float)) for value in values]
+    if not any(not_number):
+        try:
+            return _as_column(values), None
+        except OverflowError:
+            pass
+    bad = [ErrorCode.NOT_A_NUMBER if is_bad else ErrorCode.OK for is_bad in not_number]
+    for index, value in enumerate(values):
+        if not bad[index] and isinstance(value, int):
+            try:
+                float(value)
+            except OverflowError:
+                bad[index] = ErrorCode.OUT_OF_RANGE
+    nan = math.nan
+    cleaned = [nan if code else value for value, code in zip(values, bad)]
+    return _as_column(cleaned), bad
+
+
+def _mark_bad(codes, masks, np):
+    """Переносит коды непригодных значений колонок; NOT_A_NUMBER важнее OUT_OF_RANGE."""
+    for bad_code in (ErrorCode.OUT_OF_RANGE, ErrorCode.NOT_A_NUMBER):
+        for mask in masks:
+            if np is not None:
+                codes[np.asarray(mask, dtype=np.uint8) == bad_code] = bad_code
+            else:
+                codes = [bad_code if bad == bad_code else code
+                         for code, bad in zip(codes, mask)]
+    return codes
+
+
+def _finish(codes, np):
+    """Формирует ValidationResult из колонки кодов."""
+    if np is not None:
+        return ValidationResult(codes == ErrorCode.OK, codes)
+    codes = array('B', codes)
+    return ValidationResult(array('b', [code == ErrorCode.OK for code in codes]), codes)
+
+
+def validate_circles(radii: Any) -> ValidationResult:
+    """
+    Проверяет массив радиусов за один проход.
+
+    Args:
+        radii: Одномерный массив или последовательность радиусов.
+
+    Returns:
+        ValidationResult: Маска валидности и коды ошибок по строкам.
+
+    Examples:
+        >>> result = validate_circles([1.0, -2.0, "3"])
+        >>> list(result.codes)
+        [0, 2, 1]
+    """
+    radii, bad = _numeric_column(radii)
+    masks = [bad] if bad is not None else []
+    np = _backend.get_numpy()
+    if np is not None:
+        codes = np.where(radii < 0, np.uint8(ErrorCode.NEGATIVE_RADIUS), np.uint8(ErrorCode.OK))
+        return _finish(_mark_bad(codes, masks, np), np)
+
+    codes = [ErrorCode.NEGATIVE_RADIUS if r < 0 else ErrorCode.OK for r in radii]
+    return _finish(_mark_bad(codes, masks, None), None)
+
+
+def validate_triangles(side_a: Any, side_b: Any, side_c: Any) -> ValidationResult:
+    """
+    Проверяет колонки сторон треугольников за один проход.
+
+    Args:
+        side_a: Колонка первых сторон.
+        side_b: Колонка вторых сторон.
+        side_c: Колонка третьих сторон.
+
+    Returns:
+        ValidationResult: Маска валидности и коды ошибок по строкам.
+
+    Raises:
+        ValueError: Если колонки имеют разную длину.
+
+    Examples:
+        >>> result = validate_triangles([3, 1, 0], [4, 2, 1], [5, 5, 1])
+        >>> list(result.codes)
+        [0, 4, 3]
+    """
+    side_a, bad_a = _numeric_column(side_a)
+    side_b, bad_b = _numeric_column(side_b)
+    side_c, bad_c = _numeric_column(side_c)
+    if not len(side_a) == len(side_b) == len(side_c):
+        raise ValueError("Колонки сторон должны иметь одинаковую длину")
+    bad_masks = [mask for mask in (bad_a, bad_b, bad_c) if mask is not None]
+
+    np = _backend.get_numpy()
+    if np is not None:
+        # Сумма сторон у границы float переполняется до inf, как и в Python
+        with np.errstate(over='ignore'):
+            inequality = ((side_a + side_b <= side_c) |
+                          (side_a + side_c <= side_b) |
+                          (side_b + side_c <= side_a))
+        non_positive = (side_a <= 0) | (side_b <= 0) | (side_c <= 0)
+        codes = np.where(inequality, np.uint8(ErrorCode.TRIANGLE_INEQUALITY), np.uint8(ErrorCode.OK))
+        codes[non_positive] = ErrorCode.NON_POSITIVE_SIDE
+        return _finish(_mark_bad(codes, bad_masks, np), np)
+
+    codes = []
+    append = codes.append
+    for a, b, c in zip(side_a, side_b, side_c):
+        if a <= 0 or b <= 0 or c <= 0:
+            append(ErrorCode.NON_POSITIVE_SIDE)
+        elif a + b <= c or a + c <= b or b + c <= a:
+            append(ErrorCode.TRIANGLE_INEQUALITY)
+        else:
+            append(ErrorCode.OK)
+    return _finish(_mark_bad(codes, bad_masks, None), None)
@@ -16,7 +16,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/geometry_calculator",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -25,7 +25,6 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
@@ -37,11 +36,14 @@ setup(
         "Topic :: Education",
         "Typing :: Typed",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.8",
     install_requires=[
         # Библиотека использует только стандартную библиотеку Python
     ],
     extras_require={
+        "fast": [
+            "numpy>=1.17",  # Векторизация пакетных функций
+        ],
         "dev": [
             "pytest>=6.0",  # Опционально, для альтернативы unittest
             "pytest-cov>=2.0",  # Для покрытия кода
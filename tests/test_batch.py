@@ -0,0 +1,198 @@
+"""
+Тесты для модуля batch.
+"""
+
+import unittest
+import math
+import random
+from array import array
+from decimal import Decimal, localcontext
+from fractions import Fraction
+from unittest import mock
+
+from geometry_calculator import _backend
+from geometry_calculator.registry import register_batch_kernel, unregister
+from geometry_calculator.shapes import Shape, Circle, Triangle, calculate_area
+from geometry_calculator.batch import calculate_areas, circle_areas, triangle_areas, triple_columns
+
+
+RADII = [0, 1, 2.5, 5, 1e-3, 1e6, 30.19510412751344]
+TRIANGLES = [(3, 4, 5), (6, 6, 6), (5, 6, 7), (0.1, 0.2, 0.25), (1e5, 1e5, 1.5e5)]
+
+
+def _needle_triangles(count=200, seed=17):
+    """Почти вырожденные треугольники: c близка к a + b или к нулю."""
+    rng = random.Random(seed)
+    triangles = [(1.0, 1.0, 1e-10), (1e5, 1e5, 1e-3), (2.0, 1.0, 1.0 + 1e-12)]
+    while len(triangles) < count:
+        a, b = rng.uniform(1, 2), rng.uniform(1, 2)
+        c = (a + b) * (1 - 10.0 ** -rng.randint(4, 14))
+        if a + b > c:
+            triangles.append((a, b, c))
+    return triangles
+
+
+def _exact_area(a, b, c):
+    """Площадь в точной рациональной арифметике, округленная до float."""
+    a, b, c = Fraction(a), Fraction(b), Fraction(c)
+    sixteen_area_squared = (a + b + c) * (-a + b + c) * (a - b + c) * (a + b - c)
+    with localcontext() as context:
+        context.prec = 60
+        square = (Decimal(sixteen_area_squared.numerator) /
+                  Decimal(sixteen_area_squared.denominator))
+        return float(square.sqrt() / 4)
+
+
+def _relative_error(value, exact):
+    return abs(value - exact) / exact
+
+
+class Rectangle(Shape):
+    """Сторонняя фигура с пакетным ядром."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def area(self):
+        return self.width * self.height
+
+    def __str__(self):
+        return f"Прямоугольник({self.width}x{self.height})"
+
+
+class Square(Shape):
+    """Сторонняя фигура без пакетного ядра."""
+
+    def __init__(self, side):
+        self.side = side
+
+    def area(self):
+        return self.side * self.side
+
+    def __str__(self):
+        return f"Квадрат({self.side})"
+
+
+def _mixed_shapes():
+    """Разнотипные фигуры вперемешку."""
+    shapes = []
+    for i, (r, sides) in enumerate(zip(RADII, TRIANGLES * 2)):
+        shapes += [Triangle(*sides), Circle(r), Square(i + 0.5), Rectangle(i + 1, 2.5)]
+    return shapes
+
+
+class BatchAreaTests:
+    """Общие тесты пакетных функций для любого backend'а."""
+
+    def test_circle_areas_match_scalar(self):
+        """Площади кругов совпадают с Circle.area() побитово."""
+        areas = circle_areas(array('d', RADII))
+        self.assertEqual(list(areas), [Circle(r).area() for r in RADII])
+
+    def test_triangle_areas_match_scalar(self):
+        """Площади треугольников совпадают с Triangle.area() побитово."""
+        columns = [array('d', column) for column in zip(*TRIANGLES)]
+        areas = triangle_areas(*columns)
+        self.assertEqual(list(areas), [Triangle(*sides).area() for sides in TRIANGLES])
+
+    def test_accepts_lists(self):
+        """Пакетные функции принимают обычные списки."""
+        self.assertAlmostEqual(circle_areas([1])[0], math.pi, places=7)
+        self.assertAlmostEqual(triangle_areas([3], [4], [5])[0], 6.0, places=7)
+
+    def test_empty_input(self):
+        """Пустой вход дает пустой результат."""
+        self.assertEqual(len(circle_areas(array('d'))), 0)
+        self.assertEqual(len(triangle_areas([], [], [])), 0)
+
+    def test_invalid_triangle_is_nan(self):
+        """Невалидный треугольник дает NaN вместо исключения."""
+        areas = triangle_areas([1, 3], [2, 4], [5, 5])
+        self.assertTrue(math.isnan(areas[0]))
+        self.assertAlmostEqual(areas[1], 6.0, places=7)
+
+    def test_column_length_mismatch(self):
+        """Колонки разной длины вызывают ValueError."""
+        with self.assertRaises(ValueError):
+            triangle_areas([3, 4], [4], [5])
+
+    def test_triple_columns(self):
+        """Плоский массив троек разбивается на колонки."""
+        flat = array('d', [value for sides in TRIANGLES for value in sides])
+        areas = triangle_areas(*triple_columns(flat))
+        self.assertEqual(list(areas), [Triangle(*sides).area() for sides in TRIANGLES])
+        with self.assertRaises(ValueError):
+            triple_columns(array('d', [1, 2]))
+
+    def test_needle_triangles_match_exact_arithmetic(self):
+        """Площади вырожденных треугольников точны до нескольких ulp."""
+        triangles = _needle_triangles()
+        areas = triangle_areas(*zip(*triangles))
+        for sides, area in zip(triangles, areas):
+            exact = _exact_area(*sides)
+            self.assertLess(_relative_error(area, exact), 1e-15, sides)
+            self.assertEqual(Triangle(*sides).area(), area)
+
+    def test_textbook_heron_loses_precision(self):
+        """Контроль: учебная формула на тех же данных ошибается сильно."""
+        a, b, c = 1.0, 1.0, 1e-10
+        s = (a + b + c) / 2
+        textbook = math.sqrt(s * (s - a) * (s - b) * (s - c))
+        self.assertGreater(_relative_error(textbook, _exact_area(a, b, c)), 1e-8)
+        self.assertLess(_relative_error(triangle_areas([a], [b], [c])[0], _exact_area(a, b, c)), 1e-15)
+
+    def test_calculate_areas_mixed_order(self):
+        """calculate_areas возвращает площади в порядке входа."""
+        rectangle_kernel = mock.Mock(side_effect=lambda w, h: [a * b for a, b in zip(w, h)])
+        register_batch_kernel(Rectangle, ("width", "height"), rectangle_kernel)
+        self.addCleanup(unregister, Rectangle)
+        self.addCleanup(unregister, Square)
+
+        shapes = _mixed_shapes()
+        areas = calculate_areas(iter(shapes))
+        self.assertEqual(list(areas), [calculate_area(shape) for shape in shapes])
+        rectangle_kernel.assert_called_once()
+
+    def test_calculate_areas_single_type(self):
+        """Однотипный вход считается одним пакетом."""
+        circles = [Circle(r) for r in RADII]
+        self.assertEqual(list(calculate_areas(circles)), [c.area() for c in circles])
+        self.addCleanup(unregister, Square)
+        self.assertEqual(list(calculate_areas([Square(2), Square(3)])), [4, 9])
+
+    def test_calculate_areas_empty_and_invalid(self):
+        """Пустой вход и объект, не являющийся фигурой."""
+        self.assertEqual(len(calculate_areas([])), 0)
+        with self.assertRaises(TypeError):
+            calculate_areas([Circle(1), "круг"])
+
+
+@unittest.skipIf(_backend.get_numpy() is None, "NumPy не установлен")
+class TestBatchNumpy(BatchAreaTests, unittest.TestCase):
+    """Тесты пакетных функций с backend'ом NumPy."""
+
+    def test_numpy_input(self):
+        """Массив NumPy обрабатывается без преобразования в список."""
+        np = _backend.get_numpy()
+        sides = np.array(TRIANGLES, dtype=np.float64)
+        areas = triangle_areas(sides[:, 0], sides[:, 1], sides[:, 2])
+        self.assertIsInstance(areas, np.ndarray)
+        self.assertEqual(areas.tolist(), [Triangle(*s).area() for s in TRIANGLES])
+
+
+class TestBatchPurePython(BatchAreaTests, unittest.TestCase):
+    """Тесты пакетных функций на чистом Python."""
+
+    def setUp(self):
+        patcher = mock.patch.object(_backend, "get_numpy", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_result_type(self):
+        """Без NumPy результат — array('d')."""
+        self.assertIsInstance(circle_areas([1, 2]), array)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Тесты для набора бенчмарков (benchmarks/suite.py).
+"""
+
+import unittest
+from unittest import mock
+import json
+import os
+import tempfile
+
+from benchmarks import suite
+
+
+def _report(**per_item_ns):
+    """Минимальный отчет с заданным временем на фигуру."""
+    return {"results": {key: {"per_item_ns": value} for key, value in per_item_ns.items()}}
+
+
+class TestCompare(unittest.TestCase):
+    """Тесты сравнения отчетов."""
+
+    def test_regressions_above_threshold(self):
+        """Замедление больше порога считается регрессией."""
+        baseline = _report(a=100.0, b=100.0, c=100.0, removed=1.0)
+        current = _report(a=109.0, b=125.0, c=50.0, added=1.0)
+        changes = suite.compare(baseline, current)
+        self.assertEqual(sorted(change.key for change in changes), ["a", "b", "c"])
+        self.assertEqual([change.key for change in suite.regressions(changes, 0.10)], ["b"])
+        self.assertEqual(suite.regressions(changes, 0.30), [])
+
+    def test_zero_baseline_not_comparable(self):
+        """Нулевое базовое время — несравнимое изменение, а не ZeroDivisionError."""
+        changes = suite.compare(_report(zero=0.0, a=100.0), _report(zero=5.0, a=200.0))
+        zero = next(change for change in changes if change.key == "zero")
+        self.assertFalse(zero.comparable)
+        self.assertNotEqual(zero.ratio, zero.ratio)
+        self.assertEqual([change.key for change in suite.regressions(changes)], ["a"])
+
+    def test_compare_command_exit_code(self):
+        """Команда compare возвращает 1 при регрессии."""
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, value in (("base", 100.0), ("slow", 150.0)):
+                path = os.path.join(directory, f"{name}.json")
+                with open(path, "w", encoding="utf-8") as stream:
+                    json.dump(_report(x=value), stream)
+                paths.append(path)
+            with mock.patch("sys.stdout"), mock.patch("sys.stderr"):
+                self.assertEqual(suite.main(["compare", paths[0], paths[1]]), 1)
+                self.assertEqual(suite.main(["compare", paths[0], paths[0]]), 0)
+
+    def test_missing_benchmarks_fail_compare(self):
+        """Бенчмарк базового отчета, пропавший из текущего, — ошибка compare."""
+        baseline, current = _report(a=100.0, gone=1.0), _report(a=100.0, added=1.0)
+        self.assertEqual(suite.missing(baseline, current), ["gone"])
+        self.assertEqual(suite.missing(current, current), [])
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, report in (("base", baseline), ("current", current)):
+                path = os.path.join(directory, f"{name}.json")
+                with open(path, "w", encoding="utf-8") as stream:
+                    json.dump(report, stream)
+                paths.append(path)
+            with mock.patch("sys.stdout"), mock.patch("sys.stderr"):
+                self.assertEqual(suite.main(["compare", paths[0], paths[1]]), 1)
+                self.assertEqual(suite.main(["compare", paths[0], paths[1], "--allow-missing"]), 0)
+                self.assertEqual(suite.main(["compare", paths[1], paths[0]]), 1)
+
+
+class TestRun(unittest.TestCase):
+    """Тесты выполнения набора."""
+
+    def test_run_produces_json_report(self):
+        """Отчет содержит метаданные и результаты выбранных бенчмарков."""
+        report = suite.run(sizes=[10], pattern="batch.circle", repeat=1,
+                           min_time=0.01, stream=None)
+        self.assertEqual(list(report["results"]), ["batch.circle_areas[10]"])
+        result = report["results"]["batch.circle_areas[10]"]
+        self.assertGreater(result["per_item_ns"], 0)
+        self.assertIn("python", report["meta"])
+        json.dumps(report)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Тесты для модуля cache.
+"""
+
+import unittest
+import math
+import threading
+from unittest import mock
+
+from geometry_calculator import shapes
+
+from geometry_calculator.shapes import (
+    Circle, Triangle, calculate_area, circle_area, triangle_area
+)
+from geometry_calculator.cache import (
+    AreaCache, enable_area_cache, disable_area_cache, get_area_cache
+)
+
+
+class TestAreaCache(unittest.TestCase):
+    """Тесты класса AreaCache."""
+
+    def test_lru_eviction_and_stats(self):
+        """Самая давно использованная запись вытесняется первой."""
+        cache = AreaCache(maxsize=2)
+        cache.get_or_compute("a", lambda: 1.0)
+        cache.get_or_compute("b", lambda: 2.0)
+        cache.get_or_compute("a", lambda: 0.0)   # попадание, "a" становится свежей
+        cache.get_or_compute("c", lambda: 3.0)   # вытесняет "b"
+        self.assertEqual(cache.get_or_compute("b", lambda: 4.0), 4.0)
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (1, 4, 2))
+        self.assertEqual(stats.size, 2)
+        self.assertAlmostEqual(stats.hit_rate, 0.2)
+
+    def test_exception_not_cached(self):
+        """Исключение из compute не кэшируется."""
+        cache = AreaCache()
+
+        def fail():
+            raise ValueError("ошибка")
+
+        with self.assertRaises(ValueError):
+            cache.get_or_compute("x", fail)
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_maxsize(self):
+        """Неположительный размер вызывает ValueError."""
+        with self.assertRaises(ValueError):
+            AreaCache(0)
+
+    def test_thread_safety(self):
+        """Счетчики согласованы при конкурентном доступе."""
+        cache = AreaCache(maxsize=8)
+
+        def worker():
+            for i in range(1000):
+                cache.get_or_compute(i % 16, lambda: float(i))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        self.assertEqual(stats.hits + stats.misses, 4000)
+        self.assertLessEqual(stats.size, 8)
+
+
+class TestGlobalCache(unittest.TestCase):
+    """Тесты интеграции кэша с calculate_area и legacy функциями."""
+
+    def setUp(self):
+        self.cache = enable_area_cache(maxsize=16)
+        self.addCleanup(disable_area_cache)
+
+    def test_disabled_by_default(self):
+        """После disable_area_cache кэш не используется."""
+        disable_area_cache()
+        self.assertIsNone(get_area_cache())
+        self.assertAlmostEqual(calculate_area(Circle(1)), math.pi, places=7)
+
+    def test_calculate_area_uses_cache(self):
+        """Повторный расчет одинаковых фигур — попадание в кэш."""
+        self.assertAlmostEqual(calculate_area(Circle(5)), 25 * math.pi, places=7)
+        self.assertAlmostEqual(calculate_area(Circle(5.0)), 25 * math.pi, places=7)
+        self.assertEqual(self.cache.stats().hits, 1)
+
+    def test_triangle_key_is_order_independent(self):
+        """Перестановка сторон попадает в ту же запись."""
+        first = calculate_area(Triangle(5, 6, 7))
+        self.assertEqual(triangle_area(7, 5, 6), first)
+        self.assertEqual(calculate_area(Triangle(6, 7, 5)), first)
+        self.assertEqual(self.cache.stats().hits, 2)
+        self.assertAlmostEqual(first, 14.696938456699069, places=7)
+
+    def test_non_finite_not_cached(self):
+        """Фигуры с NaN и бесконечностью считаются без кэша и не занимают записи."""
+        for _ in range(3):
+            self.assertTrue(math.isnan(calculate_area(Circle(math.nan))))
+            self.assertTrue(math.isnan(calculate_area(Triangle(math.nan, 1, 1))))
+            self.assertTrue(math.isnan(circle_area(math.nan)))
+            self.assertEqual(calculate_area(Circle(math.inf)), math.inf)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.stats().misses, 0)
+
+    def test_miss_uses_shape_area(self):
+        """Промах берет площадь у самой фигуры и заполняет ее кэш экземпляра."""
+        triangle = Triangle(7, 5, 6)
+        area = calculate_area(triangle)
+        self.assertEqual(triangle._area, area)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_legacy_validation_preserved(self):
+        """Legacy функции по-прежнему валидируют параметры при включенном кэше."""
+        with self.assertRaises(ValueError):
+            circle_area(-1)
+        with self.assertRaises(TypeError):
+            circle_area("5")
+        with self.assertRaises(TypeError):
+            circle_area([5])
+        with self.assertRaises(ValueError):
+            triangle_area(1, 2, 5)
+        with self.assertRaises(TypeError):
+            triangle_area(None, 4, 5)
+        self.assertEqual(len(self.cache), 0)
+
+
+
+class TestLegacyWithoutCache(unittest.TestCase):
+    """Legacy функции при выключенном кэше считают без объектов фигур."""
+
+    def setUp(self):
+        disable_area_cache()
+
+    def test_same_results_as_shapes(self):
+        """Площади побитово совпадают с методами фигур."""
+        for radius in (0, 1, 2.5, 1e-300, 1e300, math.inf):
+            self.assertEqual(circle_area(radius), Circle(radius).area())
+        self.assertTrue(math.isnan(circle_area(math.nan)))
+        for sides in ((3, 4, 5), (5, 6, 7), (7, 5, 6), (1e-8, 1, 1), (0.1, 0.2, 0.29999)):
+            self.assertEqual(triangle_area(*sides), Triangle(*sides).area())
+
+    def test_same_errors_as_shapes(self):
+        """Ошибки и сообщения совпадают с конструкторами фигур."""
+        cases = [(circle_area, Circle, (-1,)), (circle_area, Circle, ("5",)),
+                 (circle_area, Circle, (True,)), (triangle_area, Triangle, (1, 2, 5)),
+                 (triangle_area, Triangle, (None, 4, 5)), (triangle_area, Triangle, (0, 4, 5))]
+        for function, shape_type, args in cases:
+            with self.subTest(function=function.__name__, args=args):
+                try:
+                    shape_type(*args)
+                except (TypeError, ValueError) as error:
+                    expected = error
+                else:
+                    expected = None
+                if expected is None:
+                    function(*args)
+                    continue
+                with self.assertRaises(type(expected)) as raised:
+                    function(*args)
+                self.assertEqual(str(raised.exception), str(expected))
+
+    def test_no_shape_constructed(self):
+        """Без кэша фигура не создается: сразу формула."""
+        with mock.patch.object(shapes, "Triangle", side_effect=AssertionError), \
+                mock.patch.object(shapes, "Circle", side_effect=AssertionError):
+            self.assertEqual(triangle_area(3, 4, 5), 6.0)
+            self.assertEqual(circle_area(1), math.pi)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Тесты для модуля classification.
+"""
+
+import unittest
+import math
+import random
+from array import array
+from fractions import Fraction
+from unittest import mock
+
+from geometry_calculator import _backend
+from geometry_calculator.classification import (
+    TriangleKind, classify_triangles, right_triangle_mask
+)
+
+
+def _exact_kind(a, b, c):
+    """Вид треугольника в точной рациональной арифметике."""
+    a, b, c = sorted(Fraction(side) for side in (a, b, c))
+    difference = c * c - (a * a + b * b)
+    if difference == 0:
+        return TriangleKind.RIGHT
+    return TriangleKind.OBTUSE if difference > 0 else TriangleKind.ACUTE
+
+
+class ClassificationTests:
+    """Общие тесты классификации для любого backend'а."""
+
+    def test_kinds_in_any_side_order(self):
+        """Вид не зависит от порядка сторон."""
+        triples = [(3, 4, 5), (5, 3, 4), (4, 5, 3), (2, 2, 2), (2, 3.5, 2), (3.5, 2, 2)]
+        result = classify_triangles(*zip(*triples), kinds=True)
+        self.assertEqual([bool(v) for v in result.right], [True] * 3 + [False] * 3)
+        self.assertEqual(list(result.kinds),
+                         [TriangleKind.RIGHT] * 3 + [TriangleKind.ACUTE] + [TriangleKind.OBTUSE] * 2)
+
+    def test_matches_exact_arithmetic(self):
+        """При нулевых допусках совпадает с точной арифметикой на целых сторонах."""
+        rng = random.Random(3)
+        triples = [(rng.randint(1, 50), rng.randint(1, 50), rng.randint(1, 50)) for _ in range(500)]
+        triples += [(3 * k, 4 * k, 5 * k) for k in range(1, 50)]
+        result = classify_triangles(*zip(*triples), rel_tol=0.0, kinds=True)
+        self.assertEqual(list(result.kinds), [_exact_kind(*sides) for sides in triples])
+
+    def test_relative_tolerance_scales_with_magnitude(self):
+        """Большие и малые стороны классифицируются верно."""
+        scales = [1e-8, 1e-3, 1.0, 1e6, 1e20, 1e150]
+        for scale in scales:
+            with self.subTest(scale=scale):
+                mask = right_triangle_mask([3 * scale, 3 * scale], [4 * scale, 4 * scale],
+                                           [5 * scale, 5.001 * scale])
+                self.assertEqual([bool(v) for v in mask], [True, False])
+
+    def test_absolute_tolerance(self):
+        """Абсолютный допуск расширяет сравнение для малых значений."""
+        sides = ([3.0], [4.0], [5.0 + 1e-6])
+        self.assertFalse(right_triangle_mask(*sides)[0])
+        self.assertTrue(right_triangle_mask(*sides, abs_tol=1e-4)[0])
+
+    def test_kinds_optional(self):
+        """Без kinds=True коды не вычисляются."""
+        self.assertIsNone(classify_triangles([3], [4], [5]).kinds)
+
+    def test_buffer_input(self):
+        """Буферы array('d') принимаются без копирования в списки."""
+        mask = right_triangle_mask(array('d', [6, 1]), array('d', [8, 1]), array('d', [10, 1]))
+        self.assertEqual([bool(v) for v in mask], [True, False])
+
+    def test_nan_is_not_right(self):
+        """Строка с NaN не считается прямоугольной."""
+        self.assertFalse(right_triangle_mask([math.nan], [4], [5])[0])
+
+    def test_invalid_arguments(self):
+        """Разная длина колонок и отрицательные допуски."""
+        with self.assertRaises(ValueError):
+            classify_triangles([3, 4], [4], [5])
+        with self.assertRaises(ValueError):
+            classify_triangles([3], [4], [5], rel_tol=-1)
+        with self.assertRaises(ValueError):
+            classify_triangles([3], [4], [5], abs_tol=-1)
+
+
+@unittest.skipIf(_backend.get_numpy() is None, "NumPy не установлен")
+class TestClassificationNumpy(ClassificationTests, unittest.TestCase):
+    """Тесты классификации с backend'ом NumPy."""
+
+
+class TestClassificationPurePython(ClassificationTests, unittest.TestCase):
+    """Тесты классификации на чистом Python."""
+
+    def setUp(self):
+        patcher = mock.patch.object(_backend, "get_numpy", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+Тесты бинарного кодека фигур и компактной сериализации pickle.
+"""
+
+import unittest
+import math
+import pickle
+import random
+import struct
+from unittest import mock
+
+from geometry_calculator import _backend
+from geometry_calculator.batch import calculate_areas
+from geometry_calculator.codec import (
+    DecodedShapes, decode_columns, decode_shapes, encode_shapes
+)
+from geometry_calculator.collection import ShapeCollection
+from geometry_calculator.shapes import Circle, Polygon, Shape, Triangle
+
+
+def _mixed_shapes(count=300, seed=25):
+    """Перемешанные фигуры всех поддерживаемых типов."""
+    rng = random.Random(seed)
+    shapes = []
+    for index in range(count):
+        kind = index % 5
+        if kind == 0:
+            shapes.append(Circle(rng.uniform(0.1, 10.0)))
+        elif kind == 1:
+            a, b = rng.uniform(1, 2), rng.uniform(1, 2)
+            shapes.append(Triangle(a, b, rng.uniform(abs(a - b) + 0.01, a + b - 0.01)))
+        elif kind in (2, 3):
+            dim = kind
+            shapes.append(Triangle.from_vertices(
+                *(tuple(rng.uniform(-5, 5) for _ in range(dim)) for _ in range(3))))
+        else:
+            sides = rng.randrange(3, 9)
+            radius = rng.uniform(1, 3)
+            shapes.append(Polygon([(radius * math.cos(2 * math.pi * k / sides),
+                                    radius * math.sin(2 * math.pi * k / sides))
+                                   for k in range(sides)]))
+    rng.shuffle(shapes)
+    return shapes
+
+
+class CodecTests:
+    """Общие тесты кодека для любого backend'а."""
+
+    def test_round_trip(self):
+        """Декодирование возвращает равные фигуры тех же типов в том же порядке."""
+        shapes = _mixed_shapes()
+        restored = decode_shapes(encode_shapes(shapes))
+        self.assertEqual(restored, shapes)
+        self.assertEqual([type(shape) for shape in restored], [type(shape) for shape in shapes])
+        self.assertEqual([shape.area() for shape in restored], [shape.area() for shape in shapes])
+        self.assertEqual([getattr(shape, "vertices", None) for shape in restored],
+                         [getattr(shape, "vertices", None) for shape in shapes])
+
+    def test_columns_zero_copy(self):
+        """Колонки — представления буфера, пригодные для пакетных функций."""
+        data = bytearray(encode_shapes([Triangle(3, 4, 5), Circle(1), Triangle(6, 8, 10)]))
+        decoded = decode_columns(data)
+        self.assertIsInstance(decoded, DecodedShapes)
+        self.assertEqual(len(decoded), 3)
+        self.assertEqual(list(decoded.tags), [2, 1, 2])
+        self.assertEqual([column.tolist() for column in decoded.columns["triangle"]],
+                         [[3.0, 6.0], [4.0, 8.0], [5.0, 10.0]])
+        # Изменение буфера видно в колонке: данные не копировались.
+        # Заголовок 24 + теги 8 + секция круга 24 + 8, заголовок секции треугольников 24
+        struct.pack_into("<d", data, 24 + 8 + 24 + 8 + 24, 0.5)
+        self.assertEqual(decoded.columns["triangle"][0].tolist(), [0.5, 6.0])
+
+    def test_areas(self):
+        """Площади по колонкам совпадают с calculate_areas в исходном порядке."""
+        shapes = _mixed_shapes()
+        areas = decode_columns(encode_shapes(shapes)).areas()
+        self.assertEqual(list(areas), list(calculate_areas(shapes)))
+        single = decode_columns(encode_shapes([Circle(2)] * 3)).areas()
+        self.assertEqual(list(single), [Circle(2).area()] * 3)
+
+    def test_empty(self):
+        """Пустая последовательность."""
+        data = encode_shapes([])
+        self.assertEqual(len(data), 24)
+        self.assertEqual(decode_shapes(data), [])
+        self.assertEqual(len(decode_columns(data).areas()), 0)
+
+    def test_collection_views(self):
+        """Представления ShapeCollection кодируются как Circle/Triangle."""
+        collection = ShapeCollection.from_columns(Triangle, [3.0], [4.0], [5.0])
+        restored = decode_shapes(encode_shapes([collection[0]]))
+        self.assertEqual(restored, [Triangle(3, 4, 5)])
+        self.assertIs(type(restored[0]), Triangle)
+
+    def test_unsupported_type(self):
+        """Неизвестный наследник Shape и не фигура."""
+        class Square(Shape):
+            def area(self):
+                return 1.0
+
+        with self.assertRaises(TypeError):
+            encode_shapes([Circle(1), Square()])
+        with self.assertRaises(TypeError):
+            encode_shapes(["circle"])
+
+    def test_corrupt_data(self):
+        """Поврежденные данные — ValueError, а не чтение за границей."""
+        data = encode_shapes(_mixed_shapes(20))
+        with self.assertRaises(ValueError):
+            decode_columns(b"NOTCODEC" + data[8:])
+        with self.assertRaises(ValueError):
+            decode_columns(data[:-8])
+        with self.assertRaises(ValueError):
+            decode_columns(data[:10])
+        bad_version = bytearray(data)
+        bad_version[8] = 99
+        with self.assertRaises(ValueError):
+            decode_columns(bad_version)
+        bad_tag = bytearray(data)
+        bad_tag[24] = 7
+        with self.assertRaises(ValueError):
+            decode_columns(bad_tag)
+
+    def test_invalid_parameters(self):
+        """Невалидные параметры отклоняются конструкторами при создании фигур."""
+        data = bytearray(encode_shapes([Circle(1)]))
+        struct.pack_into("<d", data, len(data) - 8, -1.0)
+        decoded = decode_columns(data)
+        self.assertEqual(decoded.columns["circle"][0].tolist(), [-1.0])
+        with self.assertRaises(ValueError):
+            decoded.shapes()
+
+
+@unittest.skipIf(_backend.get_numpy() is None, "NumPy не установлен")
+class TestCodecNumpy(CodecTests, unittest.TestCase):
+    """Тесты кодека с NumPy."""
+
+    def test_readonly_arrays(self):
+        """Колонки bytes — массивы NumPy только для чтения."""
+        decoded = decode_columns(encode_shapes([Circle(1)]))
+        column = decoded.columns["circle"][0]
+        self.assertFalse(column.flags.writeable)
+        self.assertEqual(column.dtype.str, "<f8")
+
+
+class TestCodecPurePython(CodecTests, unittest.TestCase):
+    """Тесты кодека на чистом Python."""
+
+    def setUp(self):
+        patcher = mock.patch.object(_backend, "get_numpy", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_memoryview_columns(self):
+        """Без NumPy колонки — memoryview формата 'd'."""
+        column = decode_columns(encode_shapes([Circle(1)])).columns["circle"][0]
+        self.assertIsInstance(column, memoryview)
+        self.assertEqual(column.format, "d")
+
+
+class TestPickle(unittest.TestCase):
+    """Тесты компактной сериализации pickle."""
+
+    def test_round_trip(self):
+        """Фигуры восстанавливаются равными, с тем же типом и площадью."""
+        for shape in _mixed_shapes(50):
+            restored = pickle.loads(pickle.dumps(shape))
+            self.assertEqual(restored, shape)
+            self.assertIs(type(restored), type(shape))
+            self.assertEqual(restored.area(), shape.area())
+
+    def test_polygon_flat_coords(self):
+        """Многоугольник сериализуется плоским буфером координат, без кортежей вершин."""
+        square = Polygon([(0, 0), (2, 0), (2, 2), (0, 2)])
+        restored = pickle.loads(pickle.dumps(square))
+        self.assertEqual(restored.vertices, square.vertices)
+        self.assertIsNot(restored._coords, square._coords)
+        octagons = [Polygon([(r * math.cos(k * math.pi / 4), r * math.sin(k * math.pi / 4))
+                             for k in range(8)]) for r in range(1, 101)]
+        vertex_tuples = [(Polygon, (octagon.vertices,)) for octagon in octagons]
+        self.assertLess(len(pickle.dumps(octagons)), len(pickle.dumps(vertex_tuples)))
+
+
+if __name__ == '__main__':
+    unittest.main()
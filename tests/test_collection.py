@@ -0,0 +1,100 @@
+"""
+Тесты для модуля collection и __slots__ фигур.
+"""
+
+import unittest
+
+from geometry_calculator.shapes import Shape, Circle, Triangle, calculate_area
+from geometry_calculator.collection import ShapeCollection
+
+
+class TestSlots(unittest.TestCase):
+    """Тесты компактного представления фигур."""
+
+    def test_no_instance_dict(self):
+        """У Circle и Triangle нет __dict__."""
+        self.assertFalse(hasattr(Circle(1), "__dict__"))
+        self.assertFalse(hasattr(Triangle(3, 4, 5), "__dict__"))
+
+    def test_subclass_without_slots(self):
+        """Наследники Shape без __slots__ работают как раньше."""
+        class Square(Shape):
+            def __init__(self, side):
+                self.side = side
+
+            def area(self):
+                return self.side ** 2
+
+            def __str__(self):
+                return "Квадрат"
+
+        square = Square(2)
+        square.color = "red"
+        self.assertEqual(calculate_area(square), 4)
+
+
+class TestShapeCollection(unittest.TestCase):
+    """Тесты ShapeCollection."""
+
+    def test_views_satisfy_shape_interface(self):
+        """Представления работают с calculate_area и методами класса."""
+        collection = ShapeCollection(Triangle, [Triangle(3, 4, 5), Triangle(5, 6, 7)])
+        view = collection[0]
+        self.assertIsInstance(view, Triangle)
+        self.assertIsInstance(view, Shape)
+        self.assertEqual(calculate_area(view), 6.0)
+        self.assertTrue(view.is_right_triangle())
+        self.assertEqual(repr(collection[-1]), "Triangle(side_a=5.0, side_b=6.0, side_c=7.0)")
+        self.assertFalse(hasattr(view, "__dict__"))
+
+    def test_views_follow_column_writes(self):
+        """Запись в колонку сразу видна в площади и производных величинах view."""
+        collection = ShapeCollection(Triangle, [Triangle(3, 4, 5)])
+        view = collection[0]
+        self.assertEqual((view.area(), view.sorted_sides, view.semi_perimeter), (6.0, (3, 4, 5), 6.0))
+        self.assertTrue(view.is_right_triangle())
+        collection.column("side_c")[0] = 6.0
+        self.assertEqual(view.area(), Triangle(3, 4, 6).area())
+        self.assertEqual(calculate_area(view), Triangle(3, 4, 6).area())
+        self.assertEqual((view.sorted_sides, view.semi_perimeter), ((3, 4, 6), 6.5))
+        self.assertFalse(view.is_right_triangle())
+
+    def test_views_are_read_only(self):
+        """Параметры представления нельзя изменить."""
+        collection = ShapeCollection(Circle, [Circle(1)])
+        with self.assertRaises(AttributeError):
+            collection[0].radius = 2
+
+    def test_areas_match_scalar(self):
+        """Пакетные площади совпадают с area() исходных фигур."""
+        circles = [Circle(r) for r in (0, 1, 2.5, 30.19510412751344)]
+        collection = ShapeCollection(Circle, circles)
+        self.assertEqual(list(collection.areas()), [c.area() for c in circles])
+        self.assertEqual([calculate_area(c) for c in collection], [c.area() for c in circles])
+
+    def test_from_columns(self):
+        """Создание из колонок с валидацией."""
+        collection = ShapeCollection.from_columns(Triangle, [3, 6], [4, 6], [5, 6])
+        self.assertEqual(len(collection), 2)
+        self.assertEqual(list(collection.column("side_c")), [5.0, 6.0])
+        self.assertEqual(collection.nbytes(), 2 * 3 * 8)
+        with self.assertRaises(ValueError):
+            ShapeCollection.from_columns(Triangle, [3, 1], [4, 2], [5, 5])
+        with self.assertRaises(ValueError):
+            ShapeCollection.from_columns(Circle, [-1])
+
+    def test_type_checks(self):
+        """Фигуры другого типа и неподдерживаемые типы отклоняются."""
+        collection = ShapeCollection(Circle)
+        with self.assertRaises(TypeError):
+            collection.append(Triangle(3, 4, 5))
+        with self.assertRaises(TypeError):
+            ShapeCollection(Shape)
+        with self.assertRaises(IndexError):
+            collection[0]
+        with self.assertRaises(KeyError):
+            collection.column("side_a")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Тесты ленивой загрузки подсистем при импорте пакета.
+
+Время импорта зависит от машины и не проверяется тестами; бюджет
+проверяет ``python -m benchmarks.bench_import --budget-ms N``.
+"""
+
+import subprocess
+import sys
+import unittest
+
+import geometry_calculator
+from benchmarks.bench_import import loaded_modules
+
+
+# Модули, которые не должны загружаться при импорте пакета
+HEAVY_MODULES = (
+    "numpy",
+    "multiprocessing",
+    "concurrent.futures",
+    "asyncio",
+    "mmap",
+    "geometry_calculator.batch",
+    "geometry_calculator.parallel",
+    "geometry_calculator.service",
+    "geometry_calculator.store",
+)
+
+
+class TestLazyImport(unittest.TestCase):
+    """Тесты ленивой загрузки подсистем."""
+
+    def test_heavy_modules_not_loaded(self):
+        """Импорт пакета не загружает NumPy и пакетные/параллельные/I/O подсистемы."""
+        modules = loaded_modules("geometry_calculator")
+        self.assertIn("geometry_calculator.shapes", modules)
+        for name in HEAVY_MODULES:
+            with self.subTest(module=name):
+                self.assertNotIn(name, modules)
+
+    def test_lazy_attribute_resolves(self):
+        """Ленивый атрибут совпадает с объектом из своего модуля."""
+        from geometry_calculator.batch import calculate_areas
+        self.assertIs(geometry_calculator.calculate_areas, calculate_areas)
+        self.assertIn("calculate_areas", vars(geometry_calculator))
+
+    def test_all_names_resolve(self):
+        """Все имена из __all__ доступны и импортируются через from ... import."""
+        for name in geometry_calculator.__all__:
+            with self.subTest(name=name):
+                self.assertTrue(hasattr(geometry_calculator, name))
+        from geometry_calculator import ShapeStore, reduce_areas  # noqa: F401
+
+    def test_submodule_attribute(self):
+        """Подмодуль доступен как атрибут пакета без явного импорта."""
+        code = ("import geometry_calculator as gc; "
+                "print(gc.parallel.__name__, gc.calculate_areas.__module__)")
+        completed = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE,
+                                   universal_newlines=True, check=True)
+        self.assertEqual(completed.stdout.split(),
+                         ["geometry_calculator.parallel", "geometry_calculator.batch"])
+
+    def test_unknown_attribute(self):
+        """Неизвестный атрибут вызывает AttributeError."""
+        with self.assertRaises(AttributeError):
+            geometry_calculator.no_such_attribute
+        with self.assertRaises(ImportError):
+            from geometry_calculator import no_such_attribute  # noqa: F401
+
+    def test_dir_lists_lazy_names(self):
+        """dir() показывает ленивые атрибуты и подмодули."""
+        names = dir(geometry_calculator)
+        self.assertIn("open_store", names)
+        self.assertIn("service", names)
+
+
+if __name__ == '__main__':
+    unittest.main()
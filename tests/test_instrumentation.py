@@ -0,0 +1,159 @@
+"""
+Тесты для модуля instrumentation.
+"""
+
+import unittest
+
+from geometry_calculator import instrumentation, registry
+from geometry_calculator.batch import calculate_areas
+from geometry_calculator.cache import enable_area_cache, disable_area_cache
+from geometry_calculator.shapes import Shape, Circle, Triangle, VertexTriangle, calculate_area
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Тесты инструментации."""
+
+    def setUp(self):
+        instrumentation.reset()
+        self.addCleanup(instrumentation.disable)
+        self.addCleanup(instrumentation.reset)
+
+    def test_disabled_leaves_original_methods(self):
+        """Без инструментации конструкторы и ядра реестра не обернуты."""
+        original_init, original_area = Circle.__init__, Circle.area
+        original_batch = registry.batch_kernel_for(Circle)
+        instrumentation.enable()
+        self.assertIsNot(Circle.__init__, original_init)
+        self.assertIs(Circle.area, original_area)
+        self.assertIsNot(registry.area_kernel_for(Circle), original_area)
+        self.assertIsNot(registry.batch_kernel_for(Circle), original_batch)
+        instrumentation.disable()
+        self.assertIs(Circle.__init__, original_init)
+        self.assertIs(Circle.area, original_area)
+        self.assertIs(registry.area_kernel_for(Circle), original_area)
+        self.assertIs(registry.batch_kernel_for(Circle), original_batch)
+        self.assertFalse(instrumentation.is_enabled())
+
+    def test_counters_and_histograms(self):
+        """Вызовы считаются по типу фигуры и операции."""
+        instrumentation.enable()
+        for radius in range(3):
+            calculate_area(Circle(radius))
+        calculate_area(Triangle(3, 4, 5))
+
+        shapes = instrumentation.snapshot()["shapes"]
+        self.assertEqual(shapes["Circle"]["calls"], {"construct": 3, "area": 3})
+        self.assertEqual(shapes["Triangle"]["calls"], {"construct": 1, "area": 1})
+        latency = shapes["Circle"]["latency"]["area"]
+        self.assertEqual(latency["count"], 3)
+        self.assertEqual(sum(latency["counts"]), 3)
+        self.assertLessEqual(latency["min_ns"], latency["max_ns"])
+
+    def test_subclass_kernels(self):
+        """Ядра наследников, зарегистрированные до enable(), тоже инструментированы."""
+        instrumentation.enable([Triangle])
+        self.assertEqual(calculate_area(Triangle.from_vertices((0, 0), (3, 0), (0, 4))), 6.0)
+        instrumentation.enable([Triangle])
+        calculate_area(Triangle(3, 4, 5))
+        shapes = instrumentation.snapshot()["shapes"]
+        self.assertEqual(shapes["VertexTriangle"]["calls"], {"construct": 1, "area": 1})
+        self.assertEqual(shapes["Triangle"]["calls"], {"construct": 1, "area": 1})
+        instrumentation.disable()
+        self.assertIs(registry.area_kernel_for(VertexTriangle), VertexTriangle.area)
+
+    def test_subclass_constructors(self):
+        """Наследники со своим __init__ учитываются, вложенный вызов базового — один раз."""
+        class Ring(Circle):
+            __slots__ = ()
+
+            def __init__(self, radius):
+                super().__init__(radius)
+
+        instrumentation.enable([Triangle, Circle])
+        self.assertIn("__wrapped__", vars(VertexTriangle.__init__))
+        Triangle.from_vertices((0, 0), (3, 0), (0, 4))
+        Ring(2)
+        with self.assertRaises(ValueError):
+            Ring(-1)
+        with self.assertRaises(ValueError):
+            VertexTriangle((0, 0), (1, 1), (2, 2))
+        shapes = instrumentation.snapshot()["shapes"]
+        self.assertEqual(shapes["VertexTriangle"]["calls"], {"construct": 1})
+        self.assertEqual(shapes["Ring"]["calls"], {"construct": 1})
+        self.assertEqual(shapes["Ring"]["validation_failures"], {"NEGATIVE_RADIUS": 1})
+        self.assertEqual(sum(shapes["VertexTriangle"]["validation_failures"].values()), 1)
+        self.assertNotIn("Circle", shapes)
+        instrumentation.disable()
+        self.assertNotIn("__wrapped__", vars(VertexTriangle.__init__))
+        self.assertNotIn("__wrapped__", vars(Ring.__init__))
+
+    def test_cache_hits(self):
+        """Попадания в кэш площадей считаются отдельно, промахи — как вызовы ядра."""
+        enable_area_cache()
+        self.addCleanup(disable_area_cache)
+        instrumentation.enable([Triangle])
+        for _ in range(3):
+            calculate_area(Triangle(3, 4, 5))
+        calculate_area(Circle(1))
+        shapes = instrumentation.snapshot()["shapes"]
+        self.assertEqual(shapes["Triangle"]["calls"],
+                         {"construct": 3, "area": 1, "area_cache_hit": 2})
+        self.assertNotIn("area_cache_hit", shapes["Triangle"]["latency"])
+        self.assertNotIn("Circle", shapes)
+        instrumentation.disable()
+        calculate_area(Triangle(3, 4, 5))
+        self.assertEqual(instrumentation.snapshot()["shapes"]["Triangle"]["calls"]["area_cache_hit"], 2)
+
+    def test_batch_kernels(self):
+        """Вызовы пакетных ядер calculate_areas считаются отдельно."""
+        shapes = [Circle(1), Circle(2), Triangle(3, 4, 5)]
+        instrumentation.enable([Circle])
+        self.assertEqual(list(calculate_areas(shapes)), [shape.area() for shape in shapes])
+        data = instrumentation.snapshot()["shapes"]
+        self.assertEqual(data["Circle"]["calls"], {"batch_area": 1})
+        self.assertNotIn("Triangle", data)
+
+    def test_validation_failures_by_reason(self):
+        """Ошибки валидации считаются по причинам ErrorCode."""
+        instrumentation.enable()
+        for params in [(1, 2, 5), (0, 1, 1), ("3", 4, 5), (1, 2, 5)]:
+            with self.assertRaises((TypeError, ValueError)):
+                Triangle(*params)
+        with self.assertRaises(ValueError):
+            Circle(-1)
+        shapes = instrumentation.snapshot()["shapes"]
+        self.assertEqual(shapes["Triangle"]["validation_failures"],
+                         {"TRIANGLE_INEQUALITY": 2, "NON_POSITIVE_SIDE": 1, "NOT_A_NUMBER": 1})
+        self.assertEqual(shapes["Circle"]["validation_failures"], {"NEGATIVE_RADIUS": 1})
+
+    def test_exporter(self):
+        """Экспортер получает снимок метрик."""
+        received = []
+        instrumentation.enable(exporter=received.append)
+        self.addCleanup(instrumentation.remove_exporter, received.append)
+        Circle(1).area()
+        data = instrumentation.export()
+        self.assertEqual(received, [data])
+        self.assertTrue(data["enabled"])
+
+    def test_custom_shape(self):
+        """Инструментация сторонней фигуры."""
+        class Square(Shape):
+            def __init__(self, side):
+                self.side = side
+
+            def area(self):
+                return self.side ** 2
+
+            def __str__(self):
+                return "Квадрат"
+
+        self.addCleanup(registry.unregister, Square)
+        instrumentation.enable([Square])
+        self.assertEqual(calculate_area(Square(2)), 4)
+        self.assertEqual(instrumentation.snapshot()["shapes"]["Square"]["calls"],
+                         {"construct": 1, "area": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Тесты для модуля interning.
+"""
+
+import unittest
+import gc
+import threading
+
+from geometry_calculator.collection import ShapeCollection
+from geometry_calculator.interning import (
+    ShapeInterner, get_interner, intern_circle, intern_shape, intern_triangle
+)
+from geometry_calculator.shapes import Circle, Shape, Triangle
+
+
+class Square(Shape):
+    """Фигура без поддержки интернирования."""
+
+    def __init__(self, side):
+        self.side = side
+
+    def area(self):
+        return self.side * self.side
+
+    def __str__(self):
+        return f"Квадрат({self.side})"
+
+
+class TestShapeInterner(unittest.TestCase):
+    """Тесты ShapeInterner."""
+
+    def setUp(self):
+        self.interner = ShapeInterner()
+
+    def test_circles_are_shared(self):
+        """Равные радиусы дают один экземпляр."""
+        circle = self.interner.circle(2.5)
+        self.assertIs(self.interner.circle(2.5), circle)
+        self.assertIsNot(self.interner.circle(3.0), circle)
+
+    def test_congruent_triangles_are_shared(self):
+        """Стороны в любом порядке дают один экземпляр в порядке первого запроса."""
+        triangle = self.interner.triangle(3, 4, 5)
+        for sides in ((5, 4, 3), (4, 3, 5), (3.0, 5.0, 4.0)):
+            self.assertIs(self.interner.triangle(*sides), triangle)
+        self.assertEqual((triangle.side_a, triangle.side_b, triangle.side_c), (3, 4, 5))
+
+    def test_area_computed_once(self):
+        """Площадь общего треугольника вычисляется один раз и разделяется."""
+        first = self.interner.triangle(5, 6, 7)
+        area = first.area()
+        self.assertIs(self.interner.triangle(7, 6, 5).area(), area)
+
+    def test_intern_existing_shape(self):
+        """intern() возвращает первый равный экземпляр."""
+        triangle = Triangle(3, 4, 5)
+        self.assertIs(self.interner.intern(triangle), triangle)
+        self.assertIs(self.interner.intern(Triangle(4, 5, 3)), triangle)
+        self.assertIs(self.interner.triangle(5, 4, 3), triangle)
+        circle = Circle(1)
+        self.assertIs(self.interner.intern(circle), circle)
+        self.assertIs(self.interner.intern(Circle(1.0)), circle)
+
+    def test_intern_collection_view_copies(self):
+        """Представление ShapeCollection заменяется копией базового класса."""
+        collection = ShapeCollection(Triangle, [Triangle(6, 7, 8)])
+        interned = self.interner.intern(collection[0])
+        self.assertIs(type(interned), Triangle)
+        self.assertEqual(interned, Triangle(8, 7, 6))
+        self.assertIs(self.interner.intern(collection[0]), interned)
+
+    def test_intern_vertex_triangle(self):
+        """Неизменяемый VertexTriangle хранится как есть, без копии."""
+        triangle = Triangle.from_vertices((0, 0), (3, 0), (0, 4))
+        self.assertIs(self.interner.intern(triangle), triangle)
+        self.assertIs(self.interner.intern(Triangle(5, 4, 3)), triangle)
+
+    def test_unsupported_shape(self):
+        """Фигуры других типов не интернируются."""
+        with self.assertRaises(TypeError):
+            self.interner.intern(Square(2))
+
+    def test_invalid_parameters(self):
+        """Невалидные параметры вызывают исключения конструктора и не учитываются."""
+        with self.assertRaises(ValueError):
+            self.interner.circle(-1)
+        with self.assertRaises(TypeError):
+            self.interner.circle("1")
+        with self.assertRaises(ValueError):
+            self.interner.triangle(1, 2, 10)
+        with self.assertRaises(TypeError):
+            self.interner.triangle(3, "4", 5)
+        self.assertEqual(len(self.interner), 0)
+        self.assertEqual(self.interner.stats().hits, 0)
+
+    def test_unused_shapes_are_released(self):
+        """Таблица не удерживает фигуры без внешних ссылок."""
+        circle = self.interner.circle(1)
+        self.interner.triangle(3, 4, 5)
+        gc.collect()
+        self.assertEqual(len(self.interner), 1)
+        self.assertIs(self.interner.circle(1), circle)
+        del circle
+        gc.collect()
+        self.assertEqual(len(self.interner), 0)
+
+    def test_stats(self):
+        """Счетчики и коэффициент дедупликации."""
+        self.assertEqual(self.interner.stats().dedup_ratio, 1.0)
+        self.assertEqual(self.interner.stats().hit_rate, 0.0)
+        shapes = [self.interner.triangle(3, 4, 5) for _ in range(3)]
+        shapes += [self.interner.circle(r) for r in (1, 2, 1, 1)]
+        stats = self.interner.stats()
+        self.assertEqual((stats.requests, stats.hits, stats.unique, stats.live), (7, 4, 3, 3))
+        self.assertAlmostEqual(stats.dedup_ratio, 7 / 3)
+        self.assertAlmostEqual(stats.hit_rate, 4 / 7)
+        self.interner.clear()
+        self.assertEqual(self.interner.stats(), (0, 0, 0))
+        self.assertEqual(len(shapes), 7)
+
+    def test_concurrent_requests(self):
+        """Параллельные запросы из потоков получают один экземпляр."""
+        results = []
+
+        def work():
+            results.extend(self.interner.triangle(3, 4, 5) for _ in range(1000))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(triangle) for triangle in results}), 1)
+        self.assertEqual(self.interner.stats().unique, 1)
+
+
+class TestDefaultInterner(unittest.TestCase):
+    """Тесты функций общего интернера процесса."""
+
+    def test_module_functions(self):
+        """Функции модуля используют один интернер."""
+        triangle = intern_triangle(13, 14, 15)
+        self.assertIs(intern_triangle(15, 13, 14), triangle)
+        self.assertIs(intern_shape(Triangle(14, 15, 13)), triangle)
+        self.assertIs(intern_circle(0.25), intern_circle(0.25))
+        self.assertIs(get_interner(), get_interner())
+
+
+if __name__ == '__main__':
+    unittest.main()
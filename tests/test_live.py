@@ -0,0 +1,189 @@
+"""
+Тесты набора фигур с поддерживаемыми агрегатами (модуль live).
+"""
+
+import unittest
+import math
+import random
+from unittest import mock
+
+from geometry_calculator.live import LiveShapeSet, TypeTotals
+from geometry_calculator.shapes import Circle, Polygon, Triangle, calculate_area
+
+
+def _random_shape(rng):
+    """Случайный круг, треугольник или прямоугольный треугольник."""
+    kind = rng.randrange(3)
+    if kind == 0:
+        return Circle(rng.uniform(0.1, 100.0))
+    if kind == 1:
+        scale = rng.uniform(0.1, 10.0)
+        return Triangle(3 * scale, 4 * scale, 5 * scale)
+    a, b = rng.uniform(1, 2), rng.uniform(1, 2)
+    return Triangle(a, b, rng.uniform(abs(a - b) + 0.01, a + b - 0.01))
+
+
+class TestLiveShapeSet(unittest.TestCase):
+    """Тесты LiveShapeSet."""
+
+    def assertAggregates(self, shapes, expected):
+        """Агрегаты набора совпадают с пересчетом по списку фигур."""
+        areas = [calculate_area(shape) for shape in expected]
+        self.assertEqual(len(shapes), len(expected))
+        self.assertAlmostEqual(shapes.total_area, math.fsum(areas), delta=1e-9)
+        self.assertEqual(shapes.right_triangle_count,
+                         sum(isinstance(shape, Triangle) and shape.is_right_triangle()
+                             for shape in expected))
+        by_type = shapes.by_type()
+        for shape_type in {type(shape) for shape in expected}:
+            members = [area for shape, area in zip(expected, areas) if type(shape) is shape_type]
+            self.assertEqual(by_type[shape_type].count, len(members))
+            self.assertAlmostEqual(by_type[shape_type].total_area, math.fsum(members), delta=1e-9)
+        self.assertEqual(set(by_type), {type(shape) for shape in expected})
+
+    def test_add_remove_update(self):
+        """Агрегаты после добавления, замены и удаления."""
+        shapes = LiveShapeSet()
+        first = shapes.add(Triangle(3, 4, 5))
+        second = shapes.add(Circle(1))
+        self.assertEqual((len(shapes), shapes.right_triangle_count), (2, 1))
+        self.assertEqual(shapes.total_area, 6.0 + math.pi)
+        self.assertEqual(shapes.mean_area, (6.0 + math.pi) / 2)
+
+        self.assertEqual(shapes.update(first, Triangle(2, 2, 2)), Triangle(3, 4, 5))
+        self.assertEqual(shapes.right_triangle_count, 0)
+        self.assertEqual(shapes[first], Triangle(2, 2, 2))
+        self.assertEqual(shapes.by_type(), {Triangle: TypeTotals(1, Triangle(2, 2, 2).area()),
+                                            Circle: TypeTotals(1, math.pi)})
+
+        self.assertEqual(shapes.remove(second), Circle(1))
+        self.assertNotIn(second, shapes)
+        self.assertEqual(shapes.by_type(), {Triangle: TypeTotals(1, Triangle(2, 2, 2).area())})
+        shapes.remove(first)
+        self.assertEqual((len(shapes), shapes.total_area, shapes.by_type()), (0, 0.0, {}))
+        self.assertTrue(math.isnan(shapes.mean_area))
+
+    def test_update_changes_type(self):
+        """Замена фигурой другого типа переносит ее между суммами по типам."""
+        square = Polygon([(0, 0), (2, 0), (2, 2), (0, 2)])
+        shapes = LiveShapeSet([Circle(1), Triangle(3, 4, 5)])
+        shapes.update(1, square)
+        self.assertEqual(shapes.by_type(), {Polygon: TypeTotals(1, 4.0),
+                                            Triangle: TypeTotals(1, 6.0)})
+        self.assertEqual(shapes.area(1), 4.0)
+        self.assertEqual(shapes.total_area, 10.0)
+
+    def test_handles(self):
+        """Дескрипторы уникальны, не переиспользуются и итерируются по порядку."""
+        shapes = LiveShapeSet()
+        handles = [shapes.add(Circle(r)) for r in (1, 2, 3)]
+        shapes.remove(handles[1])
+        new = shapes.add(Circle(4))
+        self.assertNotIn(new, handles)
+        self.assertEqual(list(shapes), [handles[0], handles[2], new])
+        self.assertEqual([shape.radius for _, shape in shapes.items()], [1, 3, 4])
+
+    def test_random_changes(self):
+        """Случайная серия изменений: агрегаты совпадают с полным пересчетом."""
+        rng = random.Random(24)
+        shapes = LiveShapeSet(resum_every=50)
+        expected = {}
+        for _ in range(2000):
+            action = rng.random()
+            if action < 0.5 or not expected:
+                shape = _random_shape(rng)
+                expected[shapes.add(shape)] = shape
+            elif action < 0.75:
+                handle = rng.choice(list(expected))
+                shape = _random_shape(rng)
+                self.assertIs(shapes.update(handle, shape), expected[handle])
+                expected[handle] = shape
+            else:
+                handle = rng.choice(list(expected))
+                self.assertIs(shapes.remove(handle), expected.pop(handle))
+        self.assertAggregates(shapes, list(expected.values()))
+
+    def test_resum_removes_drift(self):
+        """Пересчет возвращает точную сумму после серии с потерей точности."""
+        shapes = LiveShapeSet(resum_every=10 ** 9)
+        for r in (0.1, 0.2, 0.3):
+            shapes.add(Circle(r))
+        for _ in range(100):
+            shapes.remove(shapes.add(Circle(1e9)))
+        shapes.add(Circle(1e-3))
+        exact = math.fsum(shapes.area(handle) for handle in shapes)
+        shapes.resum()
+        self.assertEqual(shapes.total_area, exact)
+        self.assertEqual(shapes.by_type()[Circle].total_area, exact)
+
+    def test_periodic_resum(self):
+        """Суммы пересчитываются автоматически раз в resum_every изменений."""
+        shapes = LiveShapeSet(resum_every=4)
+        for r in (1, 2, 3):
+            shapes.add(Circle(r))
+        shapes._compensation = 1.0  # Имитация накопленной ошибки
+        shapes.add(Circle(4))
+        self.assertEqual(shapes.total_area,
+                         math.fsum(Circle(r).area() for r in (1, 2, 3, 4)))
+
+    def test_infinite_area(self):
+        """Удаление фигуры с бесконечной площадью не оставляет NaN в суммах."""
+        shapes = LiveShapeSet([Circle(1)])
+        handle = shapes.add(Circle(1e200))
+        self.assertEqual(shapes.total_area, math.inf)
+        shapes.remove(handle)
+        self.assertEqual(shapes.total_area, math.pi)
+        self.assertEqual(shapes.by_type()[Circle].total_area, math.pi)
+
+    def test_finite_add_after_infinite_area(self):
+        """Конечные изменения при бесконечной сумме не дают NaN ни до, ни после удаления."""
+        shapes = LiveShapeSet([Circle(1)])
+        handle = shapes.add(Circle(1e200))
+        other = shapes.add(Circle(2))
+        shapes.update(other, Triangle(3, 4, 5))
+        self.assertEqual(shapes.total_area, math.inf)
+        self.assertEqual(shapes.by_type()[Circle].total_area, math.inf)
+        self.assertEqual(shapes.mean_area, math.inf)
+        shapes.remove(handle)
+        self.assertEqual(shapes.total_area, math.pi + 6.0)
+        self.assertEqual(shapes.by_type()[Circle].total_area, math.pi)
+
+    def test_non_finite_changes_without_resum(self):
+        """Бесконечные и NaN площади учитываются за O(1), без пересчета набора."""
+        shapes = LiveShapeSet([Circle(1), Triangle(3, 4, 5)], resum_every=10 ** 9)
+        with mock.patch.object(LiveShapeSet, "resum", side_effect=AssertionError):
+            infinite = shapes.add(Circle(1e200))
+            undefined = shapes.add(Circle(math.nan))
+            self.assertTrue(math.isnan(shapes.total_area))
+            self.assertTrue(math.isnan(shapes.by_type()[Circle].total_area))
+            self.assertEqual(shapes.by_type()[Triangle].total_area, 6.0)
+            shapes.remove(undefined)
+            self.assertEqual(shapes.total_area, math.inf)
+            self.assertEqual(shapes.by_type()[Circle], TypeTotals(2, math.inf))
+            shapes.update(infinite, Circle(2))
+            self.assertEqual(shapes.total_area, math.pi + 6.0 + Circle(2).area())
+            self.assertEqual(shapes.by_type()[Circle].total_area, math.pi + Circle(2).area())
+        shapes.add(Circle(math.nan))
+        shapes.resum()
+        self.assertTrue(math.isnan(shapes.total_area))
+        self.assertEqual(shapes.by_type()[Triangle].total_area, 6.0)
+
+    def test_errors(self):
+        """Неизвестный дескриптор, не фигура, неверный интервал пересчета."""
+        shapes = LiveShapeSet([Circle(1)])
+        for call in (lambda: shapes.remove(99), lambda: shapes.update(99, Circle(1)),
+                     lambda: shapes[99], lambda: shapes.area(99)):
+            with self.assertRaises(KeyError):
+                call()
+        with self.assertRaises(TypeError):
+            shapes.add("circle")
+        with self.assertRaises(TypeError):
+            shapes.update(1, "circle")
+        self.assertEqual((len(shapes), shapes.total_area), (1, math.pi))
+        for value in (0, -1, 1.5, True):
+            with self.assertRaises(ValueError):
+                LiveShapeSet(resum_every=value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+Тесты совмещенного вычисления метрик (модуль metrics).
+"""
+
+import unittest
+import math
+import random
+from unittest import mock
+
+from geometry_calculator import _backend
+from geometry_calculator.batch import circle_areas, triangle_areas
+from geometry_calculator.classification import TriangleKind, classify_triangles
+from geometry_calculator.collection import ShapeCollection
+from geometry_calculator.metrics import (
+    CIRCLE_METRICS, TRIANGLE_METRICS, CircleMetrics, TriangleMetrics,
+    measure, measure_circles, measure_triangles
+)
+from geometry_calculator.shapes import Circle, Triangle
+
+
+def _triangles(count, seed=21):
+    """Стороны случайных валидных треугольников и несколько известных."""
+    rng = random.Random(seed)
+    rows = [(3.0, 4.0, 5.0), (5.0, 12.0, 13.0), (2.0, 2.0, 3.5), (1.0, 1.0, 1.0)]
+    for _ in range(count):
+        a, b = rng.uniform(1, 2), rng.uniform(1, 2)
+        rows.append((a, b, rng.uniform(abs(a - b) + 0.01, a + b - 0.01)))
+    return rows
+
+
+class TestMeasure(unittest.TestCase):
+    """Тесты скалярной функции measure."""
+
+    def test_triangle_metrics(self):
+        """Все метрики прямоугольного треугольника 3-4-5."""
+        self.assertEqual(measure(Triangle(3, 4, 5)),
+                         TriangleMetrics(6.0, 12.0, TriangleKind.RIGHT, 2.5, 1.0))
+
+    def test_kinds(self):
+        """Вид по наибольшему углу."""
+        self.assertEqual(measure(Triangle(2, 2, 2), "kind").kind, TriangleKind.ACUTE)
+        self.assertEqual(measure(Triangle(2, 2, 3.5), "kind").kind, TriangleKind.OBTUSE)
+        self.assertEqual(measure(Triangle(3e20, 4e20, 5e20), "kind").kind, TriangleKind.RIGHT)
+
+    def test_only_requested_metrics(self):
+        """Незапрошенные метрики равны None."""
+        result = measure(Triangle(3, 4, 5), ("perimeter", "inradius"))
+        self.assertEqual(result, TriangleMetrics(perimeter=12.0, inradius=1.0))
+
+    def test_matches_methods(self):
+        """Метрики совпадают с методами Triangle и формулами побитово."""
+        for a, b, c in _triangles(200):
+            triangle = Triangle(a, b, c)
+            result = measure(Triangle(a, b, c))
+            self.assertEqual(result.area, triangle.area())
+            self.assertEqual(result.perimeter, 2 * triangle.semi_perimeter)
+            lo, mid, hi = triangle.sorted_sides
+            self.assertEqual(result.circumradius, lo * mid * hi / (4 * triangle.area()))
+            self.assertAlmostEqual(result.inradius, triangle.area() / triangle.semi_perimeter,
+                                   places=14)
+
+    def test_circle_metrics(self):
+        """Площадь и длина окружности."""
+        self.assertEqual(measure(Circle(2)), CircleMetrics(Circle(2).area(), 4 * math.pi))
+        self.assertEqual(measure(Circle(2), "circumference"), CircleMetrics(None, 4 * math.pi))
+
+    def test_vertex_triangle_sides_lazy(self):
+        """Для треугольника по вершинам площадь не требует сторон."""
+        triangle = Triangle.from_vertices((0, 0), (3, 0), (0, 4))
+        self.assertEqual(measure(triangle, "area"), TriangleMetrics(area=6.0))
+        self.assertIsNone(Triangle.side_a.__get__(triangle))
+        self.assertEqual(measure(triangle), TriangleMetrics(6.0, 12.0, TriangleKind.RIGHT, 2.5, 1.0))
+
+    def test_collection_views(self):
+        """Представления ShapeCollection — тоже треугольники."""
+        collection = ShapeCollection.from_columns(Triangle, [3.0], [4.0], [5.0])
+        self.assertEqual(measure(collection[0]).area, 6.0)
+
+    def test_errors(self):
+        """Неизвестная метрика, отрицательный допуск, неподдерживаемая фигура."""
+        with self.assertRaises(ValueError):
+            measure(Triangle(3, 4, 5), ("area", "volume"))
+        with self.assertRaises(ValueError):
+            measure(Circle(1), "perimeter")
+        with self.assertRaises(ValueError):
+            measure(Triangle(3, 4, 5), rel_tol=-1)
+        with self.assertRaises(TypeError):
+            measure("circle")
+
+
+class MeasureBatchTests:
+    """Общие тесты пакетных функций для любого backend'а."""
+
+    def test_matches_scalar(self):
+        """Колонки совпадают с measure() побитово."""
+        rows = _triangles(500)
+        result = measure_triangles(*zip(*rows))
+        for name in TRIANGLE_METRICS:
+            with self.subTest(metric=name):
+                self.assertEqual(list(getattr(result, name)),
+                                 [getattr(measure(Triangle(*row)), name) for row in rows])
+
+    def test_matches_batch_functions(self):
+        """Площадь и вид совпадают с triangle_areas и classify_triangles."""
+        columns = list(zip(*_triangles(300)))
+        result = measure_triangles(*columns, ("area", "kind"))
+        self.assertEqual(list(result.area), list(triangle_areas(*columns)))
+        self.assertEqual(list(result.kind), list(classify_triangles(*columns, kinds=True).kinds))
+        self.assertIsNone(result.perimeter)
+        self.assertIsNone(result.circumradius)
+
+    def test_single_metric(self):
+        """Запрос одной метрики по имени."""
+        result = measure_triangles([3.0], [4.0], [5.0], "inradius")
+        self.assertEqual(list(result.inradius), [1.0])
+        self.assertIsNone(result.area)
+
+    def test_invalid_rows_nan(self):
+        """Невалидные строки дают NaN и не влияют на остальные."""
+        result = measure_triangles([1.0, 3.0], [2.0, 4.0], [5.0, 5.0], ("area", "circumradius"))
+        self.assertTrue(math.isnan(result.area[0]))
+        self.assertEqual(list(result.area)[1:], [6.0])
+        self.assertEqual(list(result.circumradius)[1:], [2.5])
+
+    def test_errors(self):
+        """Разная длина колонок и неизвестная метрика."""
+        with self.assertRaises(ValueError):
+            measure_triangles([1.0], [1.0, 2.0], [1.0])
+        with self.assertRaises(ValueError):
+            measure_triangles([1.0], [1.0], [1.0], "diameter")
+        with self.assertRaises(ValueError):
+            measure_circles([1.0], "perimeter")
+
+    def test_circles(self):
+        """Метрики кругов совпадают с circle_areas и 2πr."""
+        radii = [0.0, 0.5, 1.0, 7.25]
+        result = measure_circles(radii)
+        self.assertEqual(list(result.area), list(circle_areas(radii)))
+        self.assertEqual(list(result.circumference), [2 * math.pi * r for r in radii])
+        self.assertEqual(list(result.area), [measure(Circle(r)).area for r in radii])
+        self.assertIsNone(measure_circles(radii, "area").circumference)
+        self.assertEqual(set(CIRCLE_METRICS), set(CircleMetrics._fields))
+
+    def test_empty(self):
+        """Пустой вход."""
+        self.assertEqual(len(measure_triangles([], [], []).area), 0)
+
+
+@unittest.skipIf(_backend.get_numpy() is None, "NumPy не установлен")
+class TestMeasureBatchNumpy(MeasureBatchTests, unittest.TestCase):
+    """Тесты пакетных метрик с NumPy."""
+
+    def test_many_blocks(self):
+        """Вход длиннее блока обрабатывается целиком."""
+        np = _backend.get_numpy()
+        count = 20_000
+        result = measure_triangles(np.full(count, 3.0), np.full(count, 4.0), np.full(count, 5.0))
+        self.assertTrue((result.area == 6.0).all())
+        self.assertTrue((result.kind == TriangleKind.RIGHT).all())
+        self.assertEqual(result.kind.dtype, np.uint8)
+
+
+class TestMeasureBatchPurePython(MeasureBatchTests, unittest.TestCase):
+    """Тесты пакетных метрик на чистом Python."""
+
+    def setUp(self):
+        patcher = mock.patch.object(_backend, "get_numpy", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_result_typecodes(self):
+        """Без NumPy колонки — array('d') и array('B') для вида."""
+        result = measure_triangles([3.0], [4.0], [5.0])
+        self.assertEqual(result.area.typecode, 'd')
+        self.assertEqual(result.kind.typecode, 'B')
+
+
+if __name__ == '__main__':
+    unittest.main()
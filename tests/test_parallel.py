@@ -0,0 +1,94 @@
+"""
+Тесты для модуля parallel.
+"""
+
+import unittest
+import random
+from array import array
+from unittest import mock
+
+from geometry_calculator import _backend, parallel
+from geometry_calculator.batch import circle_areas, triangle_areas, triple_columns
+from geometry_calculator.parallel import parallel_circle_areas, parallel_triangle_areas
+from geometry_calculator.precision import area_precision
+
+
+def _random_columns(count, seed=3):
+    """Колонки радиусов и сторон валидных треугольников."""
+    rng = random.Random(seed)
+    radii = array('d', (rng.uniform(0, 100) for _ in range(count)))
+    triples = array('d')
+    for _ in range(count):
+        a, b = rng.uniform(1, 2), rng.uniform(1, 2)
+        triples.extend((a, b, rng.uniform(abs(a - b) + 0.01, a + b - 0.01)))
+    return radii, triples
+
+
+class ParallelTests:
+    """Общие тесты параллельных функций для любого backend'а."""
+
+    def setUp(self):
+        # Уменьшаем порог, чтобы тесты действительно запускали пул процессов
+        patcher = mock.patch.object(parallel, "MIN_PARALLEL_SIZE", 10)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.radii, self.triples = _random_columns(1000)
+
+    def test_circle_areas_match_batch(self):
+        """Результат совпадает с circle_areas() и сохраняет порядок."""
+        expected = list(circle_areas(self.radii))
+        result = parallel_circle_areas(self.radii, workers=2, chunk_size=97)
+        self.assertEqual(list(result), expected)
+
+    def test_triangle_areas_match_batch(self):
+        """Результат совпадает с triangle_areas() для колонок с шагом."""
+        columns = triple_columns(self.triples)
+        expected = list(triangle_areas(*columns))
+        result = parallel_triangle_areas(*columns, workers=2)
+        self.assertEqual(list(result), expected)
+
+    def test_context_precision(self):
+        """Процессы пула считают в режиме контекста; тип результата как без пула."""
+        with area_precision("single"):
+            expected = circle_areas(self.radii)
+            pooled = parallel_circle_areas(self.radii, workers=2)
+            in_process = parallel_circle_areas(self.radii, workers=1)
+        self.assertEqual(expected.itemsize, 4)
+        self.assertEqual(pooled.itemsize, 4)
+        self.assertEqual(in_process.itemsize, 4)
+        self.assertEqual(list(pooled), list(expected))
+
+    def test_invalid_arguments(self):
+        """Неположительные workers/chunk_size вызывают ValueError."""
+        with self.assertRaises(ValueError):
+            parallel_circle_areas(self.radii, workers=0)
+        with self.assertRaises(ValueError):
+            parallel_circle_areas(self.radii, chunk_size=0)
+        with self.assertRaises(ValueError):
+            parallel_triangle_areas([3], [4, 5], [5], workers=2)
+
+    def test_small_input_in_process(self):
+        """Вход меньше порога считается без пула."""
+        with mock.patch.object(parallel, "ProcessPoolExecutor") as executor:
+            result = parallel_circle_areas([1.0, 2.0, 3.0], workers=4)
+        executor.assert_not_called()
+        self.assertEqual(list(result), list(circle_areas([1.0, 2.0, 3.0])))
+
+
+@unittest.skipIf(_backend.get_numpy() is None, "NumPy не установлен")
+class TestParallelNumpy(ParallelTests, unittest.TestCase):
+    """Тесты параллельных функций с backend'ом NumPy."""
+
+
+class TestParallelPurePython(ParallelTests, unittest.TestCase):
+    """Тесты параллельных функций на чистом Python."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(_backend, "get_numpy", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Тесты для модуля pipeline и командной строки.
+"""
+
+import unittest
+import io
+import json
+import os
+import random
+import tempfile
+from contextlib import redirect_stdout
+from unittest import mock
+
+from geometry_calculator.precision import area_precision
+from geometry_calculator.shapes import circle_area, triangle_area
+from geometry_calculator.pipeline import process_stream, process_file, detect_format
+from geometry_calculator.__main__ import main
+
+
+def _random_records(count, seed=7):
+    """Генерирует валидные записи кругов и треугольников."""
+    rng = random.Random(seed)
+    records = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            records.append({"shape": "circle", "radius": rng.uniform(0, 100)})
+        else:
+            a, b = rng.uniform(1, 2), rng.uniform(1, 2)
+            records.append({"shape": "triangle", "side_a": a, "side_b": b,
+                            "side_c": rng.uniform(abs(a - b) + 0.01, a + b - 0.01)})
+    return records
+
+
+def _expected_area(record):
+    """Площадь, вычисленная legacy функциями по одной записи."""
+    if record["shape"] == "circle":
+        return circle_area(record["radius"])
+    return triangle_area(record["side_a"], record["side_b"], record["side_c"])
+
+
+class TestProcessStream(unittest.TestCase):
+    """Тесты потоковой обработки."""
+
+    def test_jsonl_matches_per_row(self):
+        """Результат JSONL совпадает с построчным вычислением при любом размере порции."""
+        records = _random_records(200)
+        source_text = "".join(json.dumps(record) + "\n" for record in records)
+        expected = "".join(json.dumps(dict(record, area=_expected_area(record)), ensure_ascii=False) + "\n"
+                           for record in records)
+        for chunk_size in (1, 7, 1000):
+            output = io.StringIO()
+            written = process_stream(io.StringIO(source_text), output, "jsonl", chunk_size)
+            self.assertEqual(written, len(records))
+            self.assertEqual(output.getvalue(), expected)
+
+    def test_ignores_context_precision(self):
+        """Режим single контекста не меняет вывод: площади float64, как у area()."""
+        records = _random_records(50)
+        source_text = "".join(json.dumps(record) + "\n" for record in records)
+        expected = io.StringIO()
+        process_stream(io.StringIO(source_text), expected, "jsonl", 16)
+        output = io.StringIO()
+        with area_precision("single"):
+            process_stream(io.StringIO(source_text), output, "jsonl", 16)
+        self.assertEqual(output.getvalue(), expected.getvalue())
+
+    def test_csv_output(self):
+        """CSV дополняется колонкой area."""
+        source = io.StringIO("shape,radius,side_a,side_b,side_c\n"
+                             "circle,5,,,\n"
+                             "triangle,,3,4,5\n")
+        output = io.StringIO()
+        process_stream(source, output, "csv", chunk_size=1)
+        self.assertEqual(output.getvalue(),
+                         "shape,radius,side_a,side_b,side_c,area\n"
+                         f"circle,5,,,,{circle_area(5)!r}\n"
+                         "triangle,,3,4,5,6.0\n")
+
+    def test_invalid_record_raises(self):
+        """Невалидная запись вызывает исключение конструктора с номером записи."""
+        source = io.StringIO('{"shape": "circle", "radius": 1}\n'
+                             '{"shape": "triangle", "side_a": 1, "side_b": 2, "side_c": 5}\n')
+        with self.assertRaisesRegex(ValueError, "Запись 2"):
+            process_stream(source, io.StringIO(), "jsonl")
+
+        source = io.StringIO('{"shape": "circle", "radius": "5"}\n')
+        with self.assertRaises(TypeError):
+            process_stream(source, io.StringIO(), "jsonl")
+
+    def test_skip_invalid(self):
+        """С skip_invalid невалидные записи пропускаются."""
+        source = io.StringIO("shape,radius,side_a,side_b,side_c\n"
+                             "circle,-1,,,\n"
+                             "circle,abc,,,\n"
+                             "triangle,,3,4,5\n")
+        output = io.StringIO()
+        self.assertEqual(process_stream(source, output, "csv", skip_invalid=True), 1)
+
+    def test_unknown_shape_and_format(self):
+        """Неизвестный тип фигуры или формат вызывает ValueError."""
+        with self.assertRaisesRegex(ValueError, "Запись 1"):
+            process_stream(io.StringIO('{"shape": "square"}\n'), io.StringIO(), "jsonl")
+        with self.assertRaises(ValueError):
+            process_stream(io.StringIO(""), io.StringIO(), "xml")
+        with self.assertRaises(ValueError):
+            process_stream(io.StringIO(""), io.StringIO(), "csv", chunk_size=0)
+
+    def test_unparsed_records_are_row_errors(self):
+        """Неизвестный тип, не объект и не JSON — ошибки своих записей, как невалидные параметры."""
+        lines = ['{"shape": "circle", "radius": 1}',
+                 '{"shape": "square", "side": 2}',
+                 '[1, 2]',
+                 '{"shape": "triangle", "side_a": 3, "side_b": 4, "side_c": 5}',
+                 '{not json',
+                 '{"shape": "circle", "radius": 2}']
+        source_text = "".join(line + "\n" for line in lines)
+        for chunk_size in (1, 1000):
+            output = io.StringIO()
+            written = process_stream(io.StringIO(source_text), output, "jsonl",
+                                     chunk_size, skip_invalid=True)
+            self.assertEqual(written, 3)
+            areas = [json.loads(line)["area"] for line in output.getvalue().splitlines()]
+            self.assertEqual(areas, [circle_area(1), 6.0, circle_area(2)])
+        for row in (2, 3, 5):
+            source = io.StringIO(lines[0] + "\n" + lines[row - 1] + "\n")
+            with self.assertRaisesRegex(ValueError, "Запись 2:"):
+                process_stream(source, io.StringIO(), "jsonl")
+
+        source = io.StringIO("shape,radius\nsquare,1\ncircle,1\n")
+        output = io.StringIO()
+        self.assertEqual(process_stream(source, output, "csv", skip_invalid=True), 1)
+
+    def test_detect_format(self):
+        """Формат определяется по расширению."""
+        self.assertEqual(detect_format("shapes.jsonl"), "jsonl")
+        self.assertEqual(detect_format("shapes.CSV"), "csv")
+
+
+class TestCommandLine(unittest.TestCase):
+    """Тесты точки входа python -m geometry_calculator."""
+
+    def test_file_to_file(self):
+        """Файл обрабатывается и результат совпадает с process_file."""
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "shapes.jsonl")
+            with open(input_path, "w", encoding="utf-8") as stream:
+                for record in _random_records(20):
+                    stream.write(json.dumps(record) + "\n")
+            cli_path = os.path.join(directory, "cli.jsonl")
+            api_path = os.path.join(directory, "api.jsonl")
+            self.assertEqual(main([input_path, "-o", cli_path, "-c", "3"]), 0)
+            process_file(input_path, api_path)
+            with open(cli_path, "rb") as cli, open(api_path, "rb") as api:
+                self.assertEqual(cli.read(), api.read())
+
+    def test_error_exit_code(self):
+        """Невалидный вход дает код возврата 1."""
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "shapes.csv")
+            with open(input_path, "w", encoding="utf-8") as stream:
+                stream.write("shape,radius\ncircle,-1\n")
+            with redirect_stdout(io.StringIO()), \
+                    mock.patch("sys.stderr", io.StringIO()):
+                self.assertEqual(main([input_path]), 1)
+
+    def test_os_error_exit_code(self):
+        """Недоступный вход или выход — сообщение об ошибке и код 1."""
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "shapes.csv")
+            with open(input_path, "w", encoding="utf-8") as stream:
+                stream.write("shape,radius\ncircle,1\n")
+            missing_input = os.path.join(directory, "missing.csv")
+            missing_output = os.path.join(directory, "missing", "areas.csv")
+            for argv in ([missing_input], [input_path, "-o", missing_output]):
+                with self.subTest(argv=argv):
+                    stderr = io.StringIO()
+                    with redirect_stdout(io.StringIO()), mock.patch("sys.stderr", stderr):
+                        self.assertEqual(main(argv), 1)
+                    self.assertTrue(stderr.getvalue().startswith("Ошибка: "))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,208 @@
+"""
+Тесты многоугольника (Polygon) и пакетной функции polygon_areas.
+"""
+
+import unittest
+import math
+import pickle
+import random
+from array import array
+from unittest import mock
+
+from geometry_calculator import _backend
+from geometry_calculator.batch import calculate_areas, polygon_areas
+from geometry_calculator.registry import batch_kernel_for
+from geometry_calculator.shapes import Circle, Polygon, Triangle, calculate_area
+
+
+def _star_polygon(rng, count, center=(0.0, 0.0)):
+    """Случайный многоугольник, звездный относительно центра (простой)."""
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(count))
+    radii = [rng.uniform(1, 2) for _ in range(count)]
+    return [(center[0] + r * math.cos(t), center[1] + r * math.sin(t))
+            for r, t in zip(radii, angles)]
+
+
+def _ragged(polygons):
+    """Плоский буфер координат и смещения для списка списков вершин."""
+    coords = [value for vertices in polygons for vertex in vertices for value in vertex]
+    offsets = [0]
+    for vertices in polygons:
+        offsets.append(offsets[-1] + len(vertices))
+    return coords, offsets
+
+
+class TestPolygonClass(unittest.TestCase):
+    """Тесты класса Polygon."""
+
+    def test_polygon_area(self):
+        """Площадь по формуле шнурков, независимо от направления обхода."""
+        square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+        self.assertEqual(Polygon(square).area(), 4.0)
+        self.assertEqual(Polygon(square[::-1]).area(), 4.0)
+        self.assertEqual(Polygon([(0, 0), (4, 0), (0, 3)]).area(), 6.0)
+        # Невыпуклый многоугольник (буква L)
+        shape_l = [(0, 0), (3, 0), (3, 1), (1, 1), (1, 3), (0, 3)]
+        self.assertEqual(Polygon(shape_l).area(), 5.0)
+
+    def test_polygon_far_from_origin(self):
+        """Сдвиг к первой вершине сохраняет точность при больших координатах."""
+        offset = 1e9
+        square = [(offset, offset), (offset + 1, offset), (offset + 1, offset + 1),
+                  (offset, offset + 1)]
+        self.assertEqual(Polygon(square).area(), 1.0)
+
+    def test_polygon_matches_triangle(self):
+        """Треугольник из вершин имеет ту же площадь, что и по сторонам."""
+        vertices = [(0, 0), (3, 0), (0, 4)]
+        self.assertAlmostEqual(Polygon(vertices).area(), Triangle(3, 4, 5).area(), places=12)
+
+    def test_polygon_validation(self):
+        """Ошибки конструктора."""
+        with self.assertRaises(ValueError):
+            Polygon([(0, 0), (1, 1)])
+        with self.assertRaises(ValueError):
+            Polygon([(0, 0), (1, 1), (2, 2)])  # Вершины на одной прямой
+        with self.assertRaises(TypeError):
+            Polygon([(0, 0), (1, 0), ("1", 1)])
+        with self.assertRaises(TypeError):
+            Polygon([(0, 0), (1, 0), (1, 1, 1)])
+        with self.assertRaises(TypeError):
+            Polygon([0, 1, 2])
+
+    def test_polygon_properties(self):
+        """Вершины и их количество."""
+        polygon = Polygon(iter([(0, 0), (2, 0), (1, 1)]))
+        self.assertEqual(polygon.vertices, ((0.0, 0.0), (2.0, 0.0), (1.0, 1.0)))
+        self.assertEqual(polygon.vertex_count, 3)
+        self.assertEqual(str(polygon), "Многоугольник(вершин=3)")
+        self.assertEqual(repr(polygon), "Polygon(vertices=((0.0, 0.0), (2.0, 0.0), (1.0, 1.0)))")
+
+    def test_polygon_is_immutable(self):
+        """Атрибуты многоугольника нельзя изменить."""
+        polygon = Polygon([(0, 0), (2, 0), (1, 1)])
+        with self.assertRaises(AttributeError):
+            polygon._area = 0.0
+        with self.assertRaises(AttributeError):
+            del polygon._coords
+        with self.assertRaises(AttributeError):
+            polygon.color = "red"
+
+    def test_polygon_equality_and_pickle(self):
+        """Сравнение по последовательности вершин и сериализация."""
+        polygon = Polygon([(0, 0), (2, 0), (1, 1)])
+        self.assertEqual(polygon, Polygon([(0.0, 0.0), (2.0, 0.0), (1.0, 1.0)]))
+        self.assertEqual(hash(polygon), hash(Polygon([(0, 0), (2, 0), (1, 1)])))
+        self.assertNotEqual(polygon, Polygon([(0, 0), (2, 0), (1, 2)]))
+        restored = pickle.loads(pickle.dumps(polygon))
+        self.assertEqual(restored, polygon)
+        self.assertEqual(restored.area(), polygon.area())
+
+    def test_calculate_area(self):
+        """Polygon работает с calculate_area."""
+        self.assertEqual(calculate_area(Polygon([(0, 0), (2, 0), (2, 2), (0, 2)])), 4.0)
+
+
+class PolygonAreasTests:
+    """Общие тесты polygon_areas для любого backend'а."""
+
+    def test_ragged_areas(self):
+        """Многоугольники разного размера в одном буфере."""
+        polygons = [[(0, 0), (4, 0), (0, 3)], [(0, 0), (2, 0), (2, 2), (0, 2)],
+                    [(0, 0), (3, 0), (3, 1), (1, 1), (1, 3), (0, 3)]]
+        coords, offsets = _ragged(polygons)
+        self.assertEqual(list(polygon_areas(coords, offsets)), [6.0, 4.0, 5.0])
+        self.assertEqual(list(polygon_areas(array('d', coords), array('q', offsets))),
+                         [6.0, 4.0, 5.0])
+
+    def test_matches_polygon_area(self):
+        """Площади совпадают с Polygon.area()."""
+        rng = random.Random(5)
+        polygons = [_star_polygon(rng, rng.randint(3, 40), (rng.uniform(-1e6, 1e6), 7.0))
+                    for _ in range(200)]
+        areas = polygon_areas(*_ragged(polygons))
+        for vertices, area in zip(polygons, areas):
+            self.assertAlmostEqual(area, Polygon(vertices).area(), delta=1e-13 * area)
+
+    def test_short_polygons_are_nan(self):
+        """Многоугольники меньше чем из трех вершин дают NaN и не влияют на соседей."""
+        coords, offsets = _ragged([[(0, 0), (1, 1)], [], [(0, 0), (4, 0), (0, 3)], []])
+        areas = list(polygon_areas(coords, offsets))
+        self.assertTrue(math.isnan(areas[0]))
+        self.assertTrue(math.isnan(areas[1]))
+        self.assertEqual(areas[2], 6.0)
+        self.assertTrue(math.isnan(areas[3]))
+
+    def test_invalid_values_isolated(self):
+        """Бесконечная координата портит только свой многоугольник."""
+        triangle = [(0, 0), (1, 0), (0, 1)]
+        coords, offsets = _ragged([triangle, [(math.inf, 0), (1, 0), (0, 1)], triangle])
+        areas = list(polygon_areas(coords, offsets))
+        self.assertEqual(areas[0], 0.5)
+        self.assertTrue(math.isnan(areas[1]))
+        self.assertEqual(areas[2], 0.5)
+
+    def test_empty(self):
+        """Пустой вход."""
+        self.assertEqual(len(polygon_areas([], [0])), 0)
+
+    def test_invalid_offsets(self):
+        """Невалидные смещения и координаты."""
+        coords, _ = _ragged([[(0, 0), (4, 0), (0, 3)]])
+        for offsets in ([], [1, 3], [0, 2], [0, 2, 1, 3]):
+            with self.subTest(offsets=offsets):
+                with self.assertRaises(ValueError):
+                    polygon_areas(coords, offsets)
+        with self.assertRaises(ValueError):
+            polygon_areas(coords[:-1], [0, 3])
+
+    def test_calculate_areas_mixed(self):
+        """calculate_areas собирает многоугольники в рваный массив."""
+        shapes = [Polygon([(0, 0), (4, 0), (0, 3)]), Circle(1),
+                  Polygon([(0, 0), (2, 0), (2, 2), (0, 2)]), Triangle(3, 4, 5)]
+        self.assertEqual(list(calculate_areas(shapes)), [6.0, math.pi, 4.0, 6.0])
+        self.assertEqual(list(calculate_areas(shapes[::2], threads=2)), [6.0, 4.0])
+
+    def test_registered_gather(self):
+        """Пакетное ядро Polygon собирает колонки своей функцией."""
+        kernel = batch_kernel_for(Polygon)
+        self.assertIs(kernel.function, polygon_areas)
+        coords, offsets = kernel.gather([Polygon([(0, 0), (4, 0), (0, 3)])])
+        self.assertEqual(list(coords), [0.0, 0.0, 4.0, 0.0, 0.0, 3.0])
+        self.assertEqual(list(offsets), [0, 3])
+
+
+@unittest.skipIf(_backend.get_numpy() is None, "NumPy не установлен")
+class TestPolygonAreasNumpy(PolygonAreasTests, unittest.TestCase):
+    """Тесты polygon_areas с NumPy."""
+
+    def test_two_column_coords(self):
+        """Координаты можно передать массивом формы (n, 2)."""
+        np = _backend.get_numpy()
+        coords = np.array([[0, 0], [4, 0], [0, 3]], dtype=np.float64)
+        self.assertEqual(list(polygon_areas(coords, np.array([0, 3]))), [6.0])
+        with self.assertRaises(ValueError):
+            polygon_areas(np.zeros((3, 3)), [0, 3])
+        with self.assertRaises(ValueError):
+            polygon_areas(coords, np.array([0.0, 3.0]))
+
+
+class TestPolygonAreasPurePython(PolygonAreasTests, unittest.TestCase):
+    """Тесты polygon_areas на чистом Python."""
+
+    def setUp(self):
+        patcher = mock.patch.object(_backend, "get_numpy", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_bit_identical(self):
+        """Без NumPy площади совпадают с Polygon.area() побитово."""
+        rng = random.Random(9)
+        polygons = [_star_polygon(rng, rng.randint(3, 30)) for _ in range(50)]
+        areas = polygon_areas(*_ragged(polygons))
+        self.assertEqual(areas.typecode, 'd')
+        self.assertEqual(list(areas), [Polygon(vertices).area() for vertices in polygons])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,225 @@
+"""
+Тесты режима точности single (модуль precision).
+"""
+
+import unittest
+import random
+import threading
+from array import array
+from unittest import mock
+
+from geometry_calculator import _backend, batch, threaded
+from geometry_calculator.batch import calculate_areas, circle_areas, triangle_areas
+from geometry_calculator.precision import (
+    SINGLE_REL_ERROR, area_precision, get_area_precision, set_area_precision
+)
+from geometry_calculator.shapes import Circle, Triangle
+
+
+def _triangles(count, seed=11):
+    """Стороны треугольников разной формы и масштаба, включая «иглы»."""
+    rng = random.Random(seed)
+    sides = []
+    for _ in range(count):
+        scale = 10.0 ** rng.uniform(-8, 15)
+        a, b = rng.uniform(1, 2), rng.uniform(1, 2)
+        c = rng.uniform(abs(a - b), a + b)
+        sides.append((a * scale, b * scale, c * scale))
+        # Игла: c почти равна a - b
+        a, b = rng.uniform(1, 2), rng.uniform(0.5, 1)
+        sides.append((a * scale, b * scale, (a - b) * scale * (1 + 10.0 ** rng.uniform(-12, -4))))
+    return [triple for triple in sides if _is_triangle(*triple)]
+
+
+def _is_triangle(a, b, c):
+    return a + b > c and a + c > b and b + c > a
+
+
+def _relative_error(value, reference):
+    return abs(value - reference) / reference
+
+
+class PrecisionTests:
+    """Общие тесты режима single для любого backend'а."""
+
+    def _column(self, values):
+        return array('f', values)
+
+    def test_default_is_double(self):
+        """По умолчанию результаты совпадают с area() побитово."""
+        self.assertEqual(get_area_precision(), "double")
+        self.assertEqual(list(circle_areas([1.5])), [Circle(1.5).area()])
+
+    def test_single_result_is_float32(self):
+        """Результат режима single хранится в float32."""
+        areas = circle_areas([1.0, 2.0], precision="single")
+        self.assertEqual(areas.itemsize, 4)
+        areas = triangle_areas([3.0], [4.0], [5.0], precision="single")
+        self.assertEqual(areas.itemsize, 4)
+        self.assertEqual(list(areas), [6.0])
+
+    def test_circle_error_bound(self):
+        """Погрешность площадей кругов не превышает 1e-6 относительно Circle.area()."""
+        rng = random.Random(5)
+        radii = [10.0 ** rng.uniform(-15, 15) for _ in range(2000)]
+        for column in (radii, self._column(radii)):
+            areas = circle_areas(column, precision="single")
+            for radius, area in zip(column, areas):
+                self.assertLessEqual(_relative_error(area, Circle(float(radius)).area()),
+                                     SINGLE_REL_ERROR)
+
+    def test_triangle_error_bound_double_columns(self):
+        """Колонки float64: погрешность не превышает 1e-6 и для «игл»."""
+        sides = _triangles(1000)
+        areas = triangle_areas(*zip(*sides), precision="single")
+        for (a, b, c), area in zip(sides, areas):
+            self.assertLessEqual(_relative_error(area, Triangle(a, b, c).area()),
+                                 SINGLE_REL_ERROR)
+
+    def test_triangle_error_bound_single_columns(self):
+        """Колонки float32: погрешность относительно Triangle.area() тех же сторон."""
+        columns = [self._column(column) for column in zip(*_triangles(1000))]
+        areas = triangle_areas(*columns, precision="single")
+        checked = 0
+        for a, b, c, area in zip(*columns, areas):
+            a, b, c = float(a), float(b), float(c)
+            if not _is_triangle(a, b, c):
+                continue  # Округление до float32 сделало треугольник вырожденным
+            checked += 1
+            self.assertLessEqual(_relative_error(area, Triangle(a, b, c).area()),
+                                 SINGLE_REL_ERROR)
+        self.assertGreater(checked, 1500)
+
+    def test_invalid_rows_are_nan(self):
+        """Невалидные строки дают NaN, как в режиме double."""
+        areas = triangle_areas([1.0, 3.0], [2.0, 4.0], [10.0, 5.0], precision="single")
+        self.assertNotEqual(areas[0], areas[0])
+        self.assertEqual(areas[1], 6.0)
+
+    def test_context(self):
+        """area_precision переключает режим для контекста и восстанавливает его."""
+        with area_precision("single"):
+            self.assertEqual(get_area_precision(), "single")
+            self.assertEqual(circle_areas([1.0]).itemsize, 4)
+            # Аргумент вызова важнее режима контекста
+            self.assertEqual(circle_areas([1.0], precision="double").itemsize, 8)
+            with area_precision("double"):
+                self.assertEqual(circle_areas([1.0]).itemsize, 8)
+            self.assertEqual(get_area_precision(), "single")
+        self.assertEqual(get_area_precision(), "double")
+
+    def test_context_is_per_thread(self):
+        """Режим одного потока не влияет на другие потоки."""
+        seen = []
+        with area_precision("single"):
+            thread = threading.Thread(target=lambda: seen.append(get_area_precision()))
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, ["double"])
+
+    def test_set_area_precision(self):
+        """set_area_precision устанавливает режим текущего контекста."""
+        def work():
+            set_area_precision("single")
+            seen.append(triangle_areas([3.0], [4.0], [5.0]).itemsize)
+
+        seen = []
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [4])
+        self.assertEqual(get_area_precision(), "double")
+
+    def test_unknown_precision(self):
+        """Неизвестный режим вызывает ValueError."""
+        with self.assertRaises(ValueError):
+            circle_areas([1.0], precision="half")
+        with self.assertRaises(ValueError):
+            with area_precision("fast"):
+                pass
+        with self.assertRaises(ValueError):
+            calculate_areas([Circle(1)], precision="quad")
+
+    def test_calculate_areas_single(self):
+        """calculate_areas в режиме single укладывается в гарантию."""
+        sides = _triangles(200, seed=3)
+        shapes = [Triangle(*triple) for triple in sides] + [Circle(r / 7) for r in range(1, 50)]
+        random.Random(2).shuffle(shapes)
+        areas = calculate_areas(shapes, precision="single")
+        self.assertEqual(areas.itemsize, 4)
+        for shape, area in zip(shapes, areas):
+            self.assertLessEqual(_relative_error(area, shape.area()), SINGLE_REL_ERROR)
+        self.assertEqual(list(calculate_areas([Circle(1)], precision="single")),
+                         list(circle_areas([1.0], precision="single")))
+
+    def test_run_kernel_single_dtype(self):
+        """На пуле потоков режим single дает float32, как и без пула."""
+        radii = [r / 7 for r in range(1, 50)]
+        with mock.patch.object(threaded, "MIN_THREADED_SIZE", 1), \
+                mock.patch.object(threaded, "gil_enabled", return_value=False):
+            with area_precision("single"):
+                areas = threaded.run_kernel(circle_areas, [radii], threads=2, chunk_size=10)
+            self.assertEqual(areas.itemsize, 4)
+            self.assertEqual(list(areas), list(circle_areas(radii, precision="single")))
+            self.assertEqual(threaded.run_kernel(circle_areas, [radii], threads=2).itemsize, 8)
+
+    def test_calculate_areas_argument_overrides_context(self):
+        """Явный аргумент precision важнее режима контекста, в том числе на пуле потоков."""
+        shapes = [Circle(r / 7) for r in range(1, 50)] + [Triangle(3, 4, 5)]
+        exact = [shape.area() for shape in shapes]
+        single = list(calculate_areas(shapes, precision="single"))
+        with mock.patch.object(threaded, "MIN_THREADED_SIZE", 1):
+            for options in ({}, {"threads": 2}):
+                with self.subTest(**options):
+                    with area_precision("single"):
+                        areas = calculate_areas(shapes, precision="double", **options)
+                    self.assertEqual(areas.itemsize, 8)
+                    self.assertEqual(list(areas), exact)
+                    with area_precision("double"):
+                        areas = calculate_areas(shapes, precision="single", **options)
+                    self.assertEqual(list(areas), single)
+
+
+@unittest.skipIf(_backend.get_numpy() is None, "NumPy не установлен")
+class TestPrecisionNumpy(PrecisionTests, unittest.TestCase):
+    """Тесты режима single с backend'ом NumPy."""
+
+    def _column(self, values):
+        np = _backend.get_numpy()
+        return np.asarray(values, dtype=np.float32)
+
+    def test_single_columns_not_copied(self):
+        """Колонки float32 используются без преобразования."""
+        np = _backend.get_numpy()
+        radii = np.arange(10, dtype=np.float32)
+        self.assertIs(batch._single_column(np, radii), radii)
+        self.assertEqual(circle_areas(radii, precision="single").dtype, np.float32)
+
+    def test_out_of_window_rows_recomputed(self):
+        """Строки вне окна масштабов float32 пересчитываются в float64."""
+        np = _backend.get_numpy()
+        sides = [(3e9, 4e9, 5e9), (3e-12, 4e-12, 5e-12), (3.0, 4.0, 5.0)]
+        columns = [np.asarray(column, dtype=np.float32) for column in zip(*sides)]
+        areas = triangle_areas(*columns, precision="single")
+        for (a, b, c), area in zip(zip(*columns), areas):
+            reference = Triangle(float(a), float(b), float(c)).area()
+            self.assertLessEqual(_relative_error(area, reference), SINGLE_REL_ERROR)
+
+
+class TestPrecisionPurePython(PrecisionTests, unittest.TestCase):
+    """Тесты режима single на чистом Python."""
+
+    def setUp(self):
+        patcher = mock.patch.object(_backend, "get_numpy", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_result_typecode(self):
+        """Без NumPy результат — array('f')."""
+        self.assertEqual(circle_areas([1.0], precision="single").typecode, 'f')
+        self.assertEqual(calculate_areas([Circle(1), Triangle(3, 4, 5)],
+                                         precision="single").typecode, 'f')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+"""
+Тесты для потоковых агрегатов площадей (модуль reductions).
+"""
+
+import unittest
+import math
+import pickle
+import random
+import statistics
+from unittest import mock
+
+from geometry_calculator import _backend
+from geometry_calculator.shapes import Circle, Triangle
+from geometry_calculator.reductions import (
+    AreaHistogram, AreaStats, TopAreas, reduce_areas
+)
+
+
+def _values(count=1000, seed=11):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(0, 2) for _ in range(count)]
+
+
+def _shapes(count=500, seed=13):
+    rng = random.Random(seed)
+    for _ in range(count):
+        if rng.random() < 0.5:
+            yield Circle(rng.uniform(0, 10))
+        else:
+            a, b = rng.uniform(1, 2), rng.uniform(1, 2)
+            yield Triangle(a, b, rng.uniform(abs(a - b) + 0.01, a + b - 0.01))
+
+
+class ReductionTests:
+    """Общие тесты редукторов для любого backend'а."""
+
+    def test_stats_match_statistics(self):
+        """Сумма, среднее и дисперсия совпадают с точными значениями."""
+        values = _values()
+        stats = AreaStats()
+        for start in range(0, len(values), 97):
+            stats.update(values[start:start + 97])
+        self.assertEqual(stats.count, len(values))
+        # Внутри порции NumPy суммирует попарно: погрешность O(eps * log n)
+        self.assertAlmostEqual(stats.total / math.fsum(values), 1.0, places=14)
+        self.assertAlmostEqual(stats.mean, statistics.fmean(values), places=12)
+        self.assertAlmostEqual(stats.variance / statistics.pvariance(values), 1.0, places=12)
+        self.assertEqual((stats.minimum, stats.maximum), (min(values), max(values)))
+
+    def test_compensated_sum(self):
+        """Компенсированная сумма не теряет малые слагаемые."""
+        stats = AreaStats()
+        stats.add(1e16)
+        for _ in range(1000):
+            stats.add(1.0)
+        stats.add(-1e16)
+        self.assertEqual(stats.total, 1000.0)
+
+    def test_ill_conditioned_chunk(self):
+        """Сумма одной порции с сильным сокращением совпадает с точной."""
+        stats = AreaStats()
+        stats.update([1e16] + [1.0] * 1000 + [-1e16])
+        self.assertEqual(stats.total, 1000.0)
+
+        values = []
+        for index, value in enumerate(_values()):
+            huge = 10.0 ** (12 + index % 7)
+            values += [huge, value, -huge]
+        stats = AreaStats()
+        stats.update(values)
+        exact = math.fsum(values)
+        self.assertLessEqual(abs(stats.total - exact), 1e-15 * exact)
+
+    def test_stats_merge_equals_single_pass(self):
+        """Объединение частичных агрегатов равно агрегату по всему потоку."""
+        values = _values()
+        whole = AreaStats()
+        whole.update(values)
+        parts = [AreaStats() for _ in range(3)]
+        for part, start in zip(parts, (0, 100, 700)):
+            part.update(values[start:{0: 100, 100: 700, 700: None}[start]])
+        merged = parts[0].merge(parts[1]).merge(parts[2])
+        self.assertEqual(merged.count, whole.count)
+        self.assertAlmostEqual(merged.total / whole.total, 1.0, places=14)
+        self.assertAlmostEqual(merged.variance / whole.variance, 1.0, places=12)
+
+    def test_nan_skipped(self):
+        """NaN пропускаются и учитываются в nan_count."""
+        stats = AreaStats()
+        histogram = AreaHistogram(0, 10, 2)
+        top = TopAreas(1)
+        for reducer in (stats, histogram, top):
+            reducer.update([1.0, math.nan, 7.0])
+        self.assertEqual((stats.count, stats.nan_count, stats.total), (2, 1, 8.0))
+        self.assertEqual(histogram.counts, [1, 1])
+        self.assertEqual(top.items(), [(7.0, 2)])
+
+    def test_empty_stats(self):
+        """Пустой агрегат."""
+        stats = AreaStats()
+        self.assertEqual((stats.count, stats.total), (0, 0.0))
+        self.assertTrue(math.isnan(stats.mean))
+
+    def test_histogram(self):
+        """Счетчики корзин совпадают с прямым подсчетом."""
+        values = _values()
+        histogram = AreaHistogram(0.0, 20.0, bins=8)
+        histogram.update(values[:300])
+        for value in values[300:400]:
+            histogram.add(value)
+        other = AreaHistogram(0.0, 20.0, bins=8)
+        other.update(values[400:])
+        histogram.merge(other)
+
+        expected = [0] * 8
+        for value in values:
+            if value < 20.0:
+                expected[int(value / 2.5)] += 1
+        self.assertEqual(histogram.counts, expected)
+        self.assertEqual(histogram.overflow, sum(value >= 20.0 for value in values))
+        self.assertEqual(histogram.underflow, 0)
+        self.assertEqual(histogram.edges[:3], [0.0, 2.5, 5.0])
+
+    def test_histogram_invalid(self):
+        """Некорректные границы и объединение разных гистограмм."""
+        with self.assertRaises(ValueError):
+            AreaHistogram(1.0, 1.0)
+        with self.assertRaises(ValueError):
+            AreaHistogram(0.0, 1.0, bins=0)
+        with self.assertRaises(ValueError):
+            AreaHistogram(0.0, 1.0, 2).merge(AreaHistogram(0.0, 1.0, 3))
+
+    def test_top_k(self):
+        """k наибольших площадей с индексами в потоке."""
+        values = _values()
+        top = TopAreas(5)
+        for start in range(0, len(values), 128):
+            top.update(values[start:start + 128], offset=start)
+        expected = sorted(((value, index) for index, value in enumerate(values)), reverse=True)[:5]
+        self.assertEqual(top.items(), expected)
+        for value, index in top.items():
+            self.assertEqual(values[index], value)
+
+    def test_reduce_areas_over_iterator(self):
+        """reduce_areas по генератору фигур равен агрегату по списку площадей."""
+        areas = [shape.area() for shape in _shapes()]
+        stats, histogram, top = reduce_areas(_shapes(), AreaStats(), AreaHistogram(0, 400, 4),
+                                             TopAreas(3), chunk_size=64)
+        self.assertEqual(stats.count, len(areas))
+        self.assertAlmostEqual(stats.total / math.fsum(areas), 1.0, places=14)
+        self.assertEqual(sum(histogram.counts), len(areas))
+        self.assertEqual(top.items(),
+                         sorted(((a, i) for i, a in enumerate(areas)), reverse=True)[:3])
+        with self.assertRaises(ValueError):
+            reduce_areas([], AreaStats(), chunk_size=0)
+
+    def test_workers_merge_via_pickle(self):
+        """Редукторы воркеров сериализуются и объединяются."""
+        shapes = list(_shapes())
+        halves = [(shapes[:200], 0), (shapes[200:], 200)]
+        partial = [pickle.loads(pickle.dumps(reduce_areas(part, AreaStats(), TopAreas(4),
+                                                          offset=offset)))
+                   for part, offset in halves]
+        stats = partial[0][0].merge(partial[1][0])
+        top = partial[0][1].merge(partial[1][1])
+        whole_stats, whole_top = reduce_areas(shapes, AreaStats(), TopAreas(4))
+        self.assertAlmostEqual(stats.total / whole_stats.total, 1.0, places=14)
+        self.assertEqual(top.items(), whole_top.items())
+
+
+@unittest.skipIf(_backend.get_numpy() is None, "NumPy не установлен")
+class TestReductionsNumpy(ReductionTests, unittest.TestCase):
+    """Тесты редукторов с backend'ом NumPy."""
+
+
+class TestReductionsPurePython(ReductionTests, unittest.TestCase):
+    """Тесты редукторов на чистом Python."""
+
+    def setUp(self):
+        patcher = mock.patch.object(_backend, "get_numpy", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_chunk_sum_is_exact(self):
+        """Без NumPy сумма порции считается math.fsum и совпадает с точной."""
+        values = _values()
+        stats = AreaStats()
+        for start in range(0, len(values), 97):
+            stats.update(values[start:start + 97])
+        self.assertEqual(stats.total, math.fsum(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Тесты для модуля registry и диспетчеризации calculate_area.
+"""
+
+import unittest
+import math
+
+from geometry_calculator import batch  # noqa: F401  регистрация пакетных ядер
+from geometry_calculator.shapes import Shape, Circle, Triangle, calculate_area
+from geometry_calculator.registry import (
+    BatchKernel, register_area_kernel, register_batch_kernel,
+    area_kernel_for, batch_kernel_for, unregister
+)
+
+
+class Square(Shape):
+    """Сторонняя фигура для тестов."""
+
+    def __init__(self, side):
+        self.side = side
+
+    def area(self):
+        return self.side ** 2
+
+    def __str__(self):
+        return f"Квадрат({self.side})"
+
+
+class TestRegistry(unittest.TestCase):
+    """Тесты реестра ядер."""
+
+    def setUp(self):
+        self.addCleanup(unregister, Square)
+
+    def test_builtin_kernels_registered(self):
+        """Встроенные фигуры зарегистрированы при импорте."""
+        self.assertIs(area_kernel_for(Circle), Circle.area)
+        self.assertIs(area_kernel_for(Triangle), Triangle.area)
+        self.assertEqual(batch_kernel_for(Circle).params, ("radius",))
+        self.assertEqual(batch_kernel_for(Triangle).params, ("side_a", "side_b", "side_c"))
+
+    def test_unregistered_shape_auto_registered(self):
+        """Незарегистрированный наследник Shape регистрируется при первом вызове."""
+        unregister(Square)
+        self.assertIsNone(area_kernel_for(Square))
+        self.assertEqual(calculate_area(Square(3)), 9)
+        self.assertIsNotNone(area_kernel_for(Square))
+
+    def test_default_kernel_is_area_method(self):
+        """Ядро по умолчанию — метод area класса."""
+        register_area_kernel(Square)
+        self.assertIs(area_kernel_for(Square), Square.area)
+        self.assertEqual(calculate_area(Square(2)), 4)
+
+    def test_custom_scalar_kernel(self):
+        """Зарегистрированное скалярное ядро используется calculate_area."""
+        register_area_kernel(Square, lambda square: -1.0)
+        self.assertEqual(calculate_area(Square(3)), -1.0)
+
+    def test_batch_kernel(self):
+        """Пакетное ядро хранится вместе с именами параметров."""
+        register_batch_kernel(Square, ["side"], lambda sides: [s * s for s in sides])
+        kernel = batch_kernel_for(Square)
+        self.assertIsInstance(kernel, BatchKernel)
+        self.assertEqual(kernel.params, ("side",))
+        self.assertEqual(kernel.function([2, 3]), [4, 9])
+
+    def test_subclass_of_builtin_not_dispatched_to_parent(self):
+        """Наследник Circle с переопределенным area() не использует ядро Circle."""
+        class HalfCircle(Circle):
+            __slots__ = ()
+
+            def area(self):
+                return super().area() / 2
+
+        self.addCleanup(unregister, HalfCircle)
+        self.assertAlmostEqual(calculate_area(HalfCircle(1)), math.pi / 2, places=7)
+
+    def test_register_requires_shape_subclass(self):
+        """Регистрировать можно только наследников Shape."""
+        with self.assertRaises(TypeError):
+            register_area_kernel(int)
+        with self.assertRaises(TypeError):
+            register_batch_kernel(object(), ("x",), len)
+
+    def test_non_shape_not_registered(self):
+        """Объекты не-Shape отклоняются и не попадают в реестр."""
+        with self.assertRaises(TypeError):
+            calculate_area(5)
+        self.assertIsNone(area_kernel_for(int))
+
+
+if __name__ == '__main__':
+    unittest.main()
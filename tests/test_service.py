@@ -0,0 +1,245 @@
+"""
+Тесты для асинхронного сервиса площадей с микро-батчингом.
+"""
+
+import unittest
+import asyncio
+import json
+import os
+import tempfile
+from unittest import mock
+
+from geometry_calculator.shapes import TRIANGLE_INEQUALITY_ERROR, circle_area, triangle_area
+from geometry_calculator import service
+from geometry_calculator.pipeline import compute_chunk_areas
+from geometry_calculator.service import AreaService, MicroBatcher
+
+
+async def _request(reader, writer, method, path, payload=None):
+    """Отправляет HTTP-запрос по keep-alive соединению и читает ответ."""
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    data = await reader.readexactly(int(headers["content-length"]))
+    return status, json.loads(data)
+
+
+class TestMicroBatcher(unittest.TestCase):
+    """Тесты MicroBatcher."""
+
+    def test_concurrent_requests_are_batched(self):
+        """Конкурентные запросы считаются одним пакетом."""
+        async def scenario():
+            batcher = MicroBatcher(max_batch_size=1000, max_wait=0.01)
+            radii = [0.5 * i for i in range(100)]
+            areas = await asyncio.gather(*(batcher.submit("circle", (r,)) for r in radii))
+            return batcher, radii, areas
+
+        batcher, radii, areas = asyncio.run(scenario())
+        self.assertEqual(areas, [circle_area(r) for r in radii])
+        self.assertEqual(batcher.requests, 100)
+        self.assertEqual(batcher.batches, 1)
+
+    def test_batch_size_limit(self):
+        """Пакет не превышает max_batch_size."""
+        async def scenario():
+            batcher = MicroBatcher(max_batch_size=8, max_wait=1.0)
+            await asyncio.gather(*(batcher.submit("triangle", (3, 4, 5)) for _ in range(20)))
+            return batcher
+
+        batcher = asyncio.run(scenario())
+        self.assertEqual(batcher.largest_batch, 8)
+        self.assertEqual(batcher.batches, 3)
+
+    def test_invalid_shape_fails_only_its_request(self):
+        """Ошибка одной фигуры не влияет на остальные запросы пакета."""
+        async def scenario():
+            batcher = MicroBatcher()
+            return await asyncio.gather(batcher.submit("circle", (-1,)),
+                                        batcher.submit("triangle", (3, 4, 5)),
+                                        return_exceptions=True)
+
+        error, area = asyncio.run(scenario())
+        self.assertIsInstance(error, ValueError)
+        self.assertEqual(area, 6.0)
+
+    def test_failed_batch_does_not_hang_requests(self):
+        """Исключение при счете пакета достается только запросу-виновнику."""
+        def compute(chunk):
+            if any(params == ("boom",) for _, params, _ in chunk):
+                raise RuntimeError("boom")
+            return compute_chunk_areas(chunk)
+
+        async def scenario():
+            batcher = MicroBatcher()
+            return await asyncio.wait_for(asyncio.gather(
+                batcher.submit("circle", ("boom",)),
+                batcher.submit("triangle", (3, 4, 5)),
+                return_exceptions=True), timeout=5)
+
+        with mock.patch.object(service, "compute_chunk_areas", side_effect=compute):
+            error, area = asyncio.run(scenario())
+        self.assertIsInstance(error, RuntimeError)
+        self.assertEqual(area, 6.0)
+
+    def test_huge_number_does_not_hang_requests(self):
+        """Число вне диапазона float не подвешивает запросы пакета."""
+        async def scenario():
+            batcher = MicroBatcher()
+            return await asyncio.wait_for(asyncio.gather(
+                batcher.submit("circle", (10 ** 400,)),
+                batcher.submit("circle", (1,)),
+                return_exceptions=True), timeout=5)
+
+        error, area = asyncio.run(scenario())
+        self.assertIsInstance(error, ValueError)
+        self.assertEqual(area, circle_area(1))
+
+    def test_unknown_kind(self):
+        """Неизвестный тип фигуры отклоняется сразу, без постановки в очередь."""
+        async def scenario():
+            batcher = MicroBatcher()
+            with self.assertRaises(ValueError):
+                await batcher.submit("square", (1,))
+            return batcher
+
+        self.assertEqual(asyncio.run(scenario()).requests, 0)
+
+    def test_invalid_parameters(self):
+        """Неположительный размер пакета и отрицательное ожидание."""
+        with self.assertRaises(ValueError):
+            MicroBatcher(max_batch_size=0)
+        with self.assertRaises(ValueError):
+            MicroBatcher(max_wait=-1)
+
+
+class TestAreaService(unittest.TestCase):
+    """Тесты HTTP-интерфейса сервиса."""
+
+    def _run(self, scenario, unix_path=None):
+        async def wrapper():
+            service = AreaService(max_batch_size=64, max_wait=0.005)
+            if unix_path:
+                await service.start_unix(unix_path)
+                connect = lambda: asyncio.open_unix_connection(unix_path)
+            else:
+                server = await service.start("127.0.0.1", 0)
+                port = server.sockets[0].getsockname()[1]
+                connect = lambda: asyncio.open_connection("127.0.0.1", port)
+            try:
+                return await scenario(connect)
+            finally:
+                await service.close()
+        return asyncio.run(wrapper())
+
+    def test_area_and_errors(self):
+        """Площадь, ошибка валидации и неизвестные путь/тип."""
+        async def scenario(connect):
+            reader, writer = await connect()
+            results = [
+                await _request(reader, writer, "POST", "/area", {"shape": "circle", "radius": 2}),
+                await _request(reader, writer, "POST", "/area",
+                               {"shape": "triangle", "side_a": 1, "side_b": 2, "side_c": 10}),
+                await _request(reader, writer, "POST", "/area", {"shape": "square", "side": 1}),
+                await _request(reader, writer, "GET", "/missing"),
+                await _request(reader, writer, "GET", "/area"),
+            ]
+            writer.close()
+            return results
+
+        results = self._run(scenario)
+        self.assertEqual(results[0], (200, {"area": circle_area(2)}))
+        self.assertEqual(results[1][0], 400)
+        self.assertEqual(results[1][1]["error"], TRIANGLE_INEQUALITY_ERROR)
+        self.assertEqual(results[2][0], 400)
+        self.assertEqual(results[3][0], 404)
+        self.assertEqual(results[4][0], 405)
+
+    def test_non_finite_area_rejected(self):
+        """Бесконечная или неопределенная площадь — ответ 400, а не невалидный JSON."""
+        async def scenario(connect):
+            reader, writer = await connect()
+            results = [
+                await _request(reader, writer, "POST", "/area", {"shape": "circle", "radius": float("inf")}),
+                await _request(reader, writer, "POST", "/area",
+                               {"shape": "triangle", "side_a": float("nan"), "side_b": 1, "side_c": 1}),
+                await _request(reader, writer, "POST", "/area", {"shape": "circle", "radius": 1}),
+            ]
+            writer.close()
+            return results
+
+        results = self._run(scenario)
+        self.assertEqual(results[0], (400, {"error": service.NON_FINITE_AREA_ERROR}))
+        self.assertEqual(results[1], (400, {"error": service.NON_FINITE_AREA_ERROR}))
+        self.assertEqual(results[2], (200, {"area": circle_area(1)}))
+
+    def test_unexpected_error_is_500(self):
+        """Непредвиденное исключение — ответ 500, соединение продолжает работать."""
+        def compute(chunk):
+            if any(params == (13,) for _, params, _ in chunk):
+                raise RuntimeError("boom")
+            return compute_chunk_areas(chunk)
+
+        async def scenario(connect):
+            reader, writer = await connect()
+            results = [
+                await _request(reader, writer, "POST", "/area", {"shape": "circle", "radius": 13}),
+                await _request(reader, writer, "POST", "/area", {"shape": "circle", "radius": 1}),
+            ]
+            writer.close()
+            return results
+
+        with mock.patch.object(service, "compute_chunk_areas", side_effect=compute):
+            results = self._run(scenario)
+        self.assertEqual(results[0], (500, {"error": service.INTERNAL_ERROR}))
+        self.assertEqual(results[1], (200, {"area": circle_area(1)}))
+
+    def test_concurrent_connections_share_batches(self):
+        """Запросы из разных соединений объединяются в пакеты."""
+        async def client(connect, sides):
+            reader, writer = await connect()
+            record = {"shape": "triangle", "side_a": sides[0], "side_b": sides[1], "side_c": sides[2]}
+            result = await _request(reader, writer, "POST", "/area", record)
+            writer.close()
+            return result
+
+        async def scenario(connect):
+            triples = [(3 + i, 4 + i, 5 + i) for i in range(32)]
+            results = await asyncio.gather(*(client(connect, sides) for sides in triples))
+            reader, writer = await connect()
+            stats = await _request(reader, writer, "GET", "/stats")
+            writer.close()
+            return triples, results, stats
+
+        triples, results, (status, stats) = self._run(scenario)
+        self.assertEqual([body["area"] for _, body in results],
+                         [triangle_area(*sides) for sides in triples])
+        self.assertEqual(status, 200)
+        self.assertEqual(stats["requests"], 32)
+        self.assertLess(stats["batches"], 32)
+
+    @unittest.skipUnless(hasattr(asyncio, "start_unix_server"), "Unix-сокеты недоступны")
+    def test_unix_socket(self):
+        """Сервис на Unix-сокете."""
+        async def scenario(connect):
+            reader, writer = await connect()
+            result = await _request(reader, writer, "POST", "/area", {"shape": "circle", "radius": 1})
+            writer.close()
+            return result
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "areas.sock")
+            self.assertEqual(self._run(scenario, unix_path=path), (200, {"area": circle_area(1)}))
+
+
+if __name__ == "__main__":
+    unittest.main()
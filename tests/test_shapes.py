@@ -4,6 +4,10 @@
 
 import unittest
 import math
+import pickle
+from unittest import mock
+
+from geometry_calculator import shapes
 from geometry_calculator.shapes import (
     # Классы
     Shape, Circle, Triangle,
@@ -54,6 +58,28 @@ class TestCircleClass(unittest.TestCase):
         circle = Circle(5)
         self.assertEqual(str(circle), "Круг(радиус=5)")
         self.assertEqual(repr(circle), "Circle(radius=5)")
+    
+    def test_circle_is_immutable(self):
+        """Тест неизменяемости круга."""
+        circle = Circle(5)
+        with self.assertRaises(AttributeError):
+            circle.radius = 10
+        with self.assertRaises(AttributeError):
+            del circle.radius
+        self.assertEqual(circle.radius, 5)
+    
+    def test_circle_equality_and_hash(self):
+        """Тест сравнения кругов по значению."""
+        self.assertEqual(Circle(2), Circle(2.0))
+        self.assertEqual(hash(Circle(2)), hash(Circle(2.0)))
+        self.assertNotEqual(Circle(2), Circle(3))
+        self.assertNotEqual(Circle(2), 2)
+        self.assertEqual(len({Circle(1), Circle(1), Circle(2)}), 2)
+    
+    def test_circle_pickle(self):
+        """Тест сериализации круга."""
+        circle = Circle(2.5)
+        self.assertEqual(pickle.loads(pickle.dumps(circle)), circle)
 
 
 class TestTriangleClass(unittest.TestCase):
@@ -132,6 +158,58 @@ class TestTriangleClass(unittest.TestCase):
         with self.assertRaises(TypeError):
             Triangle(None, 4, 5)
     
+    def test_triangle_is_immutable(self):
+        """Тест неизменяемости треугольника."""
+        triangle = Triangle(3, 4, 5)
+        with self.assertRaises(AttributeError):
+            triangle.side_a = 10
+        with self.assertRaises(AttributeError):
+            del triangle.side_b
+        self.assertEqual(triangle.side_a, 3)
+    
+    def test_triangle_derived_properties(self):
+        """Тест производных величин и их кэша в экземпляре."""
+        triangle = Triangle(5, 3, 4)
+        self.assertIsNone(triangle._sorted_sides)
+        self.assertIsNone(triangle._area)
+        self.assertEqual(triangle.area(), 6.0)
+        # Площадь кэшируется отдельно: остальные величины еще не вычислены
+        self.assertIsNone(triangle._sorted_sides)
+        self.assertEqual(triangle.semi_perimeter, 6.0)
+        self.assertEqual(triangle.sorted_sides, (3, 4, 5))
+        self.assertEqual(triangle._sorted_sides, (3, 4, 5))
+        self.assertEqual(triangle.area(), 6.0)
+        self.assertEqual(triangle._area, 6.0)
+        self.assertTrue(triangle.is_right_triangle())
+        self.assertIs(triangle._is_right, True)
+    
+    def test_triangle_derived_computed_once(self):
+        """Повторные обращения читают слоты без пересчета."""
+        for triangle in (Triangle(5, 6, 7), Triangle.from_vertices((0, 0), (3, 0), (0, 4))):
+            first = (triangle.is_right_triangle(), triangle.sorted_sides,
+                     triangle.semi_perimeter, triangle.area())
+            with mock.patch.object(shapes, "_derived", side_effect=AssertionError), \
+                    mock.patch.object(shapes, "_kahan_area", side_effect=AssertionError):
+                self.assertEqual((triangle.is_right_triangle(), triangle.sorted_sides,
+                                  triangle.semi_perimeter, triangle.area()), first)
+            self.assertIs(triangle.sorted_sides, first[1])
+    
+    def test_triangle_pickle(self):
+        """Тест сериализации треугольника."""
+        triangle = Triangle(5, 6, 7)
+        triangle.area()
+        restored = pickle.loads(pickle.dumps(triangle))
+        self.assertEqual(repr(restored), repr(triangle))
+        self.assertEqual(restored.area(), triangle.area())
+    
+    def test_triangle_equality_is_congruence(self):
+        """Тест сравнения треугольников: одинаковые стороны в любом порядке."""
+        self.assertEqual(Triangle(3, 4, 5), Triangle(5, 3, 4))
+        self.assertEqual(hash(Triangle(3, 4, 5)), hash(Triangle(4.0, 5.0, 3.0)))
+        self.assertNotEqual(Triangle(3, 4, 5), Triangle(3, 4, 6))
+        self.assertNotEqual(Triangle(3, 4, 5), Circle(3))
+        self.assertEqual(len({Triangle(3, 4, 5), Triangle(4, 3, 5), Triangle(5, 5, 5)}), 2)
+    
     def test_triangle_string_representation(self):
         """Тест строкового представления треугольника."""
         triangle = Triangle(3, 4, 5)
@@ -0,0 +1,174 @@
+"""
+Тесты для бинарного хранилища фигур (модуль store).
+"""
+
+import unittest
+import os
+import random
+import tempfile
+from array import array
+from unittest import mock
+
+from geometry_calculator import _backend
+from geometry_calculator.batch import circle_areas, triangle_areas
+from geometry_calculator.precision import area_precision
+from geometry_calculator.shapes import Circle, Triangle
+from geometry_calculator.store import (
+    HEADER_SIZE, StoreWriter, open_store, write_store
+)
+from geometry_calculator.validation import ErrorCode
+
+
+def _triangle_columns(count, seed=5):
+    rng = random.Random(seed)
+    side_a, side_b, side_c = array('d'), array('d'), array('d')
+    for _ in range(count):
+        a, b = rng.uniform(1, 2), rng.uniform(1, 2)
+        side_a.append(a)
+        side_b.append(b)
+        side_c.append(rng.uniform(abs(a - b) + 0.01, a + b - 0.01))
+    return side_a, side_b, side_c
+
+
+class StoreTests:
+    """Общие тесты хранилища для любого backend'а."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "shapes.gcs")
+
+    def test_round_trip_triangles(self):
+        """Колонки и площади читаются без изменений."""
+        columns = _triangle_columns(1000)
+        self.assertEqual(write_store(self.path, Triangle, *columns), 1000)
+        self.assertEqual(os.path.getsize(self.path), HEADER_SIZE + 3 * 1000 * 8)
+        with open_store(self.path) as store:
+            self.assertIs(store.shape_type, Triangle)
+            self.assertEqual(len(store), 1000)
+            self.assertFalse(store.has_areas)
+            self.assertEqual(list(store.column("side_b")), list(columns[1]))
+            self.assertEqual(list(store.areas()), list(triangle_areas(*columns)))
+            self.assertTrue(all(store.validate().valid))
+
+    def test_stored_areas(self):
+        """Сохраненная колонка площадей читается без пересчета."""
+        radii = [0.5, 1.0, 30.19510412751344]
+        write_store(self.path, Circle, radii, store_areas=True)
+        with open_store(self.path) as store:
+            self.assertTrue(store.has_areas)
+            self.assertEqual(list(store.areas()), [Circle(r).area() for r in radii])
+            with mock.patch.object(store, "_area_kernel", side_effect=AssertionError):
+                store.areas()
+
+    def test_stored_areas_ignore_context_precision(self):
+        """Колонка площадей float64 не округляется режимом single контекста."""
+        columns = _triangle_columns(100)
+        with area_precision("single"):
+            write_store(self.path, Triangle, *columns, store_areas=True)
+        with open_store(self.path) as store:
+            self.assertEqual(list(store.areas()), list(triangle_areas(*columns, precision="double")))
+
+    def test_chunked_writer(self):
+        """Запись порциями дает тот же файл, что и запись целиком."""
+        columns = _triangle_columns(100)
+        with StoreWriter(self.path, Triangle, count=100, store_areas=True) as writer:
+            for start in range(0, 100, 30):
+                writer.append(*(column[start:start + 30] for column in columns))
+        with open_store(self.path) as store:
+            self.assertEqual({name: list(column) for name, column in store.columns.items()},
+                             {"side_a": list(columns[0]), "side_b": list(columns[1]),
+                              "side_c": list(columns[2])})
+            self.assertEqual(list(store.areas()), list(triangle_areas(*columns)))
+
+    def test_writer_count_mismatch(self):
+        """Недописанный или переполненный файл — ValueError."""
+        with self.assertRaises(ValueError):
+            with StoreWriter(self.path, Circle, count=3) as writer:
+                writer.append([1.0, 2.0])
+        with StoreWriter(self.path, Circle, count=1) as writer:
+            with self.assertRaises(ValueError):
+                writer.append([1.0, 2.0])
+            writer.append([1.0])
+
+    def test_validation_of_stored_columns(self):
+        """Невалидные строки хранилища обнаруживаются пакетной валидацией."""
+        write_store(self.path, Triangle, [3, 1, 0], [4, 2, 1], [5, 5, 1])
+        with open_store(self.path) as store:
+            self.assertEqual([int(code) for code in store.validate().codes],
+                             [ErrorCode.OK, ErrorCode.TRIANGLE_INEQUALITY, ErrorCode.NON_POSITIVE_SIDE])
+
+    def test_columns_are_read_only(self):
+        """Колонки отображения доступны только для чтения."""
+        write_store(self.path, Circle, [1.0])
+        with open_store(self.path) as store:
+            column = store.column("radius")
+            with self.assertRaises((TypeError, ValueError)):
+                column[0] = 2.0
+            del column
+
+    def test_column_outlives_close(self):
+        """Колонка остается доступной после close()."""
+        write_store(self.path, Circle, [1.0, 2.0])
+        store = open_store(self.path)
+        column = store.column("radius")
+        store.close()
+        self.assertEqual(list(column), [1.0, 2.0])
+
+    def test_invalid_files(self):
+        """Чужой, усеченный или неизвестный файл вызывает ValueError."""
+        with open(self.path, "wb") as stream:
+            stream.write(b"x" * HEADER_SIZE)
+        with self.assertRaises(ValueError):
+            open_store(self.path)
+
+        write_store(self.path, Circle, [1.0, 2.0])
+        with open(self.path, "r+b") as stream:
+            stream.truncate(HEADER_SIZE + 8)
+        with self.assertRaises(ValueError):
+            open_store(self.path)
+
+        with open(self.path, "wb") as stream:
+            stream.write(b"short")
+        with self.assertRaises(ValueError):
+            open_store(self.path)
+
+    def test_unsupported_type(self):
+        """Произвольный тип фигуры не поддерживается."""
+        with self.assertRaises(TypeError):
+            write_store(self.path, object, [1.0])
+
+    def test_matches_circle_areas(self):
+        """Площади из mmap-колонки совпадают с circle_areas."""
+        radii = array('d', (random.Random(1).uniform(0, 100) for _ in range(500)))
+        write_store(self.path, Circle, radii)
+        with open_store(self.path) as store:
+            self.assertEqual(list(store.areas()), list(circle_areas(radii)))
+
+
+@unittest.skipIf(_backend.get_numpy() is None, "NumPy не установлен")
+class TestStoreNumpy(StoreTests, unittest.TestCase):
+    """Тесты хранилища с backend'ом NumPy."""
+
+    def test_zero_copy(self):
+        """Колонки NumPy ссылаются на отображение файла."""
+        write_store(self.path, Circle, [1.0, 2.0])
+        with open_store(self.path) as store:
+            column = store.column("radius")
+            self.assertFalse(column.flags.owndata)
+            self.assertFalse(column.flags.writeable)
+            del column
+
+
+class TestStorePurePython(StoreTests, unittest.TestCase):
+    """Тесты хранилища на чистом Python."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(_backend, "get_numpy", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+Тесты для модуля threaded.
+"""
+
+import unittest
+import operator
+import random
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from geometry_calculator import _backend, threaded
+from geometry_calculator.batch import calculate_areas, circle_areas, triangle_areas, triple_columns
+from geometry_calculator.registry import register_batch_kernel, unregister
+from geometry_calculator.shapes import Circle, Shape, Triangle
+from geometry_calculator.threaded import (
+    run_kernel, threaded_circle_areas, threaded_triangle_areas
+)
+
+
+def _random_columns(count, seed=7):
+    """Колонки радиусов и сторон валидных треугольников."""
+    rng = random.Random(seed)
+    radii = array('d', (rng.uniform(0, 100) for _ in range(count)))
+    triples = array('d')
+    for _ in range(count):
+        a, b = rng.uniform(1, 2), rng.uniform(1, 2)
+        triples.extend((a, b, rng.uniform(abs(a - b) + 0.01, a + b - 0.01)))
+    return radii, triples
+
+
+class Rectangle(Shape):
+    """Прямоугольник с пакетным ядром, не умеющим писать в готовый массив."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def area(self):
+        return self.width * self.height
+
+    def __str__(self):
+        return f"Прямоугольник({self.width}x{self.height})"
+
+
+def _rectangle_areas(widths, heights):
+    if hasattr(widths, "__array_ufunc__"):
+        return widths * heights
+    return list(map(operator.mul, widths, heights))
+
+
+class ThreadedTests:
+    """Общие тесты функций на пуле потоков для любого backend'а."""
+
+    def setUp(self):
+        # Уменьшаем порог, чтобы тесты действительно запускали пул потоков
+        patcher = mock.patch.object(threaded, "MIN_THREADED_SIZE", 10)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.radii, self.triples = _random_columns(1000)
+
+    def test_circle_areas_match_batch(self):
+        """Результат побитово совпадает с circle_areas() и сохраняет порядок."""
+        expected = list(circle_areas(self.radii))
+        result = threaded_circle_areas(self.radii, threads=3, chunk_size=97)
+        self.assertEqual(list(result), expected)
+
+    def test_triangle_areas_match_batch(self):
+        """Результат совпадает с triangle_areas() для колонок с шагом."""
+        columns = triple_columns(self.triples)
+        expected = list(triangle_areas(*columns))
+        result = threaded_triangle_areas(*columns, threads=4)
+        self.assertEqual(list(result), expected)
+
+    def test_shared_executor(self):
+        """Конкурентные вызовы с общим пулом потоков дают верные результаты."""
+        expected = list(circle_areas(self.radii))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outer = ThreadPoolExecutor(max_workers=4)
+            with outer:
+                futures = [outer.submit(threaded_circle_areas, self.radii, threads=4,
+                                        chunk_size=50, executor=executor)
+                           for _ in range(8)]
+                results = [list(future.result()) for future in futures]
+        self.assertEqual(results, [expected] * 8)
+
+    def test_custom_kernel(self):
+        """Пользовательское ядро применяется по диапазонам строк."""
+        widths = [float(i) for i in range(100)]
+        heights = [2.0] * 100
+        result = run_kernel(_rectangle_areas, [widths, heights], threads=4, chunk_size=7)
+        self.assertEqual(list(result), [w * 2.0 for w in widths])
+
+    def test_calculate_areas_threads(self):
+        """calculate_areas(threads=...) совпадает с последовательным вычислением."""
+        radii = self.radii[:300]
+        side_a, side_b, side_c = triple_columns(self.triples[:900])
+        shapes = [Circle(r) for r in radii]
+        shapes += [Triangle(a, b, c) for a, b, c in zip(side_a, side_b, side_c)]
+        shapes += [Rectangle(i, 3) for i in range(1, 50)]
+        register_batch_kernel(Rectangle, ("width", "height"), _rectangle_areas)
+        self.addCleanup(unregister, Rectangle)
+        random.Random(1).shuffle(shapes)
+        expected = list(calculate_areas(shapes))
+        self.assertEqual(list(calculate_areas(shapes, threads=4)), expected)
+
+    def test_invalid_arguments(self):
+        """Неположительные threads/chunk_size и разная длина колонок вызывают ValueError."""
+        with self.assertRaises(ValueError):
+            threaded_circle_areas(self.radii, threads=0)
+        with self.assertRaises(ValueError):
+            threaded_circle_areas(self.radii, chunk_size=0)
+        with self.assertRaises(ValueError):
+            threaded_triangle_areas([3], [4, 5], [5], threads=2)
+        with self.assertRaises(ValueError):
+            calculate_areas([Circle(1)], threads=-1)
+
+    def test_small_input_in_current_thread(self):
+        """Вход меньше порога считается без пула."""
+        with mock.patch.object(threaded, "ThreadPoolExecutor") as executor:
+            result = threaded_circle_areas([1.0, 2.0, 3.0], threads=4)
+        executor.assert_not_called()
+        self.assertEqual(list(result), list(circle_areas([1.0, 2.0, 3.0])))
+
+
+@unittest.skipIf(_backend.get_numpy() is None, "NumPy не установлен")
+class TestThreadedNumpy(ThreadedTests, unittest.TestCase):
+    """Тесты функций на пуле потоков с backend'ом NumPy."""
+
+
+class TestThreadedPurePython(ThreadedTests, unittest.TestCase):
+    """Тесты функций на пуле потоков на чистом Python (как на free-threaded сборке)."""
+
+    def setUp(self):
+        super().setUp()
+        for target, name, value in ((_backend, "get_numpy", None),
+                                    (threaded, "gil_enabled", False)):
+            patcher = mock.patch.object(target, name, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_gil_enabled_runs_in_current_thread(self):
+        """Без NumPy при включенном GIL пул потоков не запускается."""
+        with mock.patch.object(threaded, "gil_enabled", return_value=True), \
+                mock.patch.object(threaded, "ThreadPoolExecutor") as executor:
+            result = threaded_circle_areas(self.radii, threads=4)
+        executor.assert_not_called()
+        self.assertEqual(list(result), list(circle_areas(self.radii)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Тесты для модуля validation.
+"""
+
+import unittest
+import math
+import warnings
+from array import array
+from unittest import mock
+
+from geometry_calculator import _backend
+from geometry_calculator.shapes import Circle, Triangle
+from geometry_calculator.validation import (
+    ErrorCode, validate_circles, validate_triangles, error_for
+)
+
+
+RADII = [1, 0, -1, 2.5, "5", None, -0.5]
+TRIANGLES = [
+    (3, 4, 5), (1, 2, 5), (10, 1, 1), (0, 2, 3), (-1, 2, 3),
+    ("3", 4, 5), (3, None, 5), (6, 6, 6), (1, 2, 3),
+]
+
+
+def _constructor_code(shape_type, *params):
+    """Код ошибки, соответствующий исключению конструктора."""
+    try:
+        shape_type(*params)
+    except TypeError:
+        return ErrorCode.NOT_A_NUMBER
+    except ValueError as error:
+        for code in ErrorCode:
+            if code and str(error) == str(_safe_error(shape_type, code)):
+                return code
+        raise
+    return ErrorCode.OK
+
+
+def _safe_error(shape_type, code):
+    try:
+        return error_for(shape_type, code)
+    except KeyError:
+        return None
+
+
+class ValidationTests:
+    """Общие тесты пакетной валидации для любого backend'а."""
+
+    def test_circle_codes_match_constructor(self):
+        """Коды для кругов совпадают с исключениями Circle."""
+        result = validate_circles(RADII)
+        expected = [_constructor_code(Circle, r) for r in RADII]
+        self.assertEqual(list(result.codes), expected)
+        self.assertEqual([bool(v) for v in result.valid], [c == ErrorCode.OK for c in expected])
+
+    def test_triangle_codes_match_constructor(self):
+        """Коды для треугольников совпадают с исключениями Triangle."""
+        result = validate_triangles(*zip(*TRIANGLES))
+        expected = [_constructor_code(Triangle, *sides) for sides in TRIANGLES]
+        self.assertEqual(list(result.codes), expected)
+        self.assertEqual([bool(v) for v in result.valid], [c == ErrorCode.OK for c in expected])
+
+    def test_buffer_input(self):
+        """Числовые буферы проверяются без поиска нечисловых значений."""
+        result = validate_circles(array('d', [1.0, -1.0]))
+        self.assertEqual(list(result.codes), [ErrorCode.OK, ErrorCode.NEGATIVE_RADIUS])
+
+    def test_nan_matches_constructor(self):
+        """NaN принимается так же, как в конструкторах."""
+        self.assertEqual(list(validate_circles([math.nan]).codes), [ErrorCode.OK])
+        self.assertEqual(list(validate_triangles([math.nan], [1], [1]).codes),
+                         [_constructor_code(Triangle, math.nan, 1, 1)])
+
+    def test_huge_int_out_of_range(self):
+        """Целое вне диапазона float — код OUT_OF_RANGE строки, а не OverflowError."""
+        result = validate_circles([1, 10 ** 400, -(10 ** 400), "5"])
+        self.assertEqual(list(result.codes), [ErrorCode.OK, ErrorCode.OUT_OF_RANGE,
+                                              ErrorCode.OUT_OF_RANGE, ErrorCode.NOT_A_NUMBER])
+        result = validate_triangles([3, 10 ** 400, 10 ** 400], [4, 4, "4"], [5, 5, 5])
+        self.assertEqual(list(result.codes), [ErrorCode.OK, ErrorCode.OUT_OF_RANGE,
+                                              ErrorCode.NOT_A_NUMBER])
+        error = error_for(Circle, ErrorCode.OUT_OF_RANGE)
+        self.assertIsInstance(error, ValueError)
+
+    def test_overflowing_sums_without_warnings(self):
+        """Сумма сторон у границы float не выдает предупреждений."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = validate_triangles([1e308], [1e308], [1e308])
+        self.assertEqual(list(result.codes), [ErrorCode.OK])
+
+    def test_column_length_mismatch(self):
+        """Колонки разной длины вызывают ValueError."""
+        with self.assertRaises(ValueError):
+            validate_triangles([3, 4], [4], [5])
+
+
+@unittest.skipIf(_backend.get_numpy() is None, "NumPy не установлен")
+class TestValidationNumpy(ValidationTests, unittest.TestCase):
+    """Тесты пакетной валидации с backend'ом NumPy."""
+
+    def test_object_and_string_arrays(self):
+        """Массивы объектов и строк проверяются поэлементно, как списки."""
+        np = _backend.get_numpy()
+        objects = np.array([1.0, "5", None, 10 ** 400, -2], dtype=object)
+        self.assertEqual(list(validate_circles(objects).codes),
+                         list(validate_circles(list(objects)).codes))
+        self.assertEqual(list(validate_circles(objects).codes),
+                         [ErrorCode.OK, ErrorCode.NOT_A_NUMBER, ErrorCode.NOT_A_NUMBER,
+                          ErrorCode.OUT_OF_RANGE, ErrorCode.NEGATIVE_RADIUS])
+        strings = np.array(["3", "4"])
+        self.assertEqual(list(validate_triangles(strings, [4, 4], [5, 5]).codes),
+                         [ErrorCode.NOT_A_NUMBER] * 2)
+
+
+class TestValidationPurePython(ValidationTests, unittest.TestCase):
+    """Тесты пакетной валидации на чистом Python."""
+
+    def setUp(self):
+        patcher = mock.patch.object(_backend, "get_numpy", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestErrorFor(unittest.TestCase):
+    """Тесты функции error_for."""
+
+    def test_error_types_and_messages(self):
+        """error_for воспроизводит исключения конструкторов."""
+        with self.assertRaises(TypeError) as expected:
+            Triangle("3", 4, 5)
+        error = error_for(Triangle, ErrorCode.NOT_A_NUMBER)
+        self.assertIsInstance(error, TypeError)
+        self.assertEqual(str(error), str(expected.exception))
+
+        error = error_for(Circle, ErrorCode.NEGATIVE_RADIUS)
+        self.assertIsInstance(error, ValueError)
+
+    def test_code_not_applicable(self):
+        """Неприменимый к фигуре код вызывает KeyError."""
+        with self.assertRaises(KeyError):
+            error_for(Circle, ErrorCode.TRIANGLE_INEQUALITY)
+
+
+if __name__ == '__main__':
+    unittest.main()
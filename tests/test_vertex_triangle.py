@@ -0,0 +1,172 @@
+"""
+Тесты треугольника по вершинам (Triangle.from_vertices) и пакетной
+функции triangle_areas_from_vertices.
+"""
+
+import unittest
+import math
+import pickle
+import random
+from fractions import Fraction
+from unittest import mock
+
+from geometry_calculator import _backend
+from geometry_calculator.batch import calculate_areas, triangle_areas_from_vertices
+from geometry_calculator.shapes import (
+    TRIANGLE_COORDINATE_TYPE_ERROR, Triangle, VertexTriangle, calculate_area
+)
+
+
+def _points(rng, count, dim, scale=1e3):
+    """Случайные тройки точек размерности dim."""
+    return [[tuple(rng.uniform(-scale, scale) for _ in range(dim)) for _ in range(3)]
+            for _ in range(count)]
+
+
+def _flat(triangles):
+    return [value for triangle in triangles for point in triangle for value in point]
+
+
+class TestVertexTriangle(unittest.TestCase):
+    """Тесты класса VertexTriangle."""
+
+    def test_area_2d_and_3d(self):
+        """Площадь по векторному произведению."""
+        self.assertEqual(Triangle.from_vertices((0, 0), (3, 0), (0, 4)).area(), 6.0)
+        self.assertEqual(Triangle.from_vertices((1, 1, 1), (4, 1, 1), (1, 5, 1)).area(), 6.0)
+        self.assertEqual(Triangle.from_vertices((0, 0, 0), (0, 3, 0), (0, 0, 4)).area(), 6.0)
+
+    def test_is_triangle(self):
+        """Треугольник по вершинам — наследник Triangle с тем же API."""
+        triangle = Triangle.from_vertices((0, 0), (3, 0), (0, 4))
+        self.assertIsInstance(triangle, Triangle)
+        self.assertIs(type(triangle), VertexTriangle)
+        self.assertTrue(triangle.is_right_triangle())
+        self.assertEqual(triangle.semi_perimeter, 6.0)
+        self.assertEqual(triangle, Triangle(3, 4, 5))
+        self.assertEqual(hash(triangle), hash(Triangle(5, 4, 3)))
+        self.assertEqual(calculate_area(triangle), 6.0)
+
+    def test_sides_are_lazy(self):
+        """Стороны вычисляются только при обращении: |bc|, |ca|, |ab|."""
+        triangle = Triangle.from_vertices((0, 0), (3, 0), (0, 4))
+        self.assertIsNone(Triangle.side_a.__get__(triangle))
+        self.assertEqual((triangle.side_a, triangle.side_b, triangle.side_c), (5.0, 4.0, 3.0))
+        self.assertEqual(Triangle.side_a.__get__(triangle), 5.0)
+
+    def test_needle_precision(self):
+        """Площадь вытянутого треугольника точнее формулы Герона по сторонам."""
+        vertices = ((0.0, 0.0), (100.0, 1.0), (200.0, 2.0 + 1e-6))
+        exact = abs(Fraction(100.0) * Fraction(2.0 + 1e-6) - Fraction(200.0)) / 2
+        from_vertices = Triangle.from_vertices(*vertices).area()
+        a, b, c = vertices
+        from_sides = Triangle(math.dist(b, c), math.dist(c, a), math.dist(a, b)).area()
+        vertices_error = abs(Fraction(from_vertices) - exact) / exact
+        sides_error = abs(Fraction(from_sides) - exact) / exact
+        self.assertLess(vertices_error, 1e-9)
+        self.assertLess(vertices_error * 1000, sides_error)
+
+    def test_validation(self):
+        """Ошибки конструктора."""
+        with self.assertRaises(ValueError):
+            Triangle.from_vertices((0, 0), (1, 1), (2, 2))
+        with self.assertRaises(ValueError):
+            Triangle.from_vertices((0, 0), (1, 0), (0, 1, 0))
+        with self.assertRaises(ValueError):
+            Triangle.from_vertices((0,), (1, 0), (0, 1))
+        with self.assertRaisesRegex(TypeError, TRIANGLE_COORDINATE_TYPE_ERROR):
+            Triangle.from_vertices((0, 0), (1, 0), (0, "1"))
+        with self.assertRaises(TypeError):
+            Triangle.from_vertices((0, 0), (1, 0), 5)
+
+    def test_immutable_and_pickle(self):
+        """Треугольник неизменяем и сериализуется через вершины."""
+        triangle = Triangle.from_vertices((0, 0, 1), (3, 0, 1), (0, 4, 1))
+        with self.assertRaises(AttributeError):
+            triangle.side_a = 1.0
+        with self.assertRaises(AttributeError):
+            triangle._coords = None
+        restored = pickle.loads(pickle.dumps(triangle))
+        self.assertIs(type(restored), VertexTriangle)
+        self.assertEqual(restored.vertices, ((0.0, 0.0, 1.0), (3.0, 0.0, 1.0), (0.0, 4.0, 1.0)))
+        self.assertEqual(restored.dimension, 3)
+        self.assertEqual(restored.area(), triangle.area())
+
+    def test_string_representation(self):
+        """Строковое представление."""
+        triangle = Triangle.from_vertices((0, 0), (3, 0), (0, 4))
+        self.assertEqual(str(triangle), "Треугольник(вершины=(0.0, 0.0), (3.0, 0.0), (0.0, 4.0))")
+        self.assertEqual(repr(triangle), "Triangle.from_vertices((0.0, 0.0), (3.0, 0.0), (0.0, 4.0))")
+
+
+class VertexAreasTests:
+    """Общие тесты triangle_areas_from_vertices для любого backend'а."""
+
+    def test_bit_identical(self):
+        """Площади совпадают с Triangle.from_vertices(...).area() побитово."""
+        rng = random.Random(3)
+        for dim in (2, 3):
+            with self.subTest(dim=dim):
+                triangles = _points(rng, 200, dim)
+                areas = triangle_areas_from_vertices(_flat(triangles), dim=dim)
+                self.assertEqual(list(areas),
+                                 [Triangle.from_vertices(*points).area() for points in triangles])
+
+    def test_degenerate_is_zero(self):
+        """Вырожденные треугольники не валидируются: площадь ноль."""
+        self.assertEqual(list(triangle_areas_from_vertices([0, 0, 1, 1, 2, 2])), [0.0])
+
+    def test_invalid_input(self):
+        """Длина не кратна 3·dim или неверная размерность."""
+        with self.assertRaises(ValueError):
+            triangle_areas_from_vertices([0, 0, 1, 0, 0])
+        with self.assertRaises(ValueError):
+            triangle_areas_from_vertices([0, 0, 1, 0, 0, 1], dim=4)
+        with self.assertRaises(ValueError):
+            triangle_areas_from_vertices([0, 0, 1, 0, 0, 1], dim=3)
+
+    def test_calculate_areas(self):
+        """calculate_areas считает треугольники по вершинам их пакетным ядром."""
+        rng = random.Random(4)
+        shapes = [Triangle.from_vertices(*points)
+                  for points in _points(rng, 50, 2) + _points(rng, 50, 3)]
+        rng.shuffle(shapes)
+        shapes.append(Triangle(3, 4, 5))
+        self.assertEqual(list(calculate_areas(shapes)), [shape.area() for shape in shapes])
+        planar = [shape for shape in shapes if getattr(shape, "dimension", 3) == 2]
+        self.assertEqual(list(calculate_areas(planar)), [shape.area() for shape in planar])
+        # Стороны не вычисляются
+        self.assertIsNone(Triangle.side_a.__get__(shapes[0]))
+
+
+@unittest.skipIf(_backend.get_numpy() is None, "NumPy не установлен")
+class TestVertexAreasNumpy(VertexAreasTests, unittest.TestCase):
+    """Тесты triangle_areas_from_vertices с NumPy."""
+
+    def test_shaped_array(self):
+        """Массив формы (n, 3, dim) задает размерность."""
+        np = _backend.get_numpy()
+        points = np.array([[[0, 0, 1], [3, 0, 1], [0, 4, 1]]], dtype=np.float64)
+        self.assertEqual(list(triangle_areas_from_vertices(points)), [6.0])
+        self.assertEqual(list(triangle_areas_from_vertices(points[:, :, :2])), [6.0])
+        with self.assertRaises(ValueError):
+            triangle_areas_from_vertices(points, dim=2)
+        with self.assertRaises(ValueError):
+            triangle_areas_from_vertices(np.zeros((2, 2, 2)))
+
+
+class TestVertexAreasPurePython(VertexAreasTests, unittest.TestCase):
+    """Тесты triangle_areas_from_vertices на чистом Python."""
+
+    def setUp(self):
+        patcher = mock.patch.object(_backend, "get_numpy", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_result_typecode(self):
+        """Без NumPy результат — array('d')."""
+        self.assertEqual(triangle_areas_from_vertices([0, 0, 3, 0, 0, 4]).typecode, 'd')
+
+
+if __name__ == '__main__':
+    unittest.main()